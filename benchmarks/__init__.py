@@ -0,0 +1 @@
+"""Synthetic fleet benchmarks for the dashboard refresh path (see ``benchmarks.run``)."""
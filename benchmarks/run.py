@@ -0,0 +1,256 @@
+"""
+Fleet-scale benchmark for ``DashboardDataOrchestrator.get_infrastructure_data``.
+
+Runs the full refresh path against a ``SyntheticGateway`` for each fleet size
+and records wall time, peak memory and per-stage timings to JSON (both the
+wrapped collaborator timings and the pipeline's own ``refresh_trace`` stages):
+
+    python -m benchmarks.run                          # 10 / 100 / 1000 / 10000 instances
+    python -m benchmarks.run --sizes 10 100 --period-days 7
+    python -m benchmarks.run --compare artifacts/benchmarks/baseline.json
+    python -m benchmarks.run --sizes 10 --skip-startup
+
+Each size runs in a fresh temporary cache root. A ``cold`` refresh (empty
+caches) is followed by a ``warm`` refresh on the same orchestrator, which is
+what a dashboard user sees on the next rerun. Peak memory is the process's
+peak resident set size after each cold refresh (sizes run in ascending order,
+so it reflects the largest fleet so far). ``--trace-memory`` adds the Python
+heap peak from a separate ``tracemalloc`` run, kept out of the timed runs
+because tracing slows allocation-heavy code down several times. The report's
+``startup`` section holds the ``import src.app`` time report and the
+Streamlit boot-to-first-paint time (see ``benchmarks.startup``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import logging
+import platform
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from benchmarks.startup import format_report, run_startup
+from benchmarks.synthetic import create_synthetic_gateway
+from src.application.orchestrator import DashboardDataOrchestrator
+from src.infrastructure.cache import FileCacheRepository
+
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+DEFAULT_OUTPUT = Path("artifacts/benchmarks/baseline.json")
+BENCHMARK_SCHEMA_VERSION = 1
+
+
+@dataclass
+class StageTimer:
+    """Accumulates call counts and seconds for wrapped methods, keyed by stage name."""
+
+    stages: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+    def wrap(self, target: Any, method: str, stage: str) -> None:
+        original = getattr(target, method)
+
+        @functools.wraps(original)
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                entry = self.stages.setdefault(stage, {"calls": 0, "seconds": 0.0})
+                entry["calls"] += 1
+                entry["seconds"] += time.perf_counter() - started
+
+        setattr(target, method, timed)
+
+    def reset(self) -> None:
+        self.stages = {}
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        return {
+            stage: {"calls": int(entry["calls"]), "seconds": round(entry["seconds"], 6)}
+            for stage, entry in sorted(self.stages.items())
+        }
+
+
+def _instrument(orchestrator: DashboardDataOrchestrator, timer: StageTimer) -> None:
+    """Wrap the orchestrator's collaborators so each refresh stage is timed."""
+    fetch = orchestrator.fetch_use_case
+    for method in ("get_current_intensity", "get_recent_history", "get_self_collected_history", "get_period_history"):
+        timer.wrap(orchestrator.carbon_service, method, "carbon_history")
+    timer.wrap(orchestrator.runtime_service, "list_instances", "list_instances")
+    timer.wrap(fetch.gateway, "get_costs", "cost_explorer")
+    timer.wrap(fetch.gateway, "get_hourly_costs", "cost_explorer")
+    timer.wrap(fetch.enrich_use_case, "execute", "enrich")
+    timer.wrap(orchestrator.runtime_service, "input_fingerprint", "enrich.fingerprint")
+    timer.wrap(orchestrator.runtime_service, "_get_precise_runtime_hours", "enrich.runtime_hours")
+    timer.wrap(orchestrator.runtime_service, "_get_cpu_utilisation_hourly", "enrich.cpu_hourly")
+    timer.wrap(orchestrator.calculator, "calculate_cloudtrail_enhanced_accuracy", "validation")
+    timer.wrap(orchestrator.calculator, "calculate_business_case", "business_case")
+    timer.wrap(orchestrator.health_use_case, "execute", "api_health")
+
+
+def _build(size: int, cache_root: Path, *, seed: int) -> DashboardDataOrchestrator:
+    gateway = create_synthetic_gateway(size, seed=seed)
+    return DashboardDataOrchestrator(repository=FileCacheRepository(cache_root), gateway=gateway)
+
+
+def _refresh(orchestrator: DashboardDataOrchestrator, period_days: int) -> Dict[str, Any]:
+    started = time.perf_counter()
+    data = orchestrator.get_infrastructure_data(period_days=period_days)
+    wall = time.perf_counter() - started
+    instances = list(getattr(data, "instances", None) or [])
+    trace = getattr(data, "refresh_trace", None)
+    return {
+        "wall_seconds": round(wall, 4),
+        "instances_processed": len(instances),
+        "hourly_precise_count": sum(1 for instance in instances if instance.co2_calculation_method == "hourly"),
+        "total_co2_hourly_kg": round(float(getattr(data, "total_co2_hourly", 0.0) or 0.0), 3),
+        "total_cost_average_eur": round(float(getattr(data, "total_cost_average", 0.0) or 0.0), 2),
+        "trace_stages": dict(trace.stages) if trace else {},
+    }
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 2)
+
+
+def run_size(size: int, *, period_days: int = 30, seed: int = 42, trace_memory: bool = False) -> Dict[str, Any]:
+    """Benchmark one fleet size; returns cold/warm timings, stage timings and peak memory."""
+    timer = StageTimer()
+    with tempfile.TemporaryDirectory(prefix="finops-bench-") as tmp:
+        orchestrator = _build(size, Path(tmp), seed=seed)
+        _instrument(orchestrator, timer)
+
+        cold = _refresh(orchestrator, period_days)
+        cold["stages"] = timer.snapshot()
+        peak_rss_mb = _peak_rss_mb()
+        timer.reset()
+
+        warm = _refresh(orchestrator, period_days)
+        warm["stages"] = timer.snapshot()
+        gateway_calls = dict(sorted(orchestrator.gateway.calls.items()))
+
+    result: Dict[str, Any] = {
+        "instances": size,
+        "period_days": period_days,
+        "cold": cold,
+        "warm": warm,
+        "gateway_calls": gateway_calls,
+        "per_instance_ms": round(cold["wall_seconds"] * 1000.0 / max(size, 1), 3),
+        "peak_rss_mb": peak_rss_mb,
+    }
+
+    if trace_memory:
+        with tempfile.TemporaryDirectory(prefix="finops-bench-") as tmp:
+            orchestrator = _build(size, Path(tmp), seed=seed)
+            tracemalloc.start()
+            try:
+                orchestrator.get_infrastructure_data(period_days=period_days)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+        result["traced_peak_mb"] = round(peak / (1024 * 1024), 2)
+
+    return result
+
+
+def run_benchmarks(
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    *,
+    period_days: int = 30,
+    seed: int = 42,
+    trace_memory: bool = False,
+) -> Dict[str, Any]:
+    """Run every fleet size and return the JSON-serialisable report."""
+    runs: List[Dict[str, Any]] = []
+    for size in sorted(sizes):
+        result = run_size(size, period_days=period_days, seed=seed, trace_memory=trace_memory)
+        runs.append(result)
+        memory = f", peak RSS {result['peak_rss_mb']:.0f} MB" if result["peak_rss_mb"] is not None else ""
+        if "traced_peak_mb" in result:
+            memory += f", traced peak {result['traced_peak_mb']:.1f} MB"
+        print(
+            f"{size:>6} instances: cold {result['cold']['wall_seconds']:.2f}s, "
+            f"warm {result['warm']['wall_seconds']:.2f}s{memory}",
+            flush=True,
+        )
+
+    return {
+        "schema_version": BENCHMARK_SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "runs": runs,
+    }
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """Human-readable cold/warm wall-time ratios against a previous report."""
+    previous = {(run["instances"], run["period_days"]): run for run in baseline.get("runs", [])}
+    lines = []
+    before_paint = (baseline.get("startup") or {}).get("first_paint")
+    after_paint = (report.get("startup") or {}).get("first_paint")
+    if before_paint and after_paint:
+        old, new = before_paint["boot_to_first_paint_seconds"], after_paint["boot_to_first_paint_seconds"]
+        lines.append(f"first paint: {old:.2f}s → {new:.2f}s ({new / old if old else float('inf'):.2f}×)")
+    for run in report["runs"]:
+        before = previous.get((run["instances"], run["period_days"]))
+        if before is None:
+            continue
+        ratios = []
+        for phase in ("cold", "warm"):
+            old, new = before[phase]["wall_seconds"], run[phase]["wall_seconds"]
+            ratios.append(f"{phase} {old:.2f}s → {new:.2f}s ({new / old if old else float('inf'):.2f}×)")
+        lines.append(f"{run['instances']:>6} instances: " + ", ".join(ratios))
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Fleet-scale benchmark of the dashboard refresh path")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Fleet sizes to run")
+    parser.add_argument("--period-days", type=int, choices=(1, 7, 30), default=30, help="Analysis period")
+    parser.add_argument("--seed", type=int, default=42, help="Synthetic fleet seed")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="JSON report path")
+    parser.add_argument("--compare", type=Path, default=None, help="Previous report to compare against")
+    parser.add_argument("--trace-memory", action="store_true", help="Add a (slow) tracemalloc peak-memory run")
+    parser.add_argument("--skip-startup", action="store_true", help="Skip the import-time and first-paint benchmark")
+    args = parser.parse_args(argv)
+
+    # Per-instance logging (INFO and expected fallback warnings) dominates wall time at fleet scale
+    logging.basicConfig(level=logging.ERROR)
+    logging.getLogger().setLevel(logging.ERROR)
+
+    report = run_benchmarks(args.sizes, period_days=args.period_days, seed=args.seed, trace_memory=args.trace_memory)
+    if not args.skip_startup:
+        report["startup"] = run_startup(seed=args.seed, top=10)
+        for line in format_report(report["startup"]):
+            print(line)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Report written to {args.output}")
+
+    if args.compare:
+        for line in compare(report, json.loads(args.compare.read_text(encoding="utf-8"))):
+            print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+"""
+Dashboard startup benchmark: import-time report and boot-to-first-paint.
+
+Both measurements run in fresh interpreters, so nothing imported by the
+caller (or by an earlier measurement) hides import cost:
+
+    python -m benchmarks.startup                  # import report + first paint
+    python -m benchmarks.startup --top 25 --size 100
+
+``import_time_report()`` imports ``src.app`` under ``python -X importtime``
+and returns the slowest modules (cumulative and self time) together with the
+heavy third-party modules that were loaded. ``src.app`` is expected to import
+only Streamlit and the domain models; pandas, pydantic, the AWS SDK and the
+page modules load on first use.
+
+``measure_first_paint()`` launches a child interpreter that runs the app once
+with ``streamlit.testing`` against a ``SyntheticGateway`` fleet in an empty
+cache root. It reports the wall time from process launch to the first element
+sent to the browser (``boot_to_first_paint_seconds``), to the end of the first
+script run including the initial refresh (``boot_to_first_render_seconds``),
+and a warm rerun.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+APP_PATH = REPO_ROOT / "src" / "app.py"
+
+# Third-party modules that must not be imported by ``import src.app``
+HEAVY_MODULES = ("pandas", "pydantic", "boto3", "botocore", "plotly.graph_objs._figure")
+
+_IMPORT_PROBE = (
+    "import json, sys, time\n"
+    "started = time.perf_counter()\n"
+    "import {module}\n"
+    "print(json.dumps({{'seconds': time.perf_counter() - started, 'modules': sorted(sys.modules)}}))\n"
+)
+
+_FIRST_PAINT_CHILD = (
+    "import json, sys, time\n"
+    "started = time.perf_counter()\n"
+    "from streamlit.runtime.scriptrunner_utils.script_run_context import ScriptRunContext\n"
+    "from streamlit.testing.v1 import AppTest\n"
+    "import src.infrastructure.gateways as gateways\n"
+    "from benchmarks.synthetic import create_synthetic_gateway\n"
+    "gateways.create_default_gateway = lambda repository: create_synthetic_gateway({size}, seed={seed})\n"
+    "painted = []\n"
+    "enqueue = ScriptRunContext.enqueue\n"
+    "def recording_enqueue(self, msg):\n"
+    "    if not painted and msg.WhichOneof('type') == 'delta':\n"
+    "        painted.append(time.time())\n"
+    "    enqueue(self, msg)\n"
+    "ScriptRunContext.enqueue = recording_enqueue\n"
+    "app = AppTest.from_file({app!r}, default_timeout={timeout})\n"
+    "app.run()\n"
+    "completed_at, first_run = time.time(), time.perf_counter() - started\n"
+    "rerun_started = time.perf_counter()\n"
+    "app.run()\n"
+    "print(json.dumps({{'painted_at': painted[0] if painted else completed_at, 'completed_at': completed_at,\n"
+    "    'first_run_seconds': first_run, 'rerun_seconds': time.perf_counter() - rerun_started,\n"
+    "    'exceptions': len(app.exception)}}))\n"
+)
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """One line of ``python -X importtime`` output (microseconds)."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """Parse the ``import time: self | cumulative | module`` lines of ``-X importtime``."""
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header line
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        timings.append(
+            ImportTiming(
+                module=stripped,
+                self_us=int(parts[0]),
+                cumulative_us=int(parts[1]),
+                depth=(len(name) - len(stripped) - 1) // 2,
+            )
+        )
+    return timings
+
+
+def _child_env(**extra: str) -> Dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+    env.update(extra)
+    return env
+
+
+def import_time_report(module: str = "src.app", *, top: int = 15) -> Dict[str, Any]:
+    """
+    Import ``module`` in a fresh interpreter under ``-X importtime``.
+
+    Returns:
+        Dict with the import wall time, the ``top`` slowest modules by cumulative
+        and by self time, and which of ``HEAVY_MODULES`` were loaded
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _IMPORT_PROBE.format(module=module)],
+        cwd=REPO_ROOT,
+        env=_child_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    probe = json.loads(completed.stdout.strip().splitlines()[-1])
+    timings = parse_importtime(completed.stderr)
+    target = next((timing for timing in timings if timing.module == module and timing.depth == 0), None)
+
+    def rows(key: str) -> List[Dict[str, Any]]:
+        ranked = sorted(timings, key=lambda timing: getattr(timing, key), reverse=True)[:top]
+        return [{"module": timing.module, "ms": round(getattr(timing, key) / 1000.0, 2)} for timing in ranked]
+
+    loaded = set(probe["modules"])
+    return {
+        "module": module,
+        "wall_seconds": round(probe["seconds"], 4),
+        "cumulative_ms": round(target.cumulative_us / 1000.0, 2) if target else None,
+        "modules_imported": len(timings),
+        "top_cumulative": rows("cumulative_us"),
+        "top_self": rows("self_us"),
+        "heavy_modules_loaded": sorted(name for name in HEAVY_MODULES if name in loaded),
+    }
+
+
+def measure_first_paint(size: int = 10, *, seed: int = 42, timeout: float = 120.0) -> Dict[str, Any]:
+    """
+    Boot a fresh interpreter, run the app once and time launch → first paint.
+
+    The first element is recorded where Streamlit enqueues it for the browser.
+    The first run includes the initial refresh of a ``size``-instance synthetic
+    fleet (empty cache root); ``rerun_seconds`` is the following rerun that
+    reads the published snapshot.
+    """
+    code = _FIRST_PAINT_CHILD.format(size=int(size), seed=int(seed), app=str(APP_PATH), timeout=float(timeout))
+    with tempfile.TemporaryDirectory(prefix="finops-startup-") as tmp:
+        launched = time.time()
+        completed = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=REPO_ROOT,
+            env=_child_env(CACHE_ROOT=tmp),
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=timeout * 2,
+        )
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    return {
+        "instances": size,
+        "boot_to_first_paint_seconds": round(result["painted_at"] - launched, 4),
+        "boot_to_first_render_seconds": round(result["completed_at"] - launched, 4),
+        "first_run_seconds": round(result["first_run_seconds"], 4),
+        "rerun_seconds": round(result["rerun_seconds"], 4),
+        "exceptions": result["exceptions"],
+    }
+
+
+def run_startup(*, size: int = 10, seed: int = 42, top: int = 15) -> Dict[str, Any]:
+    """Import-time report plus first-paint measurement (the ``startup`` section of ``benchmarks.run``)."""
+    return {"imports": import_time_report(top=top), "first_paint": measure_first_paint(size, seed=seed)}
+
+
+def format_report(report: Dict[str, Any]) -> List[str]:
+    imports, paint = report["imports"], report["first_paint"]
+    heavy = ", ".join(imports["heavy_modules_loaded"]) or "none"
+    lines = [
+        f"import {imports['module']}: {imports['wall_seconds'] * 1000:.0f} ms "
+        f"({imports['modules_imported']} modules, heavy: {heavy})",
+        "slowest imports (cumulative):",
+    ]
+    lines += [f"  {row['ms']:>9.1f} ms  {row['module']}" for row in imports["top_cumulative"]]
+    lines.append(
+        f"boot → first paint: {paint['boot_to_first_paint_seconds']:.2f}s, first render "
+        f"({paint['instances']} instances): {paint['boot_to_first_render_seconds']:.2f}s, rerun {paint['rerun_seconds']:.2f}s, exceptions {paint['exceptions']}"
+    )
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Dashboard import-time report and boot-to-first-paint benchmark")
+    parser.add_argument("--size", type=int, default=10, help="Synthetic fleet size for the first paint")
+    parser.add_argument("--seed", type=int, default=42, help="Synthetic fleet seed")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest modules to list")
+    parser.add_argument("--output", type=Path, default=None, help="Optional JSON report path")
+    args = parser.parse_args(argv)
+
+    report = run_startup(size=args.size, seed=args.seed, top=args.top)
+    for line in format_report(report):
+        print(line)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Report written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
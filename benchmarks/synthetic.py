@@ -0,0 +1,315 @@
+"""
+Synthetic infrastructure gateway for fleet-scale benchmarks.
+
+``SyntheticGateway`` implements the surface of
+``src.infrastructure.gateways.InfrastructureGateway`` that the orchestrator
+uses, without any network access. Every value is derived from a seeded RNG,
+so a given ``(instances, seed)`` pair always produces the same fleet:
+
+- EC2 instances with a mix of instance types, running/stopped states and
+  launch times between 10 and 120 days ago
+- CloudTrail start/stop churn: always-on, office-hours and random-churn
+  instances
+- Hourly CloudWatch CPU modeled on the ``terraform/user-data/cpu-*.sh`` load
+  shapes (constant 40/60/80 % with stress-ng duty cycles, 30/70 % alternating)
+- A diurnal ElectricityMaps carbon intensity curve and static pricing
+"""
+
+from __future__ import annotations
+
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.domain.models import AWSCostData, CarbonIntensity, PowerConsumption
+
+HOUR = timedelta(hours=1)
+
+# instance type → (avg power watts, on-demand USD/hour)
+INSTANCE_TYPES: Dict[str, Tuple[float, float]] = {
+    "t3.micro": (3.4, 0.012),
+    "t3.small": (4.6, 0.024),
+    "t3.medium": (7.1, 0.048),
+    "t3.large": (10.9, 0.096),
+    "m5.large": (14.2, 0.115),
+    "m5.xlarge": (26.8, 0.230),
+    "c5.xlarge": (24.1, 0.194),
+    "r5.large": (16.5, 0.152),
+}
+
+# CPU load shapes from terraform/user-data: (mean hourly CPU %, hourly jitter)
+# stress-ng runs 300 s on / 10 s sleep (constant) or 2 × (600 s + 30 s) (variable)
+CPU_PROFILES: Dict[str, Tuple[float, float]] = {
+    "cpu-40pct": (40.0 * 300 / 310, 1.5),
+    "cpu-60pct": (60.0 * 300 / 310, 1.5),
+    "cpu-80pct": (80.0 * 300 / 310, 1.5),
+    "cpu-variable": (50.0 * 1200 / 1260, 6.0),
+}
+
+RUNTIME_PATTERNS = ("always_on", "office_hours", "churn")
+
+
+@dataclass(frozen=True)
+class SyntheticInstance:
+    """Generated instance with its running intervals and load profile."""
+
+    instance_id: str
+    instance_type: str
+    state: str
+    launch_time: datetime
+    cpu_profile: str
+    runtime_pattern: str
+    intervals: Tuple[Tuple[datetime, datetime], ...]
+
+
+def _office_hours_intervals(start: datetime, end: datetime) -> List[Tuple[datetime, datetime]]:
+    intervals = []
+    day = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    while day < end:
+        if day.weekday() < 5:
+            on, off = day + timedelta(hours=7), day + timedelta(hours=19)
+            if off > start and on < end:
+                intervals.append((max(on, start), min(off, end)))
+        day += timedelta(days=1)
+    return intervals
+
+
+def _churn_intervals(rng: np.random.Generator, start: datetime, end: datetime) -> List[Tuple[datetime, datetime]]:
+    intervals = []
+    cursor = start + timedelta(minutes=float(rng.uniform(0, 720)))
+    while cursor < end:
+        stop = cursor + timedelta(minutes=float(rng.uniform(30, 36 * 60)))
+        intervals.append((cursor, min(stop, end)))
+        cursor = stop + timedelta(minutes=float(rng.uniform(30, 24 * 60)))
+    return intervals
+
+
+class SyntheticFleet:
+    """Deterministic fleet of ``size`` instances over the last ``history_days`` days."""
+
+    def __init__(self, size: int, *, seed: int = 42, history_days: int = 35, now: Optional[datetime] = None) -> None:
+        self.now = (now or datetime.now(timezone.utc)).replace(microsecond=0)
+        self.history_start = self.now - timedelta(days=history_days)
+        rng = np.random.default_rng(seed)
+        types = list(INSTANCE_TYPES)
+        profiles = list(CPU_PROFILES)
+
+        self.instances: Dict[str, SyntheticInstance] = {}
+        for index in range(size):
+            instance_id = f"i-{seed:04x}{index:012x}"
+            pattern = RUNTIME_PATTERNS[int(rng.choice(3, p=[0.5, 0.3, 0.2]))]
+            launch_time = self.now - timedelta(days=float(rng.uniform(10, 120)))
+            window_start = max(launch_time, self.history_start)
+
+            if pattern == "always_on":
+                intervals = [(window_start, self.now)]
+            elif pattern == "office_hours":
+                intervals = _office_hours_intervals(window_start, self.now)
+            else:
+                intervals = _churn_intervals(rng, window_start, self.now)
+
+            running = bool(intervals) and intervals[-1][1] >= self.now
+            self.instances[instance_id] = SyntheticInstance(
+                instance_id=instance_id,
+                instance_type=types[int(rng.integers(len(types)))],
+                state="running" if running else "stopped",
+                launch_time=launch_time,
+                cpu_profile=profiles[int(rng.integers(len(profiles)))],
+                runtime_pattern=pattern,
+                intervals=tuple(intervals),
+            )
+
+    def __len__(self) -> int:
+        return len(self.instances)
+
+
+class SyntheticGateway:
+    """Offline stand-in for ``InfrastructureGateway`` backed by a ``SyntheticFleet``."""
+
+    def __init__(self, fleet: SyntheticFleet, *, seed: int = 42) -> None:
+        self.fleet = fleet
+        self._seed = seed
+        self.calls: Dict[str, int] = {}
+
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    # ElectricityMaps -----------------------------------------------------
+
+    @staticmethod
+    def _intensity(timestamp: datetime) -> float:
+        """Diurnal grid mix: evening peak around 20:00, solar dip between 06:00 and 18:00."""
+        hour = timestamp.hour + timestamp.minute / 60.0
+        evening_peak = 90.0 * np.cos(2 * np.pi * (hour - 20.0) / 24.0)
+        solar_dip = 60.0 * max(0.0, float(np.sin(np.pi * (hour - 6.0) / 12.0)))
+        return round(380.0 + evening_peak - solar_dip, 1)
+
+    def _history(self, start: datetime, end: datetime) -> List[Dict]:
+        cursor = start.replace(minute=0, second=0, microsecond=0)
+        history = []
+        while cursor < end:
+            history.append({"datetime": cursor.isoformat(), "carbonIntensity": self._intensity(cursor)})
+            cursor += HOUR
+        return history
+
+    def get_current_carbon_intensity(self, region: str) -> Optional[CarbonIntensity]:
+        self._count("get_current_carbon_intensity")
+        return CarbonIntensity(
+            value=self._intensity(self.fleet.now),
+            timestamp=self.fleet.now,
+            region=region,
+            source="synthetic",
+            fetched_at=self.fleet.now,
+        )
+
+    def get_carbon_intensity_24h(self, region: str) -> Optional[List[Dict]]:
+        self._count("get_carbon_intensity_24h")
+        return self._history(self.fleet.now - timedelta(hours=24), self.fleet.now)
+
+    def get_carbon_intensity_range(self, region: str, start: datetime, end: datetime) -> Optional[List[Dict]]:
+        self._count("get_carbon_intensity_range")
+        return self._history(start, end)
+
+    def get_self_collected_24h_data(self, region: str) -> Optional[List[Dict]]:
+        self._count("get_self_collected_24h_data")
+        return []
+
+    # Boavizta ------------------------------------------------------------
+
+    def get_power_consumption(self, instance_type: str) -> Optional[PowerConsumption]:
+        self._count("get_power_consumption")
+        if instance_type not in INSTANCE_TYPES:
+            return None
+        avg = INSTANCE_TYPES[instance_type][0]
+        return PowerConsumption(
+            avg_power_watts=avg,
+            min_power_watts=round(avg * 0.6, 2),
+            max_power_watts=round(avg * 1.8, 2),
+            confidence_level="high",
+            source="synthetic",
+        )
+
+    # AWS: Cost & Pricing -------------------------------------------------
+
+    def get_instance_pricing(self, instance_type: str, region: str) -> Optional[float]:
+        self._count("get_instance_pricing")
+        entry = INSTANCE_TYPES.get(instance_type)
+        return entry[1] if entry else None
+
+    def get_costs(self, region: str, period_days: int = 30) -> Optional[AWSCostData]:
+        self._count("get_costs")
+        start = self.fleet.now - timedelta(days=period_days)
+        total = 0.0
+        for instance in self.fleet.instances.values():
+            hours = sum(
+                (min(end, self.fleet.now) - max(begin, start)).total_seconds() / 3600.0
+                for begin, end in instance.intervals
+                if end > start
+            )
+            total += hours * INSTANCE_TYPES[instance.instance_type][1]
+        return AWSCostData(
+            monthly_cost_usd=round(total, 2),
+            service_costs={"Amazon Elastic Compute Cloud - Compute": round(total, 2)},
+            region=region,
+            source="synthetic",
+            fetched_at=self.fleet.now,
+        )
+
+    def get_hourly_costs(self, hours: int, region: str) -> List[Dict]:
+        self._count("get_hourly_costs")
+        return []
+
+    # AWS: Runtime (EC2, CloudTrail, CloudWatch) --------------------------
+
+    def list_instances(self, region: str) -> List[Dict]:
+        self._count("list_instances")
+        return [
+            {
+                "instance_id": instance.instance_id,
+                "instance_type": instance.instance_type,
+                "state": instance.state,
+                "region": region,
+                "instance_name": f"synthetic-{instance.cpu_profile}-{instance.runtime_pattern}",
+                "launch_time": instance.launch_time,
+                "state_transition_reason": "",
+            }
+            for instance in self.fleet.instances.values()
+        ]
+
+    def lookup_instance_events(
+        self,
+        *,
+        instance_id: str,
+        region: str,
+        lookup_start: datetime,
+        lookup_end: datetime,
+    ) -> List[Dict]:
+        self._count("lookup_instance_events")
+        instance = self.fleet.instances.get(instance_id)
+        if instance is None:
+            return []
+
+        events = []
+        resources = [{"ResourceType": "AWS::EC2::Instance", "ResourceName": instance_id}]
+        for position, (start, end) in enumerate(instance.intervals):
+            start_name = "RunInstances" if position == 0 and start <= instance.launch_time + HOUR else "StartInstances"
+            if lookup_start <= start <= lookup_end:
+                events.append({"EventName": start_name, "EventTime": start, "Resources": resources})
+            if end < self.fleet.now and lookup_start <= end <= lookup_end:
+                events.append({"EventName": "StopInstances", "EventTime": end, "Resources": resources})
+        # CloudTrail LookupEvents returns newest first
+        events.sort(key=lambda event: event["EventTime"], reverse=True)
+        return events
+
+    def fetch_cpu_metrics(
+        self,
+        *,
+        instance_id: str,
+        region: str,
+        start_time: datetime,
+        end_time: datetime,
+    ) -> List[Dict]:
+        self._count("fetch_cpu_metrics")
+        instance = self.fleet.instances.get(instance_id)
+        if instance is None:
+            return []
+
+        hours = int((end_time - start_time) / HOUR)
+        slot_edges = [start_time + HOUR * index for index in range(hours + 1)]
+        running = np.zeros(hours, dtype=bool)
+        for begin, end in instance.intervals:
+            first = max(0, int((begin - start_time) // HOUR))
+            last = min(hours, int(np.ceil((end - start_time) / HOUR)))
+            running[first:last] = True
+
+        mean, jitter = CPU_PROFILES[instance.cpu_profile]
+        rng = np.random.default_rng(zlib.crc32(f"{self._seed}:{instance_id}:{start_time.timestamp()}".encode()))
+        values = np.clip(rng.normal(mean, jitter, hours), 0.0, 100.0)
+
+        timestamps = [slot_edges[index] for index in np.flatnonzero(running)]
+        if not timestamps:
+            return []
+        return [{"Id": "cpu_utilization", "Values": np.round(values[running], 2).tolist(), "Timestamps": timestamps}]
+
+    def get_cached_launch_time(self, instance_id: str, region: str) -> Optional[datetime]:
+        self._count("get_cached_launch_time")
+        instance = self.fleet.instances.get(instance_id)
+        return instance.launch_time if instance else None
+
+
+def create_synthetic_gateway(size: int, *, seed: int = 42, history_days: int = 35) -> SyntheticGateway:
+    """Build a gateway over a fresh ``SyntheticFleet`` of ``size`` instances."""
+    return SyntheticGateway(SyntheticFleet(size, seed=seed, history_days=history_days), seed=seed)
+
+
+__all__ = [
+    "CPU_PROFILES",
+    "INSTANCE_TYPES",
+    "SyntheticFleet",
+    "SyntheticGateway",
+    "SyntheticInstance",
+    "create_synthetic_gateway",
+]
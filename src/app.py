@@ -7,6 +7,7 @@ Clean, professional implementation without overengineering.
 """
 
 import os
+import time
 import streamlit as st
 import logging
 from datetime import datetime
@@ -33,25 +34,36 @@ for _logger_name in _NOISY_AWS_LOGGERS:
     noisy_logger.setLevel(logging.CRITICAL)
     noisy_logger.propagate = False
 
-# Import our modules
+# Import our modules. The orchestrator (pandas, pydantic settings, AWS SDK) and the
+# pages (pandas, plotly) are imported where first used so the sidebar paints first.
 from src.domain.constants import UIConstants
-from src.application.orchestrator import DashboardDataOrchestrator
+from src.application.snapshots import DashboardSnapshot, SnapshotRefresher
 from src.domain.models import DashboardData
-from src.presentation import render_overview_page, render_infrastructure_page
 
 
 # Initialize data orchestrator (lazy loading)
 @st.cache_resource
 def get_data_orchestrator():
     """Get cached data orchestrator instance"""
+    from src.application.orchestrator import DashboardDataOrchestrator
+
     return DashboardDataOrchestrator()
 
 
-data_processor = get_data_orchestrator()
+# One refresher thread per process; sessions only read its snapshots
+@st.cache_resource
+def get_snapshot_refresher() -> SnapshotRefresher:
+    """Get the process-wide background snapshot refresher"""
+    return SnapshotRefresher(
+        get_data_orchestrator(), interval_seconds=UIConstants.STREAMLIT_CACHE_TTL_SECONDS
+    ).start()
+
+
+# Minimum seconds between progressive re-renders while instances are enriched
+_PROGRESS_RENDER_INTERVAL_SECONDS = 0.5
 
-_CACHE_KEY = "dashboard_data_cache"
-_CACHE_TIMESTAMP_KEY = "dashboard_data_cache_timestamp"
-_CACHE_TTL_SECONDS = UIConstants.STREAMLIT_CACHE_TTL_SECONDS
+# Longest a page load waits for the first snapshot of a period before showing an error
+_FIRST_SNAPSHOT_TIMEOUT_SECONDS = 180.0
 
 # Page configuration
 st.set_page_config(
@@ -95,64 +107,76 @@ def load_custom_css() -> None:
         logger.error(f"File system error loading CSS: {e} - using default Streamlit styles")
 
 
-def _clear_dashboard_cache() -> None:
-    """Remove cached dashboard data from session state."""
-    st.session_state.pop(_CACHE_KEY, None)
-    st.session_state.pop(_CACHE_TIMESTAMP_KEY, None)
-
-
-def _get_cached_dashboard_data() -> tuple[Optional[DashboardData], Optional[datetime]]:
-    """Retrieve cached dashboard data and its timestamp."""
-    cached_data = st.session_state.get(_CACHE_KEY)
-    cached_at = st.session_state.get(_CACHE_TIMESTAMP_KEY)
-    if cached_at is not None and not isinstance(cached_at, datetime):
-        # Clean up unexpected types to prevent timedelta errors
-        cached_at = None
-    return cached_data, cached_at
+def _wait_for_first_snapshot(period_days: int) -> Optional[DashboardSnapshot]:
+    """
+    Wait for the first snapshot of a period, rendering the refresher's partial totals meanwhile.
 
+    Gives up once the refresh has failed or ``_FIRST_SNAPSHOT_TIMEOUT_SECONDS``
+    have passed; the caller then renders an error response.
+    """
+    from src.presentation.components import render_refresh_progress
 
-def _cache_dashboard_data(data: Optional[DashboardData]) -> None:
-    """Persist dashboard data and timestamp in session state."""
-    st.session_state[_CACHE_KEY] = data
-    st.session_state[_CACHE_TIMESTAMP_KEY] = datetime.now()
+    snapshot_refresher = get_snapshot_refresher()
+    placeholder = st.empty()
+    placeholder.info("⏳ Loading carbon intensity, costs and EC2 instances…")
+    deadline = time.monotonic() + _FIRST_SNAPSHOT_TIMEOUT_SECONDS
+    snapshot = None
+    try:
+        while snapshot is None:
+            snapshot = snapshot_refresher.wait(period_days, timeout=_PROGRESS_RENDER_INTERVAL_SECONDS)
+            if snapshot is None and (
+                snapshot_refresher.last_error(period_days) is not None or time.monotonic() >= deadline
+            ):
+                break
+            progress = snapshot_refresher.progress(period_days)
+            if snapshot is None and progress is not None and not progress.done:
+                with placeholder.container():
+                    render_refresh_progress(progress)
+    finally:
+        placeholder.empty()
+    return snapshot
+
+
+def _refresh_error_response(period_days: int) -> DashboardData:
+    """Error response for a period whose first refresh failed or timed out (retried in the background)."""
+    failure = get_snapshot_refresher().last_error(period_days)
+    if failure is not None:
+        message = f"{failure.message} (retrying in {failure.retry_in_seconds:.0f}s)"
+    else:
+        message = f"No data after {_FIRST_SNAPSHOT_TIMEOUT_SECONDS:.0f}s - the refresh continues in the background"
+    st.error(f"❌ Loading {period_days}d data failed: {message}")
+    return get_data_orchestrator().error_use_case.create_empty_response(message, period_days)
 
 
 def load_infrastructure_data(force_refresh: bool = False, period_days: int = 30) -> Optional[DashboardData]:
     """
-    Load infrastructure data with manual TTL caching and specific error handling.
+    Read the latest shared dashboard snapshot of the analysis period.
+
+    All sessions read the same immutable snapshot, which the process-wide
+    background refresher replaces every ``STREAMLIT_CACHE_TTL_SECONDS``. Only
+    the very first load of a period waits for AWS; it shows running totals and
+    the latest enriched instances while the fleet is processed. After a restart
+    the last persisted snapshot is shown at once with a "data as of" marker.
 
     Args:
-        force_refresh: If True, bypass cache and fetch fresh data
+        force_refresh: If True, queue an immediate refresh bypassing the API caches
         period_days: Analysis period in days (1, 7, or 30)
 
     Returns:
         DashboardData object with instances, metrics, and API status, or None on error
     """
+    snapshot_refresher = get_snapshot_refresher()
     if force_refresh:
-        _clear_dashboard_cache()
+        snapshot_refresher.request_refresh(period_days, force=True)
 
-    cached_data, cached_at = _get_cached_dashboard_data()
-    if not force_refresh and cached_data is not None and cached_at is not None:
-        age_seconds = (datetime.now() - cached_at).total_seconds()
-        if age_seconds < _CACHE_TTL_SECONDS:
-            # Check if cached data has same period
-            if getattr(cached_data, "analysis_period_days", 30) == period_days:
-                return cached_data
-
-    try:
-        with st.spinner("Loading infrastructure data..."):
-            dashboard_data = data_processor.get_infrastructure_data(force_refresh=force_refresh, period_days=period_days)
-        _cache_dashboard_data(dashboard_data)
-        return dashboard_data
-    except (ConnectionError, TimeoutError) as e:
-        logger.error(f"Network error loading infrastructure data: {e}")
-        return cached_data if cached_data is not None else None
-    except (ImportError, AttributeError) as e:
-        logger.error(f"Module/attribute error in data processor: {e}")
-        return cached_data if cached_data is not None else None
-    except (RuntimeError, ValueError) as e:
-        logger.error(f"Runtime/value error in data processor: {e}")
-        return cached_data if cached_data is not None else None
+    snapshot = snapshot_refresher.latest(period_days)
+    if snapshot is None:
+        snapshot = _wait_for_first_snapshot(period_days)
+        if snapshot is None:
+            return _refresh_error_response(period_days)
+    elif snapshot.restored or snapshot_refresher.is_refreshing(period_days):
+        st.caption(f"🕒 Data as of {snapshot.refreshed_at:%Y-%m-%d %H:%M} · refreshing in the background…")
+    return snapshot.data if snapshot is not None else None
 
 
 def main() -> None:
@@ -212,8 +236,6 @@ def main() -> None:
     # Store in session state for cross-component access
     if "analysis_period_days" not in st.session_state or st.session_state["analysis_period_days"] != period_days:
         st.session_state["analysis_period_days"] = period_days
-        # Clear cache when period changes
-        _clear_dashboard_cache()
 
     if "force_refresh" not in st.session_state:
         st.session_state["force_refresh"] = False
@@ -246,7 +268,6 @@ def main() -> None:
         if st.sidebar.button("🔄 Refresh data", width="stretch"):
             st.session_state["refresh_count"] += 1
             st.session_state["force_refresh"] = True
-            _clear_dashboard_cache()
             st.sidebar.success(f"Refreshing API data… ({st.session_state['refresh_count']}/5 in 10min)")
 
     # Simplified navigation menu - core features only
@@ -307,8 +328,12 @@ def main() -> None:
     # Render selected page with specific error handling
     try:
         if page == "Dashboard Overview":
+            from src.presentation import render_overview_page
+
             render_overview_page(dashboard_data)
         elif page == "Infrastructure Details":
+            from src.presentation import render_infrastructure_page
+
             render_infrastructure_page(dashboard_data)
 
     except (AttributeError, KeyError) as e:
@@ -323,7 +348,8 @@ def main() -> None:
 
     # Footer
     st.sidebar.markdown("---")
-    st.sidebar.caption(f"Last updated: {datetime.now().strftime('%H:%M:%S')}")
+    refreshed_at = getattr(dashboard_data, "data_freshness", None) or datetime.now()
+    st.sidebar.caption(f"Last updated: {refreshed_at.strftime('%H:%M:%S')}")
     st.sidebar.caption("Bachelor Thesis Project 2025")
 
 
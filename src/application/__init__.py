@@ -1,12 +1,36 @@
 """
 Core Business Logic for Carbon-Aware FinOps Dashboard
 Modular architecture for maintainability and testing
+
+Exports are resolved on first access (PEP 562) so that importing
+``src.application.snapshots`` does not pull in the orchestrator and, through
+it, pandas, pydantic settings and the AWS SDK.
 """
 
-from .orchestrator import DashboardDataOrchestrator
-from .calculator import BusinessCaseCalculator
+from importlib import import_module
+
+_LAZY_EXPORTS = {
+    "DashboardDataOrchestrator": ".orchestrator",
+    "BusinessCaseCalculator": ".calculator",
+    "DashboardSnapshot": ".snapshots",
+    "RefreshFailure": ".snapshots",
+    "SnapshotRefresher": ".snapshots",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "DashboardDataOrchestrator",
     "BusinessCaseCalculator",
+    "DashboardSnapshot",
+    "RefreshFailure",
+    "SnapshotRefresher",
 ]
@@ -9,6 +9,7 @@ from datetime import datetime
 
 from src.domain.models import EC2Instance, AWSCostData, BusinessCase
 from src.domain.constants import AcademicConstants
+from src.domain.uncertainty import DEFAULT_SAMPLES, UncertaintyInputs, simulate_business_case_uncertainty
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +22,12 @@ class BusinessCaseCalculator:
         logger.info("✅ Business Case Calculator initialized")
 
     def calculate_business_case(
-        self, baseline_cost: float, baseline_co2: float, validation_factor: float = 1.0
+        self,
+        baseline_cost: float,
+        baseline_co2: float,
+        validation_factor: float = 1.0,
+        uncertainty: Optional[UncertaintyInputs] = None,
+        samples: int = DEFAULT_SAMPLES,
     ) -> BusinessCase:
         """Calculate business case scenarios with dynamic factors based on validation and data quality
 
@@ -29,6 +35,9 @@ class BusinessCaseCalculator:
             baseline_cost: Current monthly cost in EUR
             baseline_co2: Current monthly CO2 emissions in kg
             validation_factor: Cost validation factor from AWS Cost Explorer comparison
+            uncertainty: Per-instance inputs for Monte Carlo savings bands; without
+                them the literature ±15% confidence interval is reported
+            samples: Monte Carlo samples (0 disables the simulation)
         """
 
         # Normalise negative inputs (defensive programming for academic metrics)
@@ -84,6 +93,26 @@ class BusinessCaseCalculator:
         )
         logger.info(f"   🚀 Moderate Scenario: {scenario_b_factor:.1%} reduction → €{scenario_b_cost_reduction:.2f}")
 
+        # Monte Carlo bands: savings factor spans the conservative → moderate scenario
+        confidence_interval = 0.15
+        cost_band = co2_band = None
+        if uncertainty is not None and len(uncertainty) and samples > 0 and baseline_cost > 0:
+            result = simulate_business_case_uncertainty(
+                uncertainty,
+                savings_factor_range=(scenario_a_factor, scenario_b_factor),
+                samples=samples,
+                baseline_cost_eur=baseline_cost,
+                baseline_co2_kg=baseline_co2,
+                seed=0,
+            )
+            cost_band = result.band("cost_savings_eur")
+            co2_band = result.band("co2_savings_kg")
+            confidence_interval = round(result.relative_half_width("cost_savings_eur"), 4)
+            logger.info(
+                f"   🎲 Monte Carlo ({samples} samples): savings €{cost_band[0]:.2f}–€{cost_band[-1]:.2f} "
+                f"(±{confidence_interval:.0%})"
+            )
+
         return BusinessCase(
             baseline_cost_eur=baseline_cost,
             baseline_co2_kg=baseline_co2,
@@ -93,10 +122,12 @@ class BusinessCaseCalculator:
             office_hours_co2_reduction_kg=scenario_a_co2_reduction,
             carbon_aware_co2_reduction_kg=scenario_b_co2_reduction,
             integrated_co2_reduction_kg=integrated_co2_reduction,
-            confidence_interval=0.15,
+            confidence_interval=confidence_interval,
             methodology="INTEGRATION_EXCELLENCE",
             validation_status=f"Cost validation factor: {validation_factor:.2f}",
             source_notes="Factors derived from McKinsey [7] cost studies and MIT carbon-aware scheduling [20]",
+            cost_savings_band_eur=cost_band,
+            co2_savings_band_kg=co2_band,
         )
 
     def calculate_cloudtrail_enhanced_accuracy(
@@ -11,18 +11,11 @@ Pattern: Dependency Inversion
 """
 
 import logging
-from typing import Optional
-from botocore.exceptions import (
-    ClientError,
-    NoCredentialsError,
-    SSOError,
-    TokenRetrievalError,
-    UnauthorizedSSOTokenError,
-)
+from typing import Iterator, Optional
 
 from src.config import settings
 from src.domain.errors import AWSAuthenticationError, ErrorMessages
-from src.domain.models import DashboardData
+from src.domain.models import CarbonIntensity, DashboardData, RefreshProgress
 from src.application.calculator import BusinessCaseCalculator
 from src.domain.services import (
     RuntimeService,
@@ -32,6 +25,7 @@ from src.domain.services import (
 )
 from src.infrastructure.cache import FileCacheRepository
 from src.infrastructure.gateways import InfrastructureGateway, create_default_gateway
+from src.infrastructure.snapshot_store import DashboardSnapshotStore, StoredSnapshot
 
 # Import all use cases
 from src.application.use_cases import (
@@ -59,6 +53,8 @@ class DashboardDataOrchestrator:
         calculator: Optional[BusinessCaseCalculator] = None,
         repository: Optional[FileCacheRepository] = None,
         gateway: Optional[InfrastructureGateway] = None,
+        persist_snapshots: bool = True,
+        region: Optional[str] = None,
     ):
         """
         Initialize orchestrator with dependency injection.
@@ -72,9 +68,14 @@ class DashboardDataOrchestrator:
             calculator: Scenario calculations
             repository: Cache repository
             gateway: Infrastructure gateway
+            persist_snapshots: Save successful results for dashboard warm starts
+                (off for batch runs, whose regions would overwrite the dashboard's snapshot)
+            region: AWS region whose grid zone and billing are used for carbon
+                intensity and Cost Explorer (default ``AWS_REGION``)
         """
 
         # Initialize infrastructure dependencies
+        self.region = region or settings.aws_region
         self.repository = repository or FileCacheRepository(settings.cache_root)
         self.gateway = gateway or create_default_gateway(self.repository)
 
@@ -89,6 +90,13 @@ class DashboardDataOrchestrator:
         )
         self.calculator = calculator or BusinessCaseCalculator()
 
+        # Persisted results for warm starts (see load_snapshot)
+        self.snapshot_store: Optional[DashboardSnapshotStore] = (
+            DashboardSnapshotStore(self.repository, history=settings.dashboard_snapshot_history)
+            if persist_snapshots and settings.dashboard_snapshot_history > 0
+            else None
+        )
+
         # Initialize use cases
         self.fetch_use_case = FetchInfrastructureDataUseCase(
             runtime_service=self.runtime_service,
@@ -96,6 +104,7 @@ class DashboardDataOrchestrator:
             calculator=self.calculator,
             gateway=self.gateway,
             repository=self.repository,
+            region=self.region,
         )
 
         self.health_use_case = BuildAPIHealthStatusUseCase()
@@ -125,98 +134,135 @@ class DashboardDataOrchestrator:
         period_days = validate_period_days(period_days, default=30)
         logger.info(f"📊 Starting analysis with {period_days}d period")
 
-        carbon_intensity = None
-
         try:
             # Happy path: delegate to fetch use case
             dashboard_data = self.fetch_use_case.execute(force_refresh=force_refresh, period_days=period_days)
+            return self._complete(dashboard_data)
+        except Exception as error:
+            return self._error_response(error, period_days)
 
-            # Enrich with API health status
-            api_health_status = self.health_use_case.execute(
-                carbon_available=dashboard_data.carbon_intensity is not None,
-                cost_available=dashboard_data.total_cost_average > 0,
-                processed_instances=dashboard_data.instances,
-                api_last_calls=self.fetch_use_case.api_last_calls,
-                aws_auth_issue=False,
-            )
-            dashboard_data.api_health_status = api_health_status
+    def iter_infrastructure_data(
+        self, *, force_refresh: bool = False, period_days: int = 30
+    ) -> Iterator[RefreshProgress]:
+        """
+        Streaming variant of ``get_infrastructure_data`` for progressive rendering.
 
-            logger.info(f"Infrastructure analysis complete: {len(dashboard_data.instances)} instances")
-            return dashboard_data
+        Yields a ``RefreshProgress`` after every enriched instance. The last item
+        always has ``dashboard_data`` set: the complete result with API health
+        status, or the same error response ``get_infrastructure_data`` returns.
 
-        except ValueError as e:
-            # Data validation errors or missing data
-            error_message = str(e)
-            logger.warning(f"Data validation error: {error_message}")
+        Args:
+            force_refresh: Bypass cache and fetch fresh data
+            period_days: Analysis period in days (1, 7, or 30)
+        """
+        from src.presentation.utils import validate_period_days
+        period_days = validate_period_days(period_days, default=30)
+        logger.info(f"📊 Starting streaming analysis with {period_days}d period")
 
-            # Try to preserve carbon intensity if available
-            try:
-                carbon_intensity = self.carbon_service.get_current_intensity(region="eu-central-1")
-            except Exception:
-                pass
+        try:
+            for progress in self.fetch_use_case.iter_execute(force_refresh=force_refresh, period_days=period_days):
+                if progress.done:
+                    self._complete(progress.dashboard_data)
+                yield progress
+        except Exception as error:
+            yield RefreshProgress(period_days=period_days, dashboard_data=self._error_response(error, period_days))
+
+    def _complete(self, dashboard_data: DashboardData) -> DashboardData:
+        """Enrich fetched data with API health status."""
+        api_health_status = self.health_use_case.execute(
+            carbon_available=dashboard_data.carbon_intensity is not None,
+            cost_available=dashboard_data.total_cost_average > 0,
+            processed_instances=dashboard_data.instances,
+            api_last_calls=self.fetch_use_case.api_last_calls,
+            aws_auth_issue=False,
+        )
+        dashboard_data.api_health_status = api_health_status
 
-            if carbon_intensity:
-                return self.error_use_case.create_minimal_response(carbon_intensity, error_message, period_days)
-            else:
-                return self.error_use_case.create_empty_response(error_message, period_days)
+        logger.info(f"Infrastructure analysis complete: {len(dashboard_data.instances)} instances")
+        if self.snapshot_store is not None and dashboard_data.instances:
+            self.snapshot_store.save(dashboard_data)
+        return dashboard_data
 
-        except (
+    def load_snapshot(self, period_days: int = 30) -> Optional[StoredSnapshot]:
+        """
+        Last successful result persisted for the period (e.g. before a restart).
+
+        Returns:
+            StoredSnapshot with ``saved_at`` and ``data``, or None if nothing usable is stored
+        """
+        if self.snapshot_store is None:
+            return None
+        return self.snapshot_store.latest(period_days)
+
+    def _current_intensity_or_none(self) -> Optional[CarbonIntensity]:
+        """Try to preserve carbon intensity for error responses."""
+        try:
+            return self.carbon_service.get_current_intensity(region=self.region)
+        except Exception:
+            return None
+
+    def _error_response(self, error: Exception, period_days: int) -> Optional[DashboardData]:
+        """Map a failed refresh to the matching error response."""
+        # Deferred: botocore is only needed once a refresh has actually failed
+        from botocore.exceptions import (
+            ClientError,
             NoCredentialsError,
             SSOError,
-            UnauthorizedSSOTokenError,
             TokenRetrievalError,
-            AWSAuthenticationError,
-        ) as auth_error:
-            # AWS authentication errors
-            logger.error("AWS authentication error: %s", auth_error)
+            UnauthorizedSSOTokenError,
+        )
 
-            # Try to preserve carbon intensity
-            try:
-                carbon_intensity = self.carbon_service.get_current_intensity(region="eu-central-1")
-            except Exception:
-                pass
+        if isinstance(error, ValueError):
+            # Data validation errors or missing data
+            error_message = str(error)
+            logger.warning(f"Data validation error: {error_message}")
 
+            carbon_intensity = self._current_intensity_or_none()
+            if carbon_intensity:
+                return self.error_use_case.create_minimal_response(carbon_intensity, error_message, period_days)
+            return self.error_use_case.create_empty_response(error_message, period_days)
+
+        if isinstance(
+            error,
+            (NoCredentialsError, SSOError, UnauthorizedSSOTokenError, TokenRetrievalError, AWSAuthenticationError),
+        ):
+            # AWS authentication errors
+            logger.error("AWS authentication error: %s", error)
+            carbon_intensity = self._current_intensity_or_none()
             return self.error_use_case.create_auth_error_response(carbon_intensity, ErrorMessages.AWS_SSO_EXPIRED, period_days)
 
-        except ClientError as client_error:
+        if isinstance(error, ClientError):
             # AWS client errors
-            logger.error("AWS client error: %s", client_error)
+            logger.error("AWS client error: %s", error)
             message = (
-                client_error.response.get("Error", {}).get("Message")
-                if hasattr(client_error, "response")
-                else str(client_error)
+                error.response.get("Error", {}).get("Message")
+                if hasattr(error, "response")
+                else str(error)
             )
-
-            # Try to preserve carbon intensity
-            try:
-                carbon_intensity = self.carbon_service.get_current_intensity(region="eu-central-1")
-            except Exception:
-                pass
-
+            carbon_intensity = self._current_intensity_or_none()
             return self.error_use_case.create_minimal_response(carbon_intensity, message or "AWS client error occurred", period_days)
 
-        except (TypeError, KeyError) as e:
+        if isinstance(error, (TypeError, KeyError)):
             # Data type/structure errors
-            logger.error(f"Data type error: {e}")
-            return self.error_use_case.create_empty_response(f"Data type error: {str(e)}", period_days)
+            logger.error(f"Data type error: {error}")
+            return self.error_use_case.create_empty_response(f"Data type error: {str(error)}", period_days)
 
-        except (AttributeError, ImportError) as e:
+        if isinstance(error, (AttributeError, ImportError)):
             # Module/attribute errors
-            logger.error(f"Module/attribute error: {e}", exc_info=True)
-            return self.error_use_case.create_empty_response(f"Module error: {str(e)}", period_days)
+            logger.error(f"Module/attribute error: {error}", exc_info=error)
+            return self.error_use_case.create_empty_response(f"Module error: {str(error)}", period_days)
 
-        except (ConnectionError, TimeoutError) as e:
+        if isinstance(error, (ConnectionError, TimeoutError)):
             # Network/API errors
-            logger.error(f"Network/API error: {e}")
-            return self.error_use_case.create_empty_response(f"Network error: {str(e)}", period_days)
+            logger.error(f"Network/API error: {error}")
+            return self.error_use_case.create_empty_response(f"Network error: {str(error)}", period_days)
 
-        except Exception as e:
-            # Unexpected errors
-            logger.error(f"Unexpected error: {e}", exc_info=True)
-            return self.error_use_case.create_empty_response(f"Unexpected error: {str(e)}", period_days)
+        # Unexpected errors
+        logger.error(f"Unexpected error: {error}", exc_info=error)
+        return self.error_use_case.create_empty_response(f"Unexpected error: {str(error)}", period_days)
 
     # All specialized functionality now properly delegated to use cases:
-    # - FetchInfrastructureDataUseCase: Main workflow
+    # - FetchInfrastructureDataUseCase: Main workflow (batch and streaming)
     # - EnrichInstanceUseCase: Single instance enrichment
     # - BuildAPIHealthStatusUseCase: API health monitoring
     # - CreateErrorResponseUseCase: Error response factory
@@ -0,0 +1,300 @@
+"""
+Process-wide dashboard snapshots with a background refresher.
+
+Streamlit sessions used to keep their own ``DashboardData`` in
+``st.session_state`` and each triggered its own refresh. ``SnapshotRefresher``
+is created once per process (``st.cache_resource``) and owns a single daemon
+thread that refreshes every analysis period viewers asked for on a schedule.
+Sessions only read the latest ``DashboardSnapshot``; a snapshot is never
+mutated after publication, it is replaced as a whole, so memory stays
+constant as viewers are added and page loads never wait for AWS once a
+snapshot exists. After a restart, the first ``latest()`` of a period restores
+the orchestrator's persisted snapshot (``restored=True``) and queues a fresh
+refresh behind it. A failed refresh is recorded (``last_error()``) and retried
+with exponential backoff instead of immediately.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Set
+
+from src.domain.models import DashboardData, RefreshProgress
+
+logger = logging.getLogger(__name__)
+
+# Periods not viewed for this many refresh intervals are no longer refreshed
+IDLE_INTERVALS = 3
+
+# First retry after a failed refresh; doubles per consecutive failure, capped at the refresh interval
+RETRY_BASE_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class DashboardSnapshot:
+    """Published result of one background refresh."""
+
+    period_days: int
+    data: DashboardData
+    refreshed_at: datetime
+    duration_seconds: float
+    restored: bool = False
+    """Loaded from the persisted snapshot of an earlier process (see ``DashboardSnapshotStore``)"""
+
+    def age_seconds(self, now: Optional[datetime] = None) -> float:
+        return ((now or datetime.now()) - self.refreshed_at).total_seconds()
+
+
+@dataclass(frozen=True)
+class RefreshFailure:
+    """Most recent failed refresh of a period (cleared by the next successful one)."""
+
+    period_days: int
+    message: str
+    failed_at: datetime
+    attempts: int
+    """Consecutive failures, drives the retry backoff"""
+
+    retry_in_seconds: float
+
+
+class SnapshotRefresher:
+    """
+    Single background thread refreshing one snapshot per analysis period.
+
+    ``latest()`` registers interest in a period; registered periods are
+    refreshed whenever their snapshot is older than ``interval_seconds``.
+    ``request_refresh()`` queues an immediate (optionally forced) refresh.
+    Failed refreshes are retried after ``RETRY_BASE_SECONDS``, doubling per
+    consecutive failure up to ``interval_seconds``.
+    """
+
+    def __init__(self, orchestrator, *, interval_seconds: float = 300.0) -> None:
+        self._orchestrator = orchestrator
+        self._interval = float(interval_seconds)
+        self._condition = threading.Condition()
+        self._snapshots: Dict[int, DashboardSnapshot] = {}
+        self._progress: Dict[int, RefreshProgress] = {}
+        self._viewed: Dict[int, float] = {}
+        self._requested: Dict[int, bool] = {}
+        self._running: Set[int] = set()
+        self._restore_attempted: Set[int] = set()
+        self._failures: Dict[int, RefreshFailure] = {}
+        self._retry_at: Dict[int, float] = {}
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Session API
+    # ------------------------------------------------------------------
+
+    def start(self) -> "SnapshotRefresher":
+        with self._condition:
+            if self._thread is None or not self._thread.is_alive():
+                self._stopped = False
+                self._thread = threading.Thread(target=self._run, name="dashboard-snapshot-refresher", daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def latest(self, period_days: int) -> Optional[DashboardSnapshot]:
+        """Latest published snapshot of the period (``None`` before the first refresh completes)."""
+        self._restore(period_days)
+        with self._condition:
+            if period_days not in self._viewed:
+                self._condition.notify_all()
+            self._viewed[period_days] = time.monotonic()
+            return self._snapshots.get(period_days)
+
+    def progress(self, period_days: int) -> Optional[RefreshProgress]:
+        """Progress of a running refresh of the period, if any (a copy that is never updated)."""
+        with self._condition:
+            return self._progress.get(period_days) if period_days in self._running else None
+
+    def last_error(self, period_days: int) -> Optional[RefreshFailure]:
+        """Failure of the period's most recent refresh, ``None`` once a refresh succeeds."""
+        with self._condition:
+            return self._failures.get(period_days)
+
+    def is_refreshing(self, period_days: int) -> bool:
+        with self._condition:
+            return period_days in self._running or period_days in self._requested
+
+    def request_refresh(self, period_days: int, *, force: bool = False) -> None:
+        """Queue a refresh of the period ahead of the schedule."""
+        with self._condition:
+            self._viewed[period_days] = time.monotonic()
+            self._requested[period_days] = self._requested.get(period_days, False) or force
+            self._condition.notify_all()
+
+    def wait(self, period_days: int, timeout: float) -> Optional[DashboardSnapshot]:
+        """Block up to ``timeout`` seconds for a snapshot of the period; returns early once a refresh failed."""
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            self._viewed[period_days] = time.monotonic()
+            self._condition.notify_all()
+            while period_days not in self._snapshots:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._stopped or period_days in self._failures:
+                    break
+                self._condition.wait(remaining)
+            return self._snapshots.get(period_days)
+
+    def publish(self, snapshot: DashboardSnapshot) -> None:
+        """Make ``snapshot`` the latest of its period (also used to seed snapshots)."""
+        with self._condition:
+            self._snapshots[snapshot.period_days] = snapshot
+            self._condition.notify_all()
+
+    def _restore(self, period_days: int) -> None:
+        """Publish the persisted snapshot of a period once and queue a fresh refresh behind it."""
+        with self._condition:
+            if period_days in self._restore_attempted:
+                return
+            self._restore_attempted.add(period_days)
+
+        load_snapshot = getattr(self._orchestrator, "load_snapshot", None)
+        stored = load_snapshot(period_days) if load_snapshot is not None else None
+        if stored is None:
+            return
+
+        with self._condition:
+            if period_days in self._snapshots:
+                return
+            self._snapshots[period_days] = DashboardSnapshot(
+                period_days=period_days,
+                data=stored.data,
+                refreshed_at=stored.saved_at,
+                duration_seconds=0.0,
+                restored=True,
+            )
+            self._requested.setdefault(period_days, False)
+            self._condition.notify_all()
+        logger.info(f"📦 Restored {period_days}d dashboard snapshot from {stored.saved_at:%Y-%m-%d %H:%M}")
+
+    # ------------------------------------------------------------------
+    # Background thread
+    # ------------------------------------------------------------------
+
+    def _next_job(self) -> Optional[tuple[int, bool]]:
+        """Pick the next requested or due period; returns ``None`` if nothing is due."""
+        if self._requested:
+            period_days = next(iter(self._requested))
+            return period_days, self._requested.pop(period_days)
+
+        now = time.monotonic()
+        idle_after = self._interval * IDLE_INTERVALS
+        due = [
+            period_days
+            for period_days, viewed_at in self._viewed.items()
+            if now - viewed_at <= idle_after and self._is_due(period_days, now)
+        ]
+        if not due:
+            return None
+        # Missing snapshots first, then the stalest one
+        due.sort(key=lambda period: self._snapshots[period].refreshed_at if period in self._snapshots else datetime.min)
+        return due[0], False
+
+    def _is_due(self, period_days: int, now: float) -> bool:
+        if period_days in self._retry_at:
+            # Failed periods wait for their backoff, whatever the age of the kept snapshot
+            return now >= self._retry_at[period_days]
+        snapshot = self._snapshots.get(period_days)
+        return snapshot is None or snapshot.age_seconds() >= self._interval
+
+    def _seconds_until_due(self) -> float:
+        now = time.monotonic()
+        waits = [
+            self._retry_at[period] - now
+            if period in self._retry_at
+            else self._interval - self._snapshots[period].age_seconds()
+            for period in self._viewed
+            if period in self._retry_at or period in self._snapshots
+        ]
+        return max(min(waits, default=self._interval), 0.05)
+
+    def _record_outcome(self, period_days: int, error: Optional[str]) -> None:
+        """Clear or record a failure and schedule the backoff retry (caller holds the condition)."""
+        if error is None:
+            self._failures.pop(period_days, None)
+            self._retry_at.pop(period_days, None)
+            return
+        previous = self._failures.get(period_days)
+        attempts = previous.attempts + 1 if previous else 1
+        delay = min(RETRY_BASE_SECONDS * 2 ** (attempts - 1), self._interval)
+        self._retry_at[period_days] = time.monotonic() + delay
+        self._failures[period_days] = RefreshFailure(
+            period_days=period_days, message=error, failed_at=datetime.now(), attempts=attempts, retry_in_seconds=delay
+        )
+        logger.warning(f"⚠️ Background refresh ({period_days}d) failed {attempts}x, retrying in {delay:.0f}s: {error}")
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                job = self._next_job()
+                while job is None and not self._stopped:
+                    self._condition.wait(self._seconds_until_due())
+                    job = self._next_job()
+                if self._stopped:
+                    return
+                period_days, force = job
+                self._running.add(period_days)
+            error: Optional[str] = "Refresh interrupted"
+            try:
+                error = self._refresh(period_days, force)
+            except Exception as exc:  # noqa: BLE001 - the refresher thread must survive any failure
+                logger.error(f"❌ Background refresh ({period_days}d) failed: {exc}")
+                error = str(exc) or exc.__class__.__name__
+            finally:
+                with self._condition:
+                    self._running.discard(period_days)
+                    self._progress.pop(period_days, None)
+                    self._record_outcome(period_days, error)
+                    self._condition.notify_all()
+
+    def _refresh(self, period_days: int, force: bool) -> Optional[str]:
+        """Run one refresh and publish its result; returns an error message if it produced no instances."""
+        started = time.perf_counter()
+        dashboard_data = None
+        for progress in self._orchestrator.iter_infrastructure_data(force_refresh=force, period_days=period_days):
+            # Readers get a consistent copy, never the accumulator the refresh keeps updating
+            published = progress.copy()
+            with self._condition:
+                self._progress[period_days] = published
+            if progress.done:
+                dashboard_data = progress.dashboard_data
+
+        with self._condition:
+            previous = self._snapshots.get(period_days)
+        if dashboard_data is None:
+            return "Refresh ended without a result"
+        error = None
+        if not dashboard_data.instances:
+            disclaimers = dashboard_data.academic_disclaimers or []
+            error = disclaimers[0] if disclaimers else "No instances processed"
+            if previous is not None and previous.data.instances:
+                # Keep serving the last good data while APIs are failing
+                logger.warning(f"⚠️ Background refresh ({period_days}d) returned no instances - keeping previous snapshot")
+                return error
+
+        duration = time.perf_counter() - started
+        self.publish(
+            DashboardSnapshot(
+                period_days=period_days, data=dashboard_data, refreshed_at=datetime.now(), duration_seconds=duration
+            )
+        )
+        logger.info(f"📸 Published {period_days}d dashboard snapshot ({duration:.1f}s)")
+        return error
+
+
+__all__ = ["DashboardSnapshot", "IDLE_INTERVALS", "RETRY_BASE_SECONDS", "RefreshFailure", "SnapshotRefresher"]
@@ -5,13 +5,14 @@ This package contains discrete use cases that implement specific business workfl
 Each use case is a single-responsibility class following Clean Architecture principles.
 """
 
-from .enrich_instance import EnrichInstanceUseCase
+from .enrich_instance import EnrichInstanceUseCase, EnrichmentResult
 from .fetch_infrastructure_data import FetchInfrastructureDataUseCase
 from .build_api_health_status import BuildAPIHealthStatusUseCase
 from .create_error_response import CreateErrorResponseUseCase
 
 __all__ = [
     "EnrichInstanceUseCase",
+    "EnrichmentResult",
     "FetchInfrastructureDataUseCase",
     "BuildAPIHealthStatusUseCase",
     "CreateErrorResponseUseCase",
@@ -5,29 +5,49 @@ Enriches EC2 instances with runtime, pricing, power, and emissions data.
 """
 
 import logging
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Dict, List, Optional
 
+import numpy as np
+
 from src.domain.models import EC2Instance
 from src.domain.services import RuntimeService
+from src.domain.tracing import span
+from src.infrastructure.enrichment_store import EnrichmentStore
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class EnrichmentResult:
+    """Outcome of enriching one instance."""
+
+    instance: Optional[EC2Instance]
+    reused: bool = False
+    """True when ``instance`` came from the enrichment store (inputs unchanged)"""
+
+
 class EnrichInstanceUseCase:
     """
     Enrich EC2 instance with runtime, pricing, power, and emissions.
 
-    Delegates to RuntimeService and handles failures gracefully.
+    Delegates to RuntimeService and handles failures gracefully. With a
+    store, instances whose input fingerprint is unchanged since their last
+    enrichment are reused instead of recomputed. Each call is recorded as an
+    ``enrich`` span of the active refresh trace.
     """
 
-    def __init__(self, runtime_service: RuntimeService):
+    def __init__(self, runtime_service: RuntimeService, store: Optional[EnrichmentStore] = None):
         """
         Initialize with runtime service.
 
         Args:
             runtime_service: Runtime data and instance enrichment
+            store: Optional store of previously enriched instances (incremental refresh)
         """
         self.runtime_service = runtime_service
+        self.store = store
 
     def execute(
         self,
@@ -35,38 +55,71 @@ class EnrichInstanceUseCase:
         carbon_intensity: float,
         *,
         carbon_history: Optional[List[Dict]] = None,
+        carbon_hourly: Optional[np.ndarray] = None,
+        window_end: Optional[datetime] = None,
         force_refresh: bool = False,
         period_days: int = 30,
-    ) -> Optional[EC2Instance]:
+    ) -> EnrichmentResult:
         """
         Enrich EC2 instance with runtime, pricing, power, and emissions.
 
         Args:
             instance: EC2 instance to enrich
             carbon_intensity: Current carbon intensity (gCO2/kWh) - used as fallback
-            carbon_history: Optional 24h carbon history for hourly-precise calculation
-            force_refresh: Bypass cache
+            carbon_history: Optional carbon history for hourly-precise calculation
+            carbon_hourly: Optional pre-aligned hourly intensity vector shared by all instances
+            window_end: End of the shared hour-aligned analysis window
+            force_refresh: Bypass cache and the enrichment store
             period_days: Analysis period in days (1, 7, or 30)
 
         Returns:
-            Enriched EC2Instance or None if failed
+            EnrichmentResult with the enriched EC2Instance (None if failed) and
+            whether it was reused from the store
         """
-        try:
-            enriched = self.runtime_service.enrich_instance(
-                instance,
-                carbon_intensity=carbon_intensity,
-                carbon_history=carbon_history,
-                force_refresh=force_refresh,
-                period_days=period_days,
-            )
-
-            if enriched:
-                logger.debug(f"Enriched instance {instance['instance_id']} (method: {enriched.co2_calculation_method})")
-                return enriched
-            else:
-                logger.warning(f"Failed to enrich instance {instance['instance_id']}")
-                return None
-
-        except Exception as e:
-            logger.error(f"Error enriching instance {instance['instance_id']}: {e}")
-            return None
+        fingerprint_inputs = {
+            "carbon_intensity": carbon_intensity,
+            "carbon_history": carbon_history,
+            "carbon_hourly": carbon_hourly,
+            "window_end": window_end,
+            "period_days": period_days,
+        }
+        with span(
+            "enrich", category="enrich", instance_id=instance["instance_id"], instance_type=instance.get("instance_type")
+        ) as enrich_span:
+            try:
+                if self.store is not None and not force_refresh:
+                    fingerprint = self.runtime_service.input_fingerprint(instance, **fingerprint_inputs)
+                    if isinstance(fingerprint, str):
+                        reused = self.store.get(instance["instance_id"], period_days, fingerprint)
+                        if reused is not None:
+                            logger.debug(f"Reusing enriched instance {instance['instance_id']} (inputs unchanged)")
+                            enrich_span.set(reused=True, method=reused.co2_calculation_method)
+                            return EnrichmentResult(reused, reused=True)
+
+                enriched = self.runtime_service.enrich_instance(
+                    instance,
+                    carbon_intensity=carbon_intensity,
+                    carbon_history=carbon_history,
+                    carbon_hourly=carbon_hourly,
+                    window_end=window_end,
+                    force_refresh=force_refresh,
+                    period_days=period_days,
+                )
+
+                if enriched:
+                    logger.debug(f"Enriched instance {instance['instance_id']} (method: {enriched.co2_calculation_method})")
+                    enrich_span.set(reused=False, method=enriched.co2_calculation_method)
+                    if self.store is not None:
+                        # Fingerprint after enrichment so freshly written input caches are covered
+                        fingerprint = self.runtime_service.input_fingerprint(instance, **fingerprint_inputs)
+                        if isinstance(fingerprint, str):
+                            self.store.put(enriched, fingerprint)
+                    return EnrichmentResult(enriched)
+                else:
+                    logger.warning(f"Failed to enrich instance {instance['instance_id']}")
+                    return EnrichmentResult(None)
+
+            except Exception as e:
+                logger.error(f"Error enriching instance {instance['instance_id']}: {e}")
+                enrich_span.set(error=type(e).__name__)
+                return EnrichmentResult(None)
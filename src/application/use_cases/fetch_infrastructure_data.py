@@ -5,19 +5,43 @@ Coordinates fetching and enriching infrastructure data.
 """
 
 import logging
-from datetime import datetime, timezone
+import sqlite3
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Optional
-
-from src.domain.models import EC2Instance, DashboardData, CarbonIntensity
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+from src.config import settings
+from src.domain.alignment import CARBON_MAX_GAP_HOURS, align_carbon_intensity_hourly
+from src.domain.timeline import hourly_analysis_window
+from src.domain.tracing import RefreshTrace, iter_traced, stage
+from src.domain.constants import AcademicConstants
+from src.domain.models import (
+    EC2Instance,
+    DashboardData,
+    CarbonIntensity,
+    MetricsHistorySummary,
+    PowerConsumption,
+    RefreshProgress,
+)
+from src.domain.uncertainty import UncertaintyInputs, build_uncertainty_inputs
 from src.domain.services import RuntimeService, CarbonDataService
 from src.application.calculator import BusinessCaseCalculator
 from src.application.use_cases.enrich_instance import EnrichInstanceUseCase
 from src.infrastructure.gateways import InfrastructureGateway
 from src.infrastructure.cache import FileCacheRepository
+from src.infrastructure.enrichment_store import EnrichmentStore
+from src.infrastructure.metrics_warehouse import MetricsWarehouse
 
 logger = logging.getLogger(__name__)
 
+# Samples × instances budget of the business case Monte Carlo (large fleets get fewer samples)
+MONTE_CARLO_MAX_CELLS = 20_000_000
+
+# Exported refresh traces older than this are removed
+TRACE_RETENTION_DAYS = 2
+
 
 class FetchInfrastructureDataUseCase:
     """
@@ -39,6 +63,7 @@ class FetchInfrastructureDataUseCase:
         calculator: BusinessCaseCalculator,
         gateway: InfrastructureGateway,
         repository: FileCacheRepository,
+        region: Optional[str] = None,
     ):
         """
         Initialize with required services.
@@ -49,13 +74,19 @@ class FetchInfrastructureDataUseCase:
             calculator: Business case calculator
             gateway: Cost data access
             repository: Cache and API tracking
+            region: AWS region of the analysed instances; carbon intensity (its grid
+                zone) and Cost Explorer totals are fetched for it (default ``AWS_REGION``)
         """
         self.runtime_service = runtime_service
         self.carbon_service = carbon_service
         self.calculator = calculator
         self.gateway = gateway
         self.repository = repository
-        self.enrich_use_case = EnrichInstanceUseCase(runtime_service)
+        self.region = region or settings.aws_region
+        self.enrich_use_case = EnrichInstanceUseCase(runtime_service, store=EnrichmentStore(repository))
+        # Opened on first use (see ``warehouse``) so a broken SQLite file never fails construction
+        self._warehouse: Optional[MetricsWarehouse] = None
+        self._warehouse_disabled = not settings.metrics_warehouse_enabled
 
         # Track last API call timestamps for dashboard transparency
         self.api_last_calls: dict[str, Optional[datetime]] = {}
@@ -64,6 +95,10 @@ class FetchInfrastructureDataUseCase:
         """
         Execute infrastructure data fetching workflow.
 
+        The refresh is traced: every step, gateway call and enrichment is a
+        span. The summary is attached as ``DashboardData.refresh_trace`` and
+        the full trace is exported as Chrome-trace JSON (``REFRESH_TRACE_EXPORT``).
+
         Args:
             force_refresh: Bypass cache and fetch fresh data
             period_days: Analysis period in days (1, 7, or 30)
@@ -74,13 +109,69 @@ class FetchInfrastructureDataUseCase:
         Raises:
             AWSAuthenticationError, ClientError, ValueError, TypeError
         """
+        progress = None
+        for progress in self.iter_execute(force_refresh=force_refresh, period_days=period_days):
+            pass
+        return progress.dashboard_data
+
+    def iter_execute(self, *, force_refresh: bool = False, period_days: int = 30) -> Iterator[RefreshProgress]:
+        """
+        Streaming variant of ``execute``.
+
+        Yields the same ``RefreshProgress`` after every enriched instance with
+        running totals, then once more with ``dashboard_data`` set. Consumers
+        can render partial results while the rest of the fleet is enriched.
+
+        Raises:
+            Same as ``execute``; errors surface from the iteration
+        """
+        progress = RefreshProgress(period_days=period_days)
+        # The trace is only active while the pipeline runs, never while the consumer holds a yielded item
+        trace = RefreshTrace("refresh", period_days=period_days, force_refresh=force_refresh)
+        yield from iter_traced(
+            trace, self._iter_pipeline(progress, force_refresh=force_refresh, period_days=period_days)
+        )
+
+        dashboard_data = progress.dashboard_data
+        dashboard_data.refresh_trace = trace.summary(trace_path=self._export_trace(trace))
+        summary = dashboard_data.refresh_trace
+        logger.info(
+            f"⏱️ Refresh took {summary.total_seconds:.2f}s ({summary.span_count} spans), "
+            f"slowest stage: {summary.slowest_stage} ({summary.stages.get(summary.slowest_stage, 0.0):.2f}s)"
+        )
+        yield progress
+
+    def _export_trace(self, trace: RefreshTrace) -> Optional[str]:
+        """
+        Write the trace as Chrome-trace JSON into the cache root; returns the path.
+
+        Only the newest ``REFRESH_TRACE_HISTORY`` files (and none older than
+        ``TRACE_RETENTION_DAYS``) are kept.
+        """
+        if not settings.refresh_trace_export:
+            return None
+        stamp = trace.started_at.strftime("%Y%m%dT%H%M%S")
+        path = self.repository.path("traces", f"refresh_{stamp}_{trace.trace_id[:8]}")
+        self.repository.write_json(path, trace.to_chrome_trace())
+        self.repository.clean_old(path.parent, max_age_days=TRACE_RETENTION_DAYS)
+        # Timestamped names sort chronologically
+        for stale in sorted(path.parent.glob("refresh_*.json"), reverse=True)[settings.refresh_trace_history :]:
+            stale.unlink(missing_ok=True)
+        return str(path)
+
+    def _iter_pipeline(
+        self, progress: RefreshProgress, *, force_refresh: bool, period_days: int
+    ) -> Iterator[RefreshProgress]:
+        """Run steps 1-13, yielding ``progress`` after each enriched instance and filling in ``dashboard_data``."""
         # Reset API call log for this processing cycle
         self.api_last_calls = {}
 
         logger.info(f"📊 Starting infrastructure analysis with {period_days}-day period")
+        region = self.region
 
         # Step 1: Get carbon intensity (1h cache)
-        carbon_intensity = self.carbon_service.get_current_intensity(region="eu-central-1")
+        stage("step_01.carbon_intensity")
+        carbon_intensity = self.carbon_service.get_current_intensity(region=region)
         if not carbon_intensity:
             raise ValueError("No carbon intensity data available")
 
@@ -89,17 +180,35 @@ class FetchInfrastructureDataUseCase:
         else:
             self.api_last_calls["ElectricityMaps"] = datetime.now(timezone.utc)
 
-        # Step 2: Collect historical carbon data for visualizations
-        carbon_history = self.carbon_service.get_recent_history(region="eu-central-1")
-        self_collected_history = self.carbon_service.get_self_collected_history(region="eu-central-1")
+        # Step 2: Collect historical carbon data for visualizations (last 24h)
+        stage("step_02.carbon_history")
+        carbon_history = self.carbon_service.get_recent_history(region=region)
+        self_collected_history = self.carbon_service.get_self_collected_history(region=region)
+
+        # Hour-aligned analysis window shared by CPU, carbon and runtime for all instances
+        analysis_hours = period_days * 24
+        window_start, window_end = hourly_analysis_window(analysis_hours)
+        period_carbon_history = (
+            self.carbon_service.get_period_history(
+                region=region, window_start=window_start, window_end=window_end
+            )
+            if analysis_hours > 24
+            else carbon_history
+        )
 
         # Step 3: Get EC2 instances (live AWS data)
+        stage("step_03.list_instances")
         instances = self.runtime_service.list_instances()
         if not instances:
             raise ValueError("No EC2 instances found")
 
+        # Step 3b: Bulk-fetch power models missing from the offline table before enrichment
+        stage("step_03b.power_models")
+        self._warm_power_table(instances)
+
         # Step 4: Get cost data for specified period (region-specific)
-        cost_data = self.gateway.get_costs("eu-central-1", period_days)
+        stage("step_04.cost_data")
+        cost_data = self.gateway.get_costs(region, period_days)
         fetched_at = getattr(cost_data, "fetched_at", None) if cost_data else None
         if isinstance(fetched_at, datetime):
             if fetched_at.tzinfo is None:
@@ -107,65 +216,85 @@ class FetchInfrastructureDataUseCase:
             self.api_last_calls["AWS Cost Explorer"] = fetched_at
 
         # Step 5: Get hourly costs for last 24h (aligned with carbon data window)
-        hourly_costs = self.gateway.get_hourly_costs(24, "eu-central-1") or []
+        stage("step_05.hourly_costs")
+        hourly_costs = self.gateway.get_hourly_costs(24, region) or []
         logger.info(f"📊 Retrieved {len(hourly_costs)} hourly cost entries from AWS Cost Explorer")
 
         # Step 6: Process each instance with API data and enhanced tracking
-        processed_instances: List[EC2Instance] = []
+        stage("step_06.enrich_instances")
+        # Carbon history is identical for all instances - align it once and share read-only
+        carbon_hourly = (
+            align_carbon_intensity_hourly(
+                period_carbon_history,
+                analysis_hours,
+                window_start=window_start,
+                max_gap_hours=CARBON_MAX_GAP_HOURS,
+            )
+            if period_carbon_history
+            else None
+        )
+
+        progress.total = len(instances)
+        fresh_instances: List[EC2Instance] = []
+        reused_count = 0
         for instance in instances:
-            enriched = self.enrich_use_case.execute(
+            result = self.enrich_use_case.execute(
                 instance,
                 carbon_intensity=carbon_intensity.value,
-                carbon_history=carbon_history,  # NEW: Pass carbon history for hourly calculation
+                carbon_history=period_carbon_history,
+                carbon_hourly=carbon_hourly,
+                window_end=window_end,
                 force_refresh=force_refresh,
                 period_days=period_days,  # Pass analysis period to enrichment
             )
-            if enriched:
-                processed_instances.append(enriched)
-
+            if result.instance:
+                if result.reused:
+                    reused_count += 1
+                else:
+                    fresh_instances.append(result.instance)
+                progress.include(result.instance)
+                yield progress
+
+        processed_instances = progress.instances
         if not processed_instances:
             raise ValueError("No instances could be processed")
+        logger.info(
+            f"♻️ Reused {reused_count}/{len(processed_instances)} enriched instances with unchanged inputs"
+        )
+
+        # Step 6b: Upsert hourly facts of re-enriched instances (reused ones are already stored)
+        stage("step_06b.record_history")
+        self._record_history(fresh_instances)
+
+        # Step 6c: Month-to-date totals and daily trend from the warehouse
+        stage("step_06c.history_summary")
+        metrics_history = self._history_summary()
 
         # Step 7: Track API call timestamps from cache metadata
+        stage("step_07.api_timestamps")
         self._track_api_timestamps(processed_instances)
 
         # Step 8: Calculate totals with dual comparison
-        # Separate instances by calculation method
-        hourly_precise_instances = [i for i in processed_instances if i.co2_calculation_method == "hourly"]
-        fallback_instances = [i for i in processed_instances if i.co2_calculation_method == "average"]
-
-        # Aggregate totals for both calculation methods
-        # Hourly-Precise totals (from instances with 24h carbon data)
-        total_cost_hourly = sum(
-            inst.cost_eur_hourly for inst in hourly_precise_instances
-            if inst.cost_eur_hourly is not None
-        )
-        total_co2_hourly = sum(
-            inst.co2_kg_hourly for inst in hourly_precise_instances
-            if inst.co2_kg_hourly is not None
-        )
-
-        # Average-Based totals (from all instances)
-        total_cost_average = sum(
-            inst.cost_eur_average for inst in processed_instances
-            if inst.cost_eur_average is not None
-        )
-        total_co2_average = sum(
-            inst.co2_kg_average for inst in processed_instances
-            if inst.co2_kg_average is not None
-        )
+        stage("step_08.aggregate_totals")
+        # Totals for both calculation methods were accumulated while enriching:
+        # Hourly-Precise from instances with hour-by-hour data, Average-Based from all instances
+        total_cost_hourly = progress.total_cost_hourly
+        total_co2_hourly = progress.total_co2_hourly
+        total_cost_average = progress.total_cost_average
+        total_co2_average = progress.total_co2_average
 
         # DEPRECATED: Backward compatibility fields (use average-based totals)
         total_cost_eur = total_cost_average
         total_co2_kg = total_co2_average
 
         logger.info(
-            f"📊 Aggregation: {len(hourly_precise_instances)} hourly-precise, {len(fallback_instances)} average-based | "
+            f"📊 Aggregation: {progress.hourly_precise_count} hourly-precise, {progress.fallback_count} average-based | "
             f"CO2: {total_co2_hourly:.3f} kg (hourly) vs {total_co2_average:.3f} kg (average) | "
             f"Cost: €{total_cost_hourly:.2f} (hourly) vs €{total_cost_average:.2f} (average)"
         )
 
         # Step 9: Enhanced validation - compare calculated costs with actual AWS spending
+        stage("step_09.cost_validation")
         # NOTE: Use average-based costs for validation (factual runtime-based comparison)
         validation_factor, cost_explorer_eur = self.calculator.calculate_cloudtrail_enhanced_accuracy(
             processed_instances,
@@ -176,28 +305,35 @@ class FetchInfrastructureDataUseCase:
         accuracy_status = getattr(self.calculator, "_last_accuracy_status", None)
 
         # Step 10: Calculate CloudTrail Coverage for data quality validation
+        stage("step_10.cloudtrail_coverage")
         cloudtrail_coverage, cloudtrail_tracked = self._calculate_cloudtrail_coverage(processed_instances)
 
         # Step 12: Calculate business case with validation factor awareness
+        stage("step_12.business_case")
         # NOTE: Using average-based totals as baseline (most conservative estimate)
+        samples = min(settings.monte_carlo_samples, max(MONTE_CARLO_MAX_CELLS // len(processed_instances), 1000))
         business_case = self.calculator.calculate_business_case(
             baseline_cost=total_cost_average,
             baseline_co2=total_co2_average,
             validation_factor=validation_factor,
+            uncertainty=self._uncertainty_inputs(processed_instances, carbon_hourly, carbon_intensity.value),
+            samples=samples,
         )
 
         # Step 13: Create complete dashboard data (health status will be added by orchestrator)
+        stage("step_13.dashboard_data")
         dashboard_data = DashboardData(
             instances=processed_instances,
             carbon_intensity=carbon_intensity,
+            carbon_intensity_hourly=carbon_hourly,
             analysis_period_days=period_days,
             # New field names (primary)
             total_cost_hourly=total_cost_hourly,
             total_co2_hourly=total_co2_hourly,
             total_cost_average=total_cost_average,
             total_co2_average=total_co2_average,
-            hourly_precise_count=len(hourly_precise_instances),
-            fallback_count=len(fallback_instances),
+            hourly_precise_count=progress.hourly_precise_count,
+            fallback_count=progress.fallback_count,
             # DEPRECATED: Backward compatibility fields
             total_cost_eur=total_cost_eur,
             total_co2_kg=total_co2_kg,
@@ -216,13 +352,110 @@ class FetchInfrastructureDataUseCase:
             cloudtrail_tracked_instances=cloudtrail_tracked,
             carbon_history=carbon_history or [],
             self_collected_carbon_history=self_collected_history or [],
+            metrics_history=metrics_history,
         )
 
         logger.info(
             f"✅ Infrastructure analysis complete: {len(processed_instances)} instances, "
             f"€{total_cost_average:.2f} ({period_days}d period)"
         )
-        return dashboard_data
+        progress.dashboard_data = dashboard_data
+
+    def _warm_power_table(self, instances: List[Dict]) -> None:
+        """
+        Fetch the power models of instance types missing from the offline table in one bulk refresh.
+
+        Enrichment then reads every power model from the table instead of one
+        sequential Boavizta request per new instance type.
+        """
+        get_power_table = getattr(self.gateway, "get_power_table", None)
+        if get_power_table is None:
+            return
+        known = set(get_power_table().instance_types)
+        missing = sorted({instance["instance_type"] for instance in instances if instance.get("instance_type")} - known)
+        if missing:
+            written = self.gateway.refresh_power_table(missing)
+            logger.info(f"⚡ Power table warm-up: {written}/{len(missing)} new instance types")
+
+    def _uncertainty_inputs(
+        self, instances: List[EC2Instance], carbon_hourly: Optional[np.ndarray], carbon_intensity: float
+    ) -> Optional[UncertaintyInputs]:
+        """Monte Carlo inputs with min/max power of every instance type (cached power models)."""
+        if settings.monte_carlo_samples <= 0:
+            return None
+        power_models = {}
+        for instance_type in {instance.instance_type for instance in instances}:
+            model = self.gateway.get_power_consumption(instance_type)
+            if isinstance(model, PowerConsumption):
+                power_models[instance_type] = model
+        return build_uncertainty_inputs(
+            instances,
+            power_models,
+            carbon_intensity_hourly=carbon_hourly,
+            carbon_intensity=carbon_intensity,
+            eur_usd_rate=AcademicConstants.get_eur_usd_rate(),
+        )
+
+    @property
+    def warehouse(self) -> Optional[MetricsWarehouse]:
+        """
+        Metrics warehouse, opened on first access.
+
+        A warehouse that cannot be opened (read-only cache root, locked or
+        corrupt database) is logged once and disabled for this use case.
+        """
+        if self._warehouse is None and not self._warehouse_disabled:
+            try:
+                self._warehouse = MetricsWarehouse.for_repository(self.repository)
+            except (sqlite3.Error, OSError) as error:
+                logger.warning(f"⚠️ Metrics warehouse unavailable, history is not recorded: {error}")
+                self._warehouse_disabled = True
+        return self._warehouse
+
+    def _record_history(self, instances: List[EC2Instance]) -> None:
+        """
+        Persist hourly breakdowns to the metrics warehouse and apply the retention window.
+
+        Failures never break a refresh.
+        """
+        warehouse = self.warehouse
+        if warehouse is None:
+            return
+        try:
+            if instances:
+                rows = warehouse.record(instances)
+                logger.info(f"🗄️ Recorded {rows} hourly facts for {len(instances)} instances in the metrics warehouse")
+            retention_days = settings.metrics_warehouse_retention_days
+            if retention_days > 0:
+                pruned = warehouse.prune(datetime.now(timezone.utc) - timedelta(days=retention_days))
+                if pruned:
+                    logger.info(f"🗄️ Pruned {pruned} hourly facts older than {retention_days} days from the metrics warehouse")
+        except (sqlite3.Error, OSError) as error:
+            logger.warning(f"⚠️ Metrics warehouse update failed: {error}")
+
+    def _history_summary(self, trend_days: int = 30) -> Optional[MetricsHistorySummary]:
+        """Month-to-date totals and per-day trend answered by the warehouse, or None if unavailable."""
+        warehouse = self.warehouse
+        if warehouse is None:
+            return None
+        now = datetime.now(timezone.utc)
+        try:
+            month = warehouse.month_to_date(now)
+            daily = warehouse.daily_totals(now - timedelta(days=trend_days), now)
+            coverage = warehouse.coverage()
+        except (sqlite3.Error, OSError) as error:
+            logger.warning(f"⚠️ Metrics warehouse query failed: {error}")
+            return None
+        return MetricsHistorySummary(
+            month_start=now.replace(day=1, hour=0, minute=0, second=0, microsecond=0),
+            month_to_date_co2_kg=month["co2_kg"],
+            month_to_date_cost_eur=month["cost_eur"],
+            month_to_date_runtime_hours=month["runtime_hours"],
+            month_to_date_instances=month["instances"],
+            trend_days=trend_days,
+            daily=daily,
+            history_start=min((first for first, _ in coverage.values()), default=None),
+        )
 
     def _track_api_timestamps(self, processed_instances: List[EC2Instance]) -> None:
         """Track API call timestamps from cache metadata"""
@@ -0,0 +1,541 @@
+"""
+Headless batch CLI for scheduled runs and large fleets.
+
+Drives ``DashboardDataOrchestrator`` without Streamlit and streams one row per
+enriched instance to a file while the fleet is processed, followed by one
+aggregate row per region and period:
+
+    python -m src.cli run --period 30 --format csv
+    python -m src.cli run --period 1 7 30 --regions eu-central-1 eu-west-1 --jobs 4 --format parquet
+
+Each region × period is an independent job with its own orchestrator (jobs share
+the file cache under ``CACHE_ROOT``). Outputs land in ``--output-dir``:
+
+- ``instances_<region>_<period>d.<ext>``: per-instance rows, written as they are enriched
+- ``summary.<ext>``: totals, validation and business case per job
+
+Files are written to a temporary name and moved into place when complete, so
+consumers never see partial reports. ``--regions`` selects the EC2 region whose
+instances are analysed; carbon intensity comes from that region's grid zone and
+Cost Explorer totals are filtered to it. Regions without a zone in
+``settings.aws_region_to_zone`` are rejected as a usage error rather than
+reported with another grid's CO₂. Parquet output requires ``pyarrow``.
+
+``python -m src.cli power-table [--types ...]`` bulk-refreshes the offline
+Boavizta power table (a refresh also fetches missing types on its own).
+
+Exit codes (for cron and CI):
+    0  every job produced data
+    1  no job produced data
+    2  usage error (invalid arguments, missing optional dependency)
+    3  some jobs failed, the others were exported
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import importlib.util
+import json
+import logging
+import math
+import os
+import sys
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.config import settings
+from src.domain.models import DashboardData, EC2Instance
+
+logger = logging.getLogger(__name__)
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_PARTIAL = 3
+
+FORMATS = {"csv": "csv", "json": "json", "parquet": "parquet"}
+VALID_PERIODS = (1, 7, 30)
+
+# Rows buffered per Parquet row group
+PARQUET_ROW_GROUP = 5_000
+
+Columns = Tuple[Tuple[str, str], ...]
+
+# (column, type) - types map to Parquet schemas; CSV/JSON write the values as-is
+INSTANCE_COLUMNS: Columns = (
+    ("instance_id", "str"),
+    ("instance_name", "str"),
+    ("instance_type", "str"),
+    ("state", "str"),
+    ("region", "str"),
+    ("period_days", "int"),
+    ("runtime_hours", "float"),
+    ("cpu_utilization", "float"),
+    ("power_watts", "float"),
+    ("hourly_price_usd", "float"),
+    ("co2_kg_hourly", "float"),
+    ("cost_eur_hourly", "float"),
+    ("co2_kg_average", "float"),
+    ("cost_eur_average", "float"),
+    ("daily_co2_kg", "float"),
+    ("daily_runtime_hours", "float"),
+    ("co2_calculation_method", "str"),
+    ("data_quality", "str"),
+    ("confidence_level", "str"),
+)
+
+SUMMARY_COLUMNS: Columns = (
+    ("region", "str"),
+    ("period_days", "int"),
+    ("status", "str"),
+    ("instances", "int"),
+    ("hourly_precise_count", "int"),
+    ("fallback_count", "int"),
+    ("total_cost_hourly_eur", "float"),
+    ("total_co2_hourly_kg", "float"),
+    ("total_cost_average_eur", "float"),
+    ("total_co2_average_kg", "float"),
+    ("cost_explorer_eur", "float"),
+    ("validation_factor", "float"),
+    ("cloudtrail_coverage", "float"),
+    ("carbon_intensity_g_kwh", "float"),
+    ("integrated_savings_eur", "float"),
+    ("integrated_co2_reduction_kg", "float"),
+    ("month_to_date_cost_eur", "float"),
+    ("month_to_date_co2_kg", "float"),
+    ("apis_online", "int"),
+    ("apis_total", "int"),
+    ("duration_seconds", "float"),
+    ("output", "str"),
+    ("error", "str"),
+)
+
+
+def _clean(value: Any) -> Any:
+    """JSON/Parquet-safe scalar (non-finite floats become ``None``)."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def instance_row(instance: EC2Instance) -> Dict[str, Any]:
+    """Export row of one enriched instance."""
+    return {name: _clean(getattr(instance, name, None)) for name, _ in INSTANCE_COLUMNS}
+
+
+def summary_row(
+    region: str,
+    period_days: int,
+    data: Optional[DashboardData],
+    *,
+    duration_seconds: float,
+    output: Optional[Path] = None,
+    error: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Aggregate row of one job; ``status`` is ``failed`` when no instances were processed."""
+    instances = list(getattr(data, "instances", None) or [])
+    health = getattr(data, "api_health_status", None) or {}
+    business_case = getattr(data, "business_case", None)
+    carbon_intensity = getattr(data, "carbon_intensity", None)
+    history = getattr(data, "metrics_history", None)
+    if not instances and error is None:
+        disclaimers = getattr(data, "academic_disclaimers", None) or []
+        error = disclaimers[0] if disclaimers else "No instances processed"
+
+    row = {
+        "region": region,
+        "period_days": period_days,
+        "status": "ok" if instances else "failed",
+        "instances": len(instances),
+        "hourly_precise_count": getattr(data, "hourly_precise_count", 0),
+        "fallback_count": getattr(data, "fallback_count", 0),
+        "total_cost_hourly_eur": getattr(data, "total_cost_hourly", None),
+        "total_co2_hourly_kg": getattr(data, "total_co2_hourly", None),
+        "total_cost_average_eur": getattr(data, "total_cost_average", None),
+        "total_co2_average_kg": getattr(data, "total_co2_average", None),
+        "cost_explorer_eur": getattr(data, "cost_explorer_eur", None),
+        "validation_factor": getattr(data, "validation_factor", None),
+        "cloudtrail_coverage": getattr(data, "cloudtrail_coverage", None),
+        "carbon_intensity_g_kwh": carbon_intensity.value if carbon_intensity else None,
+        "integrated_savings_eur": getattr(business_case, "integrated_savings_eur", None),
+        "integrated_co2_reduction_kg": getattr(business_case, "integrated_co2_reduction_kg", None),
+        "month_to_date_cost_eur": history.month_to_date_cost_eur if history else None,
+        "month_to_date_co2_kg": history.month_to_date_co2_kg if history else None,
+        "apis_online": sum(1 for status in health.values() if getattr(status, "healthy", False)),
+        "apis_total": len(health),
+        "duration_seconds": round(duration_seconds, 3),
+        "output": str(output) if output else None,
+        "error": error,
+    }
+    return {name: _clean(value) for name, value in row.items()}
+
+
+# ----------------------------------------------------------------------
+# Streaming writers
+# ----------------------------------------------------------------------
+
+
+class _RowWriter(ABC):
+    """Writes rows to ``<path>.tmp`` and moves the file into place on ``close()``."""
+
+    def __init__(self, path: Path, columns: Columns) -> None:
+        self.path = path
+        self.columns = columns
+        self.rows = 0
+        self._tmp_path = path.with_name(path.name + ".tmp")
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+    def write(self, row: Dict[str, Any]) -> None:
+        self._write(row)
+        self.rows += 1
+
+    def close(self) -> Path:
+        self._finish()
+        os.replace(self._tmp_path, self.path)
+        return self.path
+
+    def abort(self) -> None:
+        try:
+            self._finish()
+        finally:
+            self._tmp_path.unlink(missing_ok=True)
+
+    @abstractmethod
+    def _write(self, row: Dict[str, Any]) -> None:
+        """Append one row to the temporary file."""
+
+    @abstractmethod
+    def _finish(self) -> None:
+        """Flush and close the temporary file (called once, also on abort)."""
+
+
+class _CsvWriter(_RowWriter):
+    def __init__(self, path: Path, columns: Columns) -> None:
+        super().__init__(path, columns)
+        self._handle = self._tmp_path.open("w", encoding="utf-8", newline="")
+        self._writer = csv.DictWriter(self._handle, fieldnames=[name for name, _ in columns])
+        self._writer.writeheader()
+
+    def _write(self, row: Dict[str, Any]) -> None:
+        self._writer.writerow(row)
+
+    def _finish(self) -> None:
+        self._handle.close()
+
+
+class _JsonWriter(_RowWriter):
+    """A JSON array of row objects, written element by element."""
+
+    def __init__(self, path: Path, columns: Columns) -> None:
+        super().__init__(path, columns)
+        self._handle = self._tmp_path.open("w", encoding="utf-8")
+        self._handle.write("[")
+
+    def _write(self, row: Dict[str, Any]) -> None:
+        self._handle.write(("," if self.rows else "") + "\n  " + json.dumps(row, ensure_ascii=False))
+
+    def _finish(self) -> None:
+        if not self._handle.closed:
+            self._handle.write("\n]\n" if self.rows else "]\n")
+            self._handle.close()
+
+
+class _ParquetWriter(_RowWriter):
+    """Row groups of ``PARQUET_ROW_GROUP`` rows (requires ``pyarrow``)."""
+
+    _TYPES = {"str": "string", "int": "int64", "float": "float64"}
+
+    def __init__(self, path: Path, columns: Columns) -> None:
+        super().__init__(path, columns)
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._schema = pa.schema([(name, getattr(pa, self._TYPES[kind])()) for name, kind in columns])
+        self._writer = pq.ParquetWriter(self._tmp_path, self._schema)
+        self._buffer: List[Dict[str, Any]] = []
+
+    def _write(self, row: Dict[str, Any]) -> None:
+        self._buffer.append(row)
+        if len(self._buffer) >= PARQUET_ROW_GROUP:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._buffer:
+            self._writer.write_table(self._pa.Table.from_pylist(self._buffer, schema=self._schema))
+            self._buffer = []
+
+    def _finish(self) -> None:
+        if self._writer is not None:
+            self._flush()
+            self._writer.close()
+            self._writer = None
+
+
+_WRITERS = {"csv": _CsvWriter, "json": _JsonWriter, "parquet": _ParquetWriter}
+
+
+def open_writer(fmt: str, path: Path, columns: Columns) -> _RowWriter:
+    """Streaming writer for ``fmt`` (``csv``, ``json`` or ``parquet``)."""
+    return _WRITERS[fmt](path, columns)
+
+
+# ----------------------------------------------------------------------
+# Batch run
+# ----------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class BatchOptions:
+    """Parsed ``run`` arguments."""
+
+    periods: Tuple[int, ...] = (30,)
+    regions: Tuple[str, ...] = field(default_factory=lambda: (settings.aws_region,))
+    fmt: str = "csv"
+    output_dir: Path = Path("reports")
+    jobs: int = 1
+    force_refresh: bool = False
+
+
+@dataclass(frozen=True)
+class JobResult:
+    """Outcome of one region × period job."""
+
+    region: str
+    period_days: int
+    summary: Dict[str, Any]
+    output: Optional[Path] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.summary["status"] == "ok"
+
+
+def create_orchestrator(region: str):
+    """Orchestrator analysing the EC2 instances of ``region`` (default gateway and cache)."""
+    from src.application.orchestrator import DashboardDataOrchestrator
+    from src.domain.services import RuntimeServiceConfig, create_runtime_service
+    from src.infrastructure.cache import FileCacheRepository
+    from src.infrastructure.gateways import create_default_gateway
+
+    repository = FileCacheRepository(Path(settings.cache_root))
+    gateway = create_default_gateway(repository)
+    runtime_service = create_runtime_service(
+        RuntimeServiceConfig(region=region), repository=repository, gateway=gateway
+    )
+    # Snapshots are keyed by period only: a batch run over other regions must not replace the dashboard's warm start
+    return DashboardDataOrchestrator(
+        runtime_service=runtime_service,
+        repository=repository,
+        gateway=gateway,
+        persist_snapshots=False,
+        region=region,
+    )
+
+
+def run_job(
+    orchestrator,
+    region: str,
+    period_days: int,
+    *,
+    fmt: str,
+    output_dir: Path,
+    force_refresh: bool = False,
+) -> JobResult:
+    """
+    Refresh one region × period and stream its instances to ``instances_<region>_<period>d.<ext>``.
+
+    Instances are written as the orchestrator yields them; the file is only
+    moved into place when the refresh produced instances.
+    """
+    started = time.perf_counter()
+    path = output_dir / f"instances_{region}_{period_days}d.{FORMATS[fmt]}"
+    writer = open_writer(fmt, path, INSTANCE_COLUMNS)
+    data: Optional[DashboardData] = None
+    written = 0
+    try:
+        for progress in orchestrator.iter_infrastructure_data(force_refresh=force_refresh, period_days=period_days):
+            for instance in progress.instances[written:]:
+                writer.write(instance_row(instance))
+            written = len(progress.instances)
+            if progress.done:
+                data = progress.dashboard_data
+    except Exception as error:  # noqa: BLE001 - one failing job must not stop the batch
+        writer.abort()
+        logger.error(f"❌ Batch job {region} {period_days}d failed: {error}")
+        summary = summary_row(region, period_days, None, duration_seconds=time.perf_counter() - started, error=str(error))
+        return JobResult(region, period_days, summary)
+    except BaseException:
+        # Interrupted (Ctrl+C, SystemExit): leave no temporary report behind
+        writer.abort()
+        raise
+
+    if data is None or not data.instances:
+        writer.abort()
+        summary = summary_row(region, period_days, data, duration_seconds=time.perf_counter() - started)
+        return JobResult(region, period_days, summary)
+
+    output = writer.close()
+    summary = summary_row(region, period_days, data, duration_seconds=time.perf_counter() - started, output=output)
+    return JobResult(region, period_days, summary, output)
+
+
+def run_batch(
+    options: BatchOptions,
+    *,
+    orchestrator_factory: Callable[[str], Any] = create_orchestrator,
+    echo: Callable[[str], None] = print,
+) -> Tuple[List[JobResult], Path]:
+    """
+    Run every region × period job (``options.jobs`` at a time) and write ``summary.<ext>``.
+
+    Returns:
+        Job results in region/period order and the summary path
+    """
+    jobs = [(region, period) for region in options.regions for period in options.periods]
+
+    def execute(job: Tuple[str, int]) -> JobResult:
+        region, period_days = job
+        result = run_job(
+            orchestrator_factory(region),
+            region,
+            period_days,
+            fmt=options.fmt,
+            output_dir=options.output_dir,
+            force_refresh=options.force_refresh,
+        )
+        summary = result.summary
+        if result.ok:
+            echo(
+                f"✅ {region} {period_days}d: {summary['instances']} instances, "
+                f"{summary['total_co2_average_kg'] or 0.0:.2f} kg CO₂, "
+                f"€{summary['total_cost_average_eur'] or 0.0:.2f} ({summary['duration_seconds']:.1f}s) → {result.output}"
+            )
+        else:
+            echo(f"❌ {region} {period_days}d: {summary['error']}")
+        return result
+
+    if options.jobs > 1 and len(jobs) > 1:
+        with ThreadPoolExecutor(max_workers=options.jobs, thread_name_prefix="finops-batch") as pool:
+            results = list(pool.map(execute, jobs))
+    else:
+        results = [execute(job) for job in jobs]
+
+    writer = open_writer(options.fmt, options.output_dir / f"summary.{FORMATS[options.fmt]}", SUMMARY_COLUMNS)
+    try:
+        for result in results:
+            writer.write(result.summary)
+    except BaseException:
+        writer.abort()
+        raise
+    return results, writer.close()
+
+
+def exit_code(results: Sequence[JobResult]) -> int:
+    """``EXIT_OK`` if every job succeeded, ``EXIT_FAILED`` if none did, else ``EXIT_PARTIAL``."""
+    succeeded = sum(1 for result in results if result.ok)
+    if results and succeeded == len(results):
+        return EXIT_OK
+    return EXIT_PARTIAL if succeeded else EXIT_FAILED
+
+
+def refresh_power_table(instance_types: Optional[Sequence[str]] = None) -> int:
+    """
+    Bulk-refresh the offline Boavizta power table in the cache root.
+
+    Args:
+        instance_types: Types to refresh; every AWS type known to Boavizta when empty
+
+    Returns:
+        Number of table rows written
+    """
+    from src.infrastructure.cache import FileCacheRepository
+    from src.infrastructure.gateways.boavizta import BoaviztaClient
+
+    client = BoaviztaClient(repository=FileCacheRepository(Path(settings.cache_root)))
+    return client.refresh_power_table(list(instance_types) if instance_types else None)
+
+
+# ----------------------------------------------------------------------
+# Entry point
+# ----------------------------------------------------------------------
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli",
+        description="Carbon-Aware FinOps batch mode: run the analysis pipeline and export reports",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Refresh the fleet and export instance rows and aggregates")
+    run.add_argument("--period", type=int, nargs="+", choices=VALID_PERIODS, default=[30], help="Analysis period(s) in days")
+    run.add_argument("--regions", nargs="+", default=[settings.aws_region], help="EC2 regions to analyse")
+    run.add_argument("--format", dest="fmt", choices=sorted(FORMATS), default="csv", help="Report format")
+    run.add_argument("--output-dir", type=Path, default=Path("reports"), help="Directory for the report files")
+    run.add_argument("--jobs", type=int, default=1, help="Region × period jobs to run concurrently")
+    run.add_argument("--force-refresh", action="store_true", help="Bypass API caches and persisted enrichments")
+    run.add_argument("--log-level", default="WARNING", choices=("DEBUG", "INFO", "WARNING", "ERROR"), help="Log level")
+    run.add_argument("--quiet", action="store_true", help="Only report failures")
+
+    power = commands.add_parser("power-table", help="Refresh the offline Boavizta power table in bulk")
+    power.add_argument("--types", nargs="+", default=None, help="Instance types to refresh (default: all AWS types)")
+    power.add_argument("--log-level", default="INFO", choices=("DEBUG", "INFO", "WARNING", "ERROR"), help="Log level")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "power-table":
+        logging.basicConfig(level=getattr(logging, args.log_level), format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+        written = refresh_power_table(args.types)
+        print(f"⚡ {written} power models written to the offline table", flush=True)
+        return EXIT_OK if written else EXIT_FAILED
+
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    unmapped = [region for region in args.regions if region not in settings.aws_region_to_zone]
+    if unmapped:
+        parser.error(
+            f"no ElectricityMaps zone for {', '.join(unmapped)} "
+            f"(supported: {', '.join(sorted(settings.aws_region_to_zone))})"
+        )
+    if args.fmt == "parquet" and importlib.util.find_spec("pyarrow") is None:
+        parser.error("--format parquet requires pyarrow (pip install pyarrow)")
+
+    logging.basicConfig(level=getattr(logging, args.log_level), format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    for noisy in ("botocore", "boto3", "urllib3"):
+        logging.getLogger(noisy).setLevel(logging.CRITICAL)
+
+    options = BatchOptions(
+        periods=tuple(dict.fromkeys(args.period)),
+        regions=tuple(dict.fromkeys(args.regions)),
+        fmt=args.fmt,
+        output_dir=args.output_dir,
+        jobs=args.jobs,
+        force_refresh=args.force_refresh,
+    )
+
+    def echo(line: str) -> None:
+        if not args.quiet or line.startswith("❌"):
+            print(line, flush=True)
+
+    try:
+        results, summary_path = run_batch(options, echo=echo)
+    except OSError as error:
+        print(f"❌ Cannot write reports to {options.output_dir}: {error}", file=sys.stderr)
+        return EXIT_FAILED
+    except KeyboardInterrupt:
+        return 130
+    echo(f"📄 Summary written to {summary_path}")
+    return exit_code(results)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -52,6 +52,23 @@ except (ModuleNotFoundError, ImportError):  # pragma: no cover - lightweight fal
             self.boavizta_base_url: str = os.getenv("BOAVIZTA_BASE_URL", "https://api.boavizta.org/v1")
             self.http_timeout_seconds: float = float(os.getenv("HTTP_TIMEOUT_SECONDS", "30"))
             self.cache_root: Path = Path(os.getenv("CACHE_ROOT", ".cache"))
+            self.refresh_trace_export: bool = os.getenv("REFRESH_TRACE_EXPORT", "false").strip().lower() in {
+                "1",
+                "true",
+                "yes",
+                "on",
+            }
+            self.refresh_trace_history: int = int(os.getenv("REFRESH_TRACE_HISTORY", "20"))
+            self.timeseries_retention_days: int = int(os.getenv("TIMESERIES_RETENTION_DAYS", "90"))
+            self.monte_carlo_samples: int = int(os.getenv("MONTE_CARLO_SAMPLES", "10000"))
+            self.metrics_warehouse_enabled: bool = os.getenv("METRICS_WAREHOUSE_ENABLED", "true").strip().lower() in {
+                "1",
+                "true",
+                "yes",
+                "on",
+            }
+            self.metrics_warehouse_retention_days: int = int(os.getenv("METRICS_WAREHOUSE_RETENTION_DAYS", "400"))
+            self.dashboard_snapshot_history: int = int(os.getenv("DASHBOARD_SNAPSHOT_HISTORY", "5"))
             # Financial constants
             self.eur_usd_rate: float = float(os.getenv("EUR_USD_RATE", "0.92"))  # ECB official rate
             self.aws_region_to_zone: Dict[str, str] = {
@@ -109,6 +126,29 @@ else:
 
         cache_root: Path = Field(default=Path(".cache"), **_env_alias("CACHE_ROOT"))
 
+        # Export each refresh trace as Chrome-trace JSON under <cache_root>/api_data/traces (debugging aid)
+        refresh_trace_export: bool = Field(default=False, **_env_alias("REFRESH_TRACE_EXPORT"))
+
+        # Exported trace files kept, newest first
+        refresh_trace_history: int = Field(default=20, ge=1, **_env_alias("REFRESH_TRACE_HISTORY"))
+
+        # Day segments of the cost/carbon time series older than this are deleted (0 keeps everything)
+        timeseries_retention_days: int = Field(default=90, ge=0, **_env_alias("TIMESERIES_RETENTION_DAYS"))
+
+        # Samples for the business case uncertainty bands (0 keeps the fixed ±15% interval)
+        monte_carlo_samples: int = Field(default=10_000, ge=0, **_env_alias("MONTE_CARLO_SAMPLES"))
+
+        # Accumulate per-instance hourly facts in <cache_root>/api_data/warehouse/instance_metrics.sqlite
+        metrics_warehouse_enabled: bool = Field(default=True, **_env_alias("METRICS_WAREHOUSE_ENABLED"))
+
+        # Warehouse hours older than this are pruned after each refresh (0 keeps everything)
+        metrics_warehouse_retention_days: int = Field(
+            default=400, ge=0, **_env_alias("METRICS_WAREHOUSE_RETENTION_DAYS")
+        )
+
+        # Successful refreshes kept per period in <cache_root>/api_data/snapshots (0 disables warm starts)
+        dashboard_snapshot_history: int = Field(default=5, ge=0, **_env_alias("DASHBOARD_SNAPSHOT_HISTORY"))
+
         # Financial constants
         eur_usd_rate: float = Field(default=0.92, **_env_alias("EUR_USD_RATE"))  # ECB official rate
 
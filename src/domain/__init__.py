@@ -4,29 +4,52 @@ Domain Layer - Business logic, models, and domain services
 This package contains all domain-specific code:
 - models: Domain entities (EC2Instance, CarbonIntensity, BusinessCase, etc.)
 - calculations: Core mathematical functions (power, CO2, costs)
+- timeline: Runtime timeline engine (start/stop events → per-slot runtime)
+- shifting: Carbon-aware workload shifting simulator (lazy)
+- schedules: Office-hours auto-stop simulator (lazy)
+- uncertainty: Monte Carlo bands for business case savings (lazy)
 - validation: Data quality and plausibility checks
 - errors: Domain-specific exceptions
 - constants: Academic and business constants
 - services: Domain services (runtime, carbon analysis)
+
+The simulators depend on pandas and are only needed by the business case
+panel, so their names are resolved on first access (PEP 562) instead of at
+package import; ``from src.domain import simulate_shifting`` keeps working.
 """
 
+from importlib import import_module
+
 # Core domain models
 from .models import (
     EC2Instance,
+    HourlyBreakdown,
     AWSCostData,
     CarbonIntensity,
     PowerConsumption,
     BusinessCase,
     TimeSeriesPoint,
+    TimeSeriesRollup,
     APIHealthStatus,
+    RefreshTraceSummary,
+    MetricsHistorySummary,
     DashboardData,
+    RefreshProgress,
 )
 
 # Domain calculations
 from .calculations import (
     safe_round,
     calculate_simple_power_consumption,
+    calculate_power_consumption_vectorized,
     calculate_co2_emissions,
+    calculate_co2_hourly_precise_batch,
+)
+
+# Runtime timeline
+from .timeline import (
+    RuntimeTimeline,
+    runtime_matrix,
 )
 
 # Domain validation
@@ -49,20 +72,80 @@ from .constants import (
     UIConstants,
 )
 
+# Pandas-backed simulators, imported on first attribute access
+_LAZY_EXPORTS = {
+    # Workload shifting simulation
+    "ShiftPolicy": ".shifting",
+    "ShiftingResult": ".shifting",
+    "DEFAULT_SHIFT_POLICIES": ".shifting",
+    "simulate_shifting": ".shifting",
+    "simulate_fleet_shifting": ".shifting",
+    # Office-hours schedule simulation
+    "OfficeSchedule": ".schedules",
+    "IntervalIndex": ".schedules",
+    "ScheduleSimulation": ".schedules",
+    "schedule_grid": ".schedules",
+    "simulate_schedules": ".schedules",
+    "simulate_fleet_schedules": ".schedules",
+    # Business case uncertainty
+    "UncertaintyInputs": ".uncertainty",
+    "MonteCarloResult": ".uncertainty",
+    "build_uncertainty_inputs": ".uncertainty",
+    "simulate_business_case_uncertainty": ".uncertainty",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     # Models
     "EC2Instance",
+    "HourlyBreakdown",
     "AWSCostData",
     "CarbonIntensity",
     "PowerConsumption",
     "BusinessCase",
     "TimeSeriesPoint",
+    "TimeSeriesRollup",
     "APIHealthStatus",
+    "RefreshTraceSummary",
+    "MetricsHistorySummary",
     "DashboardData",
+    "RefreshProgress",
     # Calculations
     "safe_round",
     "calculate_simple_power_consumption",
+    "calculate_power_consumption_vectorized",
     "calculate_co2_emissions",
+    "calculate_co2_hourly_precise_batch",
+    # Timeline
+    "RuntimeTimeline",
+    "runtime_matrix",
+    # Shifting
+    "ShiftPolicy",
+    "ShiftingResult",
+    "DEFAULT_SHIFT_POLICIES",
+    "simulate_shifting",
+    "simulate_fleet_shifting",
+    # Schedules
+    "OfficeSchedule",
+    "IntervalIndex",
+    "ScheduleSimulation",
+    "schedule_grid",
+    "simulate_schedules",
+    "simulate_fleet_schedules",
+    # Uncertainty
+    "UncertaintyInputs",
+    "MonteCarloResult",
+    "build_uncertainty_inputs",
+    "simulate_business_case_uncertainty",
     # Validation
     "validate_instance_data",
     "validate_dashboard_data",
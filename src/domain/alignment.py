@@ -0,0 +1,205 @@
+"""
+Carbon intensity alignment to hourly slots.
+
+ElectricityMaps history is identical for every instance of a refresh, so it
+is aligned once into a read-only NumPy vector and shared by all instances.
+Entries are parsed once and dropped into hour buckets relative to the window
+start; empty buckets are filled by linear interpolation between neighbouring
+hours (constant extrapolation at the edges).
+
+``bucket_local_series`` does the same bucketing for the dashboard time
+series, which is keyed by naive local wall-clock time at any resolution.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Longest run of missing hours bridged by interpolation in full-period windows
+CARBON_MAX_GAP_HOURS = 3
+
+
+def _parse_entry(entry: Dict) -> Optional[tuple[float, float]]:
+    """Return ``(epoch_seconds, intensity)`` for a history entry or ``None`` if unusable."""
+    dt_value = entry.get("datetime") or entry.get("hour_key")
+    value = entry.get("carbonIntensity") or entry.get("value")
+    if not dt_value or value is None:
+        return None
+
+    if isinstance(dt_value, str):
+        dt_value = datetime.fromisoformat(dt_value.replace("Z", "+00:00"))
+    if dt_value.tzinfo is None:
+        dt_value = dt_value.replace(tzinfo=timezone.utc)
+    return dt_value.timestamp(), float(value)
+
+
+def align_carbon_intensity_hourly(
+    carbon_history: Optional[Sequence[Dict]],
+    num_hours: int = 24,
+    *,
+    window_start: Optional[datetime] = None,
+    max_gap_hours: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Align ElectricityMaps history to ``num_hours`` hourly slots.
+
+    Args:
+        carbon_history: Entries like ``{'datetime': '...', 'carbonIntensity': 280}``
+            (``hour_key``/``value`` from self-collected data are accepted as well)
+        num_hours: Number of hourly slots
+        window_start: Start of the first slot (default: now - ``num_hours``)
+        max_gap_hours: If set, slots further than this from the nearest observed
+            hour stay ``NaN`` instead of being interpolated/extrapolated
+
+    Returns:
+        Read-only float array of ``num_hours`` intensities (g/kWh). The first
+        entry inside a slot wins; empty slots are linearly interpolated.
+        Without any usable entry the array is all zeros (all ``NaN`` when
+        ``max_gap_hours`` is set).
+    """
+    if window_start is None:
+        window_start = datetime.now(timezone.utc) - timedelta(hours=num_hours)
+    elif window_start.tzinfo is None:
+        window_start = window_start.replace(tzinfo=timezone.utc)
+
+    result = np.zeros(num_hours) if max_gap_hours is None else np.full(num_hours, np.nan)
+    if not carbon_history:
+        logger.warning("No carbon history provided, returning zeros")
+        result.flags.writeable = False
+        return result
+
+    parsed: List[tuple[float, float]] = []
+    for entry in carbon_history:
+        try:
+            item = _parse_entry(entry)
+        except (ValueError, TypeError, AttributeError) as error:
+            logger.debug(f"Skipping invalid carbon entry: {entry}, error: {error}")
+            continue
+        if item is not None:
+            parsed.append(item)
+
+    if not parsed:
+        logger.warning("No valid carbon data found, returning zeros")
+        result.flags.writeable = False
+        return result
+
+    epochs, values = np.asarray(parsed, dtype=np.float64).T
+    order = np.argsort(epochs, kind="stable")
+    buckets = np.floor((epochs[order] - window_start.timestamp()) / 3600.0).astype(np.int64)
+    values = values[order]
+
+    in_window = (buckets >= 0) & (buckets < num_hours)
+    known_slots, first_index = np.unique(buckets[in_window], return_index=True)
+    known_values = values[in_window][first_index]
+
+    slots = np.arange(num_hours)
+    if known_slots.size:
+        result = np.interp(slots, known_slots, known_values)
+        if max_gap_hours is not None:
+            right = np.clip(np.searchsorted(known_slots, slots), 0, known_slots.size - 1)
+            left = np.clip(right - 1, 0, known_slots.size - 1)
+            distance = np.minimum(np.abs(known_slots[right] - slots), np.abs(slots - known_slots[left]))
+            result[distance > max_gap_hours] = np.nan
+    elif max_gap_hours is None:
+        # History exists but not inside the window - fall back to its average
+        result = np.full(num_hours, values.mean())
+
+    logger.info(
+        f"Aligned {num_hours} hours of carbon intensity data "
+        f"({known_slots.size} observed, avg: {np.nanmean(result) if np.isfinite(result).any() else 0.0:.1f} g/kWh)"
+    )
+    result.flags.writeable = False
+    return result
+
+
+def align_hourly_values(
+    timestamps: Sequence[datetime],
+    values: Sequence[float],
+    window_start: datetime,
+    num_hours: int,
+) -> np.ndarray:
+    """
+    Place hourly datapoints (e.g. CloudWatch CPU) into their window slots.
+
+    Slots without a datapoint are ``NaN``; no interpolation is applied.
+    """
+    result = np.full(num_hours, np.nan)
+    if not values:
+        return result
+
+    origin = window_start.timestamp()
+    epochs = np.fromiter(
+        ((ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)).timestamp() for ts in timestamps),
+        dtype=np.float64,
+        count=len(timestamps),
+    )
+    slots = np.floor((epochs - origin) / 3600.0).astype(np.int64)
+    in_window = (slots >= 0) & (slots < num_hours)
+    result[slots[in_window]] = np.asarray(values, dtype=np.float64)[: len(timestamps)][in_window]
+    return result
+
+
+def _local_offsets(epochs: np.ndarray) -> np.ndarray:
+    """UTC offset (seconds) of the local timezone at each epoch, evaluated once per distinct hour."""
+    hours, inverse = np.unique(epochs // 3600, return_inverse=True)
+    offsets = np.fromiter((time.localtime(int(hour) * 3600).tm_gmtoff for hour in hours), dtype=np.int64, count=hours.size)
+    return offsets[inverse]
+
+
+def bucket_local_series(
+    entries: Optional[Sequence[Dict]],
+    timestamp_keys: Sequence[str],
+    value_keys: Sequence[str],
+    *,
+    resolution: timedelta = timedelta(hours=1),
+) -> pd.Series:
+    """
+    Bucket ``entries`` into local wall-clock slots of ``resolution``.
+
+    Timestamps are ISO strings or datetimes (naive ones are UTC); the first
+    truthy ``timestamp_keys``/``value_keys`` field of each entry is used.
+    Unparseable entries are dropped, and the last entry per slot wins.
+
+    Returns:
+        Float series on a sorted, naive local ``DatetimeIndex`` of slot starts
+    """
+    if not entries:
+        return pd.Series(dtype=np.float64, index=pd.DatetimeIndex([]))
+
+    def _first(entry: Dict, keys: Sequence[str]) -> Any:
+        for key in keys:
+            value = entry.get(key)
+            if value:
+                return value
+        return entry.get(keys[-1])
+
+    raw_timestamps = [_first(entry, timestamp_keys) for entry in entries]
+    raw_values = [_first(entry, value_keys) for entry in entries]
+
+    timestamps = pd.to_datetime(
+        pd.Series(raw_timestamps, dtype=object), utc=True, errors="coerce", format="ISO8601"
+    )
+    values = pd.to_numeric(pd.Series(raw_values, dtype=object), errors="coerce")
+    valid = timestamps.notna().to_numpy() & values.notna().to_numpy()
+    if not valid.any():
+        return pd.Series(dtype=np.float64, index=pd.DatetimeIndex([]))
+
+    epochs = timestamps[valid].to_numpy(dtype="datetime64[s]").astype(np.int64)
+    step = max(int(resolution.total_seconds()), 1)
+    local = epochs + _local_offsets(epochs)
+    slots = local - local % step
+
+    series = pd.Series(values[valid].to_numpy(dtype=np.float64), index=pd.to_datetime(slots, unit="s"))
+    series = series[~series.index.duplicated(keep="last")]
+    return series.sort_index()
+
+
+__all__ = ["CARBON_MAX_GAP_HOURS", "align_carbon_intensity_hourly", "align_hourly_values", "bucket_local_series"]
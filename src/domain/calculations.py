@@ -8,6 +8,9 @@ import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+from numpy.typing import ArrayLike
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,6 +55,35 @@ def calculate_simple_power_consumption(base_power_watts: float, cpu_utilization:
     return effective_power_watts
 
 
+def calculate_power_consumption_vectorized(base_power_watts: ArrayLike, cpu_utilization: ArrayLike) -> np.ndarray:
+    """Vectorized form of ``calculate_simple_power_consumption``.
+
+    Evaluates Power = Base × (0.3 + 0.7 × CPU/100) for whole arrays at once,
+    e.g. one base power per instance against an instances × hours CPU matrix.
+
+    Broadcasting:
+    - A 1-D ``base_power_watts`` of length N combined with an (N, H) CPU matrix
+      is applied row-wise (one base power per instance).
+    - Any other shapes follow standard NumPy broadcasting rules.
+
+    Args:
+        base_power_watts: Base power consumption(s) from Boavizta
+        cpu_utilization: CPU utilization values 0-100%
+
+    Returns:
+        Effective power consumption in watts. ``NaN`` inputs stay ``NaN`` so
+        missing CPU hours or unknown power models can be masked by the caller.
+    """
+    base = np.asarray(base_power_watts, dtype=float)
+    cpu = np.asarray(cpu_utilization, dtype=float)
+    if base.ndim == 1 and cpu.ndim == 2 and base.shape[0] == cpu.shape[0]:
+        base = base[:, np.newaxis]
+
+    safe_base_power = np.maximum(base, 0.1)
+    safe_cpu_utilization = np.clip(cpu, 0.0, 100.0)
+    return safe_base_power * (0.3 + 0.7 * (safe_cpu_utilization / 100.0))
+
+
 def calculate_co2_emissions(power_watts: float, carbon_intensity_g_per_kwh: float, runtime_hours: float) -> float:
     """Calculate CO2 emissions from power and grid intensity.
 
@@ -166,7 +198,7 @@ def calculate_co2_hourly_precise(
 
     for i in range(num_hours):
         cpu = cpu_values_hourly[i]
-        carbon = carbon_intensity_hourly[i]
+        carbon = float(carbon_intensity_hourly[i])
         runtime = runtime_hours_per_slot[i]
         timestamp = timestamps[i]
 
@@ -253,9 +285,172 @@ def calculate_co2_hourly_precise(
     }
 
 
+def _classify_hourly_coverage(coverage_hours: int, num_hours: int) -> str:
+    """Data quality by share of hours with valid data (24h: high ≥20h, medium ≥12h)."""
+    if num_hours <= 0:
+        return "low"
+    ratio = coverage_hours / num_hours
+    if ratio >= 20 / 24:
+        return "high"
+    if ratio >= 0.5:
+        return "medium"
+    return "low"
+
+
+def calculate_co2_hourly_precise_batch(
+    base_power_watts: ArrayLike,
+    cpu_values_hourly: ArrayLike,
+    carbon_intensity_hourly: ArrayLike,
+    runtime_hours_per_slot: ArrayLike,
+    hourly_price_usd: Optional[ArrayLike] = None,
+    eur_usd_rate: float = 0.92,
+    power_watts_hourly: Optional[ArrayLike] = None,
+) -> Dict[str, Any]:
+    """
+    Fleet-wide hourly-precise CO2 and cost in one NumPy pass.
+
+    Same per-hour formulas as ``calculate_co2_hourly_precise``, evaluated for
+    an instances × hours matrix instead of a Python loop per instance and hour.
+
+    Args:
+        base_power_watts: Base power per instance, shape (N,)
+        cpu_values_hourly: CPU % per instance and hour, shape (N, H); NaN = missing
+        carbon_intensity_hourly: Carbon intensity g/kWh, shape (H,) shared by
+            all instances or (N, H); NaN = missing
+        runtime_hours_per_slot: Runtime fractions (0.0-1.0), shape (N, H)
+        hourly_price_usd: Optional hourly price per instance, shape (N,);
+            NaN = no price (cost 0.0, as in the scalar function)
+        eur_usd_rate: EUR/USD exchange rate (default: 0.92)
+        power_watts_hourly: Optional precomputed power per instance and hour,
+            shape (N, H), e.g. from a ``PowerEngine``; derived from
+            ``base_power_watts`` and the CPU matrix when omitted
+
+    Returns:
+        Dictionary of per-instance arrays (shape (N,)) unless noted:
+        - total_co2_kg: CO2 over hours with valid data (rounded to 6 decimals)
+        - total_cost_eur: Cost over all running hours (rounded to 4 decimals)
+        - coverage_hours: Running hours with valid CPU and carbon data
+        - runtime_hours / runtime_coverage: Total runtime and its share backed by valid data
+        - data_quality: List of 'high' / 'medium' / 'low' per instance
+        - co2_g, power_watts, cost_eur, running, valid: (N, H) matrices
+        - method: Always 'hourly'
+    """
+    base = np.atleast_1d(np.asarray(base_power_watts, dtype=np.float64))
+    cpu = np.atleast_2d(np.asarray(cpu_values_hourly, dtype=np.float64))
+    carbon = np.asarray(carbon_intensity_hourly, dtype=np.float64)
+    runtime = np.nan_to_num(np.atleast_2d(np.asarray(runtime_hours_per_slot, dtype=np.float64)), nan=0.0)
+
+    num_hours = min(cpu.shape[1], carbon.shape[-1], runtime.shape[1])
+    cpu, runtime = cpu[:, :num_hours], runtime[:, :num_hours]
+    carbon = carbon[..., :num_hours]
+    if carbon.ndim == 1:
+        carbon = carbon[np.newaxis, :]
+
+    running = runtime > 0.0
+    valid = running & np.isfinite(cpu) & np.isfinite(carbon)
+
+    if power_watts_hourly is None:
+        power_watts = calculate_power_consumption_vectorized(base, cpu)
+    else:
+        power_watts = np.atleast_2d(np.asarray(power_watts_hourly, dtype=np.float64))[:, :num_hours]
+    with np.errstate(invalid="ignore"):
+        co2_g = np.where(valid, power_watts / 1000.0 * carbon * runtime, 0.0)
+
+    if hourly_price_usd is None:
+        cost_eur = np.zeros_like(runtime)
+    else:
+        price = np.nan_to_num(
+            np.broadcast_to(np.asarray(hourly_price_usd, dtype=np.float64), base.shape), nan=0.0
+        )
+        cost_eur = np.where(running, price[:, np.newaxis] * runtime * eur_usd_rate, 0.0)
+
+    runtime_hours = runtime.sum(axis=1)
+    valid_runtime = np.where(valid, runtime, 0.0).sum(axis=1)
+    coverage_hours = valid.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        runtime_coverage = np.where(runtime_hours > 0.0, valid_runtime / runtime_hours, 0.0)
+
+    return {
+        "total_co2_kg": np.round(co2_g.sum(axis=1) / 1000.0, 6),
+        "total_cost_eur": np.round(cost_eur.sum(axis=1), 4),
+        "coverage_hours": coverage_hours,
+        "runtime_hours": runtime_hours,
+        "runtime_coverage": runtime_coverage,
+        "data_quality": [_classify_hourly_coverage(int(hours), num_hours) for hours in coverage_hours],
+        "co2_g": co2_g,
+        "power_watts": power_watts,
+        "cost_eur": cost_eur,
+        "running": running,
+        "valid": valid,
+        "method": "hourly",
+    }
+
+
+def calculate_co2_hourly_precise_vectorized(
+    base_power_watts: float,
+    cpu_values_hourly: ArrayLike,
+    carbon_intensity_hourly: ArrayLike,
+    runtime_hours_per_slot: ArrayLike,
+    hourly_price_usd: Optional[float] = None,
+    eur_usd_rate: float = 0.92,
+    power_watts_hourly: Optional[ArrayLike] = None,
+) -> Dict[str, Any]:
+    """
+    Array form of ``calculate_co2_hourly_precise`` for windows of any length.
+
+    All inputs are aligned per hour slot (same length, e.g. 720 for 30 days).
+    Missing CPU or carbon values are ``NaN``; such hours are excluded from the
+    CO2 total but still count towards runtime and cost. Single-instance view
+    of ``calculate_co2_hourly_precise_batch``.
+
+    Formula for each hour h (identical to the scalar version):
+        Power_h = Base × (0.3 + 0.7 × CPU_h/100)
+        CO2_h = (Power_h / 1000) × Carbon_h × Runtime_h
+        Cost_h = HourlyPrice_USD × Runtime_h × EUR_USD_Rate
+
+    Returns:
+        Dictionary containing:
+        - total_co2_kg: CO2 over hours with valid data
+        - total_cost_eur: Cost over all running hours (0.0 without price)
+        - co2_g / power_watts / cost_eur: per-hour arrays
+        - running / valid: per-hour boolean masks
+        - coverage_hours: Number of running hours with valid CPU and carbon data
+        - runtime_hours: Total runtime in the window
+        - runtime_coverage: Share of runtime backed by valid data (0.0-1.0)
+        - data_quality: 'high' (≥20/24 of hours), 'medium' (≥50%), or 'low'
+        - method: Always 'hourly'
+    """
+    batch = calculate_co2_hourly_precise_batch(
+        [base_power_watts],
+        np.asarray(cpu_values_hourly, dtype=np.float64)[np.newaxis, :],
+        carbon_intensity_hourly,
+        np.asarray(runtime_hours_per_slot, dtype=np.float64)[np.newaxis, :],
+        None if hourly_price_usd is None else [hourly_price_usd],
+        eur_usd_rate,
+        None if power_watts_hourly is None else np.asarray(power_watts_hourly, dtype=np.float64)[np.newaxis, :],
+    )
+    return {
+        "total_co2_kg": float(batch["total_co2_kg"][0]),
+        "total_cost_eur": float(batch["total_cost_eur"][0]),
+        "co2_g": batch["co2_g"][0],
+        "power_watts": batch["power_watts"][0],
+        "cost_eur": batch["cost_eur"][0],
+        "running": batch["running"][0],
+        "valid": batch["valid"][0],
+        "coverage_hours": int(batch["coverage_hours"][0]),
+        "runtime_hours": float(batch["runtime_hours"][0]),
+        "runtime_coverage": float(batch["runtime_coverage"][0]),
+        "data_quality": batch["data_quality"][0],
+        "method": "hourly",
+    }
+
+
 __all__ = [
     "safe_round",
     "calculate_simple_power_consumption",
+    "calculate_power_consumption_vectorized",
     "calculate_co2_emissions",
     "calculate_co2_hourly_precise",
+    "calculate_co2_hourly_precise_batch",
+    "calculate_co2_hourly_precise_vectorized",
 ]
@@ -85,6 +85,12 @@ class UIConstants:
 
     STREAMLIT_CACHE_TTL_SECONDS: int = 300  # 5 minutes cache for dynamic calculations
 
+    # Chart payload limits (server-side decimation keeps browser payloads bounded)
+    CHART_MAX_POINTS: int = 1500  # Points per line trace (LTTB)
+    CHART_MAX_BARS: int = 800  # Bars per trace before switching to min/max-decimated WebGL areas
+    HEATMAP_MAX_ROWS: int = 120  # Instance blocks in fleet heatmaps
+    HEATMAP_MAX_COLUMNS: int = 360  # Hour blocks in fleet heatmaps
+
 
 # =============================================================================
 # EXPORT ALL CONSTANTS
@@ -8,9 +8,126 @@ This module consolidates all domain entities:
 - Dashboard models (UI data structures, API health)
 """
 
-from dataclasses import dataclass, field
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+import hashlib
+import json
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field, fields, is_dataclass, replace
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple, Union
+
+import numpy as np
+
+from src.domain.constants import AcademicConstants
+
+
+def _round_optional(value: Optional[float], decimals: int) -> Optional[float]:
+    """Round like the former stored deprecated fields; None stays None."""
+    if value is None:
+        return None
+    return round(float(value), decimals)
+
+
+# ============================================================================
+# HOURLY BREAKDOWN
+# ============================================================================
+
+
+@dataclass(frozen=True, eq=False)
+class HourlyBreakdown(Sequence):
+    """
+    Columnar hour-by-hour CO2 breakdown of a single instance.
+
+    Each column is a contiguous float32 array with one value per hour of the
+    analysis window; ``timestamps`` (datetime64, UTC) is shared by every
+    instance of a refresh. Indexing yields the legacy row dicts on demand, so
+    code iterating ``hourly_co2_breakdown`` keeps working.
+    """
+
+    timestamps: np.ndarray
+    co2_g: np.ndarray
+    power_watts: np.ndarray
+    cpu_percent: np.ndarray
+    carbon_intensity: np.ndarray
+    runtime_fraction: np.ndarray
+    running: np.ndarray
+    """True for running hours with valid CPU and carbon data"""
+    cost_eur: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_result(
+        cls,
+        result: Dict[str, Any],
+        *,
+        timestamps: np.ndarray,
+        cpu_values_hourly: Any,
+        carbon_intensity_hourly: Any,
+        runtime_hours_per_slot: Any,
+        include_cost: bool,
+    ) -> "HourlyBreakdown":
+        """Build from a ``calculate_co2_hourly_precise_vectorized`` result and its inputs."""
+        valid = np.asarray(result["valid"], dtype=bool)
+
+        def _column(values: Any) -> np.ndarray:
+            column = np.asarray(values, dtype=np.float32)
+            return np.where(valid, column, np.float32(np.nan))
+
+        return cls(
+            timestamps=timestamps,
+            co2_g=np.asarray(result["co2_g"], dtype=np.float32),
+            power_watts=_column(result["power_watts"]),
+            cpu_percent=_column(cpu_values_hourly),
+            carbon_intensity=_column(carbon_intensity_hourly),
+            runtime_fraction=np.nan_to_num(np.asarray(runtime_hours_per_slot, dtype=np.float32), nan=0.0),
+            running=valid,
+            cost_eur=np.asarray(result["cost_eur"], dtype=np.float32) if include_cost else None,
+        )
+
+    @property
+    def data_missing(self) -> np.ndarray:
+        """Running hours without CPU or carbon data"""
+        return (self.runtime_fraction > 0) & ~self.running
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the per-instance columns (the shared time axis excluded)"""
+        columns = (self.co2_g, self.power_watts, self.cpu_percent, self.carbon_intensity, self.runtime_fraction, self.running)
+        return sum(column.nbytes for column in columns) + (self.cost_eur.nbytes if self.cost_eur is not None else 0)
+
+    def __len__(self) -> int:
+        return int(self.co2_g.shape[0])
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self._row(position) for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("hourly breakdown index out of range")
+        return self._row(index)
+
+    def _row(self, index: int) -> Dict[str, Any]:
+        timestamp = self.timestamps[index].astype("datetime64[s]").item().replace(tzinfo=timezone.utc)
+        row: Dict[str, Any] = {"timestamp": timestamp.isoformat()}
+        if self.running[index]:
+            row.update(
+                {
+                    "co2_g": round(float(self.co2_g[index]), 3),
+                    "power_watts": round(float(self.power_watts[index]), 2),
+                    "cpu_percent": round(float(self.cpu_percent[index]), 1),
+                    "carbon_intensity": round(float(self.carbon_intensity[index]), 1),
+                    "runtime_fraction": round(float(self.runtime_fraction[index]), 2),
+                    "running": True,
+                }
+            )
+        else:
+            row.update({"co2_g": 0.0, "running": False})
+            if self.runtime_fraction[index] > 0:
+                row["runtime_fraction"] = round(float(self.runtime_fraction[index]), 2)
+                row["data_missing"] = True
+        if self.cost_eur is not None:
+            row["cost_eur"] = round(float(self.cost_eur[index]), 4)
+        return row
 
 
 # ============================================================================
@@ -18,9 +135,14 @@ from typing import List, Optional, Dict, Any
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class EC2Instance:
-    """EC2 instance with carbon and cost data"""
+    """
+    EC2 instance with carbon and cost data.
+
+    Slotted to keep large fleets lean; the deprecated ``monthly_*`` names are
+    derived on access instead of being stored.
+    """
 
     instance_id: str
     instance_type: str
@@ -44,12 +166,12 @@ class EC2Instance:
     period_days: int = 30
     """Analysis window in days (1, 7, or 30). Determines timeframe for all calculations."""
 
-    # Hourly-Precise Method (24h real-time data scaled to period)
+    # Hourly-Precise Method (hour-by-hour over the full period)
     co2_kg_hourly: Optional[float] = None
-    """CO2 emissions using Hourly-Precise method: daily_co2_kg × period_days"""
+    """CO2 emissions using Hourly-Precise method: sum over every hour of the period"""
 
     cost_eur_hourly: Optional[float] = None
-    """Cost using Hourly-Precise method: daily_cost × period_days"""
+    """Cost using Hourly-Precise method: sum over every running hour of the period"""
 
     # Average-Based Method (full period runtime)
     co2_kg_average: Optional[float] = None
@@ -63,57 +185,74 @@ class EC2Instance:
     # ========================================================================
 
     daily_co2_kg: Optional[float] = None
-    """Daily CO2 emissions calculated with hourly precision (24h window)"""
+    """CO2 emissions of the last 24 hours of the period window (hourly precision)"""
 
     daily_runtime_hours: Optional[float] = None
-    """Runtime hours from last 24h window (sum of hourly fractions)"""
+    """Runtime hours from the last 24 hours of the period window (sum of hourly fractions)"""
 
     co2_calculation_method: str = "average"
     """
     Method used for CO2 calculation:
-    - 'hourly': Hourly-Precise calculation with 24h data
+    - 'hourly': Hourly-Precise calculation over the full period
     - 'average': Average-Based calculation (fallback)
     - 'none': No CO2 data available
     """
 
-    hourly_co2_breakdown: Optional[List[Dict]] = None
+    hourly_co2_breakdown: Optional[HourlyBreakdown] = None
     """
     Hourly breakdown of CO2 emissions (only available for hourly method).
-    Format: List of dicts with keys: timestamp, co2_g, power_watts, cpu_percent, carbon_intensity, runtime_fraction, running
+    Columnar arrays (see ``HourlyBreakdown``); rows are available as dicts with keys:
+    timestamp, co2_g, power_watts, cpu_percent, carbon_intensity, runtime_fraction, running
+    (one per hour of the period; running hours without CPU/carbon data carry ``data_missing``)
     """
 
     instance_age_days: Optional[int] = None
     """Days since instance launch (for data completeness validation)"""
 
     data_completeness_24h: Optional[int] = None
-    """Number of hours with valid data in 24h window (0-24)"""
+    """Number of hours with valid data in the last 24 hours of the window (0-24)"""
+
+    def __post_init__(self):
+        if self.data_sources is None:
+            self.data_sources = []
 
     # ========================================================================
-    # DEPRECATED FIELDS (Kept for backward compatibility, will be removed in v2.0.0)
+    # DEPRECATED FIELDS (Kept for backward compatibility, will be removed in v3.0.0)
+    # Read-only views over the period-based fields above.
     # Migration Guide: docs/migration/field-deprecation.md
     # ========================================================================
 
-    monthly_co2_kg: Optional[float] = None
-    """DEPRECATED: Use co2_kg_average instead. Maps to period-based calculation."""
-
-    monthly_cost_usd: Optional[float] = None
-    """DEPRECATED: Use cost_eur_hourly or cost_eur_average instead."""
+    @property
+    def monthly_co2_kg(self) -> Optional[float]:
+        """DEPRECATED: Use co2_kg_average instead. Maps to period-based calculation."""
+        return _round_optional(self.co2_kg_average or self.co2_kg_hourly, 3)
 
-    monthly_cost_eur: Optional[float] = None
-    """DEPRECATED: Use cost_eur_average instead. Maps to period-based calculation."""
+    @property
+    def monthly_cost_usd(self) -> Optional[float]:
+        """DEPRECATED: Use cost_eur_hourly or cost_eur_average instead."""
+        if not self.cost_eur_average:
+            return None
+        return round(self.cost_eur_average / AcademicConstants.get_eur_usd_rate(), 2)
 
-    monthly_co2_kg_projected: Optional[float] = None
-    """DEPRECATED: Use co2_kg_hourly instead. Was: daily_co2_kg × 30"""
+    @property
+    def monthly_cost_eur(self) -> Optional[float]:
+        """DEPRECATED: Use cost_eur_average instead. Maps to period-based calculation."""
+        return _round_optional(self.cost_eur_average, 2)
 
-    monthly_co2_kg_30d: Optional[float] = None
-    """DEPRECATED: Use co2_kg_average instead. Was: 30d actual runtime calculation."""
+    @property
+    def monthly_co2_kg_projected(self) -> Optional[float]:
+        """DEPRECATED: Use co2_kg_hourly instead. Was: daily_co2_kg × 30"""
+        return _round_optional(self.co2_kg_hourly, 3)
 
-    monthly_cost_projected_eur: Optional[float] = None
-    """DEPRECATED: Use cost_eur_hourly instead. Was: 24h projected to 30d"""
+    @property
+    def monthly_co2_kg_30d(self) -> Optional[float]:
+        """DEPRECATED: Use co2_kg_average instead. Was: 30d actual runtime calculation."""
+        return _round_optional(self.co2_kg_average, 3)
 
-    def __post_init__(self):
-        if self.data_sources is None:
-            self.data_sources = []
+    @property
+    def monthly_cost_projected_eur(self) -> Optional[float]:
+        """DEPRECATED: Use cost_eur_hourly instead. Was: 24h projected to 30d"""
+        return _round_optional(self.cost_eur_hourly, 2)
 
 
 @dataclass
@@ -132,7 +271,7 @@ class AWSCostData:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class CarbonIntensity:
     """Carbon intensity data structure."""
 
@@ -178,13 +317,19 @@ class BusinessCase:
     analysis_period_days: int = 30
     """Analysis period for which savings are calculated (1, 7, or 30 days)"""
 
+    cost_savings_band_eur: Optional[Tuple[float, float, float]] = None
+    """Monte Carlo 5th/50th/95th percentile of the cost savings (None without uncertainty inputs)"""
+
+    co2_savings_band_kg: Optional[Tuple[float, float, float]] = None
+    """Monte Carlo 5th/50th/95th percentile of the CO2 savings"""
+
 
 # ============================================================================
 # DASHBOARD MODELS
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeSeriesPoint:
     """Hourly aligned snapshot for time alignment coverage."""
 
@@ -194,6 +339,32 @@ class TimeSeriesPoint:
     carbon_intensity: Optional[float] = None
 
 
+@dataclass
+class TimeSeriesRollup:
+    """
+    Cost/CO2/intensity aggregates per time bucket at one resolution.
+
+    ``values`` maps ``"<column>_<stat>"`` (stats: sum, mean, min, max, count)
+    to one float per bucket, e.g. ``values["co2_kg_per_hour_sum"]``.
+    """
+
+    resolution: str
+    """Bucket width: hour, day, week or month"""
+
+    timestamps: np.ndarray
+    """Bucket starts (datetime64[s], naive local time)"""
+
+    values: Dict[str, np.ndarray] = field(default_factory=dict)
+    coverage: Optional[np.ndarray] = None
+    """Stored hourly slots ÷ slots of a complete bucket (0..1)"""
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def stat(self, column: str, stat: str = "mean") -> np.ndarray:
+        return self.values[f"{column}_{stat}"]
+
+
 @dataclass
 class APIHealthStatus:
     """API health monitoring data"""
@@ -207,6 +378,45 @@ class APIHealthStatus:
     last_api_call: Optional[datetime] = None
 
 
+@dataclass
+class RefreshTraceSummary:
+    """Per-refresh timing summary derived from the refresh trace (see ``src.domain.tracing``)."""
+
+    trace_id: str
+    started_at: datetime
+    total_seconds: float
+    stages: Dict[str, float] = field(default_factory=dict)
+    """Seconds per pipeline stage, in execution order"""
+
+    slowest_stage: Optional[str] = None
+    operations: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    """Per span name: calls, seconds, cache_hits, cache_misses (gateway calls, enrichments)"""
+
+    slowest_instances: List[Tuple[str, float]] = field(default_factory=list)
+    """(instance_id, seconds) of the slowest enrichments"""
+
+    span_count: int = 0
+    trace_path: Optional[str] = None
+    """Exported Chrome trace file, if any"""
+
+
+@dataclass
+class MetricsHistorySummary:
+    """Long-window totals answered locally from the metrics warehouse (see ``MetricsWarehouse``)."""
+
+    month_start: datetime
+    month_to_date_co2_kg: float = 0.0
+    month_to_date_cost_eur: float = 0.0
+    month_to_date_runtime_hours: float = 0.0
+    month_to_date_instances: int = 0
+    trend_days: int = 30
+    daily: List[Dict[str, Any]] = field(default_factory=list)
+    """Per UTC day over the last ``trend_days``: date, co2_kg, cost_eur, runtime_hours, instances"""
+
+    history_start: Optional[datetime] = None
+    """Earliest stored hour (history accumulates from the first recorded refresh)"""
+
+
 @dataclass
 class DashboardData:
     """
@@ -241,10 +451,10 @@ class DashboardData:
     # ========================================================================
 
     total_co2_hourly: float = 0.0
-    """Total CO2 emissions using Hourly-Precise method (24h scaled to period)"""
+    """Total CO2 emissions using Hourly-Precise method (full period, hour by hour)"""
 
     total_cost_hourly: float = 0.0
-    """Total costs using Hourly-Precise method (24h scaled to period)"""
+    """Total costs using Hourly-Precise method (full period, hour by hour)"""
 
     # ========================================================================
     # PERIOD TOTALS - AVERAGE-BASED METHOD
@@ -273,6 +483,8 @@ class DashboardData:
     carbon_intensity: Optional[CarbonIntensity] = None
     carbon_history: List[Dict[str, Any]] = field(default_factory=list)
     self_collected_carbon_history: List[Dict[str, Any]] = field(default_factory=list)
+    carbon_intensity_hourly: Optional[np.ndarray] = None
+    """Carbon intensity per hour of the analysis window (aligned like the hourly breakdowns)"""
 
     validation_factor: Optional[float] = None
     """Cost validation: Cost Explorer ÷ Calculated (aligned period windows)"""
@@ -293,6 +505,12 @@ class DashboardData:
     academic_disclaimers: List[str] = field(default_factory=list)
     api_health_status: Optional[Dict[str, APIHealthStatus]] = None
 
+    refresh_trace: Optional[RefreshTraceSummary] = None
+    """Stage/gateway timings of the refresh that produced this data"""
+
+    metrics_history: Optional[MetricsHistorySummary] = None
+    """Month-to-date totals and daily trend from the local metrics warehouse"""
+
     # ========================================================================
     # DEPRECATED FIELDS (Backward compatibility, will be removed in v2.0.0)
     # Migration Guide: docs/migration/field-deprecation.md
@@ -317,6 +535,104 @@ class DashboardData:
     """DEPRECATED: Use total_co2_average instead. Was: 30d actual CO2"""
 
 
+@dataclass
+class RefreshProgress:
+    """
+    Running state of a streaming refresh (see ``FetchInfrastructureDataUseCase.iter_execute``).
+
+    One object is updated in place and yielded after every enriched instance, so
+    partial tables and totals can be rendered before the whole fleet is done.
+    The final update carries the complete ``dashboard_data``.
+
+    Key Attributes:
+        instances: Instances enriched so far (in processing order)
+        total: Number of instances being enriched
+        total_*: Running totals, identical to the final DashboardData totals once done
+        dashboard_data: Complete result, set on the final update only
+    """
+
+    period_days: int = 30
+    total: int = 0
+    instances: List[EC2Instance] = field(default_factory=list)
+
+    total_co2_hourly: float = 0.0
+    total_cost_hourly: float = 0.0
+    total_co2_average: float = 0.0
+    total_cost_average: float = 0.0
+    hourly_precise_count: int = 0
+    fallback_count: int = 0
+
+    dashboard_data: Optional[DashboardData] = None
+
+    @property
+    def processed(self) -> int:
+        return len(self.instances)
+
+    @property
+    def done(self) -> bool:
+        return self.dashboard_data is not None
+
+    @property
+    def fraction(self) -> float:
+        """Share of instances enriched so far (1.0 once done)"""
+        if self.done or not self.total:
+            return 1.0 if self.done else 0.0
+        return min(self.processed / self.total, 1.0)
+
+    def copy(self) -> "RefreshProgress":
+        """
+        Point-in-time copy for readers on other threads.
+
+        The running object keeps changing while the refresh continues; a copy
+        has an instance list and totals that always match each other.
+        """
+        return replace(self, instances=list(self.instances))
+
+    def include(self, instance: EC2Instance) -> None:
+        """Add an enriched instance to the running totals."""
+        self.instances.append(instance)
+        if instance.co2_calculation_method == "hourly":
+            self.hourly_precise_count += 1
+            if instance.cost_eur_hourly is not None:
+                self.total_cost_hourly += instance.cost_eur_hourly
+            if instance.co2_kg_hourly is not None:
+                self.total_co2_hourly += instance.co2_kg_hourly
+        elif instance.co2_calculation_method == "average":
+            self.fallback_count += 1
+        if instance.cost_eur_average is not None:
+            self.total_cost_average += instance.cost_eur_average
+        if instance.co2_kg_average is not None:
+            self.total_co2_average += instance.co2_kg_average
+
+
+# ============================================================================
+# SCHEMA
+# ============================================================================
+
+
+def dataclass_schema_digest(classes: Iterable[type]) -> str:
+    """Digest of the class names, field names, field types and field order of ``classes``."""
+    layout = sorted(
+        (cls.__qualname__, [(item.name, str(item.type)) for item in fields(cls)]) for cls in classes
+    )
+    return hashlib.sha256(json.dumps(layout).encode("utf-8")).hexdigest()[:16]
+
+
+@lru_cache(maxsize=None)
+def model_schema_digest() -> str:
+    """
+    Schema digest of every dataclass in this module.
+
+    Pickled models are stored with it (dashboard snapshots, enriched
+    instances) and ignored once any field is added, removed, renamed,
+    retyped or reordered. Slotted dataclasses pickle their state by field
+    position, so such a change would otherwise load as misaligned values.
+    """
+    return dataclass_schema_digest(
+        value for value in globals().values() if isinstance(value, type) and is_dataclass(value) and value.__module__ == __name__
+    )
+
+
 # ============================================================================
 # EXPORTS
 # ============================================================================
@@ -324,6 +640,7 @@ class DashboardData:
 __all__ = [
     # AWS Models
     "EC2Instance",
+    "HourlyBreakdown",
     "AWSCostData",
     # Carbon Models
     "CarbonIntensity",
@@ -332,6 +649,12 @@ __all__ = [
     "BusinessCase",
     # Dashboard Models
     "TimeSeriesPoint",
+    "TimeSeriesRollup",
     "APIHealthStatus",
+    "RefreshTraceSummary",
     "DashboardData",
+    "RefreshProgress",
+    # Schema
+    "dataclass_schema_digest",
+    "model_schema_digest",
 ]
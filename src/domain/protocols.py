@@ -11,7 +11,7 @@ References:
 """
 
 from __future__ import annotations
-from typing import Protocol, Optional, List, Any
+from typing import Protocol, Optional, List, Any, Sequence
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -285,6 +285,28 @@ class PowerModelGateway(Protocol):
         ...
 
 
+class PowerEngine(Protocol):
+    """
+    Protocol for vectorized CPU→power evaluation.
+
+    Backed by locally stored power models (``LocalPowerEngine`` over the
+    offline Boavizta table), so no API call happens per instance or hour.
+    """
+
+    def power_matrix(self, instance_types: Sequence[str], cpu_utilization: Any) -> Any:
+        """
+        Effective power in watts per instance (row) and hour (column).
+
+        Args:
+            instance_types: Instance type of each row
+            cpu_utilization: CPU % matrix, shape (len(instance_types), hours)
+
+        Returns:
+            NumPy array of the same shape; rows of unknown instance types are NaN
+        """
+        ...
+
+
 class InfrastructureGateway(Protocol):
     """
     Composite protocol combining all infrastructure operations.
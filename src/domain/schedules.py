@@ -0,0 +1,341 @@
+"""
+Office-hours auto-stop simulator.
+
+Replays running intervals (CloudTrail start/stop sessions) against candidate
+on-hours schedules and computes the exact runtime, cost and CO2 an auto-stop
+outside the schedule would have avoided, per instance and fleet-wide.
+
+All intervals of a fleet are concatenated into one ``IntervalIndex`` (CSR
+layout: one offsets array per instance). Every schedule becomes an hourly
+off-mask on a shared grid, turned into cumulative "off seconds" and
+"off seconds × carbon intensity" curves. The avoided amount of an interval is
+then ``F(end) - F(start)`` with ``F`` evaluated by linear interpolation, so
+schedules × intervals are evaluated in a single NumPy pass and summed per
+instance with a cumulative sum over the offsets.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from itertools import product
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.domain.models import EC2Instance
+from src.domain.shifting import DEFAULT_TIMEZONE, fleet_energy_profile
+from src.domain.timeline import RuntimeTimeline
+
+WEEKDAYS = (0, 1, 2, 3, 4)
+
+# Upper bound of schedules × intervals cells evaluated at once (~16 MB per float64 matrix)
+_BLOCK_CELLS = 2_000_000
+
+
+def _epoch(value: datetime) -> float:
+    return (value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value).timestamp()
+
+
+@dataclass(frozen=True)
+class OfficeSchedule:
+    """
+    On-hours during which instances keep running; they are stopped otherwise.
+
+    Attributes:
+        name: Label shown in reports
+        start_hour: Local hour instances are started (inclusive)
+        end_hour: Local hour instances are stopped (exclusive)
+        weekdays: Weekdays with on-hours (Monday = 0)
+        timezone: IANA time zone of the hours
+        holidays: Local dates without on-hours
+    """
+
+    name: str
+    start_hour: int = 8
+    end_hour: int = 18
+    weekdays: Tuple[int, ...] = WEEKDAYS
+    timezone: str = DEFAULT_TIMEZONE
+    holidays: Tuple[date, ...] = field(default_factory=tuple)
+
+    def on_mask(self, hour_starts: np.ndarray) -> np.ndarray:
+        """Whether each UTC ``datetime64`` hour lies inside the on-hours."""
+        local = pd.DatetimeIndex(np.asarray(hour_starts).astype("datetime64[s]")).tz_localize("UTC").tz_convert(self.timezone)
+        hours = local.hour.to_numpy()
+        mask = np.isin(local.weekday.to_numpy(), self.weekdays) & (hours >= self.start_hour) & (hours < self.end_hour)
+        if self.holidays:
+            mask &= ~np.isin(local.date, np.asarray(self.holidays, dtype=object))
+        return mask
+
+
+def schedule_grid(
+    start_hours: Iterable[int] = range(6, 11),
+    end_hours: Iterable[int] = range(16, 21),
+    weekday_sets: Sequence[Tuple[int, ...]] = (WEEKDAYS, WEEKDAYS + (5,)),
+    *,
+    timezone: str = DEFAULT_TIMEZONE,
+    holidays: Tuple[date, ...] = (),
+) -> List[OfficeSchedule]:
+    """Candidate schedules for every combination of start hour, end hour and weekday set."""
+    day_labels = {WEEKDAYS: "Mon–Fri", WEEKDAYS + (5,): "Mon–Sat"}
+    return [
+        OfficeSchedule(
+            name=f"{day_labels.get(tuple(days), ','.join(map(str, days)))} {start:02d}–{end:02d}",
+            start_hour=start,
+            end_hour=end,
+            weekdays=tuple(days),
+            timezone=timezone,
+            holidays=holidays,
+        )
+        for days, start, end in product(weekday_sets, start_hours, end_hours)
+        if start < end
+    ]
+
+
+class IntervalIndex:
+    """
+    Running intervals of many instances in one flat array.
+
+    Intervals of instance ``i`` are ``starts[offsets[i]:offsets[i + 1]]``
+    (epoch seconds, sorted and non-overlapping per instance).
+    """
+
+    __slots__ = ("instance_ids", "starts", "ends", "offsets")
+
+    def __init__(self, instance_ids: Sequence[str], starts: np.ndarray, ends: np.ndarray, offsets: np.ndarray) -> None:
+        self.instance_ids = tuple(instance_ids)
+        self.starts = np.asarray(starts, dtype=np.float64)
+        self.ends = np.asarray(ends, dtype=np.float64)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.instance_ids)
+
+    @classmethod
+    def from_timelines(cls, timelines: Sequence[Tuple[str, RuntimeTimeline]]) -> "IntervalIndex":
+        """Index of ``(instance_id, timeline)`` pairs."""
+        bounds = [timeline.intervals for _, timeline in timelines]
+        counts = [starts.size for starts, _ in bounds]
+        offsets = np.concatenate(([0], np.cumsum(counts, dtype=np.int64)))
+        starts = np.concatenate([starts for starts, _ in bounds]) if bounds else np.empty(0)
+        ends = np.concatenate([ends for _, ends in bounds]) if bounds else np.empty(0)
+        return cls([instance_id for instance_id, _ in timelines], starts, ends, offsets)
+
+    @classmethod
+    def from_runtime_fractions(
+        cls, instance_ids: Sequence[str], runtime_fractions: np.ndarray, window_start: datetime
+    ) -> "IntervalIndex":
+        """
+        Index of hourly runtime fractions (e.g. ``HourlyBreakdown.runtime_fraction``).
+
+        A partial hour becomes an interval at the start of the hour. Its
+        position inside the hour is lost, which does not matter for
+        hour-aligned schedules.
+        """
+        fractions = np.clip(np.nan_to_num(np.atleast_2d(np.asarray(runtime_fractions, dtype=np.float64))), 0.0, 1.0)
+        rows, hours = np.nonzero(fractions > 0)
+        values = fractions[rows, hours]
+        # A running hour continues the previous interval when the hour before ran fully
+        continues = np.zeros(rows.size, dtype=bool)
+        continues[1:] = (rows[1:] == rows[:-1]) & (hours[1:] == hours[:-1] + 1) & (values[:-1] >= 1.0)
+        opens = ~continues
+        closes = np.append(opens[1:], True)
+
+        base = _epoch(window_start)
+        starts = base + hours[opens] * 3600.0
+        ends = base + (hours[closes] + values[closes]) * 3600.0
+        offsets = np.searchsorted(rows[opens], np.arange(fractions.shape[0] + 1))
+        return cls(instance_ids, starts, ends, offsets)
+
+
+@dataclass(frozen=True, eq=False)
+class ScheduleSimulation:
+    """Avoided runtime, cost and CO2 per schedule (rows) and instance (columns)."""
+
+    schedules: Tuple[OfficeSchedule, ...]
+    instance_ids: Tuple[str, ...]
+    runtime_hours: np.ndarray
+    """Running hours per instance inside the window, shape (N,)"""
+    avoided_hours: np.ndarray
+    avoided_cost_eur: np.ndarray
+    avoided_co2_kg: np.ndarray
+
+    @property
+    def fleet_avoided_hours(self) -> np.ndarray:
+        return self.avoided_hours.sum(axis=1)
+
+    @property
+    def fleet_avoided_cost_eur(self) -> np.ndarray:
+        return self.avoided_cost_eur.sum(axis=1)
+
+    @property
+    def fleet_avoided_co2_kg(self) -> np.ndarray:
+        return self.avoided_co2_kg.sum(axis=1)
+
+    def ranking(self, by: str = "cost") -> List[Tuple[OfficeSchedule, float, float, float]]:
+        """``(schedule, avoided cost €, avoided CO2 kg, avoided hours)`` sorted by ``cost``, ``co2`` or ``hours``."""
+        key = {"cost": self.fleet_avoided_cost_eur, "co2": self.fleet_avoided_co2_kg, "hours": self.fleet_avoided_hours}[by]
+        order = np.argsort(-key, kind="stable")
+        return [
+            (
+                self.schedules[index],
+                float(self.fleet_avoided_cost_eur[index]),
+                float(self.fleet_avoided_co2_kg[index]),
+                float(self.fleet_avoided_hours[index]),
+            )
+            for index in order
+        ]
+
+
+def simulate_schedules(
+    index: IntervalIndex,
+    schedules: Sequence[OfficeSchedule],
+    *,
+    window_start: datetime,
+    window_end: datetime,
+    power_watts: np.ndarray,
+    hourly_price_eur: np.ndarray,
+    carbon_intensity_hourly: Optional[np.ndarray] = None,
+) -> ScheduleSimulation:
+    """
+    Evaluate auto-stop schedules for all indexed intervals in one pass.
+
+    Args:
+        index: Running intervals of the fleet
+        schedules: Candidate schedules
+        window_start / window_end: Replayed window (intervals are clipped to it)
+        power_watts: Average power per instance, shape (N,); NaN = unknown (no CO2)
+        hourly_price_eur: On-demand price per instance and hour, shape (N,)
+        carbon_intensity_hourly: g/kWh per hour from ``window_start``; missing
+            hours use the mean of the known ones
+
+    Returns:
+        ``ScheduleSimulation`` with (S, N) matrices
+    """
+    first = np.floor(_epoch(window_start) / 3600.0) * 3600.0
+    last = np.ceil(_epoch(window_end) / 3600.0) * 3600.0
+    grid_hours = max(int((last - first) // 3600), 1)
+    hour_starts = (first + 3600.0 * np.arange(grid_hours)).astype("datetime64[s]")
+
+    off = np.stack([~schedule.on_mask(hour_starts) for schedule in schedules]).astype(np.float64) * 3600.0
+    carbon = np.full(grid_hours, np.nan)
+    if carbon_intensity_hourly is not None:
+        known = np.asarray(carbon_intensity_hourly, dtype=np.float64)
+        shift = int(round((_epoch(window_start) - first) / 3600.0))
+        carbon[shift : shift + known.size] = known[: max(grid_hours - shift, 0)]
+    carbon = np.where(np.isfinite(carbon), carbon, np.nanmean(carbon) if np.isfinite(carbon).any() else 0.0)
+
+    zeros = np.zeros((len(schedules), 1))
+    off_seconds = np.hstack([zeros, np.cumsum(off, axis=1)])
+    off_carbon = np.hstack([zeros, np.cumsum(off * carbon, axis=1)])
+
+    starts = np.clip(index.starts, first, last)
+    ends = np.clip(index.ends, first, last)
+    runtime_hours = _per_instance(np.maximum(ends - starts, 0.0)[np.newaxis, :], index.offsets)[0] / 3600.0
+
+    # Instances are processed in blocks so the schedules × intervals matrices stay bounded
+    avoided_seconds = np.zeros((len(schedules), len(index)))
+    carbon_seconds = np.zeros((len(schedules), len(index)))
+    block = max(_BLOCK_CELLS // max(len(schedules), 1), 1)
+    first_instance = 0
+    while first_instance < len(index):
+        # Whole instances whose intervals fit into the block (at least one instance)
+        fitting = int(np.searchsorted(index.offsets, index.offsets[first_instance] + block, side="right")) - 1
+        last_instance = min(max(fitting, first_instance + 1), len(index))
+        offsets = index.offsets[first_instance : last_instance + 1]
+        lo, hi = offsets[0], offsets[-1]
+        avoided_seconds[:, first_instance:last_instance] = _per_instance(
+            _integrate(off_seconds, off, first, starts[lo:hi], ends[lo:hi]), offsets - lo
+        )
+        carbon_seconds[:, first_instance:last_instance] = _per_instance(
+            _integrate(off_carbon, off * carbon, first, starts[lo:hi], ends[lo:hi]), offsets - lo
+        )
+        first_instance = last_instance
+
+    avoided_hours = avoided_seconds / 3600.0
+    # seconds × g/kWh → hours × g/kWh; × kW → g
+    carbon_hours = carbon_seconds / 3600.0
+    power_kw = np.nan_to_num(np.asarray(power_watts, dtype=np.float64), nan=0.0) / 1000.0
+    price = np.nan_to_num(np.asarray(hourly_price_eur, dtype=np.float64), nan=0.0)
+
+    return ScheduleSimulation(
+        schedules=tuple(schedules),
+        instance_ids=index.instance_ids,
+        runtime_hours=runtime_hours,
+        avoided_hours=avoided_hours,
+        avoided_cost_eur=avoided_hours * price,
+        avoided_co2_kg=carbon_hours * power_kw / 1000.0,
+    )
+
+
+def _integrate(cumulative: np.ndarray, rate: np.ndarray, first: float, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """``F(end) - F(start)`` for every schedule × interval, ``F`` piecewise linear on the hour grid."""
+
+    def evaluate(points: np.ndarray) -> np.ndarray:
+        position = (points - first) / 3600.0
+        hour = np.clip(np.floor(position).astype(np.int64), 0, rate.shape[1] - 1)
+        return cumulative[:, hour] + (position - hour) * rate[:, hour]
+
+    return evaluate(ends) - evaluate(starts)
+
+
+def _per_instance(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Sum interval columns per instance using the CSR offsets."""
+    cumulative = np.hstack([np.zeros((values.shape[0], 1)), np.cumsum(values, axis=1)])
+    return cumulative[:, offsets[1:]] - cumulative[:, offsets[:-1]]
+
+
+def simulate_fleet_schedules(
+    instances: Sequence[EC2Instance],
+    schedules: Sequence[OfficeSchedule],
+    carbon_intensity_hourly: Optional[np.ndarray] = None,
+    *,
+    eur_usd_rate: float = 0.92,
+) -> Optional[ScheduleSimulation]:
+    """
+    ``simulate_schedules`` for enriched instances with an hourly breakdown.
+
+    Running intervals come from the CloudTrail-derived runtime fractions of
+    each breakdown. Average power and price come from the instance; without
+    ``carbon_intensity_hourly`` the intensity is recovered from the breakdowns.
+    """
+    with_breakdown = [
+        instance
+        for instance in instances
+        if instance.hourly_co2_breakdown is not None and len(instance.hourly_co2_breakdown)
+    ]
+    if not with_breakdown or not schedules:
+        return None
+
+    hours = min(len(instance.hourly_co2_breakdown) for instance in with_breakdown)
+    timestamps = np.asarray(with_breakdown[0].hourly_co2_breakdown.timestamps)[:hours].astype("datetime64[s]")
+    window_start = timestamps[0].item().replace(tzinfo=timezone.utc)
+    fractions = np.stack([instance.hourly_co2_breakdown.runtime_fraction[:hours] for instance in with_breakdown])
+    index = IntervalIndex.from_runtime_fractions([instance.instance_id for instance in with_breakdown], fractions, window_start)
+    if carbon_intensity_hourly is None:
+        carbon_intensity_hourly = fleet_energy_profile(with_breakdown)[3]
+
+    def _value(value: Optional[float]) -> float:
+        return float(value) if value is not None else np.nan
+
+    return simulate_schedules(
+        index,
+        schedules,
+        window_start=window_start,
+        window_end=window_start + timedelta(hours=hours),
+        power_watts=np.array([_value(instance.power_watts) for instance in with_breakdown]),
+        hourly_price_eur=np.array([_value(instance.hourly_price_usd) for instance in with_breakdown]) * eur_usd_rate,
+        carbon_intensity_hourly=carbon_intensity_hourly,
+    )
+
+
+__all__ = [
+    "IntervalIndex",
+    "OfficeSchedule",
+    "ScheduleSimulation",
+    "WEEKDAYS",
+    "schedule_grid",
+    "simulate_fleet_schedules",
+    "simulate_schedules",
+]
@@ -61,10 +61,13 @@ def create_runtime_service(
     """
     repository = repository or _default_repository()
     gateway = gateway or _default_gateway(repository)
+    # Gateways with an offline power table (see InfrastructureGateway.get_power_engine) drive hourly power
+    get_power_engine = getattr(gateway, "get_power_engine", None)
     return RuntimeService(
         config=config,
         repository=repository,
         gateway=gateway,
+        power_engine=get_power_engine() if callable(get_power_engine) else None,
     )
 
 
@@ -12,13 +12,20 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
-from src.domain.models import TimeSeriesPoint
+import numpy as np
+
+from src.domain.alignment import bucket_local_series
+from src.domain.models import TimeSeriesPoint, TimeSeriesRollup
 from src.domain.constants import AcademicConstants
 from src.domain.protocols import CacheRepository, InfrastructureGateway
-from src.infrastructure.cache import JsonTimeSeriesStore
+from src.config import settings
+from src.infrastructure.timeseries_store import DEFAULT_MAX_POINTS, ColumnarTimeSeriesStore
 
 logger = logging.getLogger(__name__)
 
+# Slots are aligned to the Unix epoch in local wall-clock time (as in ``bucket_local_series``)
+_LOCAL_EPOCH = datetime(1970, 1, 1)
+
 
 @dataclass(frozen=True)
 class CarbonServiceConfig:
@@ -43,12 +50,16 @@ class CarbonDataService:
         *,
         repository: CacheRepository,
         gateway: InfrastructureGateway,
-        time_series_store: JsonTimeSeriesStore | None = None,
+        time_series_store: ColumnarTimeSeriesStore | None = None,
     ) -> None:
         self.config = config or CarbonServiceConfig()
         self._repository = repository
         self._gateway = gateway
-        self._time_series_store = time_series_store or JsonTimeSeriesStore(repository, self.config.timeseries_cache_key)
+        self._time_series_store = time_series_store or ColumnarTimeSeriesStore(
+            repository,
+            self.config.timeseries_cache_key,
+            retention_days=settings.timeseries_retention_days,
+        )
 
     # ------------------------------------------------------------------
     # Public API
@@ -65,139 +76,175 @@ class CarbonDataService:
             history = self._gateway.get_self_collected_24h_data(region_code)
         return history
 
+    def get_period_history(
+        self,
+        *,
+        window_start: datetime,
+        window_end: datetime,
+        region: Optional[str] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Hourly carbon history covering ``[window_start, window_end)``.
+
+        Windows longer than 24 hours use the chunked past-range history; if that
+        is unavailable the most recent 24 hours are returned so callers can
+        still compute the covered part of the window.
+        """
+        region_code = region or self.config.region
+        if window_end - window_start > timedelta(hours=24):
+            history = self._gateway.get_carbon_intensity_range(region_code, window_start, window_end)
+            if history:
+                return history
+            logger.warning("⚠️ Past-range carbon history unavailable for %s, using last 24h only", region_code)
+        return self.get_recent_history(region=region_code)
+
     def get_self_collected_history(self, *, region: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
         region_code = region or self.config.region
         return self._gateway.get_self_collected_24h_data(region_code)
 
-    def get_cached_time_series(self) -> List[TimeSeriesPoint]:
-        raw_rows = self._time_series_store.load()
-        points: List[TimeSeriesPoint] = []
-        for entry in raw_rows:
-            try:
-                raw_timestamp = entry.get("timestamp")
-                if not raw_timestamp:
-                    continue
-                timestamp = datetime.fromisoformat(str(raw_timestamp))
-                points.append(
-                    TimeSeriesPoint(
-                        timestamp=timestamp,
-                        cost_eur_per_hour=float(entry.get("cost_eur_per_hour", 0.0)),
-                        co2_kg_per_hour=float(entry.get("co2_kg_per_hour", 0.0)),
-                        carbon_intensity=entry.get("carbon_intensity"),
-                    )
-                )
-            except (ValueError, TypeError) as error:
-                logger.debug("⚠️ Skipping corrupt time series entry: %s", error)
-        return sorted(points, key=lambda point: point.timestamp)
+    def get_cached_time_series(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> List[TimeSeriesPoint]:
+        """Stored points in ``[start, end)`` (naive local time); only the overlapping day segments are read."""
+        columns = self._time_series_store.query(start, end)
+        intensities = columns["carbon_intensity"].tolist()
+        return [
+            TimeSeriesPoint(
+                timestamp=timestamp,
+                cost_eur_per_hour=cost,
+                co2_kg_per_hour=co2,
+                carbon_intensity=intensity if intensity == intensity else None,
+            )
+            for timestamp, cost, co2, intensity in zip(
+                columns["timestamp"].tolist(),
+                columns["cost_eur_per_hour"].tolist(),
+                columns["co2_kg_per_hour"].tolist(),
+                intensities,
+            )
+        ]
+
+    def get_time_series_rollup(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        *,
+        resolution: Optional[str] = None,
+        max_points: int = DEFAULT_MAX_POINTS,
+    ) -> TimeSeriesRollup:
+        """
+        Aggregated time series for ``[start, end)`` (naive local time).
+
+        Without an explicit ``resolution`` the finest of hour/day/week/month
+        that keeps the window within ``max_points`` buckets is used, so 30- or
+        90-day views read daily rollups instead of every stored hour.
+        """
+        if resolution is None:
+            resolution, result = self._time_series_store.query_auto(start, end, max_points=max_points)
+        else:
+            result = self._time_series_store.query_rollup(resolution, start, end)
+        timestamps = result.pop("timestamp")
+        coverage = result.pop("coverage")
+        return TimeSeriesRollup(resolution=resolution, timestamps=timestamps, values=result, coverage=coverage)
 
     def build_time_series(
         self,
         hourly_costs: List[Dict[str, Any]],
         carbon_history: Optional[List[Dict[str, Any]]],
         total_co2_kg: float,
+        *,
+        window_start: Optional[datetime] = None,
+        window_end: Optional[datetime] = None,
+        resolution: timedelta = timedelta(hours=1),
     ) -> List[TimeSeriesPoint]:
         """
         Build time series points from hourly costs and carbon history.
 
+        Costs and carbon intensity are bucketed into local wall-clock slots of
+        ``resolution`` in one vectorized pass and aligned on a shared index.
+        Only rows that are new or changed are appended to the time-series store.
+
+        Args:
+            hourly_costs: Cost Explorer entries (``timestamp``, ``cost_eur``)
+            carbon_history: ElectricityMaps (or self-collected) history entries
+            total_co2_kg: Monthly CO2 distributed over the slots by relative intensity
+            window_start: First local slot to include (default: ``lookback_hours`` ago)
+            window_end: End of the window; its slot is excluded (default: open-ended)
+            resolution: Slot width (default: one hour)
+
         Note: TAC (Time Alignment Coverage) calculation was removed as it only
         measured ElectricityMaps API uptime, not synchronization quality.
         See docs/methodology/METRICS_REVISION.md for details.
         """
+        if window_start is None:
+            window_start = datetime.now(timezone.utc) - timedelta(hours=self.config.lookback_hours)
+        first_slot = self._local_slot(window_start, resolution)
+        end_slot = self._local_slot(window_end, resolution) if window_end is not None else None
+
         if not hourly_costs:
             logger.debug("⚠️ No hourly costs provided, using cached time series")
-            return self.get_cached_time_series()
-
-        cost_map: Dict[datetime, float] = {}
-        for entry in hourly_costs:
-            timestamp_raw = entry.get("timestamp")
-            cost_value = entry.get("cost_eur")
-            if timestamp_raw is None or cost_value is None:
-                continue
-            try:
-                ts = datetime.fromisoformat(str(timestamp_raw).replace("Z", "+00:00"))
-            except ValueError:
-                continue
-            normalised = self._normalise_hour(ts)
-            if normalised is None:
-                continue
-            cost_map[normalised] = float(cost_value)
-
-        if not cost_map:
-            logger.warning("⚠️ Cost map empty after processing, using cached time series")
-            return self.get_cached_time_series()
+            return self.get_cached_time_series(first_slot, end_slot)
 
-        non_zero_costs = sum(1 for v in cost_map.values() if v > 0)
-        logger.info(f"📊 Built cost map: {len(cost_map)} hours, {non_zero_costs} with non-zero costs")
+        costs = bucket_local_series(hourly_costs, ("timestamp",), ("cost_eur",), resolution=resolution)
+        if costs.empty:
+            logger.warning("⚠️ Cost map empty after processing, using cached time series")
+            return self.get_cached_time_series(first_slot, end_slot)
 
-        carbon_map: Dict[datetime, float] = {}
-        for entry in carbon_history or []:
-            ts_raw = entry.get("datetime") or entry.get("hour_key")
-            value = entry.get("carbonIntensity") or entry.get("value")
-            if ts_raw is None or value is None:
-                continue
-            try:
-                ts_obj = datetime.fromisoformat(str(ts_raw).replace("Z", "+00:00"))
-            except ValueError:
-                continue
-            normalised = self._normalise_hour(ts_obj)
-            if normalised is None:
-                continue
-            try:
-                carbon_map[normalised] = float(value)
-            except (TypeError, ValueError):
-                continue
+        logger.info(f"📊 Built cost map: {len(costs)} slots, {int((costs > 0).sum())} with non-zero costs")
 
-        window_start = self._normalise_hour(datetime.now(timezone.utc) - timedelta(hours=self.config.lookback_hours))
-        if window_start is None:
-            window_start = datetime.now().replace(minute=0, second=0, microsecond=0)
+        carbon = bucket_local_series(
+            carbon_history, ("datetime", "hour_key"), ("carbonIntensity", "value"), resolution=resolution
+        )
 
-        points: List[TimeSeriesPoint] = []
-        sorted_hours = sorted(hour for hour in cost_map.keys() if hour >= window_start)
-        if not sorted_hours:
-            sorted_hours = sorted(cost_map.keys())
+        in_window = costs.index >= first_slot
+        if end_slot is not None:
+            in_window &= costs.index < end_slot
+        if not in_window.any():
+            in_window[:] = True
+        costs = costs[in_window]
 
-        base_hourly_co2 = None
-        if total_co2_kg and len(sorted_hours) > 0:
+        base_slot_co2 = None
+        if total_co2_kg:
             try:
-                base_hourly_co2 = float(total_co2_kg) / AcademicConstants.HOURS_PER_MONTH
+                slot_hours = resolution / timedelta(hours=1)
+                base_slot_co2 = float(total_co2_kg) / AcademicConstants.HOURS_PER_MONTH * slot_hours
             except (TypeError, ValueError):
-                base_hourly_co2 = None
-
-        aligned_carbon_values = [carbon_map[hour] for hour in sorted_hours if hour in carbon_map]
-        avg_carbon_intensity = (
-            sum(aligned_carbon_values) / len(aligned_carbon_values) if aligned_carbon_values else None
-        )
-
-        for hour in sorted_hours:
-            cost_value = cost_map.get(hour, 0.0)
-            carbon_value = carbon_map.get(hour)
-            if base_hourly_co2 is None:
-                co2_value = 0.0
-            elif carbon_value is not None and avg_carbon_intensity not in (None, 0.0):
-                adjustment_factor = carbon_value / avg_carbon_intensity
-                co2_value = round(base_hourly_co2 * adjustment_factor, 6)
-            else:
-                co2_value = round(base_hourly_co2, 6)
-
-            points.append(
-                TimeSeriesPoint(
-                    timestamp=hour,
-                    cost_eur_per_hour=round(float(cost_value), 6),
-                    co2_kg_per_hour=co2_value,
-                    carbon_intensity=carbon_value,
-                )
+                base_slot_co2 = None
+
+        intensities = carbon.reindex(costs.index).to_numpy()
+        observed = ~np.isnan(intensities)
+        avg_carbon_intensity = float(intensities[observed].mean()) if observed.any() else None
+
+        if base_slot_co2 is None:
+            co2_values = np.zeros(len(costs))
+        elif avg_carbon_intensity not in (None, 0.0):
+            factors = np.where(observed, intensities / avg_carbon_intensity, 1.0)
+            co2_values = np.round(base_slot_co2 * factors, 6)
+        else:
+            co2_values = np.full(len(costs), round(base_slot_co2, 6))
+        cost_values = np.round(costs.to_numpy(), 6)
+
+        points = [
+            TimeSeriesPoint(
+                timestamp=timestamp,
+                cost_eur_per_hour=cost,
+                co2_kg_per_hour=co2,
+                carbon_intensity=intensity if intensity == intensity else None,
+            )
+            for timestamp, cost, co2, intensity in zip(
+                costs.index.to_pydatetime(), cost_values.tolist(), co2_values.tolist(), intensities.tolist()
             )
+        ]
 
-        serialised = [
+        written = self._time_series_store.append(
             {
-                "timestamp": point.timestamp.isoformat(),
+                "timestamp": point.timestamp,
                 "cost_eur_per_hour": point.cost_eur_per_hour,
                 "co2_kg_per_hour": point.co2_kg_per_hour,
                 "carbon_intensity": point.carbon_intensity,
             }
             for point in points
-        ]
-        self._time_series_store.save(serialised)
+        )
+        logger.debug("Time series: %d slots built, %d new or changed rows persisted", len(points), written)
 
         return points
 
@@ -206,13 +253,14 @@ class CarbonDataService:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _normalise_hour(timestamp: datetime) -> Optional[datetime]:
-        if timestamp is None:
-            return None
+    def _local_slot(timestamp: datetime, resolution: timedelta) -> datetime:
+        """Naive local start of the ``resolution`` slot containing ``timestamp``."""
         if timestamp.tzinfo is None:
             timestamp = timestamp.replace(tzinfo=timezone.utc)
-        localised = timestamp.astimezone().replace(minute=0, second=0, microsecond=0)
-        return localised.replace(tzinfo=None)
+        local = timestamp.astimezone().replace(tzinfo=None)
+        step = max(int(resolution.total_seconds()), 1)
+        offset = (local - _LOCAL_EPOCH).total_seconds() % step
+        return local - timedelta(seconds=offset)
 
 
 __all__ = ["CarbonDataService", "CarbonServiceConfig"]
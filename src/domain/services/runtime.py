@@ -7,25 +7,39 @@ not concrete infrastructure implementations.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 
+import numpy as np
+
 from src.config import settings
 from src.domain.constants import AcademicConstants
-from src.domain.protocols import CacheRepository, InfrastructureGateway
+from src.domain.protocols import CacheRepository, InfrastructureGateway, PowerEngine
 from src.infrastructure.cache import CacheTTL
-from src.domain.models import EC2Instance
+from src.domain.models import EC2Instance, HourlyBreakdown
 from src.domain.errors import AWSAuthenticationError, ErrorMessages
 from src.domain.calculations import (
     calculate_co2_emissions,
-    calculate_co2_hourly_precise,
+    calculate_co2_hourly_precise_vectorized,
     calculate_simple_power_consumption,
 )
+from src.domain.alignment import CARBON_MAX_GAP_HOURS, align_carbon_intensity_hourly, align_hourly_values
+from src.domain.timeline import RuntimeTimeline, hour_axis, hourly_analysis_window, slot_timestamps
 
 logger = logging.getLogger(__name__)
 
+# Bump when enrichment logic changes so persisted results are not reused
+FINGERPRINT_VERSION = 3
+
+# Minimum share of runtime backed by CPU and carbon data for the Hourly-Precise
+# total; below it the extrapolation factor (1 / coverage) exceeds 2 and the
+# Average-Based method is used instead
+MIN_HOURLY_RUNTIME_COVERAGE = 0.5
+
 
 @dataclass(frozen=True)
 class RuntimeServiceConfig:
@@ -51,10 +65,13 @@ class RuntimeService:
         *,
         repository: CacheRepository,
         gateway: InfrastructureGateway,
+        power_engine: Optional[PowerEngine] = None,
     ) -> None:
         self.config = config or RuntimeServiceConfig()
         self._repository = repository
         self._gateway = gateway
+        # Evaluates hourly power from the offline power table; base-power formula when absent
+        self._power_engine = power_engine
         logger.info("✅ RuntimeService initialised for region %s", self.config.region)
 
     # ---------------------------------------------------------------------
@@ -66,8 +83,9 @@ class RuntimeService:
         """
         Align ElectricityMaps history data to hourly slots.
 
-        Extracts carbon intensity values from ElectricityMaps history and aligns
-        them to the last N hours. Handles missing data with interpolation or average.
+        Thin wrapper around ``align_carbon_intensity_hourly`` for callers that
+        still expect a list. Batch callers should align once per refresh and
+        pass the shared vector via ``enrich_instance(carbon_hourly=...)``.
 
         Args:
             carbon_history: List from ElectricityMaps API with format:
@@ -76,72 +94,13 @@ class RuntimeService:
 
         Returns:
             List of carbon intensity values (g/kWh), one per hour.
-            If data is missing, returns list filled with average or zeros.
+            Gaps are linearly interpolated; without data the list is all zeros.
 
         Example:
             Input: [{'datetime': '2025-10-18T10:00:00Z', 'carbonIntensity': 280}, ...]
             Output: [280.0, 290.0, 310.0, ...] (24 values)
         """
-        if not carbon_history:
-            logger.warning("No carbon history provided, returning zeros")
-            return [0.0] * num_hours
-
-        # Extract values and timestamps
-        carbon_data = []
-        for entry in carbon_history:
-            try:
-                dt_str = entry.get("datetime") or entry.get("hour_key")
-                value = entry.get("carbonIntensity") or entry.get("value")
-
-                if dt_str and value is not None:
-                    # Parse datetime
-                    if isinstance(dt_str, str):
-                        dt = datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
-                    else:
-                        dt = dt_str
-
-                    # Ensure timezone-aware
-                    if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=timezone.utc)
-
-                    carbon_data.append((dt, float(value)))
-            except (ValueError, TypeError, KeyError) as e:
-                logger.debug(f"Skipping invalid carbon entry: {entry}, error: {e}")
-                continue
-
-        if not carbon_data:
-            logger.warning("No valid carbon data found, returning zeros")
-            return [0.0] * num_hours
-
-        # Sort by timestamp
-        carbon_data.sort(key=lambda x: x[0])
-
-        # Build hourly array for last N hours
-        now = datetime.now(timezone.utc)
-        window_start = now - timedelta(hours=num_hours)
-
-        result = []
-        for hour_offset in range(num_hours):
-            hour_start = window_start + timedelta(hours=hour_offset)
-            hour_end = hour_start + timedelta(hours=1)
-
-            # Find value for this hour
-            matching_value = None
-            for dt, value in carbon_data:
-                if hour_start <= dt < hour_end:
-                    matching_value = value
-                    break
-
-            if matching_value is not None:
-                result.append(matching_value)
-            else:
-                # No data for this hour - use average as fallback
-                avg_value = sum(v for _, v in carbon_data) / len(carbon_data)
-                result.append(avg_value)
-                logger.debug(f"Missing carbon data for hour {hour_offset}, using average {avg_value:.1f}")
-
-        logger.info(f"Aligned {len(result)} hours of carbon intensity data (avg: {sum(result)/len(result):.1f} g/kWh)")
-        return result
+        return align_carbon_intensity_hourly(carbon_history, num_hours).tolist()
 
     def list_instances(self) -> List[Dict]:
         """Return metadata for running/stopped EC2 instances in the configured region."""
@@ -162,6 +121,8 @@ class RuntimeService:
         *,
         carbon_intensity: float,
         carbon_history: Optional[List[Dict]] = None,
+        carbon_hourly: Optional[np.ndarray] = None,
+        window_end: Optional[datetime] = None,
         force_refresh: bool = False,
         period_days: int = 30,
     ) -> Optional[EC2Instance]:
@@ -171,21 +132,35 @@ class RuntimeService:
         Args:
             instance: Raw instance dict from AWS API
             carbon_intensity: Current carbon intensity (fallback value)
-            carbon_history: Optional 24h carbon history for hourly calculation
+            carbon_history: Optional carbon history covering the analysis window
+            carbon_hourly: Optional pre-aligned intensity vector (one value per hour
+                of the window) shared across instances; aligned from
+                ``carbon_history`` when omitted
+            window_end: End of the hour-aligned analysis window (see
+                ``hourly_analysis_window``); computed when omitted
             force_refresh: Force refresh all cached data
             period_days: Analysis period in days (1, 7, or 30)
 
         Returns:
             Enriched EC2Instance with period-based calculations using both
-            Hourly-Precise and Average-Based methods.
+            Hourly-Precise (full period, hour by hour) and Average-Based methods.
         """
         # Fetch basic data (now period-aware)
         runtime_hours = self._get_precise_runtime_hours(instance, force_refresh=force_refresh, period_days=period_days)
         power_data = self._gateway.get_power_consumption(instance["instance_type"])
         hourly_price = self._gateway.get_instance_pricing(instance["instance_type"], instance["region"])
 
-        # NEW: Try to get hourly CPU data (falls back to average if needed)
-        cpu_hourly_data = self._get_cpu_utilisation_hourly(instance["instance_id"], force_refresh=force_refresh)
+        # Shared hour-aligned analysis window for CPU, carbon and runtime
+        num_hours = period_days * 24
+        if window_end is None:
+            window_start, window_end = hourly_analysis_window(num_hours)
+        else:
+            window_start = window_end - timedelta(hours=num_hours)
+
+        # Hourly CPU data over the full period (falls back to average if needed)
+        cpu_hourly_data = self._get_cpu_utilisation_hourly(
+            instance["instance_id"], force_refresh=force_refresh, window_start=window_start, hours=num_hours
+        )
 
         # Fallback to old single-value CPU if hourly not available
         if cpu_hourly_data is None:
@@ -212,85 +187,97 @@ class RuntimeService:
         cost_eur_hourly = None  # Hourly-Precise method
         cost_eur_average = None  # Average-Based method
 
-        # Deprecated variables (backward compatibility)
-        monthly_co2_kg = None
-        monthly_cost_usd = None
-        monthly_cost_eur = None
-        monthly_co2_kg_projected = None
-        monthly_co2_kg_30d = None
-        monthly_cost_projected_eur = None
-
-        # NEW: Try hourly-precise CO2 calculation
-        if power_data and cpu_hourly_data and carbon_history:
+        # Hourly-Precise: CPU, carbon and runtime aligned over the full period
+        has_carbon_data = carbon_hourly is not None or bool(carbon_history)
+        if power_data and cpu_hourly_data and has_carbon_data:
             try:
+                cpu_hourly = cpu_hourly_data["hourly_values"]
                 logger.info(
                     f"Attempting hourly CO2 calculation for {instance['instance_id']} "
-                    f"(CPU hours: {len(cpu_hourly_data['hourly_values'])}, "
-                    f"Carbon history: {len(carbon_history)} entries)"
+                    f"(window: {num_hours}h, CPU hours: {int(np.isfinite(cpu_hourly).sum())}, "
+                    f"pre-aligned carbon: {carbon_hourly is not None})"
                 )
 
                 # Get CloudTrail events for runtime calculation (period-based)
-                end_time = datetime.now(timezone.utc)
-                lookback_start = end_time - timedelta(days=period_days)
                 events = self._gateway.lookup_instance_events(
                     instance_id=instance["instance_id"],
                     region=instance.get("region", self.config.region),
-                    lookup_start=lookback_start,
-                    lookup_end=end_time,
+                    lookup_start=window_start,
+                    lookup_end=datetime.now(timezone.utc),
                 )
                 relevant_events = self._extract_relevant_events(events, instance["instance_id"])
 
-                # Calculate runtime per hour for last 24h
-                runtime_per_hour, hour_timestamps = self._calculate_runtime_per_hour_24h(
-                    instance=instance, events=relevant_events, end_time=end_time
+                # Runtime fraction for every hour of the period
+                runtime_per_hour, _ = self._calculate_runtime_per_hour(
+                    instance=instance, events=relevant_events, end_time=window_end, hours=num_hours
                 )
+                runtime_hourly = np.asarray(runtime_per_hour)
 
-                # Align carbon history to hourly slots
-                carbon_hourly = self._align_carbon_history_to_hours(carbon_history, 24)
+                # Carbon intensity per hour (shared vector when pre-aligned by the use case)
+                if carbon_hourly is None or len(carbon_hourly) != num_hours:
+                    carbon_hourly = align_carbon_intensity_hourly(
+                        carbon_history, num_hours, window_start=window_start, max_gap_hours=CARBON_MAX_GAP_HOURS
+                    )
 
-                # Perform hourly-precise calculation
-                co2_result = calculate_co2_hourly_precise(
+                co2_result = calculate_co2_hourly_precise_vectorized(
                     base_power_watts=power_data.avg_power_watts,
-                    cpu_values_hourly=cpu_hourly_data["hourly_values"],
+                    cpu_values_hourly=cpu_hourly,
                     carbon_intensity_hourly=carbon_hourly,
-                    runtime_hours_per_slot=runtime_per_hour,
-                    timestamps=hour_timestamps,
+                    runtime_hours_per_slot=runtime_hourly,
                     hourly_price_usd=hourly_price,
                     eur_usd_rate=AcademicConstants.get_eur_usd_rate(),
+                    power_watts_hourly=self._engine_power_hourly(instance["instance_type"], cpu_hourly),
                 )
 
-                daily_co2_kg = co2_result["total_co2_kg"]
-                # Hourly-Precise: Scale 24h data to period
-                co2_kg_hourly = daily_co2_kg * period_days
+                if co2_result["coverage_hours"] == 0:
+                    raise ValueError("no running hour with both CPU and carbon data")
+                if co2_result["runtime_coverage"] < MIN_HOURLY_RUNTIME_COVERAGE:
+                    raise ValueError(
+                        f"only {co2_result['runtime_coverage'] * 100:.0f}% of runtime has CPU and carbon data "
+                        f"(minimum {MIN_HOURLY_RUNTIME_COVERAGE * 100:.0f}%)"
+                    )
+
+                # Hours with missing CPU/carbon data are extrapolated from the
+                # covered runtime share (1.0 when the whole period is covered)
+                co2_kg_hourly = co2_result["total_co2_kg"] / co2_result["runtime_coverage"]
                 co2_method = "hourly"
-                hourly_breakdown = co2_result["hourly_emissions"]
-                data_completeness_24h = co2_result["coverage_hours"]
+                hourly_breakdown = HourlyBreakdown.from_result(
+                    co2_result,
+                    timestamps=hour_axis(window_start, num_hours),
+                    cpu_values_hourly=cpu_hourly,
+                    carbon_intensity_hourly=carbon_hourly,
+                    runtime_hours_per_slot=runtime_hourly,
+                    include_cost=hourly_price is not None,
+                )
 
-                # Calculate 24h runtime sum for projection
-                daily_runtime_hours = sum(runtime_per_hour)
+                # Cost depends on runtime only
+                if hourly_price and co2_result["runtime_hours"]:
+                    cost_eur_hourly = co2_result["total_cost_eur"]
 
-                # Hourly-Precise cost: Scale 24h to period
-                cost_eur_hourly = None
-                if hourly_price and daily_runtime_hours:
-                    daily_cost = hourly_price * daily_runtime_hours
-                    cost_eur_hourly = daily_cost * period_days * AcademicConstants.get_eur_usd_rate()
+                # Last 24 hours of the window (detail view)
+                daily_co2_kg = float(co2_result["co2_g"][-24:].sum()) / 1000.0
+                daily_runtime_hours = float(runtime_hourly[-24:].sum())
+                data_completeness_24h = int(co2_result["valid"][-24:].sum())
 
-                # Calculate average power from hourly data
-                power_values = [e["power_watts"] for e in hourly_breakdown if e.get("power_watts")]
-                if power_values:
-                    effective_power_watts = sum(power_values) / len(power_values)
+                # Average effective power over hours with valid data
+                effective_power_watts = float(co2_result["power_watts"][co2_result["valid"]].mean())
 
                 # Calculate hourly CO2 rate (for backward compatibility)
                 if effective_power_watts:
                     hourly_co2_g = (effective_power_watts / 1000.0) * carbon_intensity
 
                 logger.info(
-                    f"✅ Hourly-Precise calculation: {daily_co2_kg:.6f} kg/day × {period_days} = {co2_kg_hourly:.3f} kg, "
-                    f"{co2_result['coverage_hours']}/24 hours"
+                    f"✅ Hourly-Precise calculation: {co2_kg_hourly:.3f} kg over {num_hours}h, "
+                    f"{co2_result['coverage_hours']}/{num_hours} hours covered "
+                    f"({co2_result['runtime_coverage'] * 100:.0f}% of runtime)"
                 )
 
             except Exception as e:
                 logger.warning(f"⚠️ Hourly-Precise calculation failed for {instance['instance_id']}: {e}", exc_info=True)
+                co2_kg_hourly = None
+                cost_eur_hourly = None
+                co2_method = "average"
+                hourly_breakdown = None
                 # Fall through to Average-Based calculation
 
         # Average-Based calculation (always, for comparison)
@@ -315,15 +302,6 @@ class RuntimeService:
                 f"{co2_kg_average:.3f} kg (period: {period_days} days)"
             )
 
-        # Map to deprecated fields for backward compatibility
-        monthly_co2_kg = co2_kg_average or co2_kg_hourly
-        monthly_cost_eur = cost_eur_average
-        monthly_co2_kg_projected = co2_kg_hourly
-        monthly_co2_kg_30d = co2_kg_average
-        monthly_cost_projected_eur = cost_eur_hourly
-        if cost_eur_average:
-            monthly_cost_usd = cost_eur_average / AcademicConstants.get_eur_usd_rate()
-
         # Calculate instance age for validation
         instance_age_days = None
         launch_time = instance.get("launch_time")
@@ -345,7 +323,7 @@ class RuntimeService:
         )
 
         data_quality = self._resolve_data_quality(
-            runtime_hours, cpu_utilisation, effective_power_watts, monthly_cost_eur
+            runtime_hours, cpu_utilisation, effective_power_watts, cost_eur_average
         )
 
         return EC2Instance(
@@ -376,19 +354,94 @@ class RuntimeService:
             hourly_co2_breakdown=hourly_breakdown,
             instance_age_days=instance_age_days,
             data_completeness_24h=data_completeness_24h,
-            # DEPRECATED fields (backward compatibility)
-            monthly_co2_kg=self._safe_round(monthly_co2_kg, 3),
-            monthly_cost_usd=self._safe_round(monthly_cost_usd, 2),
-            monthly_cost_eur=self._safe_round(monthly_cost_eur, 2),
-            monthly_co2_kg_projected=self._safe_round(monthly_co2_kg_projected, 3),
-            monthly_co2_kg_30d=self._safe_round(monthly_co2_kg_30d, 3),
-            monthly_cost_projected_eur=self._safe_round(monthly_cost_projected_eur, 2),
         )
 
+    def input_fingerprint(
+        self,
+        instance: Dict,
+        *,
+        carbon_intensity: float,
+        carbon_history: Optional[List[Dict]] = None,
+        carbon_hourly: Optional[np.ndarray] = None,
+        window_end: Optional[datetime] = None,
+        period_days: int = 30,
+    ) -> Optional[str]:
+        """
+        Fingerprint of everything ``enrich_instance`` reads for this instance.
+
+        Covers instance metadata (state, type, launch time), the analysis
+        window, the carbon inputs, the power model (gateway values and the
+        power engine's model, e.g. after a power table refresh), the hourly
+        price and the cached CloudTrail runtime and CloudWatch CPU entries
+        (by modification time). Returns ``None`` when
+        one of those cache entries is missing or expired, i.e. when a new
+        enrichment would fetch fresh data and reuse is not safe.
+        """
+        instance_id = instance["instance_id"]
+        instance_type = instance.get("instance_type")
+        region = instance.get("region", self.config.region)
+        num_hours = period_days * 24
+        if window_end is None:
+            _, window_end = hourly_analysis_window(num_hours)
+
+        digest = hashlib.sha256()
+        metadata = [
+            FINGERPRINT_VERSION,
+            instance_id,
+            instance.get("instance_type"),
+            instance.get("state"),
+            region,
+            instance.get("instance_name"),
+            str(instance.get("launch_time")),
+            period_days,
+            window_end.isoformat(),
+            round(float(carbon_intensity), 3),
+            *self._model_inputs(instance_type, region),
+        ]
+        digest.update(json.dumps(metadata, default=str).encode("utf-8"))
+
+        input_caches = (
+            (self._repository.path("cloudtrail_runtime", f"{instance_id}_{region}_{period_days}d"), CacheTTL.CLOUDTRAIL_EVENTS),
+            (self._repository.path("cpu_utilization_hourly", f"{instance_id}_{num_hours}h"), CacheTTL.CPU_UTILIZATION),
+        )
+        for path, ttl in input_caches:
+            if not self._repository.is_valid(path, ttl):
+                return None
+            digest.update(str(path.stat().st_mtime_ns).encode("ascii"))
+
+        if carbon_hourly is not None:
+            digest.update(np.ascontiguousarray(carbon_hourly, dtype=np.float64).tobytes())
+        elif carbon_history:
+            digest.update(json.dumps(carbon_history, sort_keys=True, default=str).encode("utf-8"))
+
+        return digest.hexdigest()
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _model_inputs(self, instance_type: Optional[str], region: str) -> List:
+        """Power model and hourly price ``enrich_instance`` would use for this instance type."""
+        power_data = self._gateway.get_power_consumption(instance_type)
+        power = (
+            [power_data.avg_power_watts, power_data.min_power_watts, power_data.max_power_watts, power_data.source]
+            if power_data
+            else None
+        )
+        # The engine's model is linear in CPU, so a few probe points identify it
+        engine_power = self._engine_power_hourly(instance_type, np.array([0.0, 50.0, 100.0]))
+        engine = np.round(engine_power, 6).tolist() if engine_power is not None else None
+        return [power, engine, self._gateway.get_instance_pricing(instance_type, region)]
+
+    def _engine_power_hourly(self, instance_type: str, cpu_hourly: np.ndarray) -> Optional[np.ndarray]:
+        """Hourly power from the power engine, or None if the type is not in its table."""
+        if self._power_engine is None:
+            return None
+        cpu = np.asarray(cpu_hourly, dtype=np.float64)[np.newaxis, :]
+        power = np.asarray(self._power_engine.power_matrix([instance_type], cpu), dtype=np.float64)[0]
+        # Rows of unknown types are all NaN; missing CPU hours stay NaN and are masked downstream
+        return power if np.isfinite(power).any() else None
+
     def _get_precise_runtime_hours(self, instance: Dict, *, force_refresh: bool = False, period_days: Optional[int] = None) -> Optional[float]:
         # Use provided period_days or fall back to config default
         effective_period_days = period_days if period_days is not None else self.config.period_days
@@ -544,24 +597,25 @@ class RuntimeService:
 
         return round(runtime_hours, 2)
 
-    def _calculate_runtime_per_hour_24h(
-        self, instance: Dict, events: List[Dict], end_time: datetime
+    def _calculate_runtime_per_hour(
+        self, instance: Dict, events: List[Dict], end_time: datetime, hours: int = 24
     ) -> tuple[List[float], List[datetime]]:
         """
-        Calculate runtime fraction (0.0-1.0) for each of the last 24 hours.
+        Calculate runtime fraction (0.0-1.0) for each of the last ``hours`` hours.
 
-        This function builds running intervals from CloudTrail Start/Stop events
-        and calculates what fraction of each hour the instance was running.
+        Running intervals are built once from CloudTrail Start/Stop events via
+        ``RuntimeTimeline`` and evaluated per hour with a cumulative sweep.
 
         Args:
             instance: Instance dict with state and launch_time
             events: Sorted CloudTrail events (already filtered, from _extract_relevant_events)
             end_time: Current time (usually datetime.now(UTC))
+            hours: Window length in hours
 
         Returns:
             Tuple of:
-            - List of 24 floats (runtime fractions, 0.0-1.0)
-            - List of 24 datetime objects (hour start times)
+            - List of ``hours`` floats (runtime fractions, 0.0-1.0)
+            - List of ``hours`` datetime objects (hour start times)
 
         Example:
             Instance started at 10:15, stopped at 12:45
@@ -570,109 +624,28 @@ class RuntimeService:
             Hour 12:00-13:00 → 0.75 (ran 45 minutes)
             Hour 13:00-14:00 → 0.0  (stopped)
         """
-        runtime_per_hour = []
-        timestamps = []
-
-        start_events = {"RunInstances", "StartInstances"}
-        stop_events = {"StopInstances", "TerminateInstances"}
-
-        # Build running intervals from events
-        running_intervals: List[tuple[datetime, datetime]] = []
-        session_start: Optional[datetime] = None
-
-        # Get instance state and launch time
-        instance_state = instance.get("state", "").lower()
-        launch_time = instance.get("launch_time")
-        if launch_time and isinstance(launch_time, datetime) and launch_time.tzinfo is None:
-            launch_time = launch_time.replace(tzinfo=timezone.utc)
-
-        window_start = end_time - timedelta(hours=24)
-
-        # Determine initial state at window_start
-        # If instance was launched before our 24h window, check if it was running
-        if launch_time and launch_time < window_start:
-            # Instance existed before window - check for stop events before window
-            has_early_stop = False
-            last_event_before_window = None
-
-            for event in events:
-                event_time = event["time"]
-                if event_time >= window_start:
-                    break  # Events are sorted
-                last_event_before_window = event
-
-            # If last event before window was a start event (or no events), assume running
-            if last_event_before_window is None:
-                # No events before window, instance was launched earlier
-                session_start = window_start
-            elif last_event_before_window["name"] in start_events:
-                # Last event was start, so instance was running at window start
-                session_start = window_start
-            elif last_event_before_window["name"] in stop_events:
-                # Last event was stop, so instance was stopped at window start
-                session_start = None
-
-        # Process events within the 24h window
-        for event in events:
-            event_time = event["time"]
-            event_name = event["name"]
-
-            # Only consider events within our window
-            if event_time < window_start:
-                continue
-
-            if event_name in start_events:
-                if session_start is None:
-                    session_start = event_time
-                else:
-                    logger.debug(f"Duplicate start event at {event_time}, ignoring")
-            elif event_name in stop_events:
-                if session_start is not None:
-                    # Add interval
-                    running_intervals.append((session_start, event_time))
-                    session_start = None
-                else:
-                    logger.debug(f"Stop event without start at {event_time}, ignoring")
-
-        # If still running at end_time, close the interval
-        if session_start is not None:
-            running_intervals.append((session_start, end_time))
-        elif instance_state == "running" and not running_intervals:
-            # No events but currently running - assume running entire window
-            # This handles always-on instances
-            logger.debug(f"Instance {instance.get('instance_id')} has no events but is running - assuming always-on")
-            running_intervals.append((window_start, end_time))
-
-        logger.debug(f"Built {len(running_intervals)} running intervals for last 24h")
-
-        # Calculate runtime for each hour
-        for hour_offset in range(24):
-            hour_start = window_start + timedelta(hours=hour_offset)
-            hour_end = hour_start + timedelta(hours=1)
-
-            timestamps.append(hour_start)
-
-            # Calculate overlap with running intervals
-            total_seconds = 0.0
-
-            for interval_start, interval_end in running_intervals:
-                # Calculate overlap between this hour and the running interval
-                overlap_start = max(hour_start, interval_start)
-                overlap_end = min(hour_end, interval_end)
-
-                if overlap_start < overlap_end:
-                    overlap_seconds = (overlap_end - overlap_start).total_seconds()
-                    total_seconds += overlap_seconds
-
-            # Convert to fraction (0.0-1.0)
-            runtime_fraction = min(total_seconds / 3600.0, 1.0)
-            runtime_per_hour.append(runtime_fraction)
+        window_start = end_time - timedelta(hours=hours)
+        timeline = RuntimeTimeline.from_events(
+            events,
+            window_start=window_start,
+            window_end=end_time,
+            instance_state=instance.get("state"),
+            launch_time=instance.get("launch_time"),
+        )
+        runtime_per_hour = timeline.runtime_fractions(window_start, hours).tolist()
 
         logger.debug(
-            f"Runtime per hour calculated: {sum(1 for r in runtime_per_hour if r > 0)} hours with runtime"
+            f"Runtime per hour calculated: {sum(1 for r in runtime_per_hour if r > 0)}/{hours} hours with runtime "
+            f"({len(timeline)} running intervals)"
         )
 
-        return runtime_per_hour, timestamps
+        return runtime_per_hour, slot_timestamps(window_start, hours)
+
+    def _calculate_runtime_per_hour_24h(
+        self, instance: Dict, events: List[Dict], end_time: datetime
+    ) -> tuple[List[float], List[datetime]]:
+        """Calculate runtime fractions for the last 24 hours (see ``_calculate_runtime_per_hour``)."""
+        return self._calculate_runtime_per_hour(instance, events, end_time, hours=24)
 
     # ------------------------------------------------------------------
     # Auxiliary helpers for enrichment
@@ -725,30 +698,43 @@ class RuntimeService:
             logger.warning("⚠️ CloudWatch CPU query error for %s: %s", instance_id, error)
             return None
 
-    def _get_cpu_utilisation_hourly(self, instance_id: str, force_refresh: bool = False) -> Optional[Dict]:
+    def _get_cpu_utilisation_hourly(
+        self,
+        instance_id: str,
+        force_refresh: bool = False,
+        *,
+        window_start: Optional[datetime] = None,
+        hours: int = 24,
+    ) -> Optional[Dict]:
         """
-        Fetch hourly CPU utilization for last 24h (replaces single average).
+        Fetch hourly CPU utilization for an hour-aligned window (replaces single average).
 
-        Returns hourly CPU values instead of a single average, enabling
-        hourly-precise CO2 calculations.
+        Returns hourly CPU values aligned to the window's hour slots, enabling
+        hourly-precise CO2 calculations over the full analysis period.
 
         Args:
             instance_id: EC2 instance ID
             force_refresh: Force refresh from CloudWatch (ignore cache)
+            window_start: Start of the first hour slot (default: see ``hourly_analysis_window``)
+            hours: Number of hour slots
 
         Returns:
             Dictionary containing:
-            - hourly_values: List of float (up to 24 values)
-            - timestamps: List of datetime objects
+            - hourly_values: float array with one value per slot (NaN where missing)
+            - timestamps: List of slot start datetimes
             - average: float (backward compatibility)
 
             Returns None if no data available.
 
         Note:
-            CloudWatch returns data with Period=3600 (1 hour), so we get
-            individual values for each hour, not a single average.
+            CloudWatch returns data with Period=3600 (1 hour); responses are
+            paginated by the gateway so 168h/720h windows are complete.
         """
-        cache_path = self._repository.path("cpu_utilization_hourly", instance_id)
+        if window_start is None:
+            window_start, _ = hourly_analysis_window(hours)
+        end_time = window_start + timedelta(hours=hours)
+        slots = slot_timestamps(window_start, hours)
+        cache_path = self._repository.path("cpu_utilization_hourly", f"{instance_id}_{hours}h")
 
         if not force_refresh and self._repository.is_valid(cache_path, CacheTTL.CPU_UTILIZATION):
             cached = self._repository.read_json(cache_path)
@@ -757,23 +743,16 @@ class RuntimeService:
                 timestamps = [datetime.fromisoformat(ts) for ts in cached["timestamps"]]
                 logger.debug(f"Using cached hourly CPU data for {instance_id}: {len(cached['hourly_values'])} hours")
                 return {
-                    "hourly_values": cached["hourly_values"],
-                    "timestamps": timestamps,
+                    "hourly_values": align_hourly_values(timestamps, cached["hourly_values"], window_start, hours),
+                    "timestamps": slots,
                     "average": cached["average"],
                 }
 
         try:
-            # Use UTC-aware datetime with stable hourly window
-            # Always use data ending 1 hour ago to ensure CloudWatch completeness
-            # This provides stable monthly projections (no intra-hour volatility)
-            now = datetime.now(timezone.utc)
-            end_time = now.replace(minute=0, second=0, microsecond=0) - timedelta(hours=1)
-            start_time = end_time - timedelta(hours=24)
-
             results = self._gateway.fetch_cpu_metrics(
                 instance_id=instance_id,
                 region=self.config.region,
-                start_time=start_time,
+                start_time=window_start,
                 end_time=end_time,
             )
 
@@ -797,18 +776,22 @@ class RuntimeService:
                 "average": avg_cpu,
                 "instance_id": instance_id,
                 "collected_at": datetime.now(timezone.utc).isoformat(),
-                "source": "CloudWatch_hourly_24h",
+                "source": f"CloudWatch_hourly_{hours}h",
             }
             self._repository.write_json(cache_path, payload)
 
             logger.info(
-                "✅ CPU Utilization Hourly %s: %d hours, avg %.1f%%, window=%s to %s",
-                instance_id, len(values), avg_cpu,
-                start_time.strftime("%Y-%m-%d %H:%M UTC"),
+                "✅ CPU Utilization Hourly %s: %d/%d hours, avg %.1f%%, window=%s to %s",
+                instance_id, len(values), hours, avg_cpu,
+                window_start.strftime("%Y-%m-%d %H:%M UTC"),
                 end_time.strftime("%Y-%m-%d %H:%M UTC")
             )
 
-            return {"hourly_values": values, "timestamps": timestamps, "average": avg_cpu}
+            return {
+                "hourly_values": align_hourly_values(timestamps, values, window_start, hours),
+                "timestamps": slots,
+                "average": avg_cpu,
+            }
 
         except Exception as error:  # pragma: no cover
             logger.warning("⚠️ CloudWatch CPU hourly query error for %s: %s", instance_id, error)
@@ -857,14 +840,14 @@ class RuntimeService:
         runtime_hours: Optional[float],
         cpu_utilisation: Optional[float],
         effective_power_watts: Optional[float],
-        monthly_cost_eur: Optional[float],
+        cost_eur: Optional[float],
     ) -> str:
         if all(
-            value is not None for value in (runtime_hours, cpu_utilisation, effective_power_watts, monthly_cost_eur)
+            value is not None for value in (runtime_hours, cpu_utilisation, effective_power_watts, cost_eur)
         ):
             return "measured"
         if any(
-            value is not None for value in (runtime_hours, cpu_utilisation, effective_power_watts, monthly_cost_eur)
+            value is not None for value in (runtime_hours, cpu_utilisation, effective_power_watts, cost_eur)
         ):
             return "partial"
         return "limited"
@@ -0,0 +1,264 @@
+"""
+Carbon-aware workload shifting simulator.
+
+Replays each instance's hourly energy profile against the hourly carbon
+intensity of the analysis window and computes the CO2 that shifting policies
+would actually save, instead of applying a flat literature factor.
+
+For a policy with candidate offsets ``k`` the simulator builds one
+hours × offsets matrix of target intensities, ``T[h, k] = C[h + k]`` when
+moving hour ``h`` by ``k`` is admissible (inside the window, known intensity,
+within the deferral window and before the deadline) and ``C[h]`` otherwise,
+so inadmissible work simply stays where it is. The fleet is then evaluated
+for all instances × hours × offsets at once:
+
+- ``keep_profile=False``: every hour moves to its cleanest admissible slot,
+  ``shifted = E @ min_k T[:, k]``
+- ``keep_profile=True``: each instance's whole profile moves by one offset,
+  ``shifted = min_k (E @ T)[:, k]`` (load shape and ordering are preserved)
+
+Shifting changes when instances run, not for how long, so costs are unchanged.
+"""
+
+from __future__ import annotations
+
+import warnings
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.domain.models import EC2Instance
+
+# Hour-of-day conditions (deferral windows, deadlines) refer to the German grid's local time
+DEFAULT_TIMEZONE = "Europe/Berlin"
+
+
+@dataclass(frozen=True)
+class ShiftPolicy:
+    """
+    Constraints under which flexible work may move in time.
+
+    Attributes:
+        name: Label shown in reports
+        max_shift_hours: Largest allowed offset in hours
+        allow_advance: Whether work may also run earlier (negative offsets)
+        window: Local ``(start_hour, end_hour)`` the moved work must run in;
+            wraps around midnight when ``start_hour > end_hour`` (e.g. ``(22, 6)``)
+        deadline_hour: Moved work must finish before the next occurrence of
+            this local hour of day (e.g. ``8`` = done by 08:00)
+        shiftable_fraction: Share of each instance's energy that is flexible
+        keep_profile: Move each instance's whole profile by a single offset
+            instead of moving every hour independently
+    """
+
+    name: str
+    max_shift_hours: int
+    allow_advance: bool = False
+    window: Optional[Tuple[int, int]] = None
+    deadline_hour: Optional[int] = None
+    shiftable_fraction: float = 1.0
+    keep_profile: bool = False
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """Candidate offsets in hours (always includes 0)."""
+        low = -self.max_shift_hours if self.allow_advance else 0
+        return np.arange(low, self.max_shift_hours + 1, dtype=np.int64)
+
+
+DEFAULT_SHIFT_POLICIES: Tuple[ShiftPolicy, ...] = (
+    ShiftPolicy("Defer up to 4h", max_shift_hours=4, shiftable_fraction=0.5),
+    ShiftPolicy("Defer up to 12h", max_shift_hours=12, shiftable_fraction=0.5),
+    ShiftPolicy("Nightly batch window (22–06, done by 08:00)", max_shift_hours=18, window=(22, 6), deadline_hour=8, shiftable_fraction=0.3),
+    ShiftPolicy("Whole schedule ±6h", max_shift_hours=6, allow_advance=True, keep_profile=True),
+)
+
+
+@dataclass(frozen=True, eq=False)
+class ShiftingResult:
+    """Per-instance outcome of one policy (arrays aligned with ``instance_ids``)."""
+
+    policy: ShiftPolicy
+    instance_ids: Tuple[str, ...]
+    baseline_co2_kg: np.ndarray
+    shifted_co2_kg: np.ndarray
+    mean_shift_hours: np.ndarray
+    """Energy-weighted mean absolute offset of the moved work"""
+
+    @property
+    def savings_kg(self) -> np.ndarray:
+        return self.baseline_co2_kg - self.shifted_co2_kg
+
+    @property
+    def fleet_baseline_kg(self) -> float:
+        return float(self.baseline_co2_kg.sum())
+
+    @property
+    def fleet_savings_kg(self) -> float:
+        return float(self.savings_kg.sum())
+
+    @property
+    def savings_pct(self) -> float:
+        baseline = self.fleet_baseline_kg
+        return self.fleet_savings_kg / baseline * 100.0 if baseline > 0 else 0.0
+
+    @property
+    def instances_benefiting(self) -> int:
+        return int((self.savings_kg > 1e-9).sum())
+
+
+def local_hours(timestamps: np.ndarray, timezone: str = DEFAULT_TIMEZONE) -> np.ndarray:
+    """Local hour of day (0–23) of UTC ``datetime64`` slot starts."""
+    index = pd.DatetimeIndex(np.asarray(timestamps).astype("datetime64[s]")).tz_localize("UTC").tz_convert(timezone)
+    return index.hour.to_numpy(dtype=np.int64)
+
+
+def target_intensity(policy: ShiftPolicy, carbon_intensity: np.ndarray, hours_of_day: np.ndarray) -> np.ndarray:
+    """Hours × offsets matrix of the intensity work from hour ``h`` runs at when moved by each offset."""
+    carbon = np.asarray(carbon_intensity, dtype=np.float64)
+    hours = carbon.shape[0]
+    offsets = policy.offsets
+    target = np.arange(hours)[:, np.newaxis] + offsets[np.newaxis, :]
+    clipped = np.clip(target, 0, max(hours - 1, 0))
+
+    known = np.isfinite(carbon)
+    admissible = (target >= 0) & (target < hours) & known[clipped] & known[:, np.newaxis]
+    if policy.window is not None:
+        start, end = policy.window
+        target_hour = np.asarray(hours_of_day)[clipped]
+        in_window = (target_hour >= start) & (target_hour < end) if start < end else (target_hour >= start) | (target_hour < end)
+        admissible &= in_window | (offsets == 0)[np.newaxis, :]
+    if policy.deadline_hour is not None:
+        latest = (policy.deadline_hour - np.asarray(hours_of_day) - 1) % 24
+        admissible &= offsets[np.newaxis, :] <= latest[:, np.newaxis]
+
+    original = np.nan_to_num(carbon, nan=0.0)
+    return np.where(admissible, carbon[clipped], original[:, np.newaxis])
+
+
+def simulate_shifting(
+    energy_kwh: np.ndarray,
+    carbon_intensity: np.ndarray,
+    hours_of_day: np.ndarray,
+    policies: Sequence[ShiftPolicy] = DEFAULT_SHIFT_POLICIES,
+    *,
+    instance_ids: Optional[Sequence[str]] = None,
+) -> List[ShiftingResult]:
+    """
+    Evaluate shifting policies for an instances × hours energy matrix.
+
+    Args:
+        energy_kwh: Energy per instance and hour, shape (N, H)
+        carbon_intensity: Carbon intensity g/kWh per hour, shape (H,); NaN = unknown
+            (work in such hours is neither counted nor moved)
+        hours_of_day: Local hour of day per slot, shape (H,)
+        policies: Policies to evaluate
+        instance_ids: Labels for the rows of ``energy_kwh``
+
+    Returns:
+        One ``ShiftingResult`` per policy
+    """
+    energy = np.nan_to_num(np.atleast_2d(np.asarray(energy_kwh, dtype=np.float64)), nan=0.0)
+    hours = min(energy.shape[1], len(carbon_intensity), len(hours_of_day))
+    energy = energy[:, :hours]
+    carbon = np.asarray(carbon_intensity, dtype=np.float64)[:hours]
+    hours_of_day = np.asarray(hours_of_day)[:hours]
+    ids = tuple(instance_ids) if instance_ids is not None else tuple(str(row) for row in range(energy.shape[0]))
+
+    baseline_g = energy @ np.nan_to_num(carbon, nan=0.0)
+    total_energy = energy.sum(axis=1)
+    results = []
+    for policy in policies:
+        targets = target_intensity(policy, carbon, hours_of_day)
+        offsets = np.abs(policy.offsets)
+        if policy.keep_profile:
+            per_offset = energy @ targets
+            best = per_offset.argmin(axis=1)
+            shifted_g = per_offset[np.arange(energy.shape[0]), best]
+            mean_shift = np.where(shifted_g < baseline_g, offsets[best], 0).astype(np.float64)
+        else:
+            # Prefer staying put when no slot is strictly cleaner
+            zero = int(np.flatnonzero(policy.offsets == 0)[0])
+            best = np.where(targets[:, zero] <= targets.min(axis=1), zero, targets.argmin(axis=1))
+            shifted_g = energy @ targets[np.arange(hours), best]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                mean_shift = np.where(total_energy > 0, (energy @ offsets[best]) / total_energy, 0.0)
+
+        fraction = min(max(policy.shiftable_fraction, 0.0), 1.0)
+        shifted_g = baseline_g - fraction * (baseline_g - shifted_g)
+        results.append(
+            ShiftingResult(
+                policy=policy,
+                instance_ids=ids,
+                baseline_co2_kg=baseline_g / 1000.0,
+                shifted_co2_kg=shifted_g / 1000.0,
+                mean_shift_hours=mean_shift,
+            )
+        )
+    return results
+
+
+def fleet_energy_profile(
+    instances: Sequence[EC2Instance], carbon_intensity_hourly: Optional[np.ndarray] = None
+) -> Tuple[Tuple[str, ...], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Energy matrix of all instances with an hourly breakdown.
+
+    Returns:
+        ``(instance_ids, timestamps, energy_kwh (N, H), carbon_intensity (H,))``.
+        Without ``carbon_intensity_hourly`` the intensity is recovered from the
+        breakdowns (hours no instance ran in stay unknown).
+    """
+    breakdowns = [
+        (instance.instance_id, instance.hourly_co2_breakdown)
+        for instance in instances
+        if instance.hourly_co2_breakdown is not None and len(instance.hourly_co2_breakdown)
+    ]
+    if not breakdowns:
+        empty = np.empty(0)
+        return (), empty.astype("datetime64[s]"), np.empty((0, 0)), empty
+
+    hours = min(len(breakdown) for _, breakdown in breakdowns)
+    timestamps = np.asarray(breakdowns[0][1].timestamps)[:hours]
+    energy = np.empty((len(breakdowns), hours))
+    for row, (_, breakdown) in enumerate(breakdowns):
+        power = np.nan_to_num(np.asarray(breakdown.power_watts[:hours], dtype=np.float64), nan=0.0)
+        energy[row] = np.where(breakdown.running[:hours], power / 1000.0 * breakdown.runtime_fraction[:hours], 0.0)
+
+    if carbon_intensity_hourly is not None and len(carbon_intensity_hourly) >= hours:
+        carbon = np.asarray(carbon_intensity_hourly, dtype=np.float64)[:hours]
+    else:
+        stacked = np.stack([np.asarray(breakdown.carbon_intensity[:hours], dtype=np.float64) for _, breakdown in breakdowns])
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN hours stay NaN
+            carbon = np.nanmean(stacked, axis=0)
+    return tuple(instance_id for instance_id, _ in breakdowns), timestamps, energy, carbon
+
+
+def simulate_fleet_shifting(
+    instances: Sequence[EC2Instance],
+    carbon_intensity_hourly: Optional[np.ndarray] = None,
+    policies: Sequence[ShiftPolicy] = DEFAULT_SHIFT_POLICIES,
+    *,
+    timezone: str = DEFAULT_TIMEZONE,
+) -> List[ShiftingResult]:
+    """``simulate_shifting`` for enriched instances (see ``fleet_energy_profile``)."""
+    instance_ids, timestamps, energy, carbon = fleet_energy_profile(instances, carbon_intensity_hourly)
+    if not instance_ids:
+        return []
+    return simulate_shifting(energy, carbon, local_hours(timestamps, timezone), policies, instance_ids=instance_ids)
+
+
+__all__ = [
+    "DEFAULT_SHIFT_POLICIES",
+    "DEFAULT_TIMEZONE",
+    "ShiftPolicy",
+    "ShiftingResult",
+    "fleet_energy_profile",
+    "local_hours",
+    "simulate_fleet_shifting",
+    "simulate_shifting",
+    "target_intensity",
+]
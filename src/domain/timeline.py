@@ -0,0 +1,234 @@
+"""
+Runtime timeline engine.
+
+Turns sorted CloudTrail start/stop events into merged running intervals once
+and answers "what fraction of each slot was the instance running?" for any
+window length and slot resolution.
+
+Runtime per slot is derived from a cumulative-runtime function evaluated at
+the slot edges with ``numpy.searchsorted``, so the cost is
+O((intervals + slots) · log intervals) instead of O(slots × intervals).
+"""
+
+from __future__ import annotations
+
+import logging
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+START_EVENTS = frozenset({"RunInstances", "StartInstances"})
+STOP_EVENTS = frozenset({"StopInstances", "TerminateInstances"})
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def slot_timestamps(window_start: datetime, slots: int, resolution: timedelta = timedelta(hours=1)) -> List[datetime]:
+    """Start time of every slot in the window."""
+    return [window_start + resolution * index for index in range(slots)]
+
+
+@lru_cache(maxsize=8)
+def _hour_axis(start_epoch: int, slots: int) -> np.ndarray:
+    axis = np.datetime64(start_epoch, "s") + np.arange(slots) * np.timedelta64(3600, "s")
+    axis.flags.writeable = False
+    return axis
+
+
+def hour_axis(window_start: datetime, slots: int) -> np.ndarray:
+    """
+    Read-only ``datetime64[s]`` (UTC) axis of hourly slot starts.
+
+    Identical windows return the same array object, so every instance of a
+    refresh shares one timestamp axis.
+    """
+    return _hour_axis(int(_as_utc(window_start).timestamp()), slots)
+
+
+def hourly_analysis_window(hours: int, *, now: Optional[datetime] = None) -> Tuple[datetime, datetime]:
+    """
+    Hour-aligned ``(window_start, window_end)`` covering the last ``hours`` complete hours.
+
+    The window ends one hour before the current hour boundary so CloudWatch's
+    hourly datapoints are complete, and is shared by CPU, carbon and runtime.
+    """
+    current = _as_utc(now or datetime.now(timezone.utc))
+    window_end = current.replace(minute=0, second=0, microsecond=0) - timedelta(hours=1)
+    return window_end - timedelta(hours=hours), window_end
+
+
+class RuntimeTimeline:
+    """
+    Merged, non-overlapping running intervals of a single instance.
+
+    Intervals are stored as sorted epoch-second arrays together with the
+    cumulative runtime before each interval.
+    """
+
+    __slots__ = ("_starts", "_ends", "_cumulative")
+
+    def __init__(self, starts: np.ndarray, ends: np.ndarray) -> None:
+        self._starts = starts
+        self._ends = ends
+        self._cumulative = np.concatenate(([0.0], np.cumsum(ends - starts)))
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_intervals(cls, intervals: Iterable[Tuple[datetime, datetime]]) -> "RuntimeTimeline":
+        """Build a timeline from (start, end) pairs; overlapping intervals are merged."""
+        pairs = sorted(
+            (_as_utc(start).timestamp(), _as_utc(end).timestamp()) for start, end in intervals if end > start
+        )
+        merged: List[List[float]] = []
+        for start, end in pairs:
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+
+        if not merged:
+            return cls(np.empty(0), np.empty(0))
+        array = np.asarray(merged, dtype=np.float64)
+        return cls(array[:, 0].copy(), array[:, 1].copy())
+
+    @classmethod
+    def from_events(
+        cls,
+        events: Sequence[Dict],
+        *,
+        window_start: datetime,
+        window_end: datetime,
+        instance_state: Optional[str] = None,
+        launch_time: Optional[datetime] = None,
+    ) -> "RuntimeTimeline":
+        """
+        Build the running intervals inside ``[window_start, window_end]``.
+
+        Args:
+            events: Sorted ``{"name", "time"}`` events (see ``_extract_relevant_events``)
+            window_start: Start of the analysis window
+            window_end: End of the analysis window (usually now)
+            instance_state: Current EC2 state, used for always-on instances without events
+            launch_time: Instance launch time
+
+        Semantics match the original 24h implementation: an instance launched
+        before the window is running at ``window_start`` unless its last event
+        before the window was a stop; duplicate starts and orphan stops are
+        ignored; a running instance without any interval is assumed always-on.
+        """
+        state = (instance_state or "").lower()
+        if launch_time is not None and isinstance(launch_time, datetime):
+            launch_time = _as_utc(launch_time)
+
+        intervals: List[Tuple[datetime, datetime]] = []
+        session_start: Optional[datetime] = None
+
+        if launch_time and launch_time < window_start:
+            last_before_window = None
+            for event in events:
+                if event["time"] >= window_start:
+                    break
+                last_before_window = event
+            if last_before_window is None or last_before_window["name"] in START_EVENTS:
+                session_start = window_start
+
+        for event in events:
+            event_time = event["time"]
+            if event_time < window_start:
+                continue
+            if event["name"] in START_EVENTS:
+                if session_start is None:
+                    session_start = event_time
+                else:
+                    logger.debug("Duplicate start event at %s, ignoring", event_time)
+            elif event["name"] in STOP_EVENTS:
+                if session_start is not None:
+                    intervals.append((session_start, event_time))
+                    session_start = None
+                else:
+                    logger.debug("Stop event without start at %s, ignoring", event_time)
+
+        if session_start is not None:
+            intervals.append((session_start, window_end))
+        elif state == "running" and not intervals:
+            intervals.append((window_start, window_end))
+
+        return cls.from_intervals(intervals)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return int(self._starts.size)
+
+    @property
+    def intervals(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Read-only ``(starts, ends)`` epoch-second arrays of the merged running intervals."""
+        starts, ends = self._starts.view(), self._ends.view()
+        starts.flags.writeable = ends.flags.writeable = False
+        return starts, ends
+
+    @property
+    def total_runtime_hours(self) -> float:
+        return float(self._cumulative[-1]) / 3600.0
+
+    def cumulative_seconds(self, edges: np.ndarray) -> np.ndarray:
+        """Total running seconds up to each epoch-second edge."""
+        edges = np.asarray(edges, dtype=np.float64)
+        if not self._starts.size:
+            return np.zeros_like(edges)
+        index = np.searchsorted(self._starts, edges, side="right") - 1
+        safe = np.clip(index, 0, None)
+        partial = np.minimum(edges, self._ends[safe]) - self._starts[safe]
+        return np.where(index >= 0, self._cumulative[safe] + partial, 0.0)
+
+    def runtime_fractions(
+        self,
+        window_start: datetime,
+        slots: int,
+        resolution: timedelta = timedelta(hours=1),
+    ) -> np.ndarray:
+        """
+        Running fraction (0.0-1.0) of each slot in the window.
+
+        Example:
+            Instance started at 10:15, stopped at 12:45 (hourly slots)
+            10:00-11:00 → 0.75, 11:00-12:00 → 1.0, 12:00-13:00 → 0.75
+        """
+        step = resolution.total_seconds()
+        edges = _as_utc(window_start).timestamp() + step * np.arange(slots + 1, dtype=np.float64)
+        return np.clip(np.diff(self.cumulative_seconds(edges)) / step, 0.0, 1.0)
+
+
+def runtime_matrix(
+    timelines: Sequence[RuntimeTimeline],
+    window_start: datetime,
+    slots: int,
+    resolution: timedelta = timedelta(hours=1),
+) -> np.ndarray:
+    """Instances × slots runtime-fraction matrix for a fleet sharing one window."""
+    matrix = np.zeros((len(timelines), slots))
+    for row, timeline in enumerate(timelines):
+        matrix[row] = timeline.runtime_fractions(window_start, slots, resolution)
+    return matrix
+
+
+__all__ = [
+    "START_EVENTS",
+    "STOP_EVENTS",
+    "RuntimeTimeline",
+    "hour_axis",
+    "hourly_analysis_window",
+    "runtime_matrix",
+    "slot_timestamps",
+]
@@ -0,0 +1,337 @@
+"""
+Lightweight span tracing for the refresh pipeline.
+
+Spans are recorded into the active ``RefreshTrace`` (held in a context
+variable), so use cases, services and gateways can be instrumented without
+threading a tracer through every call. Outside an active trace ``span``,
+``stage`` and ``record_cache`` are no-ops.
+
+A finished trace exports to the Chrome trace event format (open it in
+``chrome://tracing`` or https://ui.perfetto.dev); every event carries
+OpenTelemetry-style ``trace_id``/``span_id``/``parent_span_id`` in ``args``.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, TypeVar
+
+from src.domain.models import RefreshTraceSummary
+
+F = TypeVar("F", bound=Callable[..., Any])
+T = TypeVar("T")
+
+_active_trace: ContextVar[Optional["RefreshTrace"]] = ContextVar("refresh_trace", default=None)
+
+
+@dataclass(slots=True)
+class Span:
+    """A timed operation inside a refresh trace."""
+
+    name: str
+    category: str
+    span_id: int
+    parent_id: Optional[int]
+    start_ns: int
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    end_ns: Optional[int] = None
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    @property
+    def duration_s(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return (end - self.start_ns) / 1e9
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def set(self, **attributes: Any) -> None:
+        return None
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class RefreshTrace:
+    """Spans of one dashboard refresh; the root span covers the whole refresh."""
+
+    def __init__(self, name: str = "refresh", **attributes: Any) -> None:
+        self.trace_id = secrets.token_hex(16)
+        self.started_at = datetime.now(timezone.utc)
+        self.spans: List[Span] = []
+        self._stack: List[Span] = []
+        self._stage: Optional[Span] = None
+        self._next_id = 1
+        self._thread_id = threading.get_ident()
+        self.root = self.open_span(name, "refresh", attributes)
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    @property
+    def current(self) -> Span:
+        return self._stack[-1] if self._stack else self.root
+
+    def open_span(self, name: str, category: str, attributes: Dict[str, Any]) -> Span:
+        span = Span(
+            name=name,
+            category=category,
+            span_id=self._next_id,
+            parent_id=self._stack[-1].span_id if self._stack else None,
+            start_ns=time.perf_counter_ns(),
+            attributes=attributes,
+        )
+        self._next_id += 1
+        self.spans.append(span)
+        self._stack.append(span)
+        return span
+
+    def close_span(self, span: Span) -> None:
+        span.end_ns = time.perf_counter_ns()
+        if self._stack and self._stack[-1] is span:
+            self._stack.pop()
+        elif span in self._stack:
+            self._stack.remove(span)
+
+    def stage(self, name: str) -> None:
+        """End the current pipeline stage (if any) and start the next one."""
+        if self._stage is not None:
+            self.close_span(self._stage)
+        self._stage = self.open_span(name, "stage", {})
+
+    def finish(self) -> None:
+        if self._stage is not None:
+            self.close_span(self._stage)
+            self._stage = None
+        if self.root.end_ns is None:
+            self.close_span(self.root)
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def summary(self, *, top: int = 5, trace_path: Optional[str] = None) -> RefreshTraceSummary:
+        """Aggregate stage durations, per-operation totals and the slowest instances."""
+        stages: Dict[str, float] = {}
+        operations: Dict[str, Dict[str, float]] = {}
+        instance_seconds: Dict[str, float] = {}
+
+        for span in self.spans:
+            if span is self.root:
+                continue
+            if span.category == "stage":
+                stages[span.name] = round(stages.get(span.name, 0.0) + span.duration_s, 6)
+                continue
+
+            entry = operations.setdefault(
+                span.name, {"calls": 0, "seconds": 0.0, "cache_hits": 0, "cache_misses": 0}
+            )
+            entry["calls"] += 1
+            entry["seconds"] = round(entry["seconds"] + span.duration_s, 6)
+            entry["cache_hits"] += span.cache_hits
+            entry["cache_misses"] += span.cache_misses
+
+            instance_id = span.attributes.get("instance_id")
+            if span.category == "enrich" and instance_id:
+                instance_seconds[instance_id] = instance_seconds.get(instance_id, 0.0) + span.duration_s
+
+        slowest_instances = sorted(instance_seconds.items(), key=lambda item: item[1], reverse=True)[:top]
+        return RefreshTraceSummary(
+            trace_id=self.trace_id,
+            started_at=self.started_at,
+            total_seconds=round(self.root.duration_s, 6),
+            stages=stages,
+            slowest_stage=max(stages, key=stages.get) if stages else None,
+            operations=operations,
+            slowest_instances=[(instance_id, round(seconds, 6)) for instance_id, seconds in slowest_instances],
+            span_count=len(self.spans),
+            trace_path=trace_path,
+        )
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Chrome trace event JSON (complete ``X`` events, microseconds from trace start)."""
+        origin = self.root.start_ns
+        pid = os.getpid()
+        events = []
+        for span in self.spans:
+            end = span.end_ns if span.end_ns is not None else time.perf_counter_ns()
+            args: Dict[str, Any] = {
+                "trace_id": self.trace_id,
+                "span_id": f"{span.span_id:016x}",
+                "parent_span_id": f"{span.parent_id:016x}" if span.parent_id is not None else None,
+            }
+            if span.cache_hits or span.cache_misses:
+                args["cache_hits"] = span.cache_hits
+                args["cache_misses"] = span.cache_misses
+            for key, value in span.attributes.items():
+                args[key] = value if value is None or isinstance(value, (str, int, float, bool)) else str(value)
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": (span.start_ns - origin) / 1000.0,
+                    "dur": (end - span.start_ns) / 1000.0,
+                    "pid": pid,
+                    "tid": self._thread_id,
+                    "args": args,
+                }
+            )
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"trace_id": self.trace_id, "started_at": self.started_at.isoformat()},
+        }
+
+
+# ----------------------------------------------------------------------
+# Module-level helpers (no-ops without an active trace)
+# ----------------------------------------------------------------------
+
+
+@contextmanager
+def start_trace(name: str = "refresh", **attributes: Any) -> Iterator[RefreshTrace]:
+    """Activate a new ``RefreshTrace`` for the duration of the block."""
+    trace = RefreshTrace(name, **attributes)
+    token = _active_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        trace.finish()
+        _active_trace.reset(token)
+
+
+@contextmanager
+def activate_trace(trace: RefreshTrace) -> Iterator[RefreshTrace]:
+    """Make an existing trace the active one for the duration of the block."""
+    token = _active_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _active_trace.reset(token)
+
+
+def iter_traced(trace: RefreshTrace, iterator: Iterator[T]) -> Iterator[T]:
+    """
+    Drive ``iterator`` with ``trace`` active during each step only.
+
+    A generator suspended at ``yield`` inside ``start_trace`` would leave its
+    trace active in the consumer's context (the consumer's own spans land in
+    it) and reset the token from whatever context later resumes or closes it.
+    Here the trace is set and reset around every ``next()`` and around
+    ``close()``, so nothing leaks across a ``yield``. The trace is finished
+    when the iterator is exhausted, fails or is closed early.
+    """
+    try:
+        while True:
+            with activate_trace(trace):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            with activate_trace(trace):
+                close()
+        trace.finish()
+
+
+def current_trace() -> Optional[RefreshTrace]:
+    return _active_trace.get()
+
+
+@contextmanager
+def span(name: str, *, category: str = "internal", **attributes: Any) -> Iterator[Any]:
+    """Record a span in the active trace; yields an object with ``set(**attributes)``."""
+    trace = _active_trace.get()
+    if trace is None:
+        yield NOOP_SPAN
+        return
+
+    current = trace.open_span(name, category, attributes)
+    try:
+        yield current
+    except BaseException as error:
+        current.attributes["error"] = type(error).__name__
+        raise
+    finally:
+        trace.close_span(current)
+
+
+def stage(name: str) -> None:
+    """Mark the start of the next pipeline stage in the active trace."""
+    trace = _active_trace.get()
+    if trace is not None:
+        trace.stage(name)
+
+
+def record_cache(hit: bool) -> None:
+    """Count a cache hit or miss on the innermost open span."""
+    trace = _active_trace.get()
+    if trace is None:
+        return
+    if hit:
+        trace.current.cache_hits += 1
+    else:
+        trace.current.cache_misses += 1
+
+
+def traced(
+    name: Optional[str] = None,
+    *,
+    category: str = "internal",
+    attributes: Sequence[str] = ("instance_id", "instance_type", "region"),
+) -> Callable[[F], F]:
+    """Decorator recording a span per call; listed arguments become span attributes."""
+
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+        signature = inspect.signature(func)
+        wanted = [parameter for parameter in attributes if parameter in signature.parameters]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _active_trace.get() is None:
+                return func(*args, **kwargs)
+            values: Dict[str, Any] = {}
+            if wanted:
+                bound = signature.bind_partial(*args, **kwargs).arguments
+                values = {parameter: bound[parameter] for parameter in wanted if parameter in bound}
+            with span(span_name, category=category, **values):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+__all__ = [
+    "NOOP_SPAN",
+    "RefreshTrace",
+    "Span",
+    "activate_trace",
+    "current_trace",
+    "iter_traced",
+    "record_cache",
+    "span",
+    "stage",
+    "start_trace",
+    "traced",
+]
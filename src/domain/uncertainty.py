@@ -0,0 +1,254 @@
+"""
+Monte Carlo uncertainty engine for business case ranges.
+
+Samples the uncertain inputs of the fleet model for every instance at once:
+
+- base power: triangular between the power model's min, avg and max watts
+- CPU utilisation: normal around the observed mean (clipped to 0–100 %)
+- carbon intensity: normal around the window mean, shared by the fleet
+- EUR/USD: normal around the configured rate
+- savings factor: uniform over the scenario range
+
+Each sample evaluates the same formulas as the deterministic pipeline
+(``P = Base × (0.3 + 0.7 × CPU/100)``, ``CO2 = P/1000 × Runtime × Carbon``,
+``Cost = Price × Runtime × EUR/USD``) as a samples × instances matrix,
+processed in sample chunks so memory stays bounded. The standard deviations
+of CPU and carbon describe the uncertainty of their *window means*: the
+fleet helper uses the hourly standard deviation divided by the square root
+of the number of observed days.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.domain.models import EC2Instance, PowerConsumption
+
+DEFAULT_SAMPLES = 10_000
+DEFAULT_PERCENTILES = (5.0, 50.0, 95.0)
+
+# Relative standard deviation of the EUR/USD rate over a reporting month
+DEFAULT_FX_RELATIVE_STD = 0.03
+
+# CPU assumption (percentage points) for instances without hourly CPU data
+DEFAULT_CPU_MEAN = 50.0
+DEFAULT_CPU_STD = 10.0
+
+# Upper bound of samples × instances cells evaluated at once
+_CHUNK_CELLS = 2_000_000
+
+BAND_NAMES = ("baseline_cost_eur", "baseline_co2_kg", "cost_savings_eur", "co2_savings_kg")
+
+
+@dataclass(frozen=True, eq=False)
+class UncertaintyInputs:
+    """Per-instance point estimates and spreads (arrays of shape (N,))."""
+
+    power_avg_watts: np.ndarray
+    power_min_watts: np.ndarray
+    power_max_watts: np.ndarray
+    cpu_mean: np.ndarray
+    cpu_std: np.ndarray
+    runtime_hours: np.ndarray
+    hourly_price_usd: np.ndarray
+    carbon_mean: float
+    carbon_std: float
+    eur_usd_rate: float
+    eur_usd_std: float
+
+    def __len__(self) -> int:
+        return int(self.power_avg_watts.shape[0])
+
+
+@dataclass(frozen=True)
+class MonteCarloResult:
+    """Percentile bands of fleet totals over all samples."""
+
+    samples: int
+    percentiles: Tuple[float, ...]
+    bands: Dict[str, Tuple[float, ...]]
+    """``BAND_NAMES`` → values at ``percentiles``"""
+
+    def band(self, name: str) -> Tuple[float, ...]:
+        return self.bands[name]
+
+    def relative_half_width(self, name: str = "cost_savings_eur") -> float:
+        """Half the outer band width relative to the median (e.g. 0.2 = ±20 %)."""
+        values = self.bands[name]
+        median = values[len(values) // 2]
+        return (values[-1] - values[0]) / 2.0 / median if median > 0 else 0.0
+
+
+def _triangular(uniform: np.ndarray, low: np.ndarray, mode: np.ndarray, high: np.ndarray) -> np.ndarray:
+    """Inverse CDF of the triangular distribution; zero-width ranges return ``mode``."""
+    width = high - low
+    with np.errstate(invalid="ignore", divide="ignore"):
+        split = np.where(width > 0, (mode - low) / width, 0.5)
+        rising = low + np.sqrt(uniform * width * (mode - low))
+        falling = high - np.sqrt((1.0 - uniform) * width * (high - mode))
+    return np.where(width > 0, np.where(uniform < split, rising, falling), mode)
+
+
+def simulate_business_case_uncertainty(
+    inputs: UncertaintyInputs,
+    *,
+    savings_factor_range: Tuple[float, float],
+    samples: int = DEFAULT_SAMPLES,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    baseline_cost_eur: Optional[float] = None,
+    baseline_co2_kg: Optional[float] = None,
+    seed: Optional[int] = None,
+) -> MonteCarloResult:
+    """
+    Sample fleet cost, CO2 and savings ``samples`` times.
+
+    Args:
+        inputs: Per-instance point estimates and spreads
+        savings_factor_range: ``(low, high)`` share of the baseline saved
+        samples: Number of Monte Carlo samples
+        percentiles: Percentiles reported per band
+        baseline_cost_eur / baseline_co2_kg: If given, sampled totals are
+            rescaled so the point estimate maps onto these dashboard totals
+            (only the relative spread of the model is used)
+        seed: Seed for reproducible bands
+
+    Returns:
+        ``MonteCarloResult`` with bands for ``BAND_NAMES``
+    """
+    rng = np.random.default_rng(seed)
+    count = len(inputs)
+    runtime = np.nan_to_num(np.asarray(inputs.runtime_hours, dtype=np.float64), nan=0.0)
+    price = np.nan_to_num(np.asarray(inputs.hourly_price_usd, dtype=np.float64), nan=0.0)
+    avg = np.nan_to_num(np.asarray(inputs.power_avg_watts, dtype=np.float64), nan=0.0)
+    low = np.fmin(np.where(np.isfinite(inputs.power_min_watts), inputs.power_min_watts, avg), avg)
+    high = np.fmax(np.where(np.isfinite(inputs.power_max_watts), inputs.power_max_watts, avg), avg)
+    cpu_mean = np.clip(np.nan_to_num(np.asarray(inputs.cpu_mean, dtype=np.float64), nan=0.0), 0.0, 100.0)
+    cpu_std = np.nan_to_num(np.asarray(inputs.cpu_std, dtype=np.float64), nan=DEFAULT_CPU_STD)
+
+    # Fleet-wide draws (one value per sample)
+    fx = np.maximum(rng.normal(inputs.eur_usd_rate, inputs.eur_usd_std, samples), 0.0)
+    carbon = np.maximum(rng.normal(inputs.carbon_mean, inputs.carbon_std, samples), 0.0)
+    factor = rng.uniform(*savings_factor_range, samples)
+
+    # Cost only depends on the exchange rate
+    cost = fx * float(price @ runtime)
+
+    # Energy (kWh) needs one draw per instance and sample
+    energy = np.empty(samples)
+    chunk = max(_CHUNK_CELLS // max(count, 1), 1)
+    for start in range(0, samples, chunk):
+        size = min(chunk, samples - start)
+        base = _triangular(rng.random((size, count)), low, avg, high)
+        cpu = np.clip(cpu_mean + cpu_std * rng.standard_normal((size, count)), 0.0, 100.0)
+        energy[start : start + size] = (base * (0.3 + 0.7 * cpu / 100.0)) @ runtime / 1000.0
+    co2 = energy * carbon / 1000.0
+
+    if baseline_cost_eur is not None:
+        nominal = inputs.eur_usd_rate * float(price @ runtime)
+        cost = cost * (baseline_cost_eur / nominal) if nominal > 0 else np.full(samples, baseline_cost_eur)
+    if baseline_co2_kg is not None:
+        nominal = float((avg * (0.3 + 0.7 * cpu_mean / 100.0)) @ runtime) / 1000.0 * inputs.carbon_mean / 1000.0
+        co2 = co2 * (baseline_co2_kg / nominal) if nominal > 0 else np.full(samples, baseline_co2_kg)
+
+    totals = {
+        "baseline_cost_eur": cost,
+        "baseline_co2_kg": co2,
+        "cost_savings_eur": cost * factor,
+        "co2_savings_kg": co2 * factor,
+    }
+    points = tuple(float(value) for value in percentiles)
+    return MonteCarloResult(
+        samples=samples,
+        percentiles=points,
+        bands={name: tuple(float(value) for value in np.percentile(values, points)) for name, values in totals.items()},
+    )
+
+
+def build_uncertainty_inputs(
+    instances: Sequence[EC2Instance],
+    power_models: Mapping[str, PowerConsumption],
+    *,
+    carbon_intensity_hourly: Optional[np.ndarray] = None,
+    carbon_intensity: Optional[float] = None,
+    eur_usd_rate: float = 0.92,
+    eur_usd_relative_std: float = DEFAULT_FX_RELATIVE_STD,
+) -> UncertaintyInputs:
+    """
+    Point estimates and spreads of enriched instances.
+
+    Args:
+        instances: Enriched instances (runtime, price, power, CPU)
+        power_models: Power model per instance type (min/avg/max watts)
+        carbon_intensity_hourly: Hourly intensity of the window (mean and spread)
+        carbon_intensity: Fallback point estimate without a series (no spread)
+        eur_usd_rate: Configured EUR/USD rate
+        eur_usd_relative_std: Relative standard deviation of the rate
+    """
+    count = len(instances)
+    power = np.full((3, count), np.nan)
+    cpu_mean = np.full(count, np.nan)
+    cpu_std = np.full(count, DEFAULT_CPU_STD)
+    for index, instance in enumerate(instances):
+        breakdown = instance.hourly_co2_breakdown
+        running_cpu = (
+            np.asarray(breakdown.cpu_percent, dtype=np.float64)[np.asarray(breakdown.running, dtype=bool)]
+            if breakdown is not None
+            else np.empty(0)
+        )
+        if running_cpu.size:
+            cpu_mean[index] = running_cpu.mean()
+            cpu_std[index] = running_cpu.std() / math.sqrt(max(running_cpu.size / 24.0, 1.0))
+        elif instance.cpu_utilization is not None:
+            cpu_mean[index] = instance.cpu_utilization
+
+        model = power_models.get(instance.instance_type)
+        if model is not None:
+            power[:, index] = (model.avg_power_watts, model.min_power_watts, model.max_power_watts)
+        elif instance.power_watts is not None:
+            # Instance power already includes the CPU factor; recover the base power (no spread)
+            utilisation = cpu_mean[index] if np.isfinite(cpu_mean[index]) else DEFAULT_CPU_MEAN
+            power[:, index] = instance.power_watts / (0.3 + 0.7 * utilisation / 100.0)
+
+    carbon = (
+        np.asarray(carbon_intensity_hourly, dtype=np.float64)
+        if carbon_intensity_hourly is not None
+        else np.empty(0)
+    )
+    carbon = carbon[np.isfinite(carbon)]
+    if carbon.size:
+        carbon_mean = float(carbon.mean())
+        carbon_std = float(carbon.std() / math.sqrt(max(carbon.size / 24.0, 1.0)))
+    else:
+        carbon_mean, carbon_std = float(carbon_intensity or 0.0), 0.0
+
+    def _values(attribute: str) -> np.ndarray:
+        return np.array([getattr(instance, attribute) or 0.0 for instance in instances], dtype=np.float64)
+
+    return UncertaintyInputs(
+        power_avg_watts=power[0],
+        power_min_watts=power[1],
+        power_max_watts=power[2],
+        cpu_mean=np.where(np.isfinite(cpu_mean), cpu_mean, DEFAULT_CPU_MEAN),
+        cpu_std=cpu_std,
+        runtime_hours=_values("runtime_hours"),
+        hourly_price_usd=_values("hourly_price_usd"),
+        carbon_mean=carbon_mean,
+        carbon_std=carbon_std,
+        eur_usd_rate=eur_usd_rate,
+        eur_usd_std=eur_usd_rate * eur_usd_relative_std,
+    )
+
+
+__all__ = [
+    "BAND_NAMES",
+    "DEFAULT_PERCENTILES",
+    "DEFAULT_SAMPLES",
+    "MonteCarloResult",
+    "UncertaintyInputs",
+    "build_uncertainty_inputs",
+    "simulate_business_case_uncertainty",
+]
@@ -1,11 +1,12 @@
 """
-Infrastructure Cache - Filesystem-based caching and time-series persistence
+Infrastructure Cache - Filesystem-based caching
 
 This module consolidates all caching functionality:
 - FileCacheRepository: JSON file caching with TTL validation (implements CacheRepository protocol)
-- JsonTimeSeriesStore: Time-series data persistence
 - CacheTTL: Standardized cache TTL values
 
+Time-series persistence lives in ``src.infrastructure.timeseries_store``.
+
 Clean Architecture:
 FileCacheRepository implements the src.domain.protocols.CacheRepository protocol,
 allowing domain services to depend on abstractions rather than concrete implementations.
@@ -15,20 +16,49 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import tempfile
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Optional, Iterable, List, Dict
+from typing import IO, Any, Optional, Iterable, Iterator, List, Dict
+
+from src.domain.tracing import record_cache
 
 logger = logging.getLogger(__name__)
 
 
+@contextmanager
+def atomic_write(path: Path, mode: str = "w", **kwargs: Any) -> Iterator[IO]:
+    """
+    Open a uniquely named temporary file next to ``path`` that replaces it on success.
+
+    Several writers (dashboard refreshes, concurrent CLI jobs) share one cache
+    root, so the temporary name must be unique per write: readers only ever see
+    a complete file and concurrent writers never truncate each other's output.
+    The temporary file is removed if the block raises.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle = tempfile.NamedTemporaryFile(
+        mode, dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False, **kwargs
+    )
+    try:
+        with handle:
+            yield handle
+        os.replace(handle.name, path)
+    except BaseException:
+        Path(handle.name).unlink(missing_ok=True)
+        raise
+
+
 @dataclass(frozen=True)
 class CacheTTL:
     """Standard cache TTL values used across the application (minutes)."""
 
     CARBON_DATA: int = 60  # ElectricityMaps updates hourly
     CARBON_24H: int = 60  # Historical data synchronized with hourly updates (changed from 120)
+    CARBON_HISTORY: int = 10080  # Completed past-range chunks are settled (7 days)
     POWER_DATA: int = 10080  # Hardware specs rarely change (7 days)
     PRICING_DATA: int = 10080  # AWS pricing stable (7 days)
     COST_DATA: int = 1440  # Cost Explorer updates daily (24 hours)
@@ -73,9 +103,12 @@ class FileCacheRepository:
         """Check whether the given cache file exists and is fresh enough."""
 
         if not path.exists():
+            record_cache(False)
             return False
         file_age = datetime.now().timestamp() - path.stat().st_mtime
-        return file_age < (max_age_minutes * 60)
+        fresh = file_age < (max_age_minutes * 60)
+        record_cache(fresh)
+        return fresh
 
     def read_json(self, path: Path) -> Any:
         """Read a JSON payload from disk, returning ``None`` on errors."""
@@ -91,8 +124,7 @@ class FileCacheRepository:
         """Persist a JSON payload to disk, best-effort."""
 
         try:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with path.open("w", encoding="utf-8") as handle:
+            with atomic_write(path, encoding="utf-8") as handle:
                 json.dump(payload, handle, indent=2)
         except (OSError, TypeError, ValueError) as error:
             logger.warning("⚠️ Failed to write cache %s: %s", path, error)
@@ -141,32 +173,8 @@ class FileCacheRepository:
         return deleted
 
 
-class JsonTimeSeriesStore:
-    """Lightweight JSON time-series storage backed by ``FileCacheRepository``."""
-
-    def __init__(self, repository: FileCacheRepository, cache_key: str) -> None:
-        self._repository = repository
-        self._path = repository.path(*cache_key.split("/"))
-
-    @property
-    def path(self) -> Path:
-        return self._path
-
-    def load(self) -> List[Dict[str, Any]]:
-        payload = self._repository.read_json(self._path)
-        if isinstance(payload, list):
-            return payload
-        if payload is not None:
-            logger.debug("Unexpected payload while loading time series: %s", type(payload))
-        return []
-
-    def save(self, rows: Iterable[Dict[str, Any]]) -> None:
-        serialised = list(rows)
-        self._repository.write_json(self._path, serialised)
-
-
 __all__ = [
     "CacheTTL",
     "FileCacheRepository",
-    "JsonTimeSeriesStore",
+    "atomic_write",
 ]
@@ -0,0 +1,103 @@
+"""
+Persisted enriched instances keyed by an input fingerprint.
+
+Enrichment is deterministic for a given set of inputs (instance metadata,
+analysis window, carbon vector and the cached CloudTrail/CloudWatch data it
+reads). ``EnrichmentStore`` keeps the last ``EC2Instance`` produced for every
+instance and period together with the fingerprint of those inputs, in memory
+and as a pickle in the cache root, so unchanged instances can be reused across
+refreshes and process restarts. Pickles written for another model schema
+(``model_schema_digest()``) are ignored.
+"""
+
+from __future__ import annotations
+
+import logging
+import pickle
+import threading
+from typing import Dict, Optional, Tuple
+
+from src.domain.models import EC2Instance, model_schema_digest
+from src.infrastructure.cache import FileCacheRepository, atomic_write
+
+logger = logging.getLogger(__name__)
+
+ENRICHMENT_STORE_VERSION = 2
+
+
+class EnrichmentStore:
+    """Two-level (memory + pickle) store of enriched instances with their input fingerprint."""
+
+    def __init__(self, repository: FileCacheRepository, category: str = "enriched_instances") -> None:
+        self._repository = repository
+        self._category = category
+        self._lock = threading.Lock()
+        self._memory: Dict[Tuple[str, int], Tuple[str, EC2Instance]] = {}
+
+    def _path(self, instance_id: str, period_days: int):
+        return self._repository.path(self._category, f"{instance_id}_{period_days}d", extension="pkl")
+
+    def get(self, instance_id: str, period_days: int, fingerprint: str) -> Optional[EC2Instance]:
+        """Return the stored instance if it was enriched from inputs with the same fingerprint."""
+        key = (instance_id, period_days)
+        entry = self._memory.get(key)
+        if entry is None:
+            entry = self._load(instance_id, period_days)
+            if entry is None:
+                return None
+            with self._lock:
+                self._memory[key] = entry
+
+        stored_fingerprint, instance = entry
+        return instance if stored_fingerprint == fingerprint else None
+
+    def put(self, instance: EC2Instance, fingerprint: str) -> None:
+        """Remember ``instance`` for its id and period and persist it best-effort."""
+        key = (instance.instance_id, instance.period_days)
+        with self._lock:
+            self._memory[key] = (fingerprint, instance)
+
+        path = self._path(instance.instance_id, instance.period_days)
+        try:
+            with atomic_write(path, "wb") as handle:
+                pickle.dump(
+                    {
+                        "version": ENRICHMENT_STORE_VERSION,
+                        "schema": model_schema_digest(),
+                        "fingerprint": fingerprint,
+                        "instance": instance,
+                    },
+                    handle,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as error:
+            logger.warning("⚠️ Failed to persist enriched instance %s: %s", instance.instance_id, error)
+
+    def clear(self) -> None:
+        """Drop the in-memory layer (persisted entries stay on disk)."""
+        with self._lock:
+            self._memory.clear()
+
+    def _load(self, instance_id: str, period_days: int) -> Optional[Tuple[str, EC2Instance]]:
+        path = self._path(instance_id, period_days)
+        if not path.exists():
+            return None
+        try:
+            with path.open("rb") as handle:
+                payload = pickle.load(handle)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError) as error:
+            logger.debug("Ignoring unreadable enriched instance %s: %s", path, error)
+            return None
+
+        if not isinstance(payload, dict) or payload.get("version") != ENRICHMENT_STORE_VERSION:
+            return None
+        if payload.get("schema") != model_schema_digest():
+            return None
+        instance = payload.get("instance")
+        fingerprint = payload.get("fingerprint")
+        if not isinstance(instance, EC2Instance) or not isinstance(fingerprint, str):
+            return None
+        return fingerprint, instance
+
+
+__all__ = ["ENRICHMENT_STORE_VERSION", "EnrichmentStore"]
@@ -1,16 +1,26 @@
-"""Convenience gateway aggregating infrastructure clients."""
+"""
+Convenience gateway aggregating infrastructure clients.
+
+``AWSClient`` (and with it boto3/botocore) is imported by
+``create_default_gateway()`` rather than at package import, so code that only
+needs the gateway type does not pay for the AWS SDK.
+"""
 
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from src.config import settings
+from src.domain.tracing import traced
 from src.infrastructure.cache import FileCacheRepository
-from .aws import AWSClient
+from src.infrastructure.power_table import LocalPowerEngine
 from .boavizta import BoaviztaClient
 from .electricity import ElectricityClient
 
+if TYPE_CHECKING:
+    from .aws import AWSClient
+
 __all__ = [
     "InfrastructureGateway",
     "create_default_gateway",
@@ -18,7 +28,11 @@ __all__ = [
 
 
 class InfrastructureGateway:
-    """Aggregates all external API clients used by the domain services."""
+    """
+    Aggregates all external API clients used by the domain services.
+
+    Every call is recorded as a ``gateway.*`` span while a refresh trace is active.
+    """
 
     def __init__(
         self,
@@ -32,39 +46,63 @@ class InfrastructureGateway:
         self._boavizta = boavizta_client
         self._aws = aws_client
         self._region_zone_mapping = region_zone_mapping
+        self._power_engine = LocalPowerEngine(boavizta_client.power_table)
 
     # ElectricityMaps -----------------------------------------------------
 
+    @traced("gateway.get_current_carbon_intensity", category="gateway")
     def get_current_carbon_intensity(self, region: str) -> Optional[object]:
         return self._electricity.get_current_intensity(region, self._region_zone_mapping)
 
+    @traced("gateway.get_carbon_intensity_24h", category="gateway")
     def get_carbon_intensity_24h(self, region: str) -> Optional[list[dict]]:
         return self._electricity.get_carbon_intensity_history(region, self._region_zone_mapping)
 
+    @traced("gateway.get_carbon_intensity_range", category="gateway")
+    def get_carbon_intensity_range(self, region: str, start: datetime, end: datetime) -> Optional[list[dict]]:
+        return self._electricity.get_carbon_intensity_range(region, self._region_zone_mapping, start, end)
+
+    @traced("gateway.get_self_collected_24h_data", category="gateway")
     def get_self_collected_24h_data(self, region: str) -> Optional[list[dict]]:
         return self._electricity.get_self_collected_history(region)
 
     # Boavizta ------------------------------------------------------------
 
+    @traced("gateway.get_power_consumption", category="gateway")
     def get_power_consumption(self, instance_type: str):
         return self._boavizta.get_power_consumption(instance_type)
 
+    def get_power_table(self):
+        return self._boavizta.power_table
+
+    def get_power_engine(self) -> LocalPowerEngine:
+        return self._power_engine
+
+    @traced("gateway.refresh_power_table", category="gateway")
+    def refresh_power_table(self, instance_types=None) -> int:
+        return self._boavizta.refresh_power_table(instance_types)
+
     # AWS: Cost & Pricing -------------------------------------------------
 
+    @traced("gateway.get_instance_pricing", category="gateway")
     def get_instance_pricing(self, instance_type: str, region: str) -> Optional[float]:
         return self._aws.get_instance_pricing(instance_type, region)
 
+    @traced("gateway.get_costs", category="gateway")
     def get_costs(self, region: str, period_days: int = 30):
         return self._aws.get_costs(region, period_days)
 
+    @traced("gateway.get_hourly_costs", category="gateway")
     def get_hourly_costs(self, hours: int, region: str):
         return self._aws.get_hourly_costs(hours, region)
 
     # AWS: Runtime (EC2, CloudTrail, CloudWatch) --------------------------
 
+    @traced("gateway.list_instances", category="gateway")
     def list_instances(self, region: str) -> List[Dict]:
         return self._aws.list_instances(region)
 
+    @traced("gateway.lookup_instance_events", category="gateway")
     def lookup_instance_events(
         self,
         *,
@@ -80,6 +118,7 @@ class InfrastructureGateway:
             lookup_end=lookup_end,
         )
 
+    @traced("gateway.fetch_cpu_metrics", category="gateway")
     def fetch_cpu_metrics(
         self,
         *,
@@ -95,11 +134,14 @@ class InfrastructureGateway:
             end_time=end_time,
         )
 
+    @traced("gateway.get_cached_launch_time", category="gateway")
     def get_cached_launch_time(self, instance_id: str, region: str) -> Optional[datetime]:
         return self._aws.get_cached_launch_time(instance_id, region)
 
 
 def create_default_gateway(repository: FileCacheRepository) -> InfrastructureGateway:
+    from .aws import AWSClient
+
     electricity = ElectricityClient(repository=repository)
     boavizta = BoaviztaClient(repository=repository)
     aws = AWSClient(repository=repository)
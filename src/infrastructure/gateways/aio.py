@@ -0,0 +1,27 @@
+"""Helpers for calling the async HTTP clients from synchronous gateway code."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def run_blocking(coroutine_function: Callable[[], Awaitable[T]]) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    When the calling thread already runs an event loop (e.g. inside an async
+    framework) the coroutine gets its own loop in a worker thread instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine_function())
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(lambda: asyncio.run(coroutine_function())).result()
+
+
+__all__ = ["run_blocking"]
@@ -156,11 +156,17 @@ class AWSClient:
         start_time: datetime,
         end_time: datetime,
     ) -> List[Dict]:
-        """Fetch CPU utilization metrics from CloudWatch."""
+        """
+        Fetch hourly CPU utilization metrics from CloudWatch.
+
+        Follows ``NextToken`` pagination so 7- and 30-day windows return every
+        datapoint. Pages are merged into one result per query id with
+        timestamps in ascending order.
+        """
         session = self._session_helper.session(region)
         cloudwatch = session.client("cloudwatch", region_name=region)
-        response = cloudwatch.get_metric_data(
-            MetricDataQueries=[
+        request = {
+            "MetricDataQueries": [
                 {
                     "Id": "cpu_utilization",
                     "MetricStat": {
@@ -175,10 +181,29 @@ class AWSClient:
                     "ReturnData": True,
                 }
             ],
-            StartTime=start_time,
-            EndTime=end_time,
-        )
-        return response.get("MetricDataResults", [])
+            "StartTime": start_time,
+            "EndTime": end_time,
+            "ScanBy": "TimestampAscending",
+        }
+
+        merged: Dict[str, Dict] = {}
+        while True:
+            response = cloudwatch.get_metric_data(**request)
+            for result in response.get("MetricDataResults", []):
+                entry = merged.setdefault(
+                    result.get("Id", "cpu_utilization"),
+                    {**result, "Values": [], "Timestamps": []},
+                )
+                entry["Values"].extend(result.get("Values", []))
+                entry["Timestamps"].extend(result.get("Timestamps", []))
+                entry["StatusCode"] = result.get("StatusCode", entry.get("StatusCode"))
+
+            next_token = response.get("NextToken")
+            if not next_token:
+                break
+            request["NextToken"] = next_token
+
+        return list(merged.values())
 
     # =========================================================================
     # Cost Explorer & Pricing APIs
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 try:
     import httpx
@@ -14,10 +14,22 @@ except ModuleNotFoundError:  # pragma: no cover
 from src.config import settings
 from src.infrastructure.cache import FileCacheRepository, CacheTTL
 from src.domain.models import PowerConsumption
+from src.infrastructure.gateways.aio import run_blocking
+from src.infrastructure.power_table import PowerModelEntry, PowerModelTable
 
 logger = logging.getLogger(__name__)
 
 
+def _numeric(value: Any) -> Optional[float]:
+    """Extract a number from Boavizta's ``{"value": ..}`` / ``{"default": ..}`` wrappers."""
+    if isinstance(value, dict):
+        value = value.get("value", value.get("default"))
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
 class BoaviztaClient:
     """Boavizta cloud instance power consumption client."""
 
@@ -27,10 +39,18 @@ class BoaviztaClient:
         repository: FileCacheRepository,
         base_url: str = str(settings.boavizta_base_url),
         timeout_seconds: float = settings.http_timeout_seconds,
+        power_table: Optional[PowerModelTable] = None,
+        bulk_concurrency: int = 8,
     ) -> None:
         self._repository = repository
         self._base_url = base_url.rstrip("/")
         self._timeout = timeout_seconds
+        self._power_table = power_table or PowerModelTable(repository)
+        self._bulk_concurrency = max(1, bulk_concurrency)
+
+    @property
+    def power_table(self) -> PowerModelTable:
+        return self._power_table
 
     async def _async_post(self, payload: Dict[str, object]) -> Dict[str, object]:
         timeout = httpx.Timeout(self._timeout)
@@ -42,23 +62,69 @@ class BoaviztaClient:
     def _cache_path(self, instance_type: str):
         return self._repository.path("boavizta_power", instance_type)
 
+    @staticmethod
+    def _parse_power(data: Dict[str, Any]) -> Optional[PowerConsumption]:
+        verbose = data.get("verbose", {})
+        avg_power = verbose.get("avg_power", {}).get("value")
+        if avg_power is None or avg_power <= 0:
+            return None
+        min_power = verbose.get("min_power", {}).get("value", avg_power * 0.8)
+        max_power = verbose.get("max_power", {}).get("value", avg_power * 1.2)
+        return PowerConsumption(
+            avg_power_watts=float(avg_power),
+            min_power_watts=float(min_power),
+            max_power_watts=float(max_power),
+            confidence_level="high",
+            source="Boavizta_API",
+        )
+
+    @staticmethod
+    def _parse_instance_config(data: Dict[str, Any]) -> Tuple[Optional[int], Optional[float]]:
+        vcpu = _numeric(data.get("vcpu"))
+        memory_gb = _numeric(data.get("memory"))
+        return (int(vcpu) if vcpu is not None else None), memory_gb
+
+    def _remember(self, instance_type: str, power: PowerConsumption) -> None:
+        """Add a single on-demand lookup to the offline table (metadata stays empty)."""
+        existing = self._power_table.entry(instance_type)
+        self._power_table.upsert(
+            [
+                PowerModelEntry(
+                    instance_type=instance_type,
+                    avg_power_watts=power.avg_power_watts,
+                    min_power_watts=power.min_power_watts,
+                    max_power_watts=power.max_power_watts,
+                    vcpu=existing.vcpu if existing else None,
+                    memory_gb=existing.memory_gb if existing else None,
+                    source=power.source,
+                )
+            ]
+        )
+
     def get_power_consumption(self, instance_type: str) -> Optional[PowerConsumption]:
         if not instance_type:
             logger.error("❌ Invalid instance_type provided to Boavizta client")
             return None
 
+        # Offline table first: hardware power models are stable, no TTL required
+        table_hit = self._power_table.get(instance_type)
+        if table_hit is not None:
+            return table_hit
+
         cache_path = self._cache_path(instance_type)
         if self._repository.is_valid(cache_path, CacheTTL.POWER_DATA):
             cached = self._repository.read_json(cache_path)
             if cached:
                 try:
-                    return PowerConsumption(
+                    cached_power = PowerConsumption(
                         avg_power_watts=float(cached["avg_power_watts"]),
                         min_power_watts=float(cached["min_power_watts"]),
                         max_power_watts=float(cached["max_power_watts"]),
                         confidence_level=str(cached.get("confidence_level", "high")),
                         source=str(cached.get("source", "Boavizta_API")),
                     )
+                    self._remember(instance_type, cached_power)
+                    return cached_power
                 except (KeyError, ValueError, TypeError) as error:
                     logger.debug("Boavizta cache invalid for %s: %s", instance_type, error)
 
@@ -71,19 +137,7 @@ class BoaviztaClient:
 
         async def _fetch() -> Optional[PowerConsumption]:
             data = await self._async_post(payload)
-            verbose = data.get("verbose", {})
-            avg_power = verbose.get("avg_power", {}).get("value")
-            if avg_power is None or avg_power <= 0:
-                return None
-            min_power = verbose.get("min_power", {}).get("value", avg_power * 0.8)
-            max_power = verbose.get("max_power", {}).get("value", avg_power * 1.2)
-            return PowerConsumption(
-                avg_power_watts=float(avg_power),
-                min_power_watts=float(min_power),
-                max_power_watts=float(max_power),
-                confidence_level="high",
-                source="Boavizta_API",
-            )
+            return self._parse_power(data)
 
         try:
             result = asyncio.run(_fetch())
@@ -109,7 +163,109 @@ class BoaviztaClient:
                 "source": result.source,
             }
             self._repository.write_json(cache_path, payload)
+            self._remember(instance_type, result)
         return result
 
+    def refresh_power_table(self, instance_types: Optional[Iterable[str]] = None) -> int:
+        """
+        Refresh the offline power table from Boavizta in bulk.
+
+        Args:
+            instance_types: Instance types to refresh. Defaults to every AWS
+                instance type known to Boavizta (``/cloud/instance/all_instances``).
+
+        Returns:
+            Number of table rows written.
+        """
+
+        async def _refresh() -> List[PowerModelEntry]:
+            timeout = httpx.Timeout(self._timeout)
+            headers = {"Accept": "application/json"}
+            async with httpx.AsyncClient(base_url=self._base_url, timeout=timeout) as client:
+                if instance_types is None:
+                    response = await client.get("/cloud/instance/all_instances", params={"provider": "aws"})
+                    response.raise_for_status()
+                    targets = [str(item) for item in response.json() or []]
+                else:
+                    targets = [item for item in instance_types if item]
+
+                semaphore = asyncio.Semaphore(self._bulk_concurrency)
+
+                async def _fetch_one(instance_type: str) -> Optional[PowerModelEntry]:
+                    async with semaphore:
+                        try:
+                            power_response = await client.post(
+                                "/cloud/instance",
+                                json={
+                                    "provider": "aws",
+                                    "instance_type": instance_type,
+                                    "usage": {"hours_use_time": 1},
+                                    "location": "EUC",
+                                },
+                                headers=headers,
+                            )
+                            power_response.raise_for_status()
+                            power = self._parse_power(power_response.json())
+                            if power is None:
+                                return None
+
+                            vcpu, memory_gb = None, None
+                            config_response = await client.get(
+                                "/cloud/instance/instance_config",
+                                params={"provider": "aws", "instance_type": instance_type},
+                            )
+                            if config_response.status_code < 400:
+                                vcpu, memory_gb = self._parse_instance_config(config_response.json() or {})
+                        except (
+                            httpx.HTTPStatusError,
+                            httpx.RequestError,
+                            ValueError,  # invalid JSON body
+                            KeyError,
+                            TypeError,
+                            AttributeError,  # unexpected payload shape
+                        ) as exc:
+                            logger.debug("Boavizta bulk refresh skipped %s: %s", instance_type, exc)
+                            return None
+
+                    return PowerModelEntry(
+                        instance_type=instance_type,
+                        avg_power_watts=power.avg_power_watts,
+                        min_power_watts=power.min_power_watts,
+                        max_power_watts=power.max_power_watts,
+                        vcpu=vcpu,
+                        memory_gb=memory_gb,
+                        source=power.source,
+                    )
+
+                results = await asyncio.gather(
+                    *(_fetch_one(instance_type) for instance_type in targets), return_exceptions=True
+                )
+            entries = []
+            for instance_type, result in zip(targets, results):
+                if isinstance(result, BaseException):
+                    logger.warning("⚠️ Boavizta bulk refresh failed for %s: %s", instance_type, result)
+                elif result is not None:
+                    entries.append(result)
+            return entries
+
+        try:
+            entries = run_blocking(_refresh)
+        except httpx.TimeoutException as exc:
+            logger.error("⏱️ Boavizta bulk refresh timeout: %s", exc)
+            return 0
+        except httpx.HTTPStatusError as exc:
+            logger.error("❌ Boavizta bulk refresh HTTP error %s", exc.response.status_code)
+            return 0
+        except httpx.RequestError as exc:
+            logger.error("❌ Boavizta bulk refresh failed: %s", exc)
+            return 0
+        except (ValueError, TypeError) as exc:
+            logger.error("❌ Boavizta instance list unreadable: %s", exc)
+            return 0
+
+        written = self._power_table.upsert(entries)
+        logger.info("⚡ Power table refreshed: %d instance types (%d total)", written, len(self._power_table))
+        return written
+
 
 __all__ = ["BoaviztaClient"]
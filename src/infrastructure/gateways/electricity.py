@@ -16,9 +16,15 @@ except ModuleNotFoundError:  # pragma: no cover - fallback stub
 from src.config import settings
 from src.infrastructure.cache import FileCacheRepository, CacheTTL
 from src.domain.models import CarbonIntensity
+from src.infrastructure.gateways.aio import run_blocking
 
 logger = logging.getLogger(__name__)
 
+# ElectricityMaps /past-range serves at most 10 days of hourly data per request.
+# Chunks are anchored to the Unix epoch so completed chunks keep a stable cache key.
+PAST_RANGE_CHUNK = timedelta(days=10)
+_CHUNK_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
 
 def _parse_iso(dt: str) -> datetime:
     normalised = dt.strip()
@@ -162,6 +168,115 @@ class ElectricityClient:
             self._repository.write_json(cache_path, {"history": history, "fetched_at": datetime.now().isoformat()})
         return history
 
+    def get_carbon_intensity_range(
+        self,
+        region: str,
+        zone_mapping: Dict[str, str],
+        start: datetime,
+        end: datetime,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Hourly carbon intensity history for an arbitrary past window.
+
+        The window is split into fixed 10-day chunks (the ``/past-range`` limit).
+        Completed chunks are cached for ``CacheTTL.CARBON_HISTORY``; the chunk
+        containing ``end`` is refreshed with the regular 24h TTL.
+
+        Returns:
+            Entries within ``[start, end)`` sorted by time, or None if nothing
+            could be retrieved.
+        """
+        start = start.astimezone(timezone.utc)
+        end = end.astimezone(timezone.utc)
+        if end <= start:
+            return None
+
+        chunk_index = (start - _CHUNK_EPOCH) // PAST_RANGE_CHUNK
+        chunks: List[tuple[datetime, datetime, bool]] = []
+        chunk_start = _CHUNK_EPOCH + PAST_RANGE_CHUNK * chunk_index
+        while chunk_start < end:
+            chunk_end = chunk_start + PAST_RANGE_CHUNK
+            complete = chunk_end <= end
+            chunks.append((chunk_start, chunk_end if complete else end, complete))
+            chunk_start = chunk_end
+
+        entries: List[Dict[str, Any]] = []
+        missing: List[tuple[datetime, datetime, Path]] = []
+        for chunk_start, chunk_end, complete in chunks:
+            cache_path = self._cache_path("carbon_intensity_range", f"{region}_{chunk_start:%Y%m%d}")
+            ttl = CacheTTL.CARBON_HISTORY if complete else CacheTTL.CARBON_24H
+            cached = self._repository.read_json(cache_path) if self._repository.is_valid(cache_path, ttl) else None
+            if isinstance(cached, dict) and cached.get("complete", False) == complete:
+                entries.extend(cached.get("history") or [])
+            else:
+                missing.append((chunk_start, chunk_end, cache_path))
+
+        if missing and not self._api_key:
+            logger.error("❌ ElectricityMaps API key not configured for past-range history")
+        elif missing:
+            zone = zone_mapping.get(region, region)
+            timeout = httpx.Timeout(self._timeout)
+            headers = {"auth-token": self._api_key or ""}
+
+            async def _fetch_all() -> List[Optional[List[Dict[str, Any]]]]:
+                async with httpx.AsyncClient(base_url=self._base_url, headers=headers, timeout=timeout) as client:
+
+                    async def _fetch(chunk_start: datetime, chunk_end: datetime) -> Optional[List[Dict[str, Any]]]:
+                        try:
+                            response = await client.get(
+                                "/carbon-intensity/past-range",
+                                params={"zone": zone, "start": chunk_start.isoformat(), "end": chunk_end.isoformat()},
+                            )
+                            response.raise_for_status()
+                            payload = response.json()
+                            history = payload.get("data") if isinstance(payload, dict) else None
+                            if not isinstance(history, list):
+                                logger.error("❌ ElectricityMaps past-range response without data (%s)", chunk_start.date())
+                                return None
+                            return [entry for entry in history if isinstance(entry, dict)]
+                        except httpx.TimeoutException:
+                            logger.error("⏱️ ElectricityMaps past-range timeout (%s)", chunk_start.date())
+                        except httpx.HTTPStatusError as exc:
+                            logger.error("❌ ElectricityMaps past-range error: %s", exc.response.status_code)
+                        except httpx.RequestError as exc:
+                            logger.error("❌ ElectricityMaps past-range request failed: %s", exc)
+                        except ValueError as exc:
+                            logger.error("❌ ElectricityMaps past-range response unreadable (%s): %s", chunk_start.date(), exc)
+                        return None
+
+                    return await asyncio.gather(*(_fetch(chunk_start, chunk_end) for chunk_start, chunk_end, _ in missing))
+
+            results = run_blocking(_fetch_all)
+
+            for (chunk_start, chunk_end, cache_path), history in zip(missing, results):
+                if not history:
+                    continue
+                entries.extend(history)
+                self._repository.write_json(
+                    cache_path,
+                    {
+                        "history": history,
+                        "complete": chunk_start + PAST_RANGE_CHUNK == chunk_end,
+                        "fetched_at": datetime.now().isoformat(),
+                    },
+                )
+
+        window: Dict[str, Dict[str, Any]] = {}
+        for entry in entries:
+            raw = entry.get("datetime")
+            if not raw:
+                continue
+            try:
+                timestamp = _parse_iso(raw)
+            except ValueError:
+                continue
+            if start <= timestamp < end:
+                window[timestamp.isoformat()] = entry
+
+        if not window:
+            return None
+        return [window[key] for key in sorted(window)]
+
     def get_self_collected_history(self, region: str) -> Optional[List[Dict[str, Any]]]:
         if not self._enable_hourly_collection:
             return None
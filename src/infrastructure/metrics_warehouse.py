@@ -0,0 +1,319 @@
+"""
+Local SQLite warehouse of per-instance hourly facts.
+
+CloudWatch keeps detailed CPU only for a limited window and the API caches
+expire, so every refresh would otherwise forget older hours. After each
+refresh the hourly breakdown of freshly enriched instances is upserted into
+``instance_hourly``, keyed by ``(instance_id, hour)``, which accumulates
+history across refreshes. Long-window reports, trends and month-to-date
+totals are then answered locally.
+
+Only running hours are stored (stopped hours are implicit zeros). Hours
+older than ``settle_hours`` (before the newest stored hour of an instance)
+that are already stored are not rewritten, so a warm refresh touches roughly
+``settle_hours`` rows per instance. Coverage is tracked per hour, so hours
+missing from an earlier refresh (no CPU or carbon data yet, different
+runtime) are backfilled whenever a later window contains them.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from src.domain.models import EC2Instance
+from src.infrastructure.cache import FileCacheRepository
+
+logger = logging.getLogger(__name__)
+
+WAREHOUSE_SCHEMA_VERSION = 1
+
+# Recent hours are rewritten on every refresh (late CloudWatch datapoints, runtime corrections)
+DEFAULT_SETTLE_HOURS = 48
+
+# Instance ids per ``IN (...)`` query, below SQLite's bound-parameter limit
+_IN_CHUNK = 500
+
+FACT_COLUMNS = ("cpu_percent", "runtime_fraction", "power_watts", "carbon_intensity", "co2_kg", "cost_eur")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS instance_hourly (
+    instance_id TEXT NOT NULL,
+    hour INTEGER NOT NULL,
+    instance_type TEXT,
+    region TEXT,
+    cpu_percent REAL,
+    runtime_fraction REAL NOT NULL,
+    power_watts REAL,
+    carbon_intensity REAL,
+    co2_kg REAL,
+    cost_eur REAL,
+    recorded_at INTEGER NOT NULL,
+    PRIMARY KEY (instance_id, hour)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS instance_hourly_hour ON instance_hourly (hour);
+"""
+
+_UPSERT = """
+INSERT INTO instance_hourly (
+    instance_id, hour, instance_type, region,
+    cpu_percent, runtime_fraction, power_watts, carbon_intensity, co2_kg, cost_eur, recorded_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (instance_id, hour) DO UPDATE SET
+    instance_type = excluded.instance_type,
+    region = excluded.region,
+    cpu_percent = excluded.cpu_percent,
+    runtime_fraction = excluded.runtime_fraction,
+    power_watts = excluded.power_watts,
+    carbon_intensity = excluded.carbon_intensity,
+    co2_kg = excluded.co2_kg,
+    cost_eur = excluded.cost_eur,
+    recorded_at = excluded.recorded_at
+"""
+
+
+def _epoch(timestamp: datetime) -> int:
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return int(timestamp.timestamp())
+
+
+def _breakdown_hours(instance: EC2Instance) -> np.ndarray:
+    """Epoch seconds of every hour of an instance's breakdown."""
+    breakdown = instance.hourly_co2_breakdown
+    return np.asarray(breakdown.timestamps).astype("datetime64[s]").astype(np.int64)[: len(breakdown)]
+
+
+def _nullable(values: np.ndarray) -> List[Optional[float]]:
+    return [None if value != value else value for value in values.astype(np.float64).tolist()]
+
+
+class MetricsWarehouse:
+    """Upsert and query per-instance hourly facts in a local SQLite file (see module docstring)."""
+
+    def __init__(self, path: Path, *, settle_hours: int = DEFAULT_SETTLE_HOURS) -> None:
+        self._path = Path(path)
+        self._settle_seconds = settle_hours * 3600
+        self._lock = threading.Lock()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.executescript(_SCHEMA)
+            connection.execute(f"PRAGMA user_version = {WAREHOUSE_SCHEMA_VERSION}")
+
+    @classmethod
+    def for_repository(cls, repository: FileCacheRepository, **kwargs: Any) -> "MetricsWarehouse":
+        """Warehouse file inside the cache root (``api_data/warehouse/instance_metrics.sqlite``)."""
+        return cls(repository.path("warehouse", "instance_metrics", extension="sqlite"), **kwargs)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(self._path, timeout=30)
+        try:
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def record(self, instances: Iterable[EC2Instance], *, recorded_at: Optional[datetime] = None) -> int:
+        """
+        Upsert the running hours of each instance's hourly breakdown in one transaction.
+
+        Instances without a breakdown (Average-Based method) are skipped.
+        Returns the number of rows written.
+        """
+        candidates = [instance for instance in instances if instance.hourly_co2_breakdown is not None]
+        if not candidates:
+            return 0
+        stamp = _epoch(recorded_at or datetime.now(timezone.utc))
+
+        with self._lock, self._connect() as connection:
+            hours = [_breakdown_hours(instance) for instance in candidates]
+            since = min((int(values[0]) for values in hours if values.size), default=0)
+            stored = self._stored_hours(connection, sorted({instance.instance_id for instance in candidates}), since)
+            written = 0
+            for instance, instance_hours in zip(candidates, hours):
+                rows = self._rows(instance, instance_hours, stored.get(instance.instance_id), stamp)
+                if rows:
+                    connection.executemany(_UPSERT, rows)
+                    written += len(rows)
+        logger.debug("Metrics warehouse: %d hourly rows upserted for %d instances", written, len(candidates))
+        return written
+
+    def prune(self, older_than: datetime) -> int:
+        """Delete facts for hours before ``older_than``; returns the number of rows removed."""
+        with self._lock, self._connect() as connection:
+            cursor = connection.execute("DELETE FROM instance_hourly WHERE hour < ?", (_epoch(older_than),))
+            return cursor.rowcount
+
+    def _rows(self, instance: EC2Instance, hours: np.ndarray, stored: Optional[np.ndarray], stamp: int) -> List[tuple]:
+        breakdown = instance.hourly_co2_breakdown
+        keep = np.asarray(breakdown.runtime_fraction)[: hours.size] > 0
+        if stored is not None and stored.size:
+            # Settled hours already in the warehouse are not rewritten; missing ones are backfilled
+            settled = hours <= stored.max() - self._settle_seconds
+            keep &= ~(settled & np.isin(hours, stored))
+        if not keep.any():
+            return []
+
+        co2_kg = np.where(breakdown.running, np.asarray(breakdown.co2_g, dtype=np.float64) / 1000.0, np.nan)
+        cost = breakdown.cost_eur if breakdown.cost_eur is not None else np.full(len(breakdown), np.nan)
+        columns = [
+            _nullable(np.asarray(breakdown.cpu_percent)[keep]),
+            np.asarray(breakdown.runtime_fraction, dtype=np.float64)[keep].tolist(),
+            _nullable(np.asarray(breakdown.power_watts)[keep]),
+            _nullable(np.asarray(breakdown.carbon_intensity)[keep]),
+            _nullable(co2_kg[keep]),
+            _nullable(np.asarray(cost)[keep]),
+        ]
+        return [
+            (instance.instance_id, hour, instance.instance_type, instance.region, *values, stamp)
+            for hour, *values in zip(hours[keep].tolist(), *columns)
+        ]
+
+    @staticmethod
+    def _stored_hours(connection: sqlite3.Connection, instance_ids: Sequence[str], since: int) -> Dict[str, np.ndarray]:
+        """Hours already stored per instance from ``since`` on (epoch seconds)."""
+        stored: Dict[str, List[int]] = {}
+        for offset in range(0, len(instance_ids), _IN_CHUNK):
+            chunk = instance_ids[offset : offset + _IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            query = f"SELECT instance_id, hour FROM instance_hourly WHERE instance_id IN ({placeholders}) AND hour >= ?"
+            for instance_id, hour in connection.execute(query, [*chunk, since]):
+                stored.setdefault(instance_id, []).append(hour)
+        return {instance_id: np.array(hours, dtype=np.int64) for instance_id, hours in stored.items()}
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def instance_hours(self, instance_id: str, start: datetime, end: datetime) -> Dict[str, np.ndarray]:
+        """Stored hours of one instance in ``[start, end)``: ``hour`` (datetime64[s], UTC) plus fact columns."""
+        with self._connect() as connection:
+            rows = connection.execute(
+                f"SELECT hour, {', '.join(FACT_COLUMNS)} FROM instance_hourly "
+                "WHERE instance_id = ? AND hour >= ? AND hour < ? ORDER BY hour",
+                (instance_id, _epoch(start), _epoch(end)),
+            ).fetchall()
+        data = np.array(rows, dtype=np.float64) if rows else np.empty((0, len(FACT_COLUMNS) + 1))
+        result = {"hour": data[:, 0].astype(np.int64).astype("datetime64[s]")}
+        for position, column in enumerate(FACT_COLUMNS, start=1):
+            result[column] = data[:, position]
+        return result
+
+    def totals(self, start: datetime, end: datetime, *, instance_ids: Optional[Sequence[str]] = None) -> Dict[str, float]:
+        """CO2, cost and runtime hours over ``[start, end)`` for all (or the given) instances."""
+        query = (
+            "SELECT COUNT(DISTINCT instance_id), COALESCE(SUM(co2_kg), 0), COALESCE(SUM(cost_eur), 0), "
+            "COALESCE(SUM(runtime_fraction), 0), COUNT(*) FROM instance_hourly WHERE hour >= ? AND hour < ?"
+        )
+        window = [_epoch(start), _epoch(end)]
+        if instance_ids is None:
+            batches = [(query, window)]
+        else:
+            # Disjoint chunks of distinct ids, so per-chunk counts and sums add up
+            ids = sorted(set(instance_ids))
+            batches = [
+                (f"{query} AND instance_id IN ({','.join('?' * len(chunk))})", [*window, *chunk])
+                for chunk in (ids[offset : offset + _IN_CHUNK] for offset in range(0, len(ids), _IN_CHUNK))
+            ]
+
+        totals = np.zeros(5)
+        with self._connect() as connection:
+            for batch_query, parameters in batches:
+                totals += connection.execute(batch_query, parameters).fetchone()
+        instances, co2_kg, cost_eur, runtime_hours, hours = totals.tolist()
+        return {
+            "instances": int(instances),
+            "co2_kg": float(co2_kg),
+            "cost_eur": float(cost_eur),
+            "runtime_hours": float(runtime_hours),
+            "hours": int(hours),
+        }
+
+    def month_to_date(self, now: Optional[datetime] = None) -> Dict[str, float]:
+        """``totals`` from the first of the current (UTC) month until ``now``."""
+        now = now or datetime.now(timezone.utc)
+        if now.tzinfo is None:
+            now = now.replace(tzinfo=timezone.utc)
+        month_start = now.astimezone(timezone.utc).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        return self.totals(month_start, now)
+
+    def daily_totals(
+        self, start: datetime, end: datetime, *, instance_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Per-UTC-day CO2, cost and runtime hours over ``[start, end)`` (trend charts)."""
+        query = (
+            "SELECT hour / 86400 AS day, SUM(co2_kg), SUM(cost_eur), SUM(runtime_fraction), COUNT(DISTINCT instance_id) "
+            "FROM instance_hourly WHERE hour >= ? AND hour < ?"
+        )
+        parameters: List[Any] = [_epoch(start), _epoch(end)]
+        if instance_id is not None:
+            query += " AND instance_id = ?"
+            parameters.append(instance_id)
+        query += " GROUP BY day ORDER BY day"
+        with self._connect() as connection:
+            rows = connection.execute(query, parameters).fetchall()
+        return [
+            {
+                "date": datetime.fromtimestamp(day * 86400, tz=timezone.utc).date(),
+                "co2_kg": float(co2_kg or 0.0),
+                "cost_eur": float(cost_eur or 0.0),
+                "runtime_hours": float(runtime_hours or 0.0),
+                "instances": int(instances),
+            }
+            for day, co2_kg, cost_eur, runtime_hours, instances in rows
+        ]
+
+    def top_emitters(self, start: datetime, end: datetime, *, limit: int = 10) -> List[Dict[str, Any]]:
+        """Instances with the highest CO2 over ``[start, end)``."""
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT instance_id, MAX(instance_type), SUM(co2_kg), SUM(cost_eur), SUM(runtime_fraction) "
+                "FROM instance_hourly WHERE hour >= ? AND hour < ? "
+                "GROUP BY instance_id ORDER BY SUM(co2_kg) DESC LIMIT ?",
+                (_epoch(start), _epoch(end), limit),
+            ).fetchall()
+        return [
+            {
+                "instance_id": instance_id,
+                "instance_type": instance_type,
+                "co2_kg": float(co2_kg or 0.0),
+                "cost_eur": float(cost_eur or 0.0),
+                "runtime_hours": float(runtime_hours or 0.0),
+            }
+            for instance_id, instance_type, co2_kg, cost_eur, runtime_hours in rows
+        ]
+
+    def coverage(self) -> Dict[str, tuple[datetime, datetime]]:
+        """First and last stored hour per instance."""
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT instance_id, MIN(hour), MAX(hour) FROM instance_hourly GROUP BY instance_id"
+            ).fetchall()
+        return {
+            instance_id: (
+                datetime.fromtimestamp(first, tz=timezone.utc),
+                datetime.fromtimestamp(last, tz=timezone.utc) + timedelta(hours=1),
+            )
+            for instance_id, first, last in rows
+        }
+
+
+__all__ = ["DEFAULT_SETTLE_HOURS", "FACT_COLUMNS", "MetricsWarehouse", "WAREHOUSE_SCHEMA_VERSION"]
@@ -0,0 +1,215 @@
+"""
+Offline power model table for AWS instance types.
+
+The table stores Boavizta power models (avg/min/max watts) together with
+vCPU and memory metadata for every known AWS instance type. It is persisted
+as a single JSON document in the cache root and loaded into memory once, so
+power lookups during a dashboard refresh never wait on the Boavizta API.
+
+The table is populated in bulk via ``BoaviztaClient.refresh_power_table`` and
+grows incrementally whenever a single on-demand lookup succeeds.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.domain.calculations import calculate_power_consumption_vectorized
+from src.domain.models import PowerConsumption
+from src.infrastructure.cache import FileCacheRepository
+
+logger = logging.getLogger(__name__)
+
+POWER_TABLE_SCHEMA_VERSION = 1
+
+
+@dataclass(frozen=True)
+class PowerModelEntry:
+    """Single row of the power model table."""
+
+    instance_type: str
+    avg_power_watts: float
+    min_power_watts: float
+    max_power_watts: float
+    vcpu: Optional[int] = None
+    memory_gb: Optional[float] = None
+    source: str = "Boavizta_API"
+    updated_at: Optional[str] = None
+
+    def to_power_consumption(self) -> PowerConsumption:
+        return PowerConsumption(
+            avg_power_watts=self.avg_power_watts,
+            min_power_watts=self.min_power_watts,
+            max_power_watts=self.max_power_watts,
+            confidence_level="high",
+            source=self.source,
+        )
+
+
+class PowerModelTable:
+    """JSON-backed, in-memory power model table keyed by instance type."""
+
+    def __init__(self, repository: FileCacheRepository, cache_key: str = "power_models/aws_instances") -> None:
+        self._repository = repository
+        self._path = repository.path(*cache_key.split("/"))
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, PowerModelEntry]] = None
+
+    @property
+    def path(self):
+        return self._path
+
+    # ------------------------------------------------------------------
+    # Read access
+    # ------------------------------------------------------------------
+
+    def _load(self) -> Dict[str, PowerModelEntry]:
+        if self._entries is not None:
+            return self._entries
+
+        with self._lock:
+            if self._entries is not None:
+                return self._entries
+
+            entries = self._read()
+            if entries:
+                logger.info("⚡ Loaded offline power table with %d instance types", len(entries))
+            self._entries = entries
+            return entries
+
+    def _read(self) -> Dict[str, PowerModelEntry]:
+        """Parse the persisted table (callers hold ``self._lock``)."""
+        entries: Dict[str, PowerModelEntry] = {}
+        payload = self._repository.read_json(self._path) if self._path.exists() else None
+        rows = payload.get("instances", {}) if isinstance(payload, dict) else {}
+        for instance_type, row in rows.items():
+            try:
+                entries[instance_type] = PowerModelEntry(
+                    instance_type=instance_type,
+                    avg_power_watts=float(row["avg_power_watts"]),
+                    min_power_watts=float(row["min_power_watts"]),
+                    max_power_watts=float(row["max_power_watts"]),
+                    vcpu=int(row["vcpu"]) if row.get("vcpu") is not None else None,
+                    memory_gb=float(row["memory_gb"]) if row.get("memory_gb") is not None else None,
+                    source=str(row.get("source", "Boavizta_API")),
+                    updated_at=row.get("updated_at"),
+                )
+            except (KeyError, TypeError, ValueError) as error:
+                logger.debug("Skipping invalid power table row for %s: %s", instance_type, error)
+        return entries
+
+    def __contains__(self, instance_type: object) -> bool:
+        return instance_type in self._load()
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    @property
+    def instance_types(self) -> List[str]:
+        return sorted(self._load())
+
+    def entry(self, instance_type: str) -> Optional[PowerModelEntry]:
+        return self._load().get(instance_type)
+
+    def get(self, instance_type: str) -> Optional[PowerConsumption]:
+        entry = self.entry(instance_type)
+        return entry.to_power_consumption() if entry else None
+
+    def power_arrays(self, instance_types: Sequence[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return avg/min/max watts for the given instance types as aligned arrays.
+
+        Unknown instance types are represented by ``NaN`` so callers can mask
+        them without a Python-level branch per instance.
+        """
+        entries = self._load()
+        count = len(instance_types)
+        avg = np.full(count, np.nan)
+        low = np.full(count, np.nan)
+        high = np.full(count, np.nan)
+        for index, instance_type in enumerate(instance_types):
+            entry = entries.get(instance_type)
+            if entry is None:
+                continue
+            avg[index] = entry.avg_power_watts
+            low[index] = entry.min_power_watts
+            high[index] = entry.max_power_watts
+        return avg, low, high
+
+    # ------------------------------------------------------------------
+    # Write access
+    # ------------------------------------------------------------------
+
+    def upsert(self, entries: Iterable[PowerModelEntry]) -> int:
+        """
+        Insert or replace rows and persist the table. Returns the number of rows written.
+
+        Load, merge and write happen under the lock, and the file is re-read
+        first, so concurrent upserts (and other processes sharing the cache
+        root) never drop each other's rows.
+        """
+        updated_at = datetime.now(timezone.utc).isoformat()
+        rows = [
+            entry if entry.updated_at is not None else PowerModelEntry(**{**asdict(entry), "updated_at": updated_at})
+            for entry in entries
+        ]
+        if not rows:
+            return 0
+
+        with self._lock:
+            current = {**(self._entries or {}), **self._read()}
+            for entry in rows:
+                current[entry.instance_type] = entry
+            self._entries = current
+            self._repository.write_json(
+                self._path,
+                {
+                    "schema_version": POWER_TABLE_SCHEMA_VERSION,
+                    "provider": "aws",
+                    "updated_at": updated_at,
+                    "instances": {
+                        instance_type: {key: value for key, value in asdict(row).items() if key != "instance_type"}
+                        for instance_type, row in sorted(current.items())
+                    },
+                },
+            )
+        return len(rows)
+
+
+class LocalPowerEngine:
+    """
+    Vectorized CPU→power evaluation backed by the offline power table.
+
+    Evaluates the same linear model as ``calculate_simple_power_consumption``
+    for an instances × hours CPU matrix in a single NumPy expression.
+    """
+
+    def __init__(self, table: PowerModelTable) -> None:
+        self._table = table
+
+    def base_power(self, instance_types: Sequence[str]) -> np.ndarray:
+        avg, _, _ = self._table.power_arrays(instance_types)
+        return avg
+
+    def power_matrix(self, instance_types: Sequence[str], cpu_utilization: np.ndarray) -> np.ndarray:
+        """
+        Effective power in watts for each instance (row) and hour (column).
+
+        Rows for instance types missing from the table are ``NaN``.
+        """
+        base = self.base_power(instance_types)
+        return calculate_power_consumption_vectorized(base, cpu_utilization)
+
+
+__all__ = [
+    "POWER_TABLE_SCHEMA_VERSION",
+    "PowerModelEntry",
+    "PowerModelTable",
+    "LocalPowerEngine",
+]
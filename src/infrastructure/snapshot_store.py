@@ -0,0 +1,200 @@
+"""
+Persisted dashboard snapshots for warm starts and refresh diffs.
+
+Every successful refresh is written as a gzip-compressed pickle of its
+``DashboardData`` under ``<cache_root>/api_data/snapshots/`` together with a
+schema version, so a restarted process can render the last result
+immediately while a fresh refresh runs behind it. The last
+``DASHBOARD_SNAPSHOT_HISTORY`` snapshots are kept per analysis period;
+``diff_dashboard_data()`` compares two of them (fleet totals plus
+per-instance changes) without touching any API.
+
+Snapshots written with another ``SNAPSHOT_SCHEMA_VERSION`` or another
+model schema (``model_schema_digest()``, derived from the domain dataclass
+fields) are ignored, so a model change never loads as misaligned fields.
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+import pickle
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.domain.models import DashboardData, EC2Instance, model_schema_digest
+from src.infrastructure.cache import FileCacheRepository, atomic_write
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_SCHEMA_VERSION = 2
+DEFAULT_SNAPSHOT_HISTORY = 5
+
+_TIMESTAMP_FORMAT = "%Y%m%dT%H%M%S%f"
+
+
+@dataclass(frozen=True)
+class StoredSnapshot:
+    """One persisted refresh result."""
+
+    period_days: int
+    saved_at: datetime
+    data: DashboardData
+
+
+@dataclass(frozen=True)
+class SnapshotDiff:
+    """Changes between two refresh results of the same period."""
+
+    added: Tuple[str, ...]
+    removed: Tuple[str, ...]
+    cost_delta_eur: float
+    co2_delta_kg: float
+    instance_changes: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+    """instance_id → (cost delta EUR, CO2 delta kg) for instances present in both"""
+
+    @property
+    def unchanged(self) -> bool:
+        return not (self.added or self.removed or self.instance_changes) and not (self.cost_delta_eur or self.co2_delta_kg)
+
+
+def _instance_totals(instance: EC2Instance) -> Tuple[float, float]:
+    """Period cost and CO2 of an instance (Hourly-Precise where available)."""
+    cost = instance.cost_eur_hourly if instance.cost_eur_hourly is not None else instance.cost_eur_average
+    co2 = instance.co2_kg_hourly if instance.co2_kg_hourly is not None else instance.co2_kg_average
+    return float(cost or 0.0), float(co2 or 0.0)
+
+
+def diff_dashboard_data(previous: DashboardData, current: DashboardData, *, tolerance: float = 1e-9) -> SnapshotDiff:
+    """
+    Compare two refresh results.
+
+    Args:
+        previous: Older result
+        current: Newer result
+        tolerance: Per-instance changes at or below this are ignored
+
+    Returns:
+        SnapshotDiff with added/removed instance ids, fleet deltas and per-instance deltas
+    """
+    before = {instance.instance_id: _instance_totals(instance) for instance in previous.instances}
+    after = {instance.instance_id: _instance_totals(instance) for instance in current.instances}
+
+    changes: Dict[str, Tuple[float, float]] = {}
+    for instance_id in before.keys() & after.keys():
+        cost_delta = after[instance_id][0] - before[instance_id][0]
+        co2_delta = after[instance_id][1] - before[instance_id][1]
+        if abs(cost_delta) > tolerance or abs(co2_delta) > tolerance:
+            changes[instance_id] = (cost_delta, co2_delta)
+
+    return SnapshotDiff(
+        added=tuple(sorted(after.keys() - before.keys())),
+        removed=tuple(sorted(before.keys() - after.keys())),
+        cost_delta_eur=sum(cost for cost, _ in after.values()) - sum(cost for cost, _ in before.values()),
+        co2_delta_kg=sum(co2 for _, co2 in after.values()) - sum(co2 for _, co2 in before.values()),
+        instance_changes=changes,
+    )
+
+
+class DashboardSnapshotStore:
+    """Rolling, schema-versioned history of ``DashboardData`` per analysis period."""
+
+    def __init__(
+        self,
+        repository: FileCacheRepository,
+        *,
+        history: int = DEFAULT_SNAPSHOT_HISTORY,
+        category: str = "snapshots",
+    ) -> None:
+        self._repository = repository
+        self._category = category
+        self._history = max(int(history), 1)
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> Path:
+        return self._repository.root / "api_data" / self._category
+
+    def _paths(self, period_days: int) -> List[Path]:
+        """Snapshot files of a period, newest first."""
+        if not self.directory.exists():
+            return []
+        return sorted(self.directory.glob(f"dashboard_{period_days}d_*.pkl.gz"), reverse=True)
+
+    def save(self, data: DashboardData, *, saved_at: Optional[datetime] = None) -> Optional[Path]:
+        """Persist ``data`` best-effort and drop snapshots beyond the history length."""
+        saved_at = saved_at or datetime.now()
+        period_days = data.analysis_period_days
+        path = self._repository.path(
+            self._category, f"dashboard_{period_days}d_{saved_at.strftime(_TIMESTAMP_FORMAT)}", extension="pkl.gz"
+        )
+        payload = {
+            "version": SNAPSHOT_SCHEMA_VERSION,
+            "schema": model_schema_digest(),
+            "saved_at": saved_at,
+            "period_days": period_days,
+            "data": data,
+        }
+        with self._lock:
+            try:
+                with atomic_write(path, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=3) as handle:
+                    pickle.dump(payload, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            except (OSError, pickle.PicklingError, TypeError, AttributeError) as error:
+                logger.warning("⚠️ Failed to persist dashboard snapshot: %s", error)
+                return None
+
+            for stale in self._paths(period_days)[self._history :]:
+                stale.unlink(missing_ok=True)
+        return path
+
+    def history(self, period_days: int) -> List[StoredSnapshot]:
+        """Readable snapshots of a period, newest first."""
+        snapshots = (self._load(path) for path in self._paths(period_days))
+        return [snapshot for snapshot in snapshots if snapshot is not None]
+
+    def latest(self, period_days: int) -> Optional[StoredSnapshot]:
+        """Newest readable snapshot of a period."""
+        for path in self._paths(period_days):
+            snapshot = self._load(path)
+            if snapshot is not None:
+                return snapshot
+        return None
+
+    def diff_latest(self, period_days: int) -> Optional[SnapshotDiff]:
+        """Diff between the two newest snapshots of a period."""
+        snapshots = self.history(period_days)[:2]
+        if len(snapshots) < 2:
+            return None
+        return diff_dashboard_data(snapshots[1].data, snapshots[0].data)
+
+    def _load(self, path: Path) -> Optional[StoredSnapshot]:
+        try:
+            with gzip.open(path, "rb") as handle:
+                payload = pickle.load(handle)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError) as error:
+            logger.debug("Ignoring unreadable dashboard snapshot %s: %s", path, error)
+            return None
+
+        if not isinstance(payload, dict) or payload.get("version") != SNAPSHOT_SCHEMA_VERSION:
+            return None
+        if payload.get("schema") != model_schema_digest():
+            logger.debug("Ignoring dashboard snapshot %s written for another model schema", path)
+            return None
+        data = payload.get("data")
+        saved_at = payload.get("saved_at")
+        if not isinstance(data, DashboardData) or not isinstance(saved_at, datetime):
+            return None
+        return StoredSnapshot(period_days=int(payload.get("period_days", data.analysis_period_days)), saved_at=saved_at, data=data)
+
+
+__all__ = [
+    "DEFAULT_SNAPSHOT_HISTORY",
+    "DashboardSnapshotStore",
+    "SNAPSHOT_SCHEMA_VERSION",
+    "SnapshotDiff",
+    "StoredSnapshot",
+    "diff_dashboard_data",
+]
@@ -0,0 +1,249 @@
+"""
+Incremental day/week/month rollups for the columnar time-series store.
+
+``ColumnarTimeSeriesStore`` hands every day segment it rewrites to
+``TimeSeriesRollups.update_day``; that day's aggregate is recomputed from the
+segment and the enclosing week and month are re-derived from the daily
+aggregates on ``flush``. Rollups are small (one row per bucket) and are kept
+after the raw day segments expire, so long views stay available.
+
+Per bucket and column the tables hold ``sum``, ``min``, ``max`` and
+``count`` (non-missing slots); ``mean`` and coverage are derived on query.
+Tables are stored as ``_rollups/<resolution>.npy`` next to the day segments,
+row 0 being the bucket start (naive local seconds since the epoch), row 1 the
+number of stored slots, then four rows per column.
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from src.infrastructure.cache import atomic_write
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_RESOLUTIONS = ("day", "week", "month")
+RESOLUTIONS = ("hour",) + ROLLUP_RESOLUTIONS
+ROLLUP_STATS = ("sum", "mean", "min", "max", "count")
+
+# Nominal bucket widths used to pick a resolution for a window
+RESOLUTION_SECONDS = {"hour": 3600, "day": 86400, "week": 7 * 86400, "month": 30 * 86400}
+
+_DAY = 86400
+_STORED_STATS = 4  # sum, min, max, count
+
+
+def bucket_start(seconds: np.ndarray, resolution: str) -> np.ndarray:
+    """Start of the ``resolution`` bucket for naive local epoch seconds (weeks start on Monday)."""
+    seconds = np.asarray(seconds, dtype=np.int64)
+    if resolution == "hour":
+        return seconds - seconds % 3600
+    if resolution == "day":
+        return seconds - seconds % _DAY
+    if resolution == "week":
+        days = seconds // _DAY
+        # 1970-01-01 was a Thursday
+        return (days - (days + 3) % 7) * _DAY
+    if resolution == "month":
+        return seconds.astype("datetime64[s]").astype("datetime64[M]").astype("datetime64[s]").astype(np.int64)
+    raise ValueError(f"unknown resolution: {resolution}")
+
+
+def expected_slots(starts: np.ndarray, resolution: str) -> np.ndarray:
+    """Hourly slots a complete bucket holds."""
+    starts = np.asarray(starts, dtype=np.int64)
+    if resolution == "month":
+        months = starts.astype("datetime64[s]").astype("datetime64[M]")
+        return ((months + 1).astype("datetime64[s]") - months.astype("datetime64[s]")).astype(np.int64) // 3600
+    return np.full(starts.shape, RESOLUTION_SECONDS[resolution] // 3600, dtype=np.int64)
+
+
+def segment_stats(segment: np.ndarray) -> np.ndarray:
+    """``[slots, (sum, min, max, count) per column]`` of a ``(1 + columns) × n`` segment."""
+    values = np.asarray(segment[1:], dtype=np.float64)
+    present = ~np.isnan(values)
+    count = present.sum(axis=1)
+    stats = np.empty((values.shape[0], _STORED_STATS))
+    stats[:, 0] = np.where(present, values, 0.0).sum(axis=1)
+    stats[:, 1] = np.where(count > 0, np.where(present, values, np.inf).min(axis=1, initial=np.inf), np.nan)
+    stats[:, 2] = np.where(count > 0, np.where(present, values, -np.inf).max(axis=1, initial=-np.inf), np.nan)
+    stats[:, 3] = count
+    return np.concatenate([[segment.shape[1]], stats.ravel()])
+
+
+def combine_stats(vectors: np.ndarray) -> np.ndarray:
+    """Combine ``segment_stats`` vectors (one per row) into one bucket vector."""
+    vectors = np.atleast_2d(vectors)
+    per_column = vectors[:, 1:].reshape(vectors.shape[0], -1, _STORED_STATS)
+    combined = np.empty(per_column.shape[1:])
+    combined[:, 0] = per_column[:, :, 0].sum(axis=0)
+    combined[:, 1] = np.fmin.reduce(per_column[:, :, 1], axis=0)
+    combined[:, 2] = np.fmax.reduce(per_column[:, :, 2], axis=0)
+    combined[:, 3] = per_column[:, :, 3].sum(axis=0)
+    return np.concatenate([[vectors[:, 0].sum()], combined.ravel()])
+
+
+class TimeSeriesRollups:
+    """Day/week/month aggregate tables maintained from day segments (see module docstring)."""
+
+    def __init__(self, directory: Path, columns: Sequence[str]) -> None:
+        self._directory = directory / "_rollups"
+        self._columns = tuple(columns)
+        self._tables: Optional[Dict[str, Dict[int, np.ndarray]]] = None
+        self._dirty: Set[Tuple[str, int]] = set()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _path(self, resolution: str) -> Path:
+        return self._directory / f"{resolution}.npy"
+
+    def _load(self) -> Dict[str, Dict[int, np.ndarray]]:
+        if self._tables is not None:
+            return self._tables
+
+        width = 1 + _STORED_STATS * len(self._columns)
+        tables: Dict[str, Dict[int, np.ndarray]] = {}
+        for resolution in ROLLUP_RESOLUTIONS:
+            table: Dict[int, np.ndarray] = {}
+            path = self._path(resolution)
+            if path.exists():
+                try:
+                    array = np.load(path, allow_pickle=False)
+                    if array.ndim == 2 and array.shape[0] == width + 1:
+                        table = {int(start): array[1:, index] for index, start in enumerate(array[0])}
+                except (OSError, ValueError) as error:
+                    logger.debug("Ignoring unreadable rollup %s: %s", path, error)
+            tables[resolution] = table
+        self._tables = tables
+        return tables
+
+    def _save(self, resolution: str) -> None:
+        table = self._load()[resolution]
+        starts = sorted(table)
+        array = np.empty((2 + _STORED_STATS * len(self._columns), len(starts)))
+        array[0] = starts
+        for index, start in enumerate(starts):
+            array[1:, index] = table[start]
+
+        path = self._path(resolution)
+        try:
+            with atomic_write(path, "wb") as handle:
+                np.save(handle, array, allow_pickle=False)
+        except OSError as error:
+            logger.warning("⚠️ Failed to write %s rollup: %s", resolution, error)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    @property
+    def empty(self) -> bool:
+        return not self._load()["day"]
+
+    def update_day(self, segment: np.ndarray) -> None:
+        """Recompute the daily aggregate of a rewritten day segment; weeks/months follow on ``flush``."""
+        if segment.shape[1] == 0:
+            return
+        day = int(bucket_start(segment[0, :1], "day")[0])
+        self._load()["day"][day] = segment_stats(segment)
+        self._dirty.add(("day", day))
+        for resolution in ("week", "month"):
+            self._dirty.add((resolution, int(bucket_start(np.array([day]), resolution)[0])))
+
+    def rebuild(self, segments: Iterable[np.ndarray]) -> None:
+        """Recreate all tables from day segments (e.g. for a store written before rollups existed)."""
+        tables = self._load()
+        for table in tables.values():
+            table.clear()
+        for segment in segments:
+            self.update_day(segment)
+        self.flush()
+
+    def flush(self) -> None:
+        """Re-derive dirty week/month buckets from the daily table and persist changed tables."""
+        if not self._dirty:
+            return
+        tables = self._load()
+        daily = tables["day"]
+        days = np.fromiter(daily.keys(), dtype=np.int64, count=len(daily))
+
+        touched = {resolution for resolution, _ in self._dirty}
+        for resolution in ("week", "month"):
+            starts = [start for dirty_resolution, start in self._dirty if dirty_resolution == resolution]
+            if not starts:
+                continue
+            owners = bucket_start(days, resolution)
+            for start in starts:
+                members = days[owners == start]
+                if members.size:
+                    tables[resolution][start] = combine_stats(np.stack([daily[int(day)] for day in members]))
+                else:
+                    tables[resolution].pop(start, None)
+
+        self._dirty.clear()
+        for resolution in ROLLUP_RESOLUTIONS:
+            if resolution in touched:
+                self._save(resolution)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def query(self, resolution: str, start_s: Optional[int] = None, end_s: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Buckets overlapping ``[start_s, end_s)`` in the ``query_rollup`` result layout."""
+        table = self._load()[resolution]
+        starts = np.array(sorted(table), dtype=np.int64)
+        lo = int(np.searchsorted(starts, bucket_start(np.array([start_s]), resolution)[0])) if start_s is not None else 0
+        hi = int(np.searchsorted(starts, end_s, side="left")) if end_s is not None else starts.size
+        selected = starts[lo:hi]
+        width = 1 + _STORED_STATS * len(self._columns)
+        vectors = np.stack([table[int(start)] for start in selected], axis=1) if selected.size else np.empty((width, 0))
+        return rollup_result(selected, vectors, resolution, self._columns)
+
+
+def rollup_result(
+    starts: np.ndarray, vectors: np.ndarray, resolution: str, columns: Sequence[str]
+) -> Dict[str, np.ndarray]:
+    """
+    ``{"timestamp", "slots", "expected_slots", "coverage", "<column>_<stat>"...}`` from stat vectors.
+
+    ``vectors`` has one bucket per column: row 0 slots, then sum/min/max/count per column.
+    """
+    expected = expected_slots(starts, resolution)
+    result: Dict[str, np.ndarray] = {
+        "timestamp": np.asarray(starts, dtype=np.int64).astype("datetime64[s]"),
+        "slots": vectors[0].astype(np.int64),
+        "expected_slots": expected,
+        "coverage": np.minimum(vectors[0] / np.maximum(expected, 1), 1.0),
+    }
+    for position, column in enumerate(columns):
+        base = 1 + _STORED_STATS * position
+        total, minimum, maximum, count = vectors[base : base + _STORED_STATS]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(count > 0, total / count, np.nan)
+        result[f"{column}_sum"] = total
+        result[f"{column}_mean"] = mean
+        result[f"{column}_min"] = minimum
+        result[f"{column}_max"] = maximum
+        result[f"{column}_count"] = count.astype(np.int64)
+    return result
+
+
+__all__ = [
+    "RESOLUTIONS",
+    "RESOLUTION_SECONDS",
+    "ROLLUP_RESOLUTIONS",
+    "ROLLUP_STATS",
+    "TimeSeriesRollups",
+    "bucket_start",
+    "combine_stats",
+    "expected_slots",
+    "rollup_result",
+    "segment_stats",
+]
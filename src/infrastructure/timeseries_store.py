@@ -0,0 +1,363 @@
+"""
+Columnar, append-only time-series store with range queries.
+
+The dashboard time series (hourly cost, CO2 and carbon intensity) is kept as
+one ``.npy`` segment per local day under ``api_data/<cache_key>/``. Each
+segment is a ``(1 + columns) × rows`` float64 array: row 0 holds the slot
+timestamps (naive local wall-clock seconds since the epoch, sorted and
+unique), the following rows hold one column each, so every column is a
+contiguous, memory-mappable slice. Missing values are ``NaN``.
+
+- ``append`` rewrites only the day segments that receive new or changed rows
+- ``query`` maps only the segments overlapping the requested range and cuts
+  them with a binary search on the timestamp row
+- segments older than the retention period are dropped on append
+- day/week/month rollups are maintained incrementally from every rewritten
+  day (``src.infrastructure.timeseries_rollups``) and ``query_auto`` reads
+  the finest resolution that keeps a window within a point budget
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from src.infrastructure.cache import FileCacheRepository, atomic_write
+from src.infrastructure.timeseries_rollups import (
+    RESOLUTION_SECONDS,
+    RESOLUTIONS,
+    TimeSeriesRollups,
+    rollup_result,
+)
+
+logger = logging.getLogger(__name__)
+
+TIMESERIES_COLUMNS = ("cost_eur_per_hour", "co2_kg_per_hour", "carbon_intensity")
+
+# Default point budget for ``query_auto`` (a 7-day window still reads hourly slots)
+DEFAULT_MAX_POINTS = 200
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _to_seconds(timestamp: datetime) -> int:
+    """Naive wall-clock datetime → seconds since the (naive) epoch."""
+    return int((timestamp.replace(tzinfo=None) - _EPOCH).total_seconds())
+
+
+def _from_seconds(seconds: float) -> datetime:
+    return _EPOCH + timedelta(seconds=int(seconds))
+
+
+class ColumnarTimeSeriesStore:
+    """Per-day ``.npy`` segments of timestamp-indexed float columns (see module docstring)."""
+
+    def __init__(
+        self,
+        repository: FileCacheRepository,
+        cache_key: str,
+        *,
+        columns: Sequence[str] = TIMESERIES_COLUMNS,
+        retention_days: Optional[int] = 90,
+    ) -> None:
+        self._repository = repository
+        self._parts = [part for part in cache_key.split("/") if part]
+        self._columns = tuple(columns)
+        self._retention_days = retention_days
+        self._lock = threading.Lock()
+        self._days: Optional[List[date]] = None
+        # api_data/<cache_key>/<YYYY-MM-DD>.npy
+        self._directory = repository.path(*self._parts, "segment", extension="npy").parent
+        self._rollups = TimeSeriesRollups(self._directory, self._columns)
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return self._columns
+
+    # ------------------------------------------------------------------
+    # Segment index
+    # ------------------------------------------------------------------
+
+    def _segment_path(self, day: date) -> Path:
+        return self._directory / f"{day.isoformat()}.npy"
+
+    def _index(self) -> List[date]:
+        """Sorted days that have a segment (listed once, then maintained in memory)."""
+        if self._days is None:
+            days = []
+            for path in self._directory.glob("*.npy"):
+                try:
+                    days.append(date.fromisoformat(path.stem))
+                except ValueError:
+                    continue
+            self._days = sorted(days)
+            self._migrate_legacy()
+            if self._days and self._rollups.empty:
+                self._rollups.rebuild(
+                    segment for segment in (self._read_segment(day, mmap=False) for day in self._days) if segment is not None
+                )
+        return self._days
+
+    def _read_segment(self, day: date, *, mmap: bool = True) -> Optional[np.ndarray]:
+        try:
+            segment = np.load(self._segment_path(day), mmap_mode="r" if mmap else None, allow_pickle=False)
+        except (OSError, ValueError) as error:
+            logger.debug("Ignoring unreadable time series segment %s: %s", day, error)
+            return None
+        if segment.ndim != 2 or segment.shape[0] != len(self._columns) + 1:
+            logger.debug("Ignoring time series segment %s with unexpected shape %s", day, segment.shape)
+            return None
+        return segment
+
+    def _write_segment(self, day: date, segment: np.ndarray) -> bool:
+        path = self._segment_path(day)
+        try:
+            with atomic_write(path, "wb") as handle:
+                np.save(handle, np.ascontiguousarray(segment, dtype=np.float64), allow_pickle=False)
+        except OSError as error:
+            logger.warning("⚠️ Failed to write time series segment %s: %s", path, error)
+            return False
+        return True
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def append(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        Add rows keyed by ``timestamp`` (naive local datetime or ISO string).
+
+        Existing slots are overwritten; only day segments with new or changed
+        values are rewritten. Returns the number of new or changed rows.
+        """
+        by_day = self._group_by_day(rows)
+        with self._lock:
+            days = self._index()
+            written = self._write_days(days, by_day)
+            self._rollups.flush()
+            self._apply_retention(days)
+        return written
+
+    def query(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> Dict[str, np.ndarray]:
+        """
+        Columns for slots in ``[start, end)`` (open-ended when ``None``).
+
+        Returns ``{"timestamp": datetime64[s], <column>: float64, ...}``; only
+        segments overlapping the range are mapped.
+        """
+        with self._lock:
+            days = list(self._index())
+        first = bisect.bisect_left(days, start.date()) if start else 0
+        last = bisect.bisect_right(days, end.date()) if end else len(days)
+
+        start_s = _to_seconds(start) if start else None
+        end_s = _to_seconds(end) if end else None
+        pieces = []
+        for day in days[first:last]:
+            segment = self._read_segment(day)
+            if segment is None:
+                continue
+            timestamps = segment[0]
+            lo = int(np.searchsorted(timestamps, start_s, side="left")) if start_s is not None else 0
+            hi = int(np.searchsorted(timestamps, end_s, side="left")) if end_s is not None else timestamps.size
+            if hi > lo:
+                pieces.append(np.array(segment[:, lo:hi]))
+
+        data = np.concatenate(pieces, axis=1) if pieces else np.empty((len(self._columns) + 1, 0))
+        result: Dict[str, np.ndarray] = {"timestamp": data[0].astype("datetime64[s]")}
+        for position, column in enumerate(self._columns, start=1):
+            result[column] = data[position]
+        return result
+
+    def load(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Rows in ``[start, end)`` as dicts (``None`` for missing values)."""
+        columns = self.query(start, end)
+        rows = []
+        for position, timestamp in enumerate(columns["timestamp"].astype("int64").tolist()):
+            row: Dict[str, Any] = {"timestamp": _from_seconds(timestamp)}
+            for column in self._columns:
+                value = float(columns[column][position])
+                row[column] = None if np.isnan(value) else value
+            rows.append(row)
+        return rows
+
+    def query_rollup(
+        self, resolution: str, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Aggregates per ``resolution`` bucket ("hour", "day", "week", "month") overlapping ``[start, end)``.
+
+        Returns ``timestamp`` (bucket start), ``slots``, ``expected_slots``,
+        ``coverage`` and ``<column>_<sum|mean|min|max|count>`` arrays. Hourly
+        results come from the raw segments, coarser ones from the rollup tables.
+        """
+        if resolution not in RESOLUTIONS:
+            raise ValueError(f"unknown resolution: {resolution}")
+        if resolution == "hour":
+            columns = self.query(start, end)
+            values = np.stack([columns[column] for column in self._columns])
+            present = ~np.isnan(values)
+            stats = np.stack([np.where(present, values, 0.0), values, values, present.astype(np.float64)], axis=1)
+            vectors = np.concatenate([np.ones((1, values.shape[1])), stats.reshape(-1, values.shape[1])])
+            return rollup_result(columns["timestamp"].astype(np.int64), vectors, "hour", self._columns)
+
+        with self._lock:
+            self._index()
+            return self._rollups.query(
+                resolution,
+                _to_seconds(start) if start else None,
+                _to_seconds(end) if end else None,
+            )
+
+    def choose_resolution(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None, *, max_points: int = DEFAULT_MAX_POINTS
+    ) -> str:
+        """Finest resolution whose bucket count for the window stays within ``max_points``."""
+        if start is None or end is None:
+            stored = self.time_range()
+            if stored is None:
+                return "hour"
+            start = start or stored[0]
+            end = end or stored[1] + timedelta(hours=1)
+        span = max((end - start).total_seconds(), 0.0)
+        for resolution in RESOLUTIONS:
+            if span / RESOLUTION_SECONDS[resolution] <= max_points:
+                return resolution
+        return RESOLUTIONS[-1]
+
+    def query_auto(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None, *, max_points: int = DEFAULT_MAX_POINTS
+    ) -> tuple[str, Dict[str, np.ndarray]]:
+        """``query_rollup`` at ``choose_resolution``; returns ``(resolution, result)``."""
+        resolution = self.choose_resolution(start, end, max_points=max_points)
+        return resolution, self.query_rollup(resolution, start, end)
+
+    def time_range(self) -> Optional[tuple[datetime, datetime]]:
+        """First and last stored slot, or ``None`` when empty."""
+        with self._lock:
+            days = list(self._index())
+        if not days:
+            return None
+        first = self._read_segment(days[0])
+        last = self._read_segment(days[-1])
+        if first is None or last is None or not first.shape[1] or not last.shape[1]:
+            return None
+        return _from_seconds(first[0, 0]), _from_seconds(last[0, -1])
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _group_by_day(self, rows: Iterable[Dict[str, Any]]) -> Dict[date, np.ndarray]:
+        """Rows → one ``(1 + columns) × n`` block per day; the last row per slot wins."""
+        by_day: Dict[date, Dict[int, List[float]]] = {}
+        for row in rows:
+            raw = row.get("timestamp")
+            if raw is None:
+                continue
+            try:
+                timestamp = raw if isinstance(raw, datetime) else datetime.fromisoformat(str(raw))
+                values = [np.nan if row.get(column) is None else float(row[column]) for column in self._columns]
+            except (TypeError, ValueError):
+                continue
+            by_day.setdefault(timestamp.date(), {})[_to_seconds(timestamp)] = values
+
+        blocks = {}
+        for day, slots in by_day.items():
+            block = np.empty((len(self._columns) + 1, len(slots)))
+            block[0] = np.fromiter(slots.keys(), dtype=np.float64, count=len(slots))
+            block[1:] = np.asarray(list(slots.values()), dtype=np.float64).T
+            blocks[day] = block
+        return blocks
+
+    def _write_days(self, days: List[date], blocks: Dict[date, np.ndarray]) -> int:
+        """Merge each block into its day segment; only segments with changes are rewritten."""
+        written = 0
+        for day, incoming in blocks.items():
+            existing = self._read_segment(day, mmap=False) if day in days else None
+            merged, changed = self._merge(existing, incoming)
+            if changed and self._write_segment(day, merged):
+                self._rollups.update_day(merged)
+                written += changed
+                if day not in days:
+                    bisect.insort(days, day)
+        return written
+
+    @staticmethod
+    def _merge(existing: Optional[np.ndarray], incoming: np.ndarray) -> tuple[np.ndarray, int]:
+        """Union by timestamp (incoming wins); returns the merged segment and the changed-row count."""
+        incoming = incoming[:, np.argsort(incoming[0], kind="stable")]
+        if existing is None or existing.shape[1] == 0:
+            return incoming, incoming.shape[1]
+
+        positions = np.searchsorted(existing[0], incoming[0])
+        clipped = np.minimum(positions, existing.shape[1] - 1)
+        present = existing[0, clipped] == incoming[0]
+        same = present.copy()
+        same[present] = np.all(
+            (existing[1:, clipped[present]] == incoming[1:, present])
+            | (np.isnan(existing[1:, clipped[present]]) & np.isnan(incoming[1:, present])),
+            axis=0,
+        )
+        changed = int((~same).sum())
+        if not changed:
+            return existing, 0
+
+        merged = existing.copy()
+        merged[:, clipped[present]] = incoming[:, present]
+        merged = np.concatenate([merged, incoming[:, ~present]], axis=1)
+        return merged[:, np.argsort(merged[0], kind="stable")], changed
+
+    def _apply_retention(self, days: List[date]) -> None:
+        if not self._retention_days or not days:
+            return
+        cutoff = date.today() - timedelta(days=self._retention_days)
+        expired = bisect.bisect_left(days, cutoff)
+        for day in days[:expired]:
+            self._segment_path(day).unlink(missing_ok=True)
+        if expired:
+            logger.info("🧹 Time series retention removed %d day segments before %s", expired, cutoff)
+            del days[:expired]
+
+    def _migrate_legacy(self) -> None:
+        """Import the previous ``.json`` / ``.jsonl`` series once, then remove it."""
+        legacy_rows: List[Dict[str, Any]] = []
+        legacy_paths = [
+            self._repository.path(*self._parts, extension="json"),
+            self._repository.path(*self._parts, extension="jsonl"),
+        ]
+        for path in legacy_paths:
+            if not path.exists():
+                continue
+            try:
+                text = path.read_text(encoding="utf-8")
+                if path.suffix == ".json":
+                    payload = json.loads(text)
+                    lines = payload if isinstance(payload, list) else []
+                else:
+                    lines = [json.loads(line) for line in text.splitlines() if line.strip()]
+            except (OSError, ValueError) as error:
+                logger.debug("Skipping legacy time series %s: %s", path, error)
+                continue
+            legacy_rows.extend(row for row in lines if isinstance(row, dict))
+
+        if legacy_rows and self._days is not None:
+            self._write_days(self._days, self._group_by_day(legacy_rows))
+            self._rollups.flush()
+            logger.info("📦 Migrated %d legacy time series rows to columnar segments", len(legacy_rows))
+        for path in legacy_paths:
+            path.unlink(missing_ok=True)
+
+
+__all__ = ["ColumnarTimeSeriesStore", "DEFAULT_MAX_POINTS", "TIMESERIES_COLUMNS"]
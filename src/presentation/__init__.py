@@ -3,10 +3,26 @@ Carbon-Aware FinOps Dashboard Views
 Modular view structure for better maintainability
 
 This package contains all dashboard views split into logical modules
-for improved code organization and maintainability.
+for improved code organization and maintainability. Pages are imported on
+first access (PEP 562), so a page's pandas/plotly dependencies only load
+when it is first rendered.
 """
 
-from .pages.overview import render_overview_page
-from .pages.infrastructure_details import render_infrastructure_page
+from importlib import import_module
+
+_LAZY_EXPORTS = {
+    "render_overview_page": ".pages.overview",
+    "render_infrastructure_page": ".pages.infrastructure_details",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = ["render_overview_page", "render_infrastructure_page"]
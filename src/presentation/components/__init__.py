@@ -10,6 +10,8 @@ from .metrics import render_core_metrics
 from .business_case import render_business_insights
 from .validation import render_validation_panel
 from .ui_helpers import extract_carbon_series
+from .progress import render_refresh_progress
+from .history import render_history_trends
 
 __all__ = [
     "render_grid_status",
@@ -17,4 +19,6 @@ __all__ = [
     "render_business_insights",
     "render_validation_panel",
     "extract_carbon_series",
+    "render_refresh_progress",
+    "render_history_trends",
 ]
@@ -0,0 +1,58 @@
+"""
+History Trends Component
+Displays month-to-date totals and the daily trend stored in the metrics warehouse
+"""
+
+import streamlit as st
+from typing import Optional
+from src.domain.models import DashboardData
+
+
+def render_history_trends(dashboard_data: Optional[DashboardData]) -> None:
+    """
+    Render month-to-date CO₂/cost and the daily trend across refreshes.
+
+    Nothing is rendered when the metrics warehouse is disabled or has no
+    recorded hours yet.
+
+    Args:
+        dashboard_data: Dashboard data carrying ``metrics_history``
+    """
+    history = getattr(dashboard_data, "metrics_history", None) if dashboard_data else None
+    if history is None or not history.daily:
+        return
+
+    st.markdown("### 📈 Month-to-Date & Trend")
+    since = history.history_start.strftime("%Y-%m-%d") if history.history_start else "the first refresh"
+    st.caption(
+        f"Accumulated locally across refreshes since {since} "
+        f"(hourly-precise instances only, settled hours are never re-fetched)"
+    )
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric(f"💰 Costs since {history.month_start:%d %b}", f"€{history.month_to_date_cost_eur:.2f}")
+    with col2:
+        st.metric(f"🌍 Carbon since {history.month_start:%d %b}", f"{history.month_to_date_co2_kg:.2f} kg CO₂")
+    with col3:
+        st.metric(
+            "⏱️ Runtime Hours",
+            f"{history.month_to_date_runtime_hours:.0f} h",
+            f"{history.month_to_date_instances} instances",
+        )
+
+    # Deferred: plotly is only needed once there is history to chart
+    from plotly.subplots import make_subplots
+    import plotly.graph_objects as go
+
+    dates = [row["date"] for row in history.daily]
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    fig.add_trace(go.Bar(x=dates, y=[row["co2_kg"] for row in history.daily], name="CO₂ (kg)"), secondary_y=False)
+    fig.add_trace(
+        go.Scatter(x=dates, y=[row["cost_eur"] for row in history.daily], name="Cost (€)", mode="lines+markers"),
+        secondary_y=True,
+    )
+    fig.update_layout(title=f"Daily totals, last {history.trend_days} days", height=320, margin=dict(t=40, b=20))
+    fig.update_yaxes(title_text="kg CO₂", secondary_y=False)
+    fig.update_yaxes(title_text="€", secondary_y=True)
+    st.plotly_chart(fig, use_container_width=True)
@@ -7,6 +7,7 @@ import streamlit as st
 from typing import Optional
 from src.domain.models import DashboardData
 from src.presentation.utils import get_period_label
+from src.presentation.view_models import get_view_model
 
 
 def render_core_metrics(dashboard_data: Optional[DashboardData]) -> None:
@@ -32,7 +33,7 @@ def render_core_metrics(dashboard_data: Optional[DashboardData]) -> None:
     total_co2 = dashboard_data.total_co2_average
 
     # Data quality assessment
-    num_instances = len(dashboard_data.instances) if dashboard_data.instances else 0
+    num_instances = get_view_model(dashboard_data).instance_count
     cost_quality = "🟢 Calculated" if total_cost > 0 else "🔴 No Data"
     co2_quality = "🟢 Real API" if total_co2 > 0 else "🔴 No Data"
 
@@ -69,7 +70,7 @@ def render_core_metrics(dashboard_data: Optional[DashboardData]) -> None:
                  f"• Runtime hours (CloudTrail tracking)\n"
                  f"• Grid intensity (ElectricityMaps German grid)\n\n"
                  f"**Formula**: CO₂(kg) = Power(kW) × Intensity(g/kWh) × Runtime(h) ÷ 1000\n\n"
-                 f"Updated hourly. See Infrastructure Details for 24h-Pattern Based comparison."
+                 f"Updated hourly. See Infrastructure Details for the Hourly-Precise comparison."
         )
         if not has_carbon_data:
             st.warning("⚠️ No carbon data - check ElectricityMaps API")
@@ -0,0 +1,58 @@
+"""
+Refresh Progress Component
+Displays partial totals and instances while a streaming refresh is running
+"""
+
+import streamlit as st
+import pandas as pd
+from src.domain.models import RefreshProgress
+from src.presentation.utils import get_period_label
+
+# Most recently enriched instances shown while the refresh runs
+PROGRESS_TABLE_ROWS = 25
+
+
+def render_refresh_progress(progress: RefreshProgress) -> None:
+    """
+    Render running totals and the latest enriched instances.
+
+    Called repeatedly inside an ``st.empty()`` placeholder, which is cleared
+    once the complete dashboard data is available.
+
+    Args:
+        progress: Running state yielded by ``iter_infrastructure_data``
+    """
+    period_label = get_period_label(progress.period_days, format_type="long")
+
+    st.progress(progress.fraction, text=f"Enriching instances… {progress.processed}/{progress.total or '?'}")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric(f"💰 {period_label.title()} Costs (so far)", f"€{progress.total_cost_average:.2f}")
+    with col2:
+        st.metric(f"🌍 {period_label.title()} Carbon (so far)", f"{progress.total_co2_average:.2f} kg CO₂")
+    with col3:
+        st.metric(
+            "⏱️ Hourly-Precise",
+            f"{progress.hourly_precise_count}/{progress.processed}",
+            f"{progress.fallback_count} average-based",
+            delta_color="off",
+        )
+
+    if not progress.instances:
+        return
+
+    rows = [
+        {
+            "Instance": instance.instance_name or instance.instance_id,
+            "Type": instance.instance_type,
+            "State": instance.state,
+            "CO₂ (kg)": round(instance.co2_kg_average, 3) if instance.co2_kg_average is not None else None,
+            "Cost (€)": round(instance.cost_eur_average, 2) if instance.cost_eur_average is not None else None,
+            "Method": instance.co2_calculation_method,
+        }
+        for instance in progress.instances[-PROGRESS_TABLE_ROWS:]
+    ]
+    st.dataframe(pd.DataFrame(rows), width="stretch", hide_index=True)
+    if progress.processed > PROGRESS_TABLE_ROWS:
+        st.caption(f"Latest {PROGRESS_TABLE_ROWS} of {progress.processed} enriched instances")
@@ -4,12 +4,9 @@ Displays data precision, quality metrics, and API health status
 """
 
 import streamlit as st
-import pandas as pd
-from datetime import datetime, timezone
-from zoneinfo import ZoneInfo
 from typing import Optional
 from src.domain.models import DashboardData
-from src.domain.validation import validate_dashboard_data, get_data_quality_score
+from src.presentation.view_models import get_view_model
 
 
 def render_validation_panel(dashboard_data: Optional[DashboardData]) -> None:
@@ -32,20 +29,12 @@ def _render_system_status(dashboard_data: DashboardData) -> None:
     st.markdown("### 📊 System Status")
     st.caption("Real-time monitoring of infrastructure and API integrations")
 
-    # Dynamic system metrics
-    if dashboard_data and dashboard_data.instances:
-        running_instances = len([i for i in dashboard_data.instances if i.state == "running"])
-        total_instances = len(dashboard_data.instances)
-    else:
-        running_instances = 0
-        total_instances = 0
-
-    if dashboard_data and hasattr(dashboard_data, "api_health_status") and dashboard_data.api_health_status:
-        apis_online = len([api for api, status in dashboard_data.api_health_status.items() if status.healthy])
-        total_apis = len(dashboard_data.api_health_status)
-    else:
-        apis_online = 0
-        total_apis = 5  # Known total APIs
+    # Counts and the status table are derived once per dashboard result
+    view = get_view_model(dashboard_data)
+    running_instances = view.running_instances
+    total_instances = view.instance_count
+    apis_online = view.apis_online
+    total_apis = view.apis_total or 5  # Known total APIs
 
     # Data quality indicators for system status
     cost_available = dashboard_data and dashboard_data.total_cost_average > 0
@@ -81,82 +70,8 @@ def _render_system_status(dashboard_data: DashboardData) -> None:
             help="ElectricityMaps provides real-time German grid carbon intensity (g CO₂/kWh). Updated hourly, cached for 1 hour. Essential for carbon-aware scheduling."
         )
 
-    api_health = getattr(dashboard_data, "api_health_status", {}) if dashboard_data else {}
-    if api_health:
-        # Standardized API service names and roles
-        role_map = {
-            "ElectricityMaps": "Grid carbon intensity (1 h cache)",
-            "Boavizta": "Power models (7 day cache)",
-            "AWS Pricing": "Instance pricing (7 day cache)",
-            "AWS Cost Explorer": "Aggregated cost comparison (24 h cache)",
-            "AWS CloudWatch": "CPU utilisation (1 h cache)",
-            "AWS CloudTrail": "Instance-specific runtime (3 h cache)",
-        }
-
-        # Normalize service names to standard format
-        display_labels = {
-            "CloudWatch": "AWS CloudWatch",
-            "CloudTrail": "AWS CloudTrail",
-            "Aws Cloudwatch": "AWS CloudWatch",
-            "Aws Cloudtrail": "AWS CloudTrail",
-            "AWS Cloudwatch": "AWS CloudWatch",
-            "AWS Cloudtrail": "AWS CloudTrail",
-        }
-
-        status_rows: list[dict[str, str]] = []
-        berlin_tz = ZoneInfo("Europe/Berlin")
-
-        for service, status in sorted(api_health.items()):
-            label = display_labels.get(service, service.replace("_", " "))
-            state = getattr(status, "status", "unknown").replace("_", " ").title()
-            icon = "🟢" if getattr(status, "healthy", False) else ("🟡" if state.lower() == "degraded" else "🔴")
-
-            last_check = getattr(status, "last_check", None)
-            if last_check is None:
-                checked_at = "–"
-            else:
-                try:
-                    ts_obj = last_check
-                    if hasattr(ts_obj, "tzinfo") and ts_obj.tzinfo is not None:
-                        localized = ts_obj.astimezone(berlin_tz)
-                    else:
-                        localized = ts_obj.replace(tzinfo=berlin_tz)
-                    # Show relative age if older than 24 hours, else absolute time
-                    age_hours = (datetime.now(timezone.utc) - localized.astimezone(timezone.utc)).total_seconds() / 3600
-                    if age_hours > 24:
-                        checked_at = f"{age_hours:.0f}h ago"
-                    else:
-                        checked_at = localized.strftime("%d.%m.%Y %H:%M")
-                except Exception:  # pragma: no cover - defensive formatting
-                    checked_at = str(last_check)
-
-            api_call = getattr(status, "last_api_call", None)
-            if api_call is None:
-                last_api_call = "–"
-            else:
-                try:
-                    if hasattr(api_call, "tzinfo") and api_call.tzinfo is not None:
-                        api_call_local = api_call.astimezone(berlin_tz)
-                    else:
-                        api_call_local = api_call.replace(tzinfo=berlin_tz)
-                    last_api_call = api_call_local.strftime("%d.%m.%Y %H:%M")
-                except Exception:  # pragma: no cover - defensive formatting
-                    last_api_call = str(api_call)
-
-            role = role_map.get(service, role_map.get(label, "Monitoring service"))
-
-            status_rows.append(
-                {
-                    "Service": label,
-                    "Status": f"{icon} {state}",
-                    "Last check": checked_at,
-                    "Last API call": last_api_call,
-                    "Role": role,
-                }
-            )
-
-        df = pd.DataFrame(status_rows)
-        st.dataframe(df, hide_index=True, width="stretch")
+    if not view.api_status_table.empty:
+        st.dataframe(view.api_status_table, hide_index=True, width="stretch")
 
 
 def _render_precision_insights(dashboard_data: DashboardData) -> None:
@@ -169,8 +84,9 @@ def _render_precision_insights(dashboard_data: DashboardData) -> None:
         return
 
     # Add data quality validation
-    validation_results = validate_dashboard_data(dashboard_data.instances)
-    quality_score = get_data_quality_score(dashboard_data.instances)
+    view = get_view_model(dashboard_data)
+    validation_results = view.validation
+    quality_score = view.quality_score
 
     # Show validation warnings if any
     if validation_results["total_errors"] > 0:
@@ -184,10 +100,10 @@ def _render_precision_insights(dashboard_data: DashboardData) -> None:
                 st.warning(f"• {warning}")
 
     # Calculate basic metrics
-    total_instances = len(dashboard_data.instances)
-    measured_runtime = len([i for i in dashboard_data.instances if getattr(i, "runtime_hours", None) is not None])
-    pricing_available = len([i for i in dashboard_data.instances if getattr(i, "hourly_price_usd", None)])
-    measured_quality = len([i for i in dashboard_data.instances if getattr(i, "data_quality", "") == "measured"])
+    total_instances = view.instance_count
+    measured_runtime = view.runtime_coverage
+    pricing_available = view.pricing_coverage
+    measured_quality = view.measured_quality
 
     validation_factor = getattr(dashboard_data, "validation_factor", None)
     # Type-safe validation: ensure it's a number
@@ -388,9 +304,9 @@ def _render_precision_insights(dashboard_data: DashboardData) -> None:
         - **Formula**: `cost_eur = cost_usd × {eur_usd_rate:.4f}`
 
         **Calculation Methods:**
-        - **24h Projected**: Uses last 24h data × 30 for monthly projection
-        - **30d Actual**: Uses total runtime from last 30 days for monthly calculation
-        - **Validation**: Cost Explorer comparison uses 30d actual (not projected) for factual validation
+        - **Hourly-Precise**: Sums every hour of the selected period (CPU, carbon intensity, runtime)
+        - **Average-Based**: Uses total runtime of the period with average CPU and current carbon intensity
+        - **Validation**: Cost Explorer comparison uses the average-based runtime total for factual validation
 
         **Power Consumption Model:**
         - **Idle Power**: 30% of peak power (constant baseline)
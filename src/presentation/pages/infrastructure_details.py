@@ -3,12 +3,32 @@ Infrastructure Analytics Page
 DevOps-focused infrastructure analytics with CloudTrail precision tracking
 """
 
+import time
 import streamlit as st
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+from datetime import datetime
 from typing import Any, Optional
-from src.presentation.utils import get_period_label
+from src.domain.constants import UIConstants
+from src.presentation.utils import get_period_label, lttb_indices, minmax_indices
+from src.presentation.view_models import INSTANCE_COLUMNS, get_view_model, query_instance_frame
+
+# Instance table controls
+_PAGE_SIZES = [25, 50, 100, 250]
+_SORT_OPTIONS = {
+    "cost_eur": "Cost",
+    "co2_kg": "CO₂",
+    "runtime_hours": "Runtime",
+    "cpu_percent": "CPU",
+    "power_kw": "Power",
+    "name": "Name",
+    "type": "Type",
+    "state": "State",
+}
+# Options offered by the hourly analysis instance selector
+_SELECT_OPTIONS = 100
 
 
 def render_infrastructure_page(dashboard_data: Optional[Any]) -> None:
@@ -28,7 +48,7 @@ def render_infrastructure_page(dashboard_data: Optional[Any]) -> None:
     # Essential infrastructure overview
     _render_infrastructure_overview(dashboard_data)
 
-    # NEW: Dual Comparison (24h vs 30d)
+    # NEW: Dual Comparison (Hourly-Precise vs Average-Based)
     _render_dual_comparison_section(dashboard_data)
 
     # Core feature: Instance Detail Table with all calculations
@@ -40,19 +60,18 @@ def render_infrastructure_page(dashboard_data: Optional[Any]) -> None:
 
 def _render_infrastructure_overview(dashboard_data: Any) -> None:
     """Render essential infrastructure metrics"""
-    running_instances = len([i for i in dashboard_data.instances if i.state == "running"])
-    total_instances = len(dashboard_data.instances)
-    total_power = sum(i.power_watts for i in dashboard_data.instances if i.power_watts is not None)
+    view = get_view_model(dashboard_data)
+    running_instances = view.running_instances
+    total_instances = view.instance_count
+    total_power = view.total_power_watts
 
     # Get analysis period (with fallback for backward compatibility)
-    period_days = getattr(dashboard_data, "analysis_period_days", 30)
+    period_days = view.period_days
     period_label = get_period_label(period_days, format_type="short")
 
     # Use average-based totals for overview metrics
     total_cost = dashboard_data.total_cost_average
-    avg_cost_per_instance = (
-        total_cost / len(dashboard_data.instances) if dashboard_data.instances else 0
-    )
+    avg_cost_per_instance = total_cost / total_instances if total_instances else 0
 
     # Essential metrics only
     col1, col2, col3, col4 = st.columns(4)
@@ -87,70 +106,13 @@ def _render_infrastructure_overview(dashboard_data: Any) -> None:
     with col4:
         st.metric(
             "📊 Instance Types",
-            f"{len(set(i.instance_type for i in dashboard_data.instances))}",
+            f"{view.instance_types}",
             "Unique types",
             help="Number of distinct EC2 instance types in your infrastructure. Diversity indicator for right-sizing opportunities. "
                  "Common types: t3.micro (dev), t3.medium (apps), m5.large (prod)."
         )
 
 
-def _prepare_instance_row_data(instance: Any, grid_intensity: Optional[float], period_days: int = 30) -> dict[str, str]:
-    """
-    Prepare table row data for a single instance.
-
-    Args:
-        instance: EC2Instance object
-        grid_intensity: Current grid carbon intensity (g CO₂/kWh)
-        period_days: Analysis period in days
-
-    Returns:
-        Dictionary with formatted instance data for table display
-    """
-    # Get CPU utilization with NO-FALLBACK transparency
-    cpu_util = "⚠️ CloudWatch missing"
-    if hasattr(instance, "cpu_utilization") and instance.cpu_utilization is not None:
-        cpu_util = f"{instance.cpu_utilization:.1f}%"
-
-    # Get runtime data with NO-FALLBACK transparency
-    runtime_hours = "⚠️ Not available"
-    if hasattr(instance, "runtime_hours") and instance.runtime_hours is not None:
-        runtime_hours = f"{instance.runtime_hours:.1f}h"
-
-    # Data quality badge
-    data_quality = getattr(instance, "data_quality", "limited").lower()
-    quality_badge = {
-        "measured": "🟢 Measured",
-        "partial": "🟡 Partial",
-    }.get(data_quality, "🔴 Limited")
-
-    # Period label for column headers
-    period_label = get_period_label(period_days, format_type="short")
-
-    # Formatted values - use new field names with fallback
-    power_kw = f"{instance.power_watts / 1000:.3f}" if instance.power_watts is not None else "N/A"
-    grid_intensity_display = f"{grid_intensity:.0f}" if grid_intensity else "N/A"
-
-    # Use primary field names (average-based method)
-    co2_avg = instance.co2_kg_average
-    cost_avg = instance.cost_eur_average
-
-    co2_display = f"{co2_avg:.3f}" if co2_avg is not None else "⚠️ Not available"
-    cost_display = f"€{cost_avg:.2f}" if cost_avg is not None else "⚠️ Not available"
-
-    return {
-        "Instance Name": instance.instance_name or "Unnamed",
-        "Type": instance.instance_type,
-        "State": instance.state.title(),
-        f"Runtime ({period_label})": runtime_hours,
-        "CPU Avg (%)": cpu_util,
-        "Power (kW)": power_kw,
-        "Grid Intensity (g/kWh)": grid_intensity_display,
-        f"CO₂ ({period_label} avg)": co2_display,
-        f"Cost ({period_label})": cost_display,
-        "Data Quality": quality_badge,
-    }
-
-
 def _render_dual_comparison_section(dashboard_data: Any) -> None:
     """
     Render side-by-side comparison of Hourly-Precise vs Average-Based calculations.
@@ -164,20 +126,20 @@ def _render_dual_comparison_section(dashboard_data: Any) -> None:
     period_days = getattr(dashboard_data, "analysis_period_days", 30)
     period_label = get_period_label(period_days, format_type="short")
 
-    st.caption(f"**Hourly-Precise** (hourly carbon intensity scaled to {period_label}) vs. **Average-Based** (period-average carbon × actual runtime) - Methodology Validation")
+    st.caption(f"**Hourly-Precise** (every hour of the {period_label} window) vs. **Average-Based** (period-average carbon × actual runtime) - Methodology Validation")
 
     # Add explanation expander
     with st.expander("ℹ️ What's the difference between these methods?"):
         st.markdown("""
         **Hourly-Precise**:
-        - Uses 24-hour carbon intensity patterns from ElectricityMaps
-        - Scales power consumption × grid intensity for each hour
-        - More accurate for always-on or predictable workloads
-        - Requires complete 24h runtime and carbon data
+        - Uses hourly carbon intensity from ElectricityMaps for the whole period
+        - Multiplies power consumption × grid intensity × runtime for each hour
+        - Captures daily and weekly workload and grid patterns
+        - Requires hourly CPU, carbon and runtime data for the period
 
         **Average-Based**:
         - Uses period-average carbon intensity × total runtime hours
-        - Fallback when 24h data is incomplete
+        - Fallback when hourly data is unavailable
         - More conservative estimate for variable workloads
         - Works with any runtime window ({period_label})
 
@@ -198,13 +160,13 @@ def _render_dual_comparison_section(dashboard_data: Any) -> None:
         st.metric(
             "Hourly-Precise",
             f"{hourly_precise_count} instances",
-            help="Instances with complete 24h data (CPU, Carbon, Runtime) using hourly carbon intensity patterns"
+            help="Instances with hourly CPU, carbon and runtime data over the analysis period"
         )
     with col2:
         st.metric(
             "Average-Based",
             f"{fallback_count} instances",
-            help="Instances using period-average calculation (fallback when 24h data incomplete)"
+            help="Instances using period-average calculation (fallback when hourly data is unavailable)"
         )
 
     # Side-by-side comparison cards
@@ -214,7 +176,7 @@ def _render_dual_comparison_section(dashboard_data: Any) -> None:
     with col1:
         st.markdown("#### Hourly-Precise")
         st.markdown(f"**{total_co2_hourly:.3f} kg CO₂**")
-        st.caption(f"Hourly patterns × {period_days} days")
+        st.caption(f"{period_days * 24} hours, hour by hour")
         st.caption(f"({hourly_precise_count} instances)")
 
     with col2:
@@ -243,7 +205,7 @@ def _render_dual_comparison_section(dashboard_data: Any) -> None:
     with col1:
         st.markdown("#### Hourly-Precise")
         st.markdown(f"**€{total_cost_hourly:.2f}**")
-        st.caption(f"24h data × {period_days}")
+        st.caption(f"{period_days * 24} hours, hour by hour")
         st.caption(f"({hourly_precise_count} instances)")
 
     with col2:
@@ -268,9 +230,9 @@ def _render_dual_comparison_section(dashboard_data: Any) -> None:
     with st.expander("📖 Understanding the Comparison", expanded=False):
         st.markdown(f"""
         **Hourly-Precise Method:**
-        - Calculates CO₂ for each of the last 24 hours individually
+        - Calculates CO₂ for each of the last {period_days * 24} hours individually
         - Uses hourly CPU data, carbon intensity, and runtime fractions
-        - Scales to {period_days} days: `daily_co2 × {period_days}`
+        - Hours without CPU/carbon data are extrapolated from the covered runtime share
         - **Best for:** Variable workloads, carbon intensity tracking
 
         **Average-Based Method:**
@@ -280,8 +242,8 @@ def _render_dual_comparison_section(dashboard_data: Any) -> None:
 
         **Pattern Analysis:**
         - **Stable (<5% difference):** Consistent workload, both methods agree
-        - **Higher (>5%):** 24h period had higher activity than {period_days}-day average
-        - **Lower (>5%):** 24h period had lower activity than {period_days}-day average
+        - **Higher (>5%):** Running hours coincided with above-average load or grid intensity
+        - **Lower (>5%):** Running hours coincided with below-average load or grid intensity
 
         **Thesis Relevance:**
         This comparison validates the hourly-precise method by showing how it differs from
@@ -298,10 +260,10 @@ def _render_calculation_methodology_expander() -> None:
 
         The instance table above shows metrics calculated using the **30-day actual runtime** method:
         - **Runtime**: Total hours from CloudTrail events over last 30 days
-        - **CPU**: Average CPU utilization from CloudWatch (24h window)
+        - **CPU**: Average CPU utilization from CloudWatch (analysis period)
         - **Carbon Intensity**: Current grid intensity (snapshot)
 
-        For **hourly-precise 24h calculations**, see the "Calculation Method Comparison" section above.
+        For **hourly-precise calculations**, see the "Calculation Method Comparison" section above.
 
         ---
 
@@ -322,7 +284,7 @@ def _render_calculation_methodology_expander() -> None:
         - **Runtime**: CloudTrail Start/Stop events (±5% accuracy)
 
         **NO-FALLBACK Policy**:
-        - Instances without CPU data show "⚠️ CloudWatch missing"
+        - Instances without CPU data show an empty CPU cell (CloudWatch missing)
         - No artificial defaults to maintain scientific integrity
         - Missing data reduces power calculation accuracy
         """)
@@ -334,16 +296,10 @@ def _render_summary_metrics(dashboard_data: Any) -> None:
     period_days = getattr(dashboard_data, "analysis_period_days", 30)
     period_label = get_period_label(period_days, format_type="short")
 
-    # Use new field names with fallback
-    total_cost = sum(
-        getattr(i, "cost_eur_average", i.monthly_cost_eur if hasattr(i, "monthly_cost_eur") else None) or 0
-        for i in dashboard_data.instances
-    )
-    total_co2 = sum(
-        getattr(i, "co2_kg_average", i.monthly_co2_kg if hasattr(i, "monthly_co2_kg") else None) or 0
-        for i in dashboard_data.instances
-    )
-    total_power = sum(i.power_watts for i in dashboard_data.instances if i.power_watts is not None)
+    view = get_view_model(dashboard_data)
+    total_cost = view.total_cost_eur
+    total_co2 = view.total_co2_kg
+    total_power = view.total_power_watts
 
     col1, col2, col3 = st.columns(3)
 
@@ -385,23 +341,86 @@ def _render_instance_detail_table(dashboard_data: Any) -> None:
         st.warning("No instance data available")
         return
 
-    # Get carbon intensity for formula display
-    grid_intensity = dashboard_data.carbon_intensity.value if dashboard_data.carbon_intensity else None
-
-    # Prepare data for table
-    table_data = []
-
-    for instance in dashboard_data.instances:
-        table_data.append(_prepare_instance_row_data(instance, grid_intensity, period_days))
-
-    if table_data:
-        # Create DataFrame
-        import pandas as pd
+    frame = get_view_model(dashboard_data).instance_frame
+    short_label = get_period_label(period_days, format_type="short")
+
+    # Filters, sorting and paging run server-side; only the visible page is sent to the browser
+    filter_col, state_col, type_col = st.columns([2, 1, 1])
+    with filter_col:
+        search = st.text_input(
+            "Search instances",
+            placeholder="Name or instance ID",
+            key="instance_table_search",
+            on_change=_reset_instance_table_page,
+        )
+    with state_col:
+        states = st.multiselect(
+            "State",
+            options=list(frame["state"].cat.categories),
+            key="instance_table_states",
+            on_change=_reset_instance_table_page,
+        )
+    with type_col:
+        types = st.multiselect(
+            "Instance type",
+            options=list(frame["type"].cat.categories),
+            key="instance_table_types",
+            on_change=_reset_instance_table_page,
+        )
 
-        df = pd.DataFrame(table_data)
+    sort_col, order_col, size_col, page_col = st.columns([2, 1, 1, 1])
+    with sort_col:
+        sort_by = st.selectbox(
+            "Sort by",
+            options=list(_SORT_OPTIONS),
+            format_func=lambda column: _SORT_OPTIONS[column],
+            index=list(_SORT_OPTIONS).index("cost_eur"),
+            key="instance_table_sort",
+            on_change=_reset_instance_table_page,
+        )
+    with order_col:
+        descending = st.toggle(
+            "Descending",
+            value=True,
+            key="instance_table_descending",
+            on_change=_reset_instance_table_page,
+        )
+    with size_col:
+        page_size = st.selectbox(
+            "Rows per page",
+            options=_PAGE_SIZES,
+            index=1,
+            key="instance_table_page_size",
+            on_change=_reset_instance_table_page,
+        )
+    with page_col:
+        page_number = st.number_input("Page", min_value=1, step=1, key="instance_table_page")
+
+    page = query_instance_frame(
+        frame,
+        search=search,
+        states=states,
+        types=types,
+        sort_by=sort_by,
+        descending=descending,
+        page=page_number,
+        page_size=page_size,
+    )
 
-        # Display table with help text
-        st.dataframe(df, width="stretch", hide_index=True)
+    if page.matching:
+        st.dataframe(
+            page.rows,
+            width="stretch",
+            hide_index=True,
+            column_order=[column for column in INSTANCE_COLUMNS if column != "hourly"],
+            column_config=_instance_column_config(short_label),
+        )
+        first_row = (page.page - 1) * page_size + 1
+        st.caption(
+            f"Rows {first_row}–{first_row + len(page.rows) - 1} of {page.matching} matching "
+            f"({len(frame)} instances) · page {page.page}/{page.page_count} · "
+            "empty cells mean the measurement is not available (no fallback values)"
+        )
 
         # Power & CO₂ Calculation Methodology
         _render_calculation_methodology_expander()
@@ -410,7 +429,29 @@ def _render_instance_detail_table(dashboard_data: Any) -> None:
         _render_summary_metrics(dashboard_data)
 
     else:
-        st.error("No instance data available for detailed analysis")
+        st.info("No instances match the current filters")
+
+
+def _reset_instance_table_page() -> None:
+    """Return the instance table to its first page when the filters, sorting or page size change"""
+    st.session_state["instance_table_page"] = 1
+
+
+def _instance_column_config(period_label: str) -> dict[str, Any]:
+    """Units and number formats of the instance table (values stay numeric)."""
+    return {
+        "instance_id": st.column_config.TextColumn("Instance ID"),
+        "name": st.column_config.TextColumn("Instance Name"),
+        "type": st.column_config.TextColumn("Type"),
+        "state": st.column_config.TextColumn("State"),
+        "runtime_hours": st.column_config.NumberColumn(f"Runtime ({period_label})", format="%.1f h", help="CloudTrail runtime; empty when not available"),
+        "cpu_percent": st.column_config.NumberColumn("CPU Avg (%)", format="%.1f%%", help="Empty when CloudWatch data is missing"),
+        "power_kw": st.column_config.NumberColumn("Power (kW)", format="%.3f"),
+        "grid_intensity": st.column_config.NumberColumn("Grid Intensity (g/kWh)", format="%.0f"),
+        "co2_kg": st.column_config.NumberColumn(f"CO₂ ({period_label} avg, kg)", format="%.3f"),
+        "cost_eur": st.column_config.NumberColumn(f"Cost ({period_label})", format="€%.2f"),
+        "data_quality": st.column_config.TextColumn("Data Quality"),
+    }
 
 
 def _render_hourly_co2_analysis_section(dashboard_data: Any) -> None:
@@ -420,19 +461,17 @@ def _render_hourly_co2_analysis_section(dashboard_data: Any) -> None:
     Only displays for instances that have hourly calculation method.
     """
     # Filter instances with hourly data
-    instances_with_hourly = [
-        inst for inst in dashboard_data.instances
-        if inst.co2_calculation_method == "hourly" and inst.hourly_co2_breakdown
-    ]
+    frame = get_view_model(dashboard_data).instance_frame
+    hourly_count = int(frame["hourly"].sum())
 
-    if not instances_with_hourly:
+    if not hourly_count:
         # No hourly data available - show info message
-        with st.expander("📊 24-Hour CO2 Analysis", expanded=False):
+        with st.expander("📊 Hourly CO2 Analysis", expanded=False):
             st.info(
                 "ℹ️ Hourly CO2 analysis not yet available. The system is collecting data.\n\n"
                 "**Requirements for hourly analysis:**\n"
                 "- Hourly CPU utilization data (CloudWatch)\n"
-                "- 24h carbon intensity history (ElectricityMaps)\n"
+                "- Hourly carbon intensity history for the period (ElectricityMaps)\n"
                 "- CloudTrail runtime events\n\n"
                 "This feature provides detailed hour-by-hour CO2 emissions tracking."
             )
@@ -440,25 +479,44 @@ def _render_hourly_co2_analysis_section(dashboard_data: Any) -> None:
 
     # Show hourly analysis section
     st.markdown("---")
-    st.markdown("### 📊 24-Hour Precise CO2 Analysis")
+    st.markdown("### 📊 Hourly-Precise CO2 Analysis")
     st.caption(
-        f"Detailed hourly breakdown for {len(instances_with_hourly)} instance(s) "
+        f"Detailed hourly breakdown for {hourly_count} instance(s) "
         f"with complete data (CPU, Carbon Intensity, Runtime)"
     )
 
-    # Instance selector if multiple instances
-    if len(instances_with_hourly) == 1:
-        selected_instance = instances_with_hourly[0]
+    _render_fleet_co2_heatmap(get_view_model(dashboard_data).co2_heatmap)
+
+    # Searchable selector; only the best matches are turned into options
+    if hourly_count == 1:
+        selected_instance = dashboard_data.instances[int(np.flatnonzero(frame["hourly"].to_numpy())[0])]
     else:
-        instance_options = {
-            f"{inst.instance_name or inst.instance_id} ({inst.instance_type})": inst
-            for inst in instances_with_hourly
+        search = st.text_input(
+            "Find instance for detailed hourly analysis:",
+            placeholder="Name or instance ID",
+            key="hourly_instance_search",
+        )
+        matches = query_instance_frame(
+            frame, search=search, hourly_only=True, sort_by="co2_kg", descending=True, page_size=_SELECT_OPTIONS
+        )
+        if not matches.matching:
+            st.info("No instance with hourly data matches the search")
+            return
+        options = {
+            int(row_index): f"{name if name != 'Unnamed' else instance_id} ({instance_type})"
+            for row_index, name, instance_id, instance_type in zip(
+                matches.rows.index, matches.rows["name"], matches.rows["instance_id"], matches.rows["type"]
+            )
         }
-        selected_name = st.selectbox(
+        selected_row = st.selectbox(
             "Select instance for detailed hourly analysis:",
-            options=list(instance_options.keys())
+            options=list(options),
+            format_func=options.__getitem__,
+            key="hourly_instance_select",
         )
-        selected_instance = instance_options[selected_name]
+        if matches.matching > len(options):
+            st.caption(f"Showing the {len(options)} highest-emitting of {matches.matching} matches - refine the search to narrow down")
+        selected_instance = dashboard_data.instances[selected_row]
 
     # Render hourly analysis for selected instance
     _render_instance_hourly_analysis(selected_instance)
@@ -483,35 +541,26 @@ def _render_instance_hourly_analysis(instance: Any) -> None:
         st.warning("⚠️ Hourly breakdown data missing")
         return
 
-    # Parse timestamps and convert from UTC to local timezone for display
-    from datetime import datetime, timezone
-    timestamps = []
-    for entry in breakdown:
-        ts = entry.get("timestamp")
-        if isinstance(ts, str):
-            dt = datetime.fromisoformat(ts)
-        else:
-            dt = ts
+    # Columnar arrays; shared UTC time axis converted to local timezone for display
+    local_tz = datetime.now().astimezone().tzinfo
+    timestamps = pd.DatetimeIndex(pd.to_datetime(breakdown.timestamps, utc=True)).tz_convert(local_tz)
 
-        # Ensure datetime is timezone-aware (assume UTC if naive)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-
-        # Convert to local timezone for display
-        timestamps.append(dt.astimezone())
-
-    co2_values = [e.get("co2_g", 0) for e in breakdown]
-    cost_values = [e.get("cost_eur", 0) for e in breakdown]  # NEW: Extract hourly costs
-    cpu_values = [e.get("cpu_percent") for e in breakdown if e.get("running", False)]
-    carbon_values = [e.get("carbon_intensity") for e in breakdown if e.get("running", False)]
-    power_values = [e.get("power_watts") for e in breakdown if e.get("running", False)]
-    runtime_fractions = [e.get("runtime_fraction", 0) for e in breakdown]
+    running_mask = breakdown.running
+    co2_values = breakdown.co2_g
+    cost_values = breakdown.cost_eur if breakdown.cost_eur is not None else np.zeros(len(breakdown), dtype=np.float32)
+    cpu_values = breakdown.cpu_percent[running_mask]
+    carbon_values = breakdown.carbon_intensity[running_mask]
+    runtime_fractions = breakdown.runtime_fraction
+    running_timestamps = timestamps[running_mask]
 
     # Check if cost data is available
-    has_cost_data = any(cost_values) and any(e.get("cost_eur") is not None for e in breakdown)
+    has_cost_data = breakdown.cost_eur is not None and bool(cost_values.any())
 
     # Summary statistics
-    st.markdown("#### Summary Statistics (24h)")
+    period_days = getattr(instance, "period_days", 30)
+    period_label = get_period_label(period_days, format_type="short")
+    window_hours = len(breakdown)
+    st.markdown(f"#### Summary Statistics ({period_label})")
 
     # Dynamically adjust columns based on cost data availability
     if has_cost_data:
@@ -519,91 +568,77 @@ def _render_instance_hourly_analysis(instance: Any) -> None:
     else:
         col1, col2, col3, col4 = st.columns(4)
 
+    avg_cpu = float(cpu_values.mean()) if cpu_values.size else 0
+    avg_carbon = float(carbon_values.mean()) if carbon_values.size else 0
+
     with col1:
         st.metric(
-            "Total CO2 (24h)",
-            f"{instance.daily_co2_kg:.4f} kg" if instance.daily_co2_kg else "N/A",
-            help="Total CO2 emissions over the last 24 hours (hourly-precise calculation)"
+            f"Total CO2 ({period_label})",
+            f"{instance.co2_kg_hourly:.4f} kg" if instance.co2_kg_hourly else "N/A",
+            help=f"Total CO2 emissions over the last {window_hours} hours (hourly-precise calculation)"
         )
 
     with col2:
         if has_cost_data:
-            daily_cost_eur = sum(cost_values)
             st.metric(
-                "Total Cost (24h)",
-                f"€{daily_cost_eur:.4f}",
-                help="Total cost over the last 24 hours (hourly-precise calculation)"
+                f"Total Cost ({period_label})",
+                f"€{float(cost_values.sum()):.4f}",
+                help=f"Total cost over the last {window_hours} hours (hourly-precise calculation)"
             )
         else:
-            avg_cpu = sum(cpu_values) / len(cpu_values) if cpu_values else 0
             st.metric(
                 "Avg CPU",
                 f"{avg_cpu:.1f}%",
-                help="Average CPU utilization over the last 24 hours"
+                help=f"Average CPU utilization over running hours of the last {window_hours} hours"
             )
 
     with col3:
         if has_cost_data:
-            avg_cpu = sum(cpu_values) / len(cpu_values) if cpu_values else 0
             st.metric(
                 "Avg CPU",
                 f"{avg_cpu:.1f}%",
-                help="Average CPU utilization over the last 24 hours"
+                help=f"Average CPU utilization over running hours of the last {window_hours} hours"
             )
         else:
-            avg_carbon = sum(carbon_values) / len(carbon_values) if carbon_values else 0
             st.metric(
                 "Avg Carbon",
                 f"{avg_carbon:.0f} g/kWh",
-                help="Average grid carbon intensity over the last 24 hours"
+                help=f"Average grid carbon intensity over running hours of the last {window_hours} hours"
             )
 
     with col4:
         if has_cost_data:
-            avg_carbon = sum(carbon_values) / len(carbon_values) if carbon_values else 0
             st.metric(
                 "Avg Carbon",
                 f"{avg_carbon:.0f} g/kWh",
-                help="Average grid carbon intensity over the last 24 hours"
+                help=f"Average grid carbon intensity over running hours of the last {window_hours} hours"
             )
         else:
-            # Get period-based projection
-            period_days = getattr(instance, "period_days", 30)
-            period_projection = instance.daily_co2_kg * period_days if instance.daily_co2_kg else 0
-            # Use new field name with fallback
-            co2_average = getattr(instance, "co2_kg_average", instance.monthly_co2_kg if hasattr(instance, "monthly_co2_kg") else None)
-            delta = period_projection - (co2_average or 0)
-            # Only show delta if co2_average is meaningful (not None and > 0)
+            co2_hourly = instance.co2_kg_hourly or 0
+            co2_average = getattr(instance, "co2_kg_average", None)
             st.metric(
-                f"Period Projection ({period_days}d)",
-                f"{period_projection:.2f} kg",
-                delta=f"{delta:+.2f} kg" if co2_average and co2_average > 0 else None,
-                help=f"Period projection: daily × {period_days} days"
+                "vs. Average-Based",
+                f"{co2_hourly:.2f} kg",
+                delta=f"{co2_hourly - co2_average:+.2f} kg" if co2_average and co2_average > 0 else None,
+                help="Hourly-precise period total compared with the average-based estimate"
             )
 
     if has_cost_data:
         with col5:
-            period_days = getattr(instance, "period_days", 30)
-            period_cost_projection = sum(cost_values) * period_days
-            # Use new field name with fallback
-            cost_average = getattr(instance, "cost_eur_average", instance.monthly_cost_eur if hasattr(instance, "monthly_cost_eur") else None)
-            delta_cost = period_cost_projection - (cost_average or 0)
-            # Only show delta if cost_average is meaningful (not None and > 0)
+            cost_hourly = instance.cost_eur_hourly or 0
+            cost_average = getattr(instance, "cost_eur_average", None)
             st.metric(
-                f"Period Cost Projection ({period_days}d)",
-                f"€{period_cost_projection:.2f}",
-                delta=f"€{delta_cost:+.2f}" if cost_average and cost_average > 0 else None,
-                help=f"Period cost projection: daily × {period_days} days"
+                "vs. Average-Based",
+                f"€{cost_hourly:.2f}",
+                delta=f"€{cost_hourly - cost_average:+.2f}" if cost_average and cost_average > 0 else None,
+                help="Hourly-precise period cost compared with the average-based estimate"
             )
 
     # Create detailed hourly chart
-    from plotly.subplots import make_subplots
-    import plotly.graph_objects as go
-
     # NEW: Synchronized Cost & CO2 Chart (for Thesis validation)
     if has_cost_data:
         st.markdown("---")
-        st.markdown("#### 💰 Synchronized Cost & CO2 Timeline (24h)")
+        st.markdown(f"#### 💰 Synchronized Cost & CO2 Timeline ({period_label})")
         st.caption(
             "This chart demonstrates synchronized cost and carbon data on a common timeline, "
             "enabling simultaneous analysis of both dimensions (Thesis requirement F1)"
@@ -617,12 +652,11 @@ def _render_instance_hourly_analysis(instance: Any) -> None:
 
         # Primary Y-axis (left): Hourly Costs (Bar Chart)
         fig_cost_co2.add_trace(
-            go.Bar(
-                x=timestamps,
-                y=cost_values,
+            _bar_trace(
+                timestamps,
+                cost_values,
                 name='Cost (EUR)',
-                marker_color='rgba(54, 162, 235, 0.7)',  # Blue
-                yaxis='y',
+                color='rgba(54, 162, 235, 0.7)',  # Blue
                 hovertemplate='<b>%{x}</b><br>Cost: €%{y:.4f}<extra></extra>'
             ),
             secondary_y=False
@@ -630,20 +664,18 @@ def _render_instance_hourly_analysis(instance: Any) -> None:
 
         # Secondary Y-axis (right): Hourly CO2 (Line Chart)
         fig_cost_co2.add_trace(
-            go.Scatter(
-                x=timestamps,
-                y=co2_values,
+            _line_trace(
+                timestamps,
+                co2_values,
                 name='CO2 (g)',
                 line=dict(color='rgba(75, 192, 192, 1)', width=3),  # Green
-                mode='lines+markers',
-                yaxis='y2',
+                mode='lines+markers' if len(co2_values) <= UIConstants.CHART_MAX_BARS else 'lines',
                 hovertemplate='<b>%{x}</b><br>CO2: %{y:.2f} g<extra></extra>'
             ),
             secondary_y=True
         )
 
         # Get local timezone name for display
-        import time
         local_tz_name = time.strftime('%Z')
 
         # Update layout
@@ -670,7 +702,7 @@ def _render_instance_hourly_analysis(instance: Any) -> None:
                 x=1
             ),
             hovermode='x unified',
-            title_text=f"<b>Synchronized Cost & CO2 Analysis</b><br><sub>Last 24 hours (times in {local_tz_name}) - Common timeline for simultaneous analysis</sub>",
+            title_text=f"<b>Synchronized Cost & CO2 Analysis</b><br><sub>Last {window_hours} hours (times in {local_tz_name}) - Common timeline for simultaneous analysis</sub>",
             title_font_size=16
         )
 
@@ -685,8 +717,8 @@ def _render_instance_hourly_analysis(instance: Any) -> None:
             > sodass Entscheidungsträger beide Dimensionen simultan analysieren können."
 
             **Key Features:**
-            - ✅ **Synchronized Timeline**: Both metrics share the same 24-hour X-axis
-            - ✅ **Hourly Precision**: Individual data points for each hour (24 data points)
+            - ✅ **Synchronized Timeline**: Both metrics share the same {window_hours}-hour X-axis
+            - ✅ **Hourly Precision**: Individual data points for each hour ({window_hours} data points)
             - ✅ **Dual-Axis Design**: Enables direct comparison of Cost (EUR) and CO2 (g)
             - ✅ **Common Hover**: Hovering shows both values simultaneously
 
@@ -696,10 +728,11 @@ def _render_instance_hourly_analysis(instance: Any) -> None:
             - Support carbon-aware scheduling decisions with cost impact visibility
             - Validate economic vs. environmental trade-offs
 
-            **Data Coverage:** {coverage_hours}/24 hours ({coverage_pct:.0f}% coverage)
+            **Data Coverage:** {coverage_hours}/{window_hours} hours ({coverage_pct:.0f}% coverage)
             """.format(
-                coverage_hours=sum(1 for rf in runtime_fractions if rf > 0),
-                coverage_pct=(sum(1 for rf in runtime_fractions if rf > 0) / 24) * 100
+                window_hours=window_hours,
+                coverage_hours=int((runtime_fractions > 0).sum()),
+                coverage_pct=float((runtime_fractions > 0).mean()) * 100
             ))
 
         st.markdown("---")
@@ -719,22 +752,21 @@ def _render_instance_hourly_analysis(instance: Any) -> None:
 
     # Row 1: CO2 emissions as bar chart
     fig.add_trace(
-        go.Bar(
-            x=timestamps,
-            y=co2_values,
+        _bar_trace(
+            timestamps,
+            co2_values,
             name='CO2 (g/h)',
-            marker_color='rgba(255, 99, 71, 0.7)',
+            color='rgba(255, 99, 71, 0.7)',
             hovertemplate='<b>%{x}</b><br>CO2: %{y:.2f} g<extra></extra>'
         ),
         row=1, col=1
     )
 
     # Row 2: CPU utilization (primary y-axis)
-    running_timestamps = [ts for ts, e in zip(timestamps, breakdown) if e.get('running')]
     fig.add_trace(
-        go.Scatter(
-            x=running_timestamps,
-            y=cpu_values,
+        _line_trace(
+            running_timestamps,
+            cpu_values,
             name='CPU %',
             line=dict(color='blue', width=2),
             hovertemplate='<b>%{x}</b><br>CPU: %{y:.1f}%<extra></extra>'
@@ -744,9 +776,9 @@ def _render_instance_hourly_analysis(instance: Any) -> None:
 
     # Row 2: Carbon intensity (secondary y-axis)
     fig.add_trace(
-        go.Scatter(
-            x=running_timestamps,
-            y=carbon_values,
+        _line_trace(
+            running_timestamps,
+            carbon_values,
             name='Carbon Intensity (g/kWh)',
             line=dict(color='green', width=2, dash='dot'),
             hovertemplate='<b>%{x}</b><br>Carbon: %{y:.0f} g/kWh<extra></extra>'
@@ -761,14 +793,13 @@ def _render_instance_hourly_analysis(instance: Any) -> None:
     fig.update_yaxes(title_text="Carbon Intensity (g/kWh)", row=2, col=1, secondary_y=True)
 
     # Get local timezone name for display
-    import time
     local_tz_name = time.strftime('%Z')  # e.g., "CET", "EDT", "UTC+4"
 
     fig.update_layout(
         height=600,
         showlegend=True,
         hovermode='x unified',
-        title_text=f"24-Hour Analysis: {instance.instance_name or instance.instance_id}<br><sub>Last 24 complete hours (times in {local_tz_name})</sub>"
+        title_text=f"Hourly Analysis: {instance.instance_name or instance.instance_id}<br><sub>Last {window_hours} complete hours (times in {local_tz_name})</sub>"
     )
 
     st.plotly_chart(fig, use_container_width=True)
@@ -776,30 +807,77 @@ def _render_instance_hourly_analysis(instance: Any) -> None:
     # Additional insights
     with st.expander("📈 Hourly Data Insights", expanded=False):
         st.markdown("**Peak Hours:**")
-        max_co2_idx = co2_values.index(max(co2_values)) if co2_values else 0
-        max_cpu_idx = cpu_values.index(max(cpu_values)) if cpu_values else 0
+        max_co2_idx = int(co2_values.argmax()) if co2_values.size else 0
+        max_cpu_idx = int(cpu_values.argmax()) if cpu_values.size else 0
 
         col1, col2 = st.columns(2)
         with col1:
             st.metric(
                 "Highest CO2 Hour",
-                f"{timestamps[max_co2_idx].strftime('%H:%M')}",
+                f"{timestamps[max_co2_idx].strftime('%d.%m. %H:%M')}",
                 f"{co2_values[max_co2_idx]:.2f} g"
             )
         with col2:
             st.metric(
                 "Highest CPU Hour",
-                f"{running_timestamps[max_cpu_idx].strftime('%H:%M')}" if cpu_values else "N/A",
-                f"{cpu_values[max_cpu_idx]:.1f}%" if cpu_values else "N/A"
+                f"{running_timestamps[max_cpu_idx].strftime('%d.%m. %H:%M')}" if cpu_values.size else "N/A",
+                f"{cpu_values[max_cpu_idx]:.1f}%" if cpu_values.size else "N/A"
             )
 
         st.markdown("**Runtime Coverage:**")
-        hours_running = sum(1 for rf in runtime_fractions if rf > 0)
+        hours_running = int((runtime_fractions > 0).sum())
         st.metric(
             "Hours Running",
-            f"{hours_running}/24",
-            f"{(hours_running/24)*100:.0f}% uptime"
+            f"{hours_running}/{window_hours}",
+            f"{(hours_running/window_hours)*100:.0f}% uptime"
+        )
+
+
+def _render_fleet_co2_heatmap(heatmap: Optional[Any]) -> None:
+    """Render the binned instances × hours CO2 heatmap (bounded payload for any fleet size)."""
+    if heatmap is None or heatmap.instances < 2:
+        return
+
+    rows, columns = heatmap.values.shape
+    local_tz = datetime.now().astimezone().tzinfo
+    hour_starts = pd.DatetimeIndex(pd.to_datetime(heatmap.hour_starts, utc=True)).tz_convert(local_tz)
+
+    with st.expander(f"🗺️ Fleet CO2 Heatmap ({heatmap.instances} instances × {heatmap.hours} hours)", expanded=False):
+        fig = go.Figure(
+            go.Heatmap(
+                z=heatmap.values,
+                x=hour_starts,
+                y=list(heatmap.row_labels),
+                colorscale="YlOrRd",
+                colorbar=dict(title="g CO2/h"),
+                hovertemplate='<b>%{y}</b><br>%{x}<br>CO2: %{z:.2f} g/h<extra></extra>',
+            )
         )
+        fig.update_yaxes(autorange="reversed", title_text="Instances (highest CO2 first)")
+        fig.update_xaxes(title_text="Time")
+        fig.update_layout(height=min(200 + 6 * rows, 800), margin=dict(t=30))
+        st.plotly_chart(fig, use_container_width=True)
+        st.caption(
+            f"{rows} instance blocks × {columns} time blocks; each cell is the mean hourly CO2 of its block, "
+            "so the chart size stays bounded for large fleets and long periods"
+        )
+
+
+def _line_trace(x: Any, y: np.ndarray, **kwargs: Any) -> go.Scattergl:
+    """WebGL line trace, LTTB-decimated to ``CHART_MAX_POINTS`` points."""
+    axis = x.asi8 if isinstance(x, pd.DatetimeIndex) else np.asarray(x)
+    keep = lttb_indices(axis, y, UIConstants.CHART_MAX_POINTS)
+    return go.Scattergl(x=x[keep], y=y[keep], **kwargs)
+
+
+def _bar_trace(x: Any, y: np.ndarray, *, color: str, **kwargs: Any) -> Any:
+    """Bars for short series; min/max-decimated WebGL area beyond ``CHART_MAX_BARS`` (peaks are kept)."""
+    if len(y) <= UIConstants.CHART_MAX_BARS:
+        return go.Bar(x=x, y=y, marker_color=color, **kwargs)
+    keep = minmax_indices(y, UIConstants.CHART_MAX_POINTS // 2)
+    return go.Scattergl(
+        x=x[keep], y=y[keep], mode="lines", fill="tozeroy", line=dict(color=color, width=1), fillcolor=color, **kwargs
+    )
 
 
 def _render_co2_method_badge(method: str) -> None:
@@ -808,12 +886,12 @@ def _render_co2_method_badge(method: str) -> None:
         st.success("🟢 Calculation Method: Hourly-Precise")
         st.caption(
             "This instance uses hourly-precise calculation with individual CPU, "
-            "carbon intensity, and runtime values for each of the last 24 hours."
+            "carbon intensity, and runtime values for each hour of the analysis period."
         )
     elif method == "average":
         st.info("🔵 Calculation Method: Average-Based")
         st.caption(
-            "This instance uses average calculation (24h CPU average × current carbon intensity × total runtime)."
+            "This instance uses average calculation (period CPU average × current carbon intensity × total runtime)."
         )
     else:
         st.warning("⚪ Calculation Method: No Data")
@@ -13,6 +13,7 @@ from src.domain.models import DashboardData
 from src.presentation.components import (
     render_grid_status,
     render_core_metrics,
+    render_history_trends,
     render_business_insights,
     render_validation_panel,
     extract_carbon_series,
@@ -82,6 +83,7 @@ def render_overview_page(dashboard_data: Optional[DashboardData]) -> None:
     # Core sections - simplified for SME decision makers
     render_grid_status(dashboard_data)
     render_core_metrics(dashboard_data)
+    render_history_trends(dashboard_data)
 
     # Business case, CSRD readiness, and recommendations
     render_business_insights(dashboard_data, carbon_series)
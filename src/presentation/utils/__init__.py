@@ -14,6 +14,7 @@ from .formatters import (
     PERIOD_LABELS,
     CALCULATION_METHODS,
 )
+from .downsampling import bin_matrix, lttb_indices, minmax_indices
 
 __all__ = [
     "get_period_label",
@@ -26,4 +27,7 @@ __all__ = [
     "validate_period_days",
     "PERIOD_LABELS",
     "CALCULATION_METHODS",
+    "bin_matrix",
+    "lttb_indices",
+    "minmax_indices",
 ]
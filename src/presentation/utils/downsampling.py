@@ -0,0 +1,133 @@
+"""
+Server-side chart decimation
+
+Keeps the number of points sent to the browser bounded regardless of the
+series length:
+
+- ``lttb_indices()``: Largest-Triangle-Three-Buckets for line charts (keeps the
+  visual shape, always includes the first and last point)
+- ``minmax_indices()``: minimum and maximum per pixel bucket for bar/area data
+  (peaks are never dropped)
+- ``bin_matrix()``: block aggregation of instances × hours matrices for heatmaps
+
+All functions return indices or aggregates only; callers select timestamps
+and values with them, so series of any dtype can be decimated.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Indices of the points selected by Largest-Triangle-Three-Buckets.
+
+    Args:
+        x: Monotonic x values (numbers or datetime64)
+        y: Values (NaN is treated as 0 for the triangle areas)
+        threshold: Maximum number of points to keep (>= 3)
+
+    Returns:
+        Sorted indices into ``x``/``y`` (all indices if the series is short enough)
+    """
+    count = len(y)
+    if threshold >= count or threshold < 3:
+        return np.arange(count)
+
+    xs = np.asarray(x)
+    if np.issubdtype(xs.dtype, np.datetime64):
+        xs = xs.astype("datetime64[s]").astype(np.int64)
+    xs = xs.astype(np.float64)
+    ys = np.nan_to_num(np.asarray(y, dtype=np.float64))
+
+    # Bucket boundaries for the points between the fixed first and last one
+    edges = np.floor(np.linspace(1, count - 1, threshold - 1)).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, count - 1
+
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_start, next_end = end, edges[bucket + 2] if bucket + 2 < len(edges) else count
+        # Average point of the next bucket (the last point for the final bucket)
+        next_x = xs[next_start:next_end].mean() if next_end > next_start else xs[-1]
+        next_y = ys[next_start:next_end].mean() if next_end > next_start else ys[-1]
+
+        area = np.abs(
+            (xs[previous] - next_x) * (ys[start:end] - ys[previous])
+            - (xs[previous] - xs[start:end]) * (next_y - ys[previous])
+        )
+        previous = start + int(area.argmax())
+        selected[bucket + 1] = previous
+    return selected
+
+
+def minmax_indices(y: np.ndarray, buckets: int) -> np.ndarray:
+    """
+    Indices of the minimum and maximum of every bucket (at most ``2 × buckets`` points).
+
+    Args:
+        y: Values (NaN is ignored where a bucket has other values)
+        buckets: Number of equal-width buckets (≈ chart width in pixels)
+
+    Returns:
+        Sorted unique indices into ``y``
+    """
+    count = len(y)
+    if buckets <= 0 or 2 * buckets >= count:
+        return np.arange(count)
+
+    values = np.asarray(y, dtype=np.float64)
+    size = -(-count // buckets)
+    padded = np.full(size * buckets, np.nan)
+    padded[:count] = values
+    blocks = padded.reshape(buckets, size)
+
+    offsets = np.arange(buckets) * size
+    low = np.where(np.isnan(blocks), np.inf, blocks).argmin(axis=1) + offsets
+    high = np.where(np.isnan(blocks), -np.inf, blocks).argmax(axis=1) + offsets
+    indices = np.unique(np.concatenate([low, high, [0, count - 1]]))
+    return indices[indices < count]
+
+
+def bin_matrix(matrix: np.ndarray, max_rows: int, max_columns: int, *, reducer: str = "mean") -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Aggregate a rows × columns matrix into at most ``max_rows × max_columns`` blocks.
+
+    Args:
+        matrix: 2-D values (NaN cells are ignored)
+        max_rows / max_columns: Output size limits
+        reducer: ``"mean"``, ``"sum"`` or ``"max"`` per block
+
+    Returns:
+        ``(binned, row_starts, column_starts)``: aggregated values and the first
+        source row/column of every block
+    """
+    values = np.asarray(matrix, dtype=np.float64)
+    rows, columns = values.shape
+    row_size = max(-(-rows // max(max_rows, 1)), 1)
+    column_size = max(-(-columns // max(max_columns, 1)), 1)
+    row_blocks = -(-rows // row_size) if rows else 0
+    column_blocks = -(-columns // column_size) if columns else 0
+
+    padded = np.full((row_blocks * row_size, column_blocks * column_size), np.nan)
+    padded[:rows, :columns] = values
+    blocks = padded.reshape(row_blocks, row_size, column_blocks, column_size)
+
+    valid = (~np.isnan(blocks)).sum(axis=(1, 3))
+    if reducer == "sum":
+        binned = np.nansum(blocks, axis=(1, 3))
+    elif reducer == "max":
+        binned = np.where(np.isnan(blocks), -np.inf, blocks).max(axis=(1, 3))
+    elif reducer == "mean":
+        binned = np.nansum(blocks, axis=(1, 3)) / np.maximum(valid, 1)
+    else:
+        raise ValueError(f"Unknown reducer: {reducer}")
+    binned = np.where(valid > 0, binned, np.nan)
+    return binned, np.arange(row_blocks) * row_size, np.arange(column_blocks) * column_size
+
+
+__all__ = ["bin_matrix", "lttb_indices", "minmax_indices"]
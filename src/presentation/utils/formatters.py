@@ -181,13 +181,13 @@ def get_calculation_method_label(method: str, format_type: str = "full") -> str:
 
     Examples:
         >>> get_calculation_method_label("hourly", "full")
-        "24h-Pattern Based"
+        "Hourly-Precise (full period)"
         >>> get_calculation_method_label("average", "badge")
         "📊 Average"
     """
     if method == "hourly":
         if format_type == "full":
-            return "24h-Pattern Based"
+            return "Hourly-Precise (full period)"
         elif format_type == "badge":
             return "🔍 Hourly"
         else:  # short
@@ -233,10 +233,10 @@ PERIOD_LABELS = {
 
 CALCULATION_METHODS = {
     "hourly": {
-        "full": "24h-Pattern Based",
+        "full": "Hourly-Precise (full period)",
         "short": "Hourly",
         "badge": "🔍 Hourly",
-        "description": "Uses 24h carbon intensity patterns scaled to analysis period"
+        "description": "Hour-by-hour CPU, carbon intensity and runtime over the whole analysis period"
     },
     "average": {
         "full": "Average Runtime Based",
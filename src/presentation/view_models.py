@@ -0,0 +1,425 @@
+"""
+View models for the dashboard pages.
+
+Streamlit reruns the whole script on every widget interaction. Everything
+the pages derive from a ``DashboardData`` (the columnar instance frame, status
+tables, the binned fleet CO2 heatmap, totals and quality counts) is built once by ``build_view_model()``
+and memoized with ``st.cache_data`` under ``dashboard_fingerprint()``, so
+selecting an instance or switching pages reuses the prepared DataFrames.
+``query_instance_frame()`` filters, sorts and pages the instance frame so only
+the visible rows reach the browser. Published snapshots are never
+mutated (see ``src.application.snapshots``), so the fingerprint only needs
+to distinguish one refresh result from another.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import weakref
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from src.domain.constants import UIConstants
+from src.domain.models import DashboardData, EC2Instance
+from src.domain.validation import get_data_quality_score, validate_dashboard_data
+from src.presentation.utils import bin_matrix
+
+# Number of dashboard results (periods × refreshes) kept per process
+VIEW_MODEL_CACHE_ENTRIES = 8
+
+# id(DashboardData) → (weak reference, fingerprint); snapshots are immutable, so one hash per object suffices
+_FINGERPRINTS: Dict[int, Tuple[weakref.ref, str]] = {}
+_FINGERPRINTS_LOCK = threading.Lock()
+
+INSTANCE_COLUMNS = (
+    "instance_id",
+    "name",
+    "type",
+    "state",
+    "runtime_hours",
+    "cpu_percent",
+    "power_kw",
+    "grid_intensity",
+    "co2_kg",
+    "cost_eur",
+    "data_quality",
+    "hourly",
+)
+
+QUALITY_BADGES = {
+    "measured": "🟢 Measured",
+    "partial": "🟡 Partial",
+    "limited": "🔴 Limited",
+}
+
+# Standardized API service names and roles
+API_ROLES = {
+    "ElectricityMaps": "Grid carbon intensity (1 h cache)",
+    "Boavizta": "Power models (7 day cache)",
+    "AWS Pricing": "Instance pricing (7 day cache)",
+    "AWS Cost Explorer": "Aggregated cost comparison (24 h cache)",
+    "AWS CloudWatch": "CPU utilisation (1 h cache)",
+    "AWS CloudTrail": "Instance-specific runtime (3 h cache)",
+}
+
+# Normalize service names to standard format
+API_DISPLAY_LABELS = {
+    "CloudWatch": "AWS CloudWatch",
+    "CloudTrail": "AWS CloudTrail",
+    "Aws Cloudwatch": "AWS CloudWatch",
+    "Aws Cloudtrail": "AWS CloudTrail",
+    "AWS Cloudwatch": "AWS CloudWatch",
+    "AWS Cloudtrail": "AWS CloudTrail",
+}
+
+
+@dataclass(frozen=True)
+class FleetHeatmap:
+    """Binned instances × hours CO2 matrix (see ``build_fleet_heatmap``)."""
+
+    values: np.ndarray
+    """Mean CO2 g per instance-hour of every block (rows = instance blocks, columns = hour blocks)"""
+    hour_starts: np.ndarray
+    """First hour (UTC ``datetime64``) of every column block"""
+    row_labels: Tuple[str, ...]
+    instances: int
+    hours: int
+
+
+@dataclass(frozen=True)
+class DashboardViewModel:
+    """Display-ready values derived from one ``DashboardData``."""
+
+    period_days: int
+    instance_count: int
+    running_instances: int
+    instance_types: int
+    total_power_watts: float
+    total_cost_eur: float
+    """Sum of instance average-based costs (table summary)"""
+    total_co2_kg: float
+    """Sum of instance average-based CO2 (table summary)"""
+    apis_online: int
+    apis_total: int
+    instance_frame: pd.DataFrame
+    """Columnar instance table (see ``build_instance_frame``)"""
+    api_status_table: pd.DataFrame
+    runtime_coverage: int
+    pricing_coverage: int
+    measured_quality: int
+    quality_score: Optional[float]
+    validation: Dict[str, Any]
+    co2_heatmap: Optional[FleetHeatmap] = None
+
+    @property
+    def avg_cost_per_instance(self) -> float:
+        return self.total_cost_eur / self.instance_count if self.instance_count else 0.0
+
+
+def dashboard_fingerprint(dashboard_data: DashboardData) -> str:
+    """Content hash distinguishing refresh results (period, freshness, totals and per-instance values)."""
+    key = id(dashboard_data)
+    with _FINGERPRINTS_LOCK:
+        entry = _FINGERPRINTS.get(key)
+    if entry is not None and entry[0]() is dashboard_data:
+        return entry[1]
+
+    fingerprint = _content_fingerprint(dashboard_data)
+    with _FINGERPRINTS_LOCK:
+        _FINGERPRINTS[key] = (weakref.ref(dashboard_data, lambda _: _FINGERPRINTS.pop(key, None)), fingerprint)
+    return fingerprint
+
+
+def _content_fingerprint(dashboard_data: DashboardData) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(
+        repr(
+            (
+                dashboard_data.analysis_period_days,
+                dashboard_data.data_freshness,
+                dashboard_data.total_cost_average,
+                dashboard_data.total_co2_average,
+                dashboard_data.total_cost_hourly,
+                dashboard_data.total_co2_hourly,
+                dashboard_data.carbon_intensity.value if dashboard_data.carbon_intensity else None,
+                sorted(
+                    (name, getattr(status, "status", None), getattr(status, "last_check", None))
+                    for name, status in (dashboard_data.api_health_status or {}).items()
+                ),
+            )
+        ).encode()
+    )
+    for instance in dashboard_data.instances:
+        digest.update(
+            repr(
+                (
+                    instance.instance_id,
+                    instance.state,
+                    instance.runtime_hours,
+                    instance.cpu_utilization,
+                    instance.power_watts,
+                    instance.cost_eur_average,
+                    instance.co2_kg_average,
+                    instance.co2_kg_hourly,
+                    instance.co2_calculation_method,
+                    instance.data_quality,
+                )
+            ).encode()
+        )
+    return digest.hexdigest()
+
+
+def build_instance_frame(instances: Sequence[EC2Instance], grid_intensity: Optional[float] = None) -> pd.DataFrame:
+    """
+    Columnar instance table with numeric columns kept numeric.
+
+    Missing measurements stay ``NaN`` (NO-FALLBACK transparency); units and
+    number formats are applied by the table's column config, not per cell.
+
+    Args:
+        instances: Enriched instances
+        grid_intensity: Current grid carbon intensity (g CO₂/kWh)
+
+    Returns:
+        DataFrame with one row per instance and the columns of ``INSTANCE_COLUMNS``
+    """
+
+    def _numbers(attribute: str) -> np.ndarray:
+        return np.array(
+            [value if (value := getattr(instance, attribute, None)) is not None else np.nan for instance in instances],
+            dtype=np.float64,
+        )
+
+    quality = [(getattr(instance, "data_quality", None) or "limited").lower() for instance in instances]
+    frame = pd.DataFrame(
+        {
+            "instance_id": [instance.instance_id for instance in instances],
+            "name": [instance.instance_name or "Unnamed" for instance in instances],
+            "type": pd.Categorical([instance.instance_type for instance in instances]),
+            "state": pd.Categorical([instance.state.title() for instance in instances]),
+            "runtime_hours": _numbers("runtime_hours"),
+            "cpu_percent": _numbers("cpu_utilization"),
+            "power_kw": _numbers("power_watts") / 1000.0,
+            "grid_intensity": np.full(len(instances), grid_intensity if grid_intensity else np.nan),
+            "co2_kg": _numbers("co2_kg_average"),
+            "cost_eur": _numbers("cost_eur_average"),
+            "data_quality": pd.Categorical([QUALITY_BADGES.get(value, QUALITY_BADGES["limited"]) for value in quality]),
+            "hourly": [
+                instance.co2_calculation_method == "hourly" and instance.hourly_co2_breakdown is not None
+                for instance in instances
+            ],
+        },
+        columns=list(INSTANCE_COLUMNS),
+    )
+    return frame
+
+
+@dataclass(frozen=True)
+class InstancePage:
+    """Visible slice of a filtered and sorted instance frame."""
+
+    rows: pd.DataFrame
+    matching: int
+    page: int
+    page_count: int
+
+
+def query_instance_frame(
+    frame: pd.DataFrame,
+    *,
+    search: str = "",
+    states: Sequence[str] = (),
+    types: Sequence[str] = (),
+    hourly_only: bool = False,
+    sort_by: Optional[str] = None,
+    descending: bool = False,
+    page: int = 1,
+    page_size: int = 50,
+) -> InstancePage:
+    """
+    Filter, sort and page the instance frame server-side.
+
+    Only the rows of the requested page are copied; the full frame is never
+    formatted or sent to the browser.
+
+    Args:
+        frame: Frame from ``build_instance_frame``
+        search: Case-insensitive substring of instance name or id
+        states / types: Keep only these values (empty keeps all)
+        hourly_only: Keep only instances with an hourly breakdown
+        sort_by: Column to sort by (missing values last)
+        descending: Sort order
+        page: 1-based page number (clamped to the available pages)
+        page_size: Rows per page
+    """
+    mask = np.ones(len(frame), dtype=bool)
+    needle = search.strip().lower()
+    if needle:
+        mask &= (
+            frame["name"].str.lower().str.contains(needle, regex=False).to_numpy()
+            | frame["instance_id"].str.lower().str.contains(needle, regex=False).to_numpy()
+        )
+    if states:
+        mask &= frame["state"].isin(states).to_numpy()
+    if types:
+        mask &= frame["type"].isin(types).to_numpy()
+    if hourly_only:
+        mask &= frame["hourly"].to_numpy(dtype=bool)
+
+    positions = np.flatnonzero(mask)
+    if sort_by is not None and sort_by in frame.columns and positions.size:
+        column = frame[sort_by].iloc[positions]
+        order = column.sort_values(ascending=not descending, na_position="last", kind="stable").index
+        positions = frame.index.get_indexer(order)
+
+    page_size = max(int(page_size), 1)
+    page_count = max(-(-positions.size // page_size), 1)
+    page = min(max(int(page), 1), page_count)
+    visible = positions[(page - 1) * page_size : page * page_size]
+    return InstancePage(rows=frame.iloc[visible], matching=int(positions.size), page=page, page_count=page_count)
+
+
+def build_fleet_heatmap(
+    instances: Sequence[EC2Instance],
+    *,
+    max_rows: int = UIConstants.HEATMAP_MAX_ROWS,
+    max_columns: int = UIConstants.HEATMAP_MAX_COLUMNS,
+) -> Optional[FleetHeatmap]:
+    """
+    Instances × hours CO2 of every instance with an hourly breakdown, binned for display.
+
+    Rows are ordered by period CO2 (highest first) and aggregated into at most
+    ``max_rows`` instance blocks and ``max_columns`` hour blocks, so the
+    heatmap payload is bounded for any fleet size and period.
+    """
+    breakdowns = [
+        (instance, instance.hourly_co2_breakdown)
+        for instance in instances
+        if instance.co2_calculation_method == "hourly" and instance.hourly_co2_breakdown is not None
+    ]
+    if not breakdowns:
+        return None
+
+    axis = max((breakdown.timestamps for _, breakdown in breakdowns), key=len)
+    matrix = np.full((len(breakdowns), len(axis)), np.nan)
+    for row, (_, breakdown) in enumerate(breakdowns):
+        timestamps = breakdown.timestamps
+        if len(timestamps) == len(axis) and timestamps[0] == axis[0]:
+            matrix[row] = breakdown.co2_g
+            continue
+        positions = np.searchsorted(axis, timestamps)
+        inside = positions < len(axis)
+        inside[inside] = axis[positions[inside]] == timestamps[inside]
+        matrix[row, positions[inside]] = np.asarray(breakdown.co2_g)[inside]
+
+    order = np.argsort(-np.nansum(matrix, axis=1), kind="stable")
+    binned, row_starts, column_starts = bin_matrix(matrix[order], max_rows, max_columns)
+    row_size = int(row_starts[1] - row_starts[0]) if len(row_starts) > 1 else len(breakdowns)
+    if row_size == 1:
+        labels = tuple(breakdowns[index][0].instance_name or breakdowns[index][0].instance_id for index in order)
+    else:
+        labels = tuple(f"#{start + 1}–#{min(start + row_size, len(breakdowns))}" for start in row_starts)
+    return FleetHeatmap(
+        values=binned,
+        hour_starts=np.asarray(axis)[column_starts],
+        row_labels=labels,
+        instances=len(breakdowns),
+        hours=len(axis),
+    )
+
+
+def _format_local(timestamp: Any, zone: ZoneInfo, *, relative_after_hours: Optional[float] = None) -> str:
+    """Format an API timestamp in the dashboard time zone ("–" if missing)."""
+    if timestamp is None:
+        return "–"
+    try:
+        localized = timestamp.astimezone(zone) if getattr(timestamp, "tzinfo", None) is not None else timestamp.replace(tzinfo=zone)
+        if relative_after_hours is not None:
+            # Show relative age if older than the threshold, else absolute time
+            age_hours = (datetime.now(timezone.utc) - localized.astimezone(timezone.utc)).total_seconds() / 3600
+            if age_hours > relative_after_hours:
+                return f"{age_hours:.0f}h ago"
+        return localized.strftime("%d.%m.%Y %H:%M")
+    except Exception:  # pragma: no cover - defensive formatting
+        return str(timestamp)
+
+
+def build_api_status_table(api_health: Optional[Dict[str, Any]]) -> pd.DataFrame:
+    """Service, status, last check/API call and role per monitored API."""
+    berlin_tz = ZoneInfo("Europe/Berlin")
+    rows: list[dict[str, str]] = []
+    for service, status in sorted((api_health or {}).items()):
+        label = API_DISPLAY_LABELS.get(service, service.replace("_", " "))
+        state = getattr(status, "status", "unknown").replace("_", " ").title()
+        icon = "🟢" if getattr(status, "healthy", False) else ("🟡" if state.lower() == "degraded" else "🔴")
+        rows.append(
+            {
+                "Service": label,
+                "Status": f"{icon} {state}",
+                "Last check": _format_local(getattr(status, "last_check", None), berlin_tz, relative_after_hours=24),
+                "Last API call": _format_local(getattr(status, "last_api_call", None), berlin_tz),
+                "Role": API_ROLES.get(service, API_ROLES.get(label, "Monitoring service")),
+            }
+        )
+    return pd.DataFrame(rows, columns=["Service", "Status", "Last check", "Last API call", "Role"])
+
+
+def build_view_model(dashboard_data: DashboardData) -> DashboardViewModel:
+    """Derive every table and total the pages display from ``dashboard_data``."""
+    instances = dashboard_data.instances or []
+    period_days = getattr(dashboard_data, "analysis_period_days", 30)
+    grid_intensity = dashboard_data.carbon_intensity.value if dashboard_data.carbon_intensity else None
+    api_health = dashboard_data.api_health_status or {}
+
+    return DashboardViewModel(
+        period_days=period_days,
+        instance_count=len(instances),
+        running_instances=sum(1 for instance in instances if instance.state == "running"),
+        instance_types=len({instance.instance_type for instance in instances}),
+        total_power_watts=float(sum(instance.power_watts for instance in instances if instance.power_watts is not None)),
+        total_cost_eur=float(sum(instance.cost_eur_average or 0 for instance in instances)),
+        total_co2_kg=float(sum(instance.co2_kg_average or 0 for instance in instances)),
+        apis_online=sum(1 for status in api_health.values() if getattr(status, "healthy", False)),
+        apis_total=len(api_health),
+        instance_frame=build_instance_frame(instances, grid_intensity),
+        api_status_table=build_api_status_table(api_health),
+        runtime_coverage=sum(1 for instance in instances if getattr(instance, "runtime_hours", None) is not None),
+        pricing_coverage=sum(1 for instance in instances if getattr(instance, "hourly_price_usd", None)),
+        measured_quality=sum(1 for instance in instances if getattr(instance, "data_quality", "") == "measured"),
+        quality_score=get_data_quality_score(instances) if instances else None,
+        validation=validate_dashboard_data(instances) if instances else {},
+        co2_heatmap=build_fleet_heatmap(instances),
+    )
+
+
+@st.cache_data(max_entries=VIEW_MODEL_CACHE_ENTRIES, show_spinner=False)
+def _cached_view_model(fingerprint: str, _dashboard_data: DashboardData) -> DashboardViewModel:
+    # ``_dashboard_data`` is excluded from Streamlit's argument hashing; the fingerprint is the key
+    return build_view_model(_dashboard_data)
+
+
+def get_view_model(dashboard_data: DashboardData) -> DashboardViewModel:
+    """View model of ``dashboard_data``, built once per fingerprint and reused across reruns and sessions."""
+    return _cached_view_model(dashboard_fingerprint(dashboard_data), dashboard_data)
+
+
+__all__ = [
+    "DashboardViewModel",
+    "FleetHeatmap",
+    "INSTANCE_COLUMNS",
+    "InstancePage",
+    "build_api_status_table",
+    "build_fleet_heatmap",
+    "build_instance_frame",
+    "build_view_model",
+    "dashboard_fingerprint",
+    "get_view_model",
+    "query_instance_frame",
+]
@@ -0,0 +1,46 @@
+"""
+Smoke tests for the synthetic fleet benchmark harness
+"""
+
+import unittest
+
+from benchmarks.run import run_size
+from benchmarks.synthetic import SyntheticFleet, create_synthetic_gateway
+
+
+class TestSyntheticBenchmark(unittest.TestCase):
+    """The harness drives the full orchestrator path offline and deterministically"""
+
+    def test_fleet_is_deterministic(self):
+        first = SyntheticFleet(20, seed=7)
+        second = SyntheticFleet(20, seed=7, now=first.now)
+
+        self.assertEqual(list(first.instances.values()), list(second.instances.values()))
+        self.assertEqual({i.runtime_pattern for i in first.instances.values()} - {"always_on", "office_hours", "churn"}, set())
+
+    def test_gateway_emits_cloudtrail_churn(self):
+        gateway = create_synthetic_gateway(30, seed=3)
+        churn = next(i for i in gateway.fleet.instances.values() if i.runtime_pattern == "churn")
+
+        events = gateway.lookup_instance_events(
+            instance_id=churn.instance_id,
+            region="eu-central-1",
+            lookup_start=gateway.fleet.history_start,
+            lookup_end=gateway.fleet.now,
+        )
+
+        self.assertTrue(any(event["EventName"] == "StopInstances" for event in events))
+
+    def test_run_size_records_stages(self):
+        result = run_size(5, period_days=1)
+
+        self.assertEqual(result["cold"]["instances_processed"], 5)
+        self.assertEqual(result["warm"]["instances_processed"], 5)
+        self.assertEqual(result["cold"]["stages"]["enrich"]["calls"], 5)
+        self.assertIn("enrich.cpu_hourly", result["cold"]["stages"])
+        self.assertGreater(result["cold"]["wall_seconds"], 0.0)
+        self.assertEqual(result["gateway_calls"]["list_instances"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
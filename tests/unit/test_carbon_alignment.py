@@ -0,0 +1,206 @@
+"""
+Unit Tests for hourly carbon intensity alignment
+"""
+
+import asyncio
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import httpx
+import numpy as np
+
+from src.domain.alignment import align_carbon_intensity_hourly, bucket_local_series
+from src.domain.services import CarbonDataService
+from src.infrastructure.cache import FileCacheRepository
+from src.infrastructure.gateways.electricity import PAST_RANGE_CHUNK, ElectricityClient
+from src.infrastructure.timeseries_store import ColumnarTimeSeriesStore
+
+WINDOW_START = datetime(2025, 10, 28, 0, 0, tzinfo=timezone.utc)
+
+
+def _entry(hour_offset, value, minutes=0):
+    timestamp = WINDOW_START + timedelta(hours=hour_offset, minutes=minutes)
+    return {"datetime": timestamp.isoformat().replace("+00:00", "Z"), "carbonIntensity": value}
+
+
+class TestCarbonAlignment(unittest.TestCase):
+    """Bucketing, interpolation and edge cases"""
+
+    def test_complete_history_maps_one_to_one(self):
+        """One entry per hour lands in its own slot"""
+        history = [_entry(hour, 200 + hour) for hour in range(24)]
+        result = align_carbon_intensity_hourly(history, 24, window_start=WINDOW_START)
+        np.testing.assert_allclose(result, [200 + hour for hour in range(24)])
+
+    def test_gaps_are_interpolated(self):
+        """Missing hours are filled linearly, edges held constant"""
+        history = [_entry(1, 100), _entry(4, 400)]
+        result = align_carbon_intensity_hourly(history, 6, window_start=WINDOW_START)
+        np.testing.assert_allclose(result, [100, 100, 200, 300, 400, 400])
+
+    def test_first_entry_in_hour_wins(self):
+        """Several entries in one hour keep the earliest, regardless of input order"""
+        history = [_entry(0, 300, minutes=45), _entry(0, 250, minutes=5)]
+        result = align_carbon_intensity_hourly(history, 1, window_start=WINDOW_START)
+        self.assertEqual(result[0], 250)
+
+    def test_self_collected_format_and_invalid_entries(self):
+        """hour_key/value entries are accepted, broken ones skipped"""
+        history = [
+            {"hour_key": WINDOW_START.isoformat(), "value": 123},
+            {"datetime": "not-a-date", "carbonIntensity": 999},
+            {"datetime": None, "carbonIntensity": 1},
+        ]
+        result = align_carbon_intensity_hourly(history, 3, window_start=WINDOW_START)
+        np.testing.assert_allclose(result, [123, 123, 123])
+
+    def test_empty_history_returns_zeros(self):
+        """No usable data → zeros"""
+        np.testing.assert_array_equal(align_carbon_intensity_hourly([], 4), np.zeros(4))
+        np.testing.assert_array_equal(align_carbon_intensity_hourly(None, 4), np.zeros(4))
+
+    def test_result_is_read_only(self):
+        """The shared vector cannot be mutated by one instance"""
+        result = align_carbon_intensity_hourly([_entry(0, 100)], 2, window_start=WINDOW_START)
+        with self.assertRaises(ValueError):
+            result[0] = 1.0
+
+
+class TestTimeSeriesBuild(unittest.TestCase):
+    """Vectorized cost/carbon time series built on the columnar store"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        repository = FileCacheRepository(Path(self._tmp.name))
+        # Fixed 2025 timestamps would fall outside the default retention period
+        store = ColumnarTimeSeriesStore(repository, "timeseries/cost_carbon", retention_days=None)
+        self.service = CarbonDataService(repository=repository, gateway=Mock(), time_series_store=store)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    @staticmethod
+    def _costs(first_hour, hours):
+        return [
+            {"timestamp": (WINDOW_START + timedelta(hours=hour)).isoformat().replace("+00:00", "Z"), "cost_eur": 0.1 * hour}
+            for hour in range(first_hour, first_hour + hours)
+        ]
+
+    def test_buckets_match_local_hour_normalisation(self):
+        """Slots equal the per-entry local-time flooring; the last entry per slot wins"""
+        entries = [_entry(hour, 100 + hour, minutes=20) for hour in range(30)] + [_entry(3, 999, minutes=50)]
+        series = bucket_local_series(entries, ("datetime",), ("carbonIntensity",))
+
+        expected = {}
+        for entry in entries:
+            ts = datetime.fromisoformat(entry["datetime"].replace("Z", "+00:00"))
+            expected[ts.astimezone().replace(minute=0, second=0, microsecond=0, tzinfo=None)] = float(entry["carbonIntensity"])
+        self.assertEqual(dict(zip(series.index.to_pydatetime(), series.tolist())), expected)
+        self.assertIn(999.0, series.tolist())
+
+    def test_daily_resolution_buckets_local_days(self):
+        """Coarser resolutions bucket into local days"""
+        series = bucket_local_series(self._costs(0, 72), ("timestamp",), ("cost_eur",), resolution=timedelta(days=1))
+        self.assertTrue(all(slot.hour == 0 and slot.minute == 0 for slot in series.index))
+        self.assertLessEqual(len(series), 4)
+
+    def test_series_is_aligned_and_only_new_rows_are_persisted(self):
+        history = [_entry(hour, 200.0 if hour % 2 else 400.0) for hour in range(48)]
+        first = self.service.build_time_series(self._costs(0, 24), history, 720.0, window_start=WINDOW_START)
+
+        self.assertEqual(len(first), 24)
+        self.assertEqual(first[1].cost_eur_per_hour, 0.1)
+        self.assertEqual(first[0].carbon_intensity, 400.0)
+        # 720 kg over HOURS_PER_MONTH, scaled by intensity relative to the window average of 300
+        self.assertGreater(first[0].co2_kg_per_hour, first[1].co2_kg_per_hour)
+        self.assertAlmostEqual(first[0].co2_kg_per_hour / first[1].co2_kg_per_hour, 2.0, places=4)
+
+        self.service.build_time_series(self._costs(12, 24), history, 720.0, window_start=WINDOW_START)
+
+        cached = self.service.get_cached_time_series()
+        self.assertEqual(len(cached), 36)
+        self.assertEqual([point.timestamp for point in cached[:24]], [point.timestamp for point in first])
+        self.assertEqual(len(self.service.get_cached_time_series(cached[30].timestamp)), 6)
+
+    def test_rollup_view_of_built_series(self):
+        points = self.service.build_time_series(self._costs(0, 48), None, 0.0, window_start=WINDOW_START)
+
+        rollup = self.service.get_time_series_rollup(resolution="day")
+
+        self.assertEqual(rollup.resolution, "day")
+        self.assertAlmostEqual(
+            float(rollup.stat("cost_eur_per_hour", "sum").sum()), sum(point.cost_eur_per_hour for point in points)
+        )
+        self.assertEqual(self.service.get_time_series_rollup().resolution, "hour")
+
+    def test_window_end_and_empty_costs(self):
+        points = self.service.build_time_series(
+            self._costs(0, 24), None, 0.0, window_start=WINDOW_START, window_end=WINDOW_START + timedelta(hours=6)
+        )
+        self.assertEqual(len(points), 6)
+        self.assertTrue(all(point.co2_kg_per_hour == 0.0 and point.carbon_intensity is None for point in points))
+        self.assertEqual(len(self.service.build_time_series([], None, 0.0, window_start=WINDOW_START)), 6)
+
+
+# Three complete /past-range chunks: unreadable body, JSON without a data object, valid history
+RANGE_START = datetime(1970, 1, 1, tzinfo=timezone.utc) + PAST_RANGE_CHUNK * 2000
+
+
+def _past_range_transport(request):
+    chunk = (datetime.fromisoformat(request.url.params["start"]) - RANGE_START) // PAST_RANGE_CHUNK
+    if chunk == 0:
+        return httpx.Response(200, content=b"<html>maintenance</html>")
+    if chunk == 1:
+        return httpx.Response(200, json=[1, 2])
+    chunk_start = RANGE_START + PAST_RANGE_CHUNK * chunk
+    history = [
+        {"datetime": (chunk_start + timedelta(hours=hour)).isoformat(), "carbonIntensity": 300.0}
+        for hour in range(PAST_RANGE_CHUNK // timedelta(hours=1))
+    ]
+    return httpx.Response(200, json={"data": history})
+
+
+class TestPastRangeHistory(unittest.TestCase):
+    """A malformed chunk is dropped without failing the other chunks"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.repository = FileCacheRepository(Path(self._tmp.name))
+        self.client = ElectricityClient(repository=self.repository, api_key="test")
+        async_client = httpx.AsyncClient
+        self._patch = patch.object(
+            httpx,
+            "AsyncClient",
+            lambda **kwargs: async_client(transport=httpx.MockTransport(_past_range_transport), **kwargs),
+        )
+        self._patch.start()
+
+    def tearDown(self):
+        self._patch.stop()
+        self._tmp.cleanup()
+
+    def _fetch(self):
+        return self.client.get_carbon_intensity_range(
+            "eu-central-1", {"eu-central-1": "DE"}, RANGE_START, RANGE_START + PAST_RANGE_CHUNK * 3
+        )
+
+    def test_malformed_chunks_are_skipped(self):
+        history = self._fetch()
+
+        self.assertEqual(len(history), 240)
+        self.assertEqual(history[0]["datetime"], (RANGE_START + PAST_RANGE_CHUNK * 2).isoformat())
+        cached = sorted(path.name for path in self.repository.path("carbon_intensity_range", "x").parent.iterdir())
+        self.assertEqual(len(cached), 1)
+
+    def test_fetch_from_running_event_loop(self):
+        async def caller():
+            return self._fetch()
+
+        self.assertEqual(len(asyncio.run(caller())), 240)
+
+
+if __name__ == "__main__":
+    unittest.main()
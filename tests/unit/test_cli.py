@@ -0,0 +1,146 @@
+"""
+Unit Tests for the headless batch CLI
+"""
+
+import csv
+import json
+import logging
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.synthetic import create_synthetic_gateway
+from src.application.orchestrator import DashboardDataOrchestrator
+from src.config import settings
+from src.cli import (
+    EXIT_FAILED,
+    EXIT_OK,
+    EXIT_PARTIAL,
+    INSTANCE_COLUMNS,
+    BatchOptions,
+    create_orchestrator,
+    exit_code,
+    main,
+    run_batch,
+    run_job,
+)
+from src.domain.services import RuntimeServiceConfig, create_runtime_service
+from src.infrastructure.cache import FileCacheRepository
+
+
+class TestBatchCLI(unittest.TestCase):
+    """The CLI streams per-instance rows and job aggregates without Streamlit"""
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        self._tmp.cleanup()
+
+    def _factory(self, empty_regions=()):
+        def create(region):
+            repository = FileCacheRepository(self.root / "cache" / region)
+            gateway = create_synthetic_gateway(0 if region in empty_regions else 6, seed=5)
+            runtime_service = create_runtime_service(
+                RuntimeServiceConfig(region=region), repository=repository, gateway=gateway
+            )
+            return DashboardDataOrchestrator(
+                runtime_service=runtime_service, repository=repository, gateway=gateway, region=region
+            )
+
+        return create
+
+    def test_csv_report_per_job_and_summary(self):
+        options = BatchOptions(periods=(1, 7), regions=("eu-central-1",), fmt="csv", output_dir=self.root / "out", jobs=2)
+
+        results, summary_path = run_batch(options, orchestrator_factory=self._factory(), echo=lambda line: None)
+
+        self.assertEqual(exit_code(results), EXIT_OK)
+        with (self.root / "out" / "instances_eu-central-1_7d.csv").open(encoding="utf-8") as handle:
+            rows = list(csv.DictReader(handle))
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(list(rows[0].keys()), [name for name, _ in INSTANCE_COLUMNS])
+        self.assertEqual({row["region"] for row in rows}, {"eu-central-1"})
+
+        with summary_path.open(encoding="utf-8") as handle:
+            summary = list(csv.DictReader(handle))
+        self.assertEqual([(row["period_days"], row["status"], row["instances"]) for row in summary], [("1", "ok", "6"), ("7", "ok", "6")])
+        self.assertFalse(any(path.name.endswith(".tmp") for path in (self.root / "out").iterdir()))
+
+    def test_failed_region_is_partial_and_leaves_no_instance_file(self):
+        options = BatchOptions(periods=(1,), regions=("eu-central-1", "eu-west-1"), fmt="json", output_dir=self.root / "out")
+
+        results, summary_path = run_batch(
+            options, orchestrator_factory=self._factory(empty_regions={"eu-west-1"}), echo=lambda line: None
+        )
+
+        self.assertEqual(exit_code(results), EXIT_PARTIAL)
+        self.assertFalse((self.root / "out" / "instances_eu-west-1_1d.json").exists())
+        summary = json.loads(summary_path.read_text(encoding="utf-8"))
+        failed = next(row for row in summary if row["region"] == "eu-west-1")
+        self.assertEqual(failed["status"], "failed")
+        self.assertTrue(failed["error"])
+        self.assertEqual(len(json.loads((self.root / "out" / "instances_eu-central-1_1d.json").read_text())), 6)
+
+    def test_cli_orchestrator_does_not_persist_snapshots(self):
+        with patch.object(settings, "cache_root", self.root / "cache"), patch(
+            "src.infrastructure.gateways.create_default_gateway", return_value=create_synthetic_gateway(2, seed=5)
+        ):
+            orchestrator = create_orchestrator("eu-west-1")
+
+        self.assertIsNone(orchestrator.snapshot_store)
+        self.assertIsNone(orchestrator.load_snapshot(1))
+        # Carbon intensity and Cost Explorer follow the analysed region
+        self.assertEqual(orchestrator.fetch_use_case.region, "eu-west-1")
+
+    def test_carbon_and_costs_use_the_job_region(self):
+        orchestrator = self._factory()("eu-west-1")
+        gateway = orchestrator.gateway
+        with patch.object(
+            gateway, "get_current_carbon_intensity", wraps=gateway.get_current_carbon_intensity
+        ) as intensity, patch.object(gateway, "get_costs", wraps=gateway.get_costs) as costs:
+            orchestrator.get_infrastructure_data(period_days=7)
+
+        self.assertEqual({call.args[0] for call in intensity.call_args_list}, {"eu-west-1"})
+        self.assertEqual(costs.call_args.args[0], "eu-west-1")
+
+    def test_interrupted_job_leaves_no_temporary_file(self):
+        class InterruptedOrchestrator:
+            def iter_infrastructure_data(self, force_refresh=False, period_days=30):
+                raise KeyboardInterrupt
+                yield
+
+        output_dir = self.root / "out"
+        output_dir.mkdir()
+        with self.assertRaises(KeyboardInterrupt):
+            run_job(InterruptedOrchestrator(), "eu-central-1", 1, fmt="csv", output_dir=output_dir)
+
+        self.assertEqual(list(output_dir.iterdir()), [])
+
+    def test_exit_codes(self):
+        self.assertEqual(exit_code([]), EXIT_FAILED)
+        options = BatchOptions(periods=(1,), regions=("eu-west-1",), fmt="csv", output_dir=self.root / "out")
+        results, _ = run_batch(options, orchestrator_factory=self._factory(empty_regions={"eu-west-1"}), echo=lambda line: None)
+        self.assertEqual(exit_code(results), EXIT_FAILED)
+
+    def test_power_table_command(self):
+        with patch("src.cli.refresh_power_table", return_value=2) as refresh:
+            self.assertEqual(main(["power-table", "--types", "t3.micro", "m5.large"]), EXIT_OK)
+        refresh.assert_called_once_with(["t3.micro", "m5.large"])
+
+        with patch("src.cli.refresh_power_table", return_value=0):
+            self.assertEqual(main(["power-table"]), EXIT_FAILED)
+
+    def test_usage_errors_exit_with_2(self):
+        for argv in (["run", "--period", "14"], ["run", "--jobs", "0"], ["run", "--regions", "ap-south-1"], []):
+            with self.subTest(argv=argv), self.assertRaises(SystemExit) as raised:
+                main(argv)
+            self.assertEqual(raised.exception.code, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,10 +6,17 @@ Tests mathematical correctness of core calculation functions.
 
 import unittest
 from unittest.mock import patch
+
+import numpy as np
+
 from src.domain.calculations import (
     safe_round,
     calculate_simple_power_consumption,
+    calculate_power_consumption_vectorized,
     calculate_co2_emissions,
+    calculate_co2_hourly_precise,
+    calculate_co2_hourly_precise_batch,
+    calculate_co2_hourly_precise_vectorized,
 )
 
 
@@ -284,5 +291,113 @@ class TestCalculationIntegration(unittest.TestCase):
         self.assertAlmostEqual(ratio, 3.333, places=2)
 
 
+class TestVectorizedPowerConsumption(unittest.TestCase):
+    """Test the array form of the CPU→power model"""
+
+    def test_matches_scalar_model(self):
+        """Every element equals calculate_simple_power_consumption"""
+        base = np.array([0.0, 5.0, 15.0, 120.0])
+        cpu = np.array([[-10.0, 0.0, 37.5, 150.0]] * 4)
+        result = calculate_power_consumption_vectorized(base, cpu)
+
+        self.assertEqual(result.shape, (4, 4))
+        for row, base_power in enumerate(base):
+            for col, cpu_util in enumerate(cpu[row]):
+                self.assertAlmostEqual(
+                    result[row, col], calculate_simple_power_consumption(base_power, cpu_util), places=9
+                )
+
+    def test_nan_base_propagates(self):
+        """Unknown instance types (NaN base power) stay NaN"""
+        result = calculate_power_consumption_vectorized(np.array([np.nan, 10.0]), np.array([[50.0], [50.0]]))
+        self.assertTrue(np.isnan(result[0, 0]))
+        self.assertAlmostEqual(result[1, 0], 6.5)
+
+
+class TestHourlyPreciseVectorized(unittest.TestCase):
+    """Array form of the hourly-precise calculation"""
+
+    def test_matches_scalar_loop_on_complete_data(self):
+        """Totals and coverage equal calculate_co2_hourly_precise"""
+        from datetime import datetime, timedelta, timezone
+
+        rng = np.random.default_rng(3)
+        cpu = rng.uniform(0, 100, 24)
+        carbon = rng.uniform(100, 500, 24)
+        runtime = rng.choice([0.0, 0.5, 1.0], 24)
+        timestamps = [datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(hours=h) for h in range(24)]
+
+        scalar = calculate_co2_hourly_precise(15.0, cpu.tolist(), carbon.tolist(), runtime.tolist(), timestamps, 0.05)
+        vector = calculate_co2_hourly_precise_vectorized(15.0, cpu, carbon, runtime, 0.05)
+
+        self.assertAlmostEqual(vector["total_co2_kg"], scalar["total_co2_kg"], places=6)
+        self.assertAlmostEqual(vector["total_cost_eur"], scalar["total_cost_eur"], places=4)
+        self.assertEqual(vector["coverage_hours"], scalar["coverage_hours"])
+        self.assertEqual(vector["data_quality"], scalar["data_quality"])
+
+    def test_nan_hours_excluded_from_co2_but_not_cost(self):
+        """Missing CPU or carbon drops the hour from CO2 only"""
+        result = calculate_co2_hourly_precise_vectorized(
+            10.0, [100.0, np.nan, 100.0], [500.0, 500.0, np.nan], [1.0, 1.0, 1.0], 1.0, 1.0
+        )
+        self.assertAlmostEqual(result["total_co2_kg"], 0.005)
+        self.assertAlmostEqual(result["total_cost_eur"], 3.0)
+        self.assertEqual(result["coverage_hours"], 1)
+        self.assertAlmostEqual(result["runtime_coverage"], 1 / 3)
+
+
+class TestHourlyPreciseBatchProperties(unittest.TestCase):
+    """Randomised property tests: batch result equals the scalar loop per instance"""
+
+    def _timestamps(self, hours):
+        from datetime import datetime, timedelta, timezone
+
+        return [datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(hours=h) for h in range(hours)]
+
+    def test_batch_matches_scalar_per_instance(self):
+        """Totals, coverage and quality agree for random fleets"""
+        rng = np.random.default_rng(2025)
+        for _ in range(25):
+            instances = int(rng.integers(1, 12))
+            hours = 24
+            base = rng.uniform(0.0, 200.0, instances)
+            cpu = rng.uniform(-20.0, 130.0, (instances, hours))
+            carbon = rng.uniform(50.0, 700.0, hours)
+            runtime = rng.choice([0.0, 0.25, 0.5, 1.0], (instances, hours))
+            price = np.where(rng.random(instances) < 0.3, np.nan, rng.uniform(0.005, 2.0, instances))
+
+            batch = calculate_co2_hourly_precise_batch(base, cpu, carbon, runtime, price, 0.9)
+
+            for row in range(instances):
+                scalar = calculate_co2_hourly_precise(
+                    base[row],
+                    cpu[row].tolist(),
+                    carbon.tolist(),
+                    runtime[row].tolist(),
+                    self._timestamps(hours),
+                    None if np.isnan(price[row]) else float(price[row]),
+                    0.9,
+                )
+                self.assertAlmostEqual(batch["total_co2_kg"][row], scalar["total_co2_kg"], places=6)
+                self.assertAlmostEqual(batch["total_cost_eur"][row], scalar["total_cost_eur"], places=4)
+                self.assertEqual(batch["coverage_hours"][row], scalar["coverage_hours"])
+                self.assertEqual(batch["data_quality"][row], scalar["data_quality"])
+
+    def test_per_instance_carbon_matrix(self):
+        """A (N, H) carbon matrix is applied row by row"""
+        carbon = np.array([[100.0, 100.0], [400.0, 400.0]])
+        batch = calculate_co2_hourly_precise_batch([10.0, 10.0], np.full((2, 2), 100.0), carbon, np.ones((2, 2)))
+        np.testing.assert_allclose(batch["total_co2_kg"], [0.002, 0.008])
+
+    def test_zero_runtime_instance(self):
+        """Instances that never ran have zero totals and coverage"""
+        batch = calculate_co2_hourly_precise_batch([10.0], np.full((1, 24), 50.0), np.full(24, 300.0), np.zeros((1, 24)), [1.0])
+        self.assertEqual(batch["total_co2_kg"][0], 0.0)
+        self.assertEqual(batch["total_cost_eur"][0], 0.0)
+        self.assertEqual(batch["coverage_hours"][0], 0)
+        self.assertEqual(batch["runtime_coverage"][0], 0.0)
+        self.assertEqual(batch["data_quality"][0], "low")
+
+
 if __name__ == "__main__":
     unittest.main()
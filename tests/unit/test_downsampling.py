@@ -0,0 +1,105 @@
+"""
+Unit Tests for server-side chart decimation
+"""
+
+import unittest
+
+import numpy as np
+
+from src.domain.models import EC2Instance, HourlyBreakdown
+from src.presentation.utils import bin_matrix, lttb_indices, minmax_indices
+from src.presentation.view_models import build_fleet_heatmap
+
+
+def _lttb_reference(x, y, threshold):
+    """Reference LTTB following the original sequential description"""
+    count = len(y)
+    every = (count - 2) / (threshold - 2)
+    selected, previous = [0], 0
+    for bucket in range(threshold - 2):
+        start = int(np.floor(bucket * every)) + 1
+        end = int(np.floor((bucket + 1) * every)) + 1
+        next_start, next_end = end, min(int(np.floor((bucket + 2) * every)) + 1, count)
+        next_x, next_y = np.mean(x[next_start:next_end]), np.mean(y[next_start:next_end])
+        best, best_area = start, -1.0
+        for index in range(start, end):
+            area = abs((x[previous] - next_x) * (y[index] - y[previous]) - (x[previous] - x[index]) * (next_y - y[previous]))
+            if area > best_area:
+                best, best_area = index, area
+        selected.append(best)
+        previous = best
+    return selected + [count - 1]
+
+
+class TestDownsampling(unittest.TestCase):
+    """Decimated series stay bounded and keep shape and peaks"""
+
+    def test_lttb_matches_reference(self):
+        rng = np.random.default_rng(4)
+        x = np.arange(5000, dtype=float)
+        y = np.cumsum(rng.normal(size=5000))
+
+        selected = lttb_indices(x, y, 500)
+
+        self.assertEqual(len(selected), 500)
+        self.assertEqual(list(selected), _lttb_reference(x, y, 500))
+        np.testing.assert_array_equal(lttb_indices(x[:100], y[:100], 500), np.arange(100))
+
+    def test_lttb_accepts_datetimes(self):
+        x = np.datetime64("2025-06-01T00:00:00") + np.arange(720) * np.timedelta64(3600, "s")
+        y = np.sin(np.arange(720) / 12.0)
+
+        np.testing.assert_array_equal(lttb_indices(x, y, 100), lttb_indices(np.arange(720) * 3600.0, y, 100))
+
+    def test_minmax_keeps_peaks(self):
+        y = np.zeros(10_001)
+        y[1234], y[8765] = 50.0, -20.0
+
+        selected = minmax_indices(y, 200)
+
+        self.assertLessEqual(len(selected), 2 * 200 + 2)
+        self.assertIn(1234, selected)
+        self.assertIn(8765, selected)
+        self.assertEqual((selected[0], selected[-1]), (0, 10_000))
+
+    def test_bin_matrix_aggregates_blocks(self):
+        matrix = np.arange(35, dtype=float).reshape(5, 7)
+        matrix[0, 0] = np.nan
+
+        binned, row_starts, column_starts = bin_matrix(matrix, 2, 3)
+
+        self.assertEqual(binned.shape, (2, 3))
+        np.testing.assert_array_equal(row_starts, [0, 3])
+        np.testing.assert_array_equal(column_starts, [0, 3, 6])
+        self.assertAlmostEqual(binned[0, 0], np.nanmean(matrix[0:3, 0:3]))
+        self.assertAlmostEqual(binned[1, 2], matrix[3:5, 6].mean())
+        np.testing.assert_allclose(bin_matrix(matrix, 2, 3, reducer="sum")[0][1, 1], matrix[3:5, 3:6].sum())
+
+    def test_fleet_heatmap_is_bounded_and_sorted(self):
+        hours = 720
+        timestamps = np.datetime64("2025-06-01T00:00:00") + np.arange(hours) * np.timedelta64(3600, "s")
+
+        def instance(index, start=0):
+            length = hours - start
+            breakdown = HourlyBreakdown(
+                timestamps=timestamps[start:],
+                co2_g=np.full(length, float(index), dtype=np.float32),
+                power_watts=np.zeros(length, dtype=np.float32),
+                cpu_percent=np.zeros(length, dtype=np.float32),
+                carbon_intensity=np.zeros(length, dtype=np.float32),
+                runtime_fraction=np.ones(length, dtype=np.float32),
+                running=np.ones(length, dtype=bool),
+            )
+            return EC2Instance(f"i-{index}", "t3.micro", "running", "eu-central-1", co2_calculation_method="hourly", hourly_co2_breakdown=breakdown)
+
+        heatmap = build_fleet_heatmap([instance(index, start=index % 3) for index in range(500)], max_rows=50, max_columns=100)
+
+        self.assertEqual(heatmap.values.shape, (50, 90))
+        self.assertEqual((heatmap.instances, heatmap.hours), (500, 720))
+        self.assertEqual(heatmap.row_labels[0], "#1–#10")
+        self.assertAlmostEqual(heatmap.values[0, -1], np.mean(np.arange(490, 500)))
+        self.assertEqual(heatmap.hour_starts[1], timestamps[8])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,201 @@
+"""
+Unit Tests for fingerprint-based incremental re-enrichment
+"""
+
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+from src.application.use_cases import EnrichInstanceUseCase
+from src.domain.alignment import align_carbon_intensity_hourly
+from src.domain.models import EC2Instance, PowerConsumption
+from src.domain.services import RuntimeService
+from src.domain.timeline import hourly_analysis_window, slot_timestamps
+from src.infrastructure.cache import FileCacheRepository, atomic_write
+from src.infrastructure.enrichment_store import EnrichmentStore
+
+
+class TestIncrementalEnrichment(unittest.TestCase):
+    """Unchanged inputs reuse the stored instance; any change recomputes it"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.repository = FileCacheRepository(Path(self._tmp.name))
+        self.hours = 7 * 24
+        self.window_start, self.window_end = hourly_analysis_window(self.hours)
+        slots = slot_timestamps(self.window_start, self.hours)
+
+        self.gateway = Mock()
+        self.gateway.get_power_consumption.return_value = PowerConsumption(
+            avg_power_watts=10.0, min_power_watts=8.0, max_power_watts=12.0, confidence_level="high", source="test"
+        )
+        self.gateway.get_instance_pricing.return_value = 0.01
+        self.gateway.lookup_instance_events.return_value = []
+        self.gateway.get_cached_launch_time.return_value = None
+        self.gateway.fetch_cpu_metrics.return_value = [
+            {"Id": "cpu_utilization", "Values": [40.0] * self.hours, "Timestamps": slots}
+        ]
+
+        self.service = RuntimeService(repository=self.repository, gateway=self.gateway)
+        self.instance = {
+            "instance_id": "i-stable",
+            "instance_type": "t3.micro",
+            "state": "running",
+            "region": "eu-central-1",
+            "launch_time": datetime.now(timezone.utc) - timedelta(days=60),
+        }
+        history = [{"datetime": slot.isoformat(), "carbonIntensity": 250.0} for slot in slots]
+        self.carbon_hourly = align_carbon_intensity_hourly(history, self.hours, window_start=self.window_start)
+        self.reused = []
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _execute(self, use_case, *, instance=None, carbon_hourly=None, force_refresh=False):
+        result = use_case.execute(
+            instance or self.instance,
+            carbon_intensity=250.0,
+            carbon_hourly=self.carbon_hourly if carbon_hourly is None else carbon_hourly,
+            window_end=self.window_end,
+            force_refresh=force_refresh,
+            period_days=7,
+        )
+        self.reused.append(result.reused)
+        return result.instance
+
+    def test_unchanged_inputs_are_reused(self):
+        use_case = EnrichInstanceUseCase(self.service, store=EnrichmentStore(self.repository))
+        first = self._execute(use_case)
+        fetches = self.gateway.fetch_cpu_metrics.call_count
+
+        second = self._execute(use_case)
+
+        self.assertIs(second, first)
+        self.assertEqual(self.reused, [False, True])
+        self.assertEqual(self.gateway.fetch_cpu_metrics.call_count, fetches)
+
+    def test_reuse_survives_restart(self):
+        first = self._execute(EnrichInstanceUseCase(self.service, store=EnrichmentStore(self.repository)))
+
+        restarted = EnrichInstanceUseCase(self.service, store=EnrichmentStore(self.repository))
+        reused = self._execute(restarted)
+
+        self.assertEqual(self.reused, [False, True])
+        self.assertEqual(reused.co2_kg_hourly, first.co2_kg_hourly)
+        self.assertEqual(len(reused.hourly_co2_breakdown), self.hours)
+
+    def test_model_schema_change_disables_reuse(self):
+        self._execute(EnrichInstanceUseCase(self.service, store=EnrichmentStore(self.repository)))
+
+        with patch("src.infrastructure.enrichment_store.model_schema_digest", return_value="changed"):
+            self._execute(EnrichInstanceUseCase(self.service, store=EnrichmentStore(self.repository)))
+
+        self.assertEqual(self.reused, [False, False])
+
+    def test_changed_inputs_are_recomputed(self):
+        use_case = EnrichInstanceUseCase(self.service, store=EnrichmentStore(self.repository))
+        self._execute(use_case)
+
+        self._execute(use_case, instance={**self.instance, "state": "stopped"})
+        self._execute(use_case, carbon_hourly=self.carbon_hourly * 2)
+        self._execute(use_case, force_refresh=True)
+
+        self.assertEqual(self.reused, [False] * 4)
+
+    def test_power_model_and_price_changes_are_recomputed(self):
+        engine = Mock()
+        engine.power_matrix.side_effect = lambda types, cpu: np.asarray(cpu) * 0.1 + 5.0
+        service = RuntimeService(repository=self.repository, gateway=self.gateway, power_engine=engine)
+        use_case = EnrichInstanceUseCase(service, store=EnrichmentStore(self.repository))
+        self._execute(use_case)
+
+        # A refreshed power table changes the engine's model
+        engine.power_matrix.side_effect = lambda types, cpu: np.asarray(cpu) * 0.2 + 5.0
+        self._execute(use_case)
+        self.gateway.get_instance_pricing.return_value = 0.02
+        self._execute(use_case)
+        self.gateway.get_power_consumption.return_value = PowerConsumption(
+            avg_power_watts=11.0, min_power_watts=8.0, max_power_watts=12.0, confidence_level="high", source="test"
+        )
+        self._execute(use_case)
+        self.assertEqual(self.reused, [False] * 4)
+
+        self._execute(use_case)
+        self.assertTrue(self.reused[-1])
+
+    def test_expired_input_cache_disables_reuse(self):
+        use_case = EnrichInstanceUseCase(self.service, store=EnrichmentStore(self.repository))
+        self._execute(use_case)
+        self.repository.path("cpu_utilization_hourly", f"i-stable_{self.hours}h").unlink()
+
+        fingerprint = self.service.input_fingerprint(
+            self.instance,
+            carbon_intensity=250.0,
+            carbon_hourly=self.carbon_hourly,
+            window_end=self.window_end,
+            period_days=7,
+        )
+
+        self.assertIsNone(fingerprint)
+
+
+class TestConcurrentCacheWrites(unittest.TestCase):
+    """Writers sharing a cache root never leave torn files or temp files behind"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.repository = FileCacheRepository(Path(self._tmp.name))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_interleaved_writers_use_separate_temp_files(self):
+        path = self.repository.path("shared", "interleaved")
+        with atomic_write(path) as first:
+            first.write('{"writer": ')
+            with atomic_write(path) as second:
+                second.write('{"writer": 2}')
+            self.assertEqual(self.repository.read_json(path), {"writer": 2})
+            first.write("1}")
+
+        self.assertEqual(self.repository.read_json(path), {"writer": 1})
+        self.assertEqual(sorted(item.name for item in path.parent.iterdir()), [path.name])
+
+    def test_failed_write_keeps_previous_file(self):
+        path = self.repository.path("shared", "failing")
+        self.repository.write_json(path, {"version": 1})
+        with self.assertRaises(RuntimeError), atomic_write(path) as handle:
+            handle.write("{")
+            raise RuntimeError("interrupted")
+
+        self.assertEqual(self.repository.read_json(path), {"version": 1})
+        self.assertEqual(sorted(item.name for item in path.parent.iterdir()), [path.name])
+
+    def test_concurrent_json_and_enrichment_writes(self):
+        path = self.repository.path("shared", "payload")
+        payloads = [{"writer": index, "values": list(range(2000))} for index in range(8)]
+        stores = [EnrichmentStore(self.repository) for _ in range(8)]
+        instance = EC2Instance(instance_id="i-shared", instance_type="t3.micro", state="running", region="eu-central-1")
+
+        def write(index):
+            for _ in range(20):
+                self.repository.write_json(path, payloads[index])
+                stores[index].put(instance, f"fingerprint-{index}")
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(write, range(8)))
+
+        self.assertIn(self.repository.read_json(path), payloads)
+        fingerprints = {f"fingerprint-{index}" for index in range(8)}
+        self.assertTrue(any(EnrichmentStore(self.repository).get("i-shared", 30, fp) for fp in fingerprints))
+        leftovers = [item for item in Path(self._tmp.name).rglob("*") if item.name.endswith(".tmp")]
+        self.assertEqual(leftovers, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
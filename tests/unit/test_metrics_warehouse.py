@@ -0,0 +1,192 @@
+"""
+Unit Tests for the per-instance hourly metrics warehouse
+"""
+
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+from benchmarks.synthetic import create_synthetic_gateway
+from src.application.orchestrator import DashboardDataOrchestrator
+from src.config import settings
+from src.domain.models import EC2Instance, HourlyBreakdown
+from src.infrastructure.cache import FileCacheRepository
+from src.infrastructure.metrics_warehouse import MetricsWarehouse
+
+
+def _instance(instance_id, start, hours, *, co2_g=100.0, stopped=()):
+    first = np.datetime64(start.replace(tzinfo=None), "s")
+    timestamps = first + np.arange(hours) * np.timedelta64(3600, "s")
+    runtime = np.ones(hours, dtype=np.float32)
+    runtime[list(stopped)] = 0.0
+    running = runtime > 0
+    breakdown = HourlyBreakdown(
+        timestamps=timestamps,
+        co2_g=np.where(running, co2_g, 0.0).astype(np.float32),
+        power_watts=np.full(hours, 10.0, dtype=np.float32),
+        cpu_percent=np.full(hours, 40.0, dtype=np.float32),
+        carbon_intensity=np.full(hours, 300.0, dtype=np.float32),
+        runtime_fraction=runtime,
+        running=running,
+        cost_eur=np.where(running, 0.02, 0.0).astype(np.float32),
+    )
+    return EC2Instance(
+        instance_id=instance_id,
+        instance_type="t3.micro",
+        state="running",
+        region="eu-central-1",
+        hourly_co2_breakdown=breakdown,
+    )
+
+
+def _connect_with_parameter_limit(limit):
+    connect = sqlite3.connect
+
+    def limited(*args, **kwargs):
+        connection = connect(*args, **kwargs)
+        connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, limit)
+        return connection
+
+    return limited
+
+
+class TestMetricsWarehouse(unittest.TestCase):
+    """Upserts keyed by (instance_id, hour) accumulate history across refreshes"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.warehouse = MetricsWarehouse.for_repository(FileCacheRepository(Path(self._tmp.name)))
+        self.start = datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_only_running_hours_are_stored(self):
+        written = self.warehouse.record([_instance("i-a", self.start, 24, stopped=range(12, 24))])
+
+        hours = self.warehouse.instance_hours("i-a", self.start, self.start + timedelta(days=1))
+        self.assertEqual(written, 12)
+        self.assertEqual(hours["hour"][0], np.datetime64("2025-03-01T00:00:00"))
+        np.testing.assert_allclose(hours["co2_kg"], 0.1)
+        np.testing.assert_allclose(hours["cost_eur"], 0.02, rtol=1e-6)
+
+    def test_overlapping_refreshes_upsert_and_extend_history(self):
+        self.warehouse.record([_instance("i-a", self.start, 72)])
+        # Next refresh: window moved by a day, the last day revised
+        later = _instance("i-a", self.start + timedelta(days=1), 72, co2_g=200.0)
+        written = self.warehouse.record([later])
+
+        hours = self.warehouse.instance_hours("i-a", self.start, self.start + timedelta(days=4))
+        self.assertEqual(hours["hour"].size, 96)
+        # Settled hours are kept; the last 48 stored hours and the new day are rewritten
+        self.assertEqual(written, 48 + 24)
+        np.testing.assert_allclose(hours["co2_kg"][:24], 0.1)
+        np.testing.assert_allclose(hours["co2_kg"][24:], 0.2)
+
+    def test_missing_settled_hours_are_backfilled(self):
+        # Hours 10-19 had no CPU/carbon data (not running) in the first refresh
+        self.warehouse.record([_instance("i-a", self.start, 120, stopped=range(10, 20))])
+
+        written = self.warehouse.record([_instance("i-a", self.start, 120, co2_g=200.0)])
+
+        hours = self.warehouse.instance_hours("i-a", self.start, self.start + timedelta(days=5))
+        self.assertEqual(hours["hour"].size, 120)
+        # The ten missing settled hours plus the 48 settle hours, nothing else is rewritten
+        self.assertEqual(written, 10 + 48)
+        np.testing.assert_allclose(hours["co2_kg"][:10], 0.1)
+        np.testing.assert_allclose(hours["co2_kg"][10:20], 0.2)
+        np.testing.assert_allclose(hours["co2_kg"][20:72], 0.1)
+
+    def test_aggregate_queries(self):
+        self.warehouse.record([_instance("i-a", self.start, 48), _instance("i-b", self.start, 24, co2_g=500.0)])
+        end = self.start + timedelta(days=2)
+
+        totals = self.warehouse.totals(self.start, end)
+        self.assertEqual((totals["instances"], totals["hours"]), (2, 72))
+        self.assertAlmostEqual(totals["co2_kg"], 48 * 0.1 + 24 * 0.5, places=4)
+        self.assertAlmostEqual(totals["runtime_hours"], 72.0)
+        self.assertEqual(self.warehouse.totals(self.start, end, instance_ids=["i-b"])["hours"], 24)
+
+        # More ids than SQLite accepts as bound parameters in one statement (999 on older builds)
+        many = ["i-b", *(f"i-missing-{index}" for index in range(2000)), "i-a", "i-b"]
+        with patch("src.infrastructure.metrics_warehouse.sqlite3.connect", _connect_with_parameter_limit(999)):
+            chunked = self.warehouse.totals(self.start, end, instance_ids=many)
+        self.assertEqual((chunked["instances"], chunked["hours"]), (2, 72))
+        self.assertAlmostEqual(chunked["co2_kg"], totals["co2_kg"], places=6)
+        self.assertEqual(self.warehouse.totals(self.start, end, instance_ids=[])["hours"], 0)
+
+        daily = self.warehouse.daily_totals(self.start, end)
+        self.assertEqual([row["date"].day for row in daily], [1, 2])
+        self.assertEqual([row["instances"] for row in daily], [2, 1])
+
+        self.assertEqual([row["instance_id"] for row in self.warehouse.top_emitters(self.start, end)], ["i-b", "i-a"])
+        self.assertEqual(self.warehouse.month_to_date(now=end)["hours"], 72)
+        self.assertEqual(self.warehouse.coverage()["i-a"], (self.start, end))
+
+        self.assertEqual(self.warehouse.prune(self.start + timedelta(days=1)), 48)
+        self.assertEqual(self.warehouse.totals(self.start, end)["hours"], 24)
+
+
+class TestRefreshRecordsHistory(unittest.TestCase):
+    """A refresh records the running hours of every hourly-precise instance"""
+
+    def test_refresh_populates_warehouse(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            orchestrator = DashboardDataOrchestrator(
+                repository=FileCacheRepository(Path(tmp)), gateway=create_synthetic_gateway(4, seed=3)
+            )
+            data = orchestrator.get_infrastructure_data(period_days=1)
+            warehouse = orchestrator.fetch_use_case.warehouse
+
+            precise = {
+                instance.instance_id
+                for instance in data.instances
+                if instance.hourly_co2_breakdown is not None and instance.hourly_co2_breakdown.runtime_fraction.any()
+            }
+            self.assertTrue(precise)
+            self.assertEqual(set(warehouse.coverage()), precise)
+            self.assertIn("step_06b.record_history", data.refresh_trace.stages)
+
+            history = data.metrics_history
+            self.assertIsNotNone(history)
+            totals = warehouse.month_to_date()
+            self.assertAlmostEqual(history.month_to_date_co2_kg, totals["co2_kg"])
+            self.assertEqual(history.month_to_date_instances, totals["instances"])
+            self.assertTrue(history.daily)
+            self.assertIn("step_06c.history_summary", data.refresh_trace.stages)
+
+    def test_refresh_prunes_hours_outside_retention(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            orchestrator = DashboardDataOrchestrator(
+                repository=FileCacheRepository(Path(tmp)), gateway=create_synthetic_gateway(3, seed=3)
+            )
+            warehouse = orchestrator.fetch_use_case.warehouse
+            old = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0) - timedelta(days=500)
+            warehouse.record([_instance("i-old", old, 24)])
+
+            with patch.object(settings, "metrics_warehouse_retention_days", 400):
+                orchestrator.get_infrastructure_data(period_days=1)
+
+            self.assertNotIn("i-old", warehouse.coverage())
+
+    def test_unavailable_warehouse_does_not_break_refresh(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            # A file where the warehouse directory belongs makes opening the database fail
+            (Path(tmp) / "api_data").mkdir()
+            (Path(tmp) / "api_data" / "warehouse").write_text("not a directory")
+            repository = FileCacheRepository(Path(tmp))
+
+            orchestrator = DashboardDataOrchestrator(repository=repository, gateway=create_synthetic_gateway(3, seed=3))
+            data = orchestrator.get_infrastructure_data(period_days=1)
+
+            self.assertEqual(len(data.instances), 3)
+            self.assertIsNone(orchestrator.fetch_use_case.warehouse)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,13 +3,17 @@
 Updated for new Use Case architecture after Phase 3 refactoring.
 """
 
+import tempfile
 import unittest
 from unittest.mock import Mock, MagicMock
 from datetime import datetime
+from pathlib import Path
 
+from benchmarks.synthetic import create_synthetic_gateway
 from src.application.orchestrator import DashboardDataOrchestrator
 from src.domain.models import BusinessCase, CarbonIntensity, EC2Instance, DashboardData
 from src.domain.services import RuntimeService, CarbonDataService
+from src.infrastructure.cache import FileCacheRepository
 
 
 class TestDashboardDataOrchestrator(unittest.TestCase):
@@ -20,8 +24,15 @@ class TestDashboardDataOrchestrator(unittest.TestCase):
         runtime_mock = Mock(spec=RuntimeService)
         carbon_mock = Mock(spec=CarbonDataService)
 
+        # Keep snapshots and the metrics warehouse out of the real cache root
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.repository = FileCacheRepository(Path(self._tmp.name))
+
         # Initialize orchestrator with mocked services
-        self.processor = DashboardDataOrchestrator(runtime_service=runtime_mock, carbon_service=carbon_mock)
+        self.processor = DashboardDataOrchestrator(
+            runtime_service=runtime_mock, carbon_service=carbon_mock, repository=self.repository
+        )
 
         # Setup mock returns
         self.processor.carbon_service.get_self_collected_history.return_value = []
@@ -61,7 +72,7 @@ class TestDashboardDataOrchestrator(unittest.TestCase):
 
     def test_initialization(self) -> None:
         """Test orchestrator initializes with services and use cases."""
-        processor = DashboardDataOrchestrator()
+        processor = DashboardDataOrchestrator(repository=self.repository)
         self.assertIsInstance(processor.runtime_service, RuntimeService)
         self.assertIsInstance(processor.carbon_service, CarbonDataService)
         # Verify use cases exist
@@ -236,5 +247,47 @@ class TestDashboardDataOrchestrator(unittest.TestCase):
         self.assertIsInstance(result, DashboardData)
 
 
+class TestStreamingRefresh(unittest.TestCase):
+    """Streaming refresh yields per-instance progress and the same final data as the batch path."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.processor = DashboardDataOrchestrator(
+            repository=FileCacheRepository(Path(self._tmp.name)), gateway=create_synthetic_gateway(6, seed=5)
+        )
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_progress_then_complete_dashboard_data(self) -> None:
+        processed = []
+        final = None
+        for progress in self.processor.iter_infrastructure_data(period_days=1):
+            if progress.done:
+                final = progress
+            else:
+                processed.append(progress.processed)
+
+        self.assertEqual(processed, list(range(1, 7)))
+        data = final.dashboard_data
+        self.assertEqual(len(data.instances), 6)
+        self.assertTrue(data.api_health_status)
+        self.assertEqual(final.total_co2_average, data.total_co2_average)
+        self.assertEqual(final.hourly_precise_count + final.fallback_count, data.hourly_precise_count + data.fallback_count)
+
+        batch = self.processor.get_infrastructure_data(period_days=1)
+        self.assertAlmostEqual(batch.total_co2_hourly, data.total_co2_hourly, places=9)
+        self.assertAlmostEqual(batch.total_cost_average, data.total_cost_average, places=9)
+
+    def test_errors_end_stream_with_error_response(self) -> None:
+        self.processor.runtime_service.list_instances = Mock(return_value=[])
+
+        updates = list(self.processor.iter_infrastructure_data(period_days=1))
+
+        self.assertEqual(len(updates), 1)
+        self.assertTrue(updates[0].done)
+        self.assertEqual(updates[0].dashboard_data.instances, [])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,209 @@
+"""
+Unit Tests for the offline power model table and local power engine
+"""
+
+import asyncio
+import json
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import httpx
+import numpy as np
+
+from src.application.use_cases import FetchInfrastructureDataUseCase
+from src.domain.calculations import calculate_co2_hourly_precise_vectorized
+from src.domain.services import create_runtime_service
+from src.infrastructure.cache import FileCacheRepository
+from src.infrastructure.gateways import InfrastructureGateway
+from src.infrastructure.gateways.boavizta import BoaviztaClient
+from src.infrastructure.power_table import LocalPowerEngine, PowerModelEntry, PowerModelTable
+
+
+class TestPowerModelTable(unittest.TestCase):
+    """Persistence and lookup behaviour of PowerModelTable"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.repository = FileCacheRepository(Path(self._tmp.name))
+        self.table = PowerModelTable(self.repository)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_upsert_persists_and_reloads(self):
+        """Rows survive a reload from disk"""
+        written = self.table.upsert(
+            [PowerModelEntry("t3.micro", 4.0, 2.0, 8.0, vcpu=2, memory_gb=1.0)]
+        )
+        self.assertEqual(written, 1)
+
+        reloaded = PowerModelTable(self.repository)
+        self.assertIn("t3.micro", reloaded)
+        entry = reloaded.entry("t3.micro")
+        self.assertEqual(entry.vcpu, 2)
+        self.assertEqual(reloaded.get("t3.micro").avg_power_watts, 4.0)
+        self.assertIsNotNone(entry.updated_at)
+
+    def test_concurrent_upserts_keep_every_row(self):
+        """Upserts from threads and from a second table on the same file never drop rows"""
+        self.assertEqual(len(self.table), 0)
+        other = PowerModelTable(self.repository)
+        other.upsert([PowerModelEntry("c5.large", 15.0, 8.0, 30.0)])
+
+        def upsert(index):
+            self.table.upsert([PowerModelEntry(f"t3.type{index}", 4.0, 2.0, 8.0)])
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(upsert, range(16)))
+
+        reloaded = PowerModelTable(self.repository)
+        self.assertEqual(len(reloaded), 17)
+        self.assertIn("c5.large", self.table)
+
+    def test_power_arrays_mark_unknown_types_nan(self):
+        """Unknown instance types map to NaN"""
+        self.table.upsert([PowerModelEntry("m5.large", 20.0, 10.0, 40.0)])
+        avg, low, high = self.table.power_arrays(["m5.large", "x9.huge"])
+        self.assertEqual(avg[0], 20.0)
+        self.assertEqual(low[0], 10.0)
+        self.assertEqual(high[0], 40.0)
+        self.assertTrue(np.isnan(avg[1]))
+
+    def test_local_engine_power_matrix(self):
+        """Engine evaluates the linear model per instance row"""
+        self.table.upsert([PowerModelEntry("m5.large", 20.0, 10.0, 40.0)])
+        engine = LocalPowerEngine(self.table)
+        matrix = engine.power_matrix(["m5.large", "x9.huge"], np.array([[0.0, 100.0], [50.0, 50.0]]))
+        np.testing.assert_allclose(matrix[0], [6.0, 20.0])
+        self.assertTrue(np.isnan(matrix[1]).all())
+
+
+class TestBoaviztaClientPowerTable(unittest.TestCase):
+    """Boavizta client consults the offline table before the network"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.repository = FileCacheRepository(Path(self._tmp.name))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_table_hit_skips_network(self):
+        """A known instance type never triggers an HTTP request"""
+        client = BoaviztaClient(repository=self.repository)
+        client.power_table.upsert([PowerModelEntry("t3.small", 5.0, 3.0, 9.0)])
+
+        with patch.object(client, "_async_post") as post:
+            power = client.get_power_consumption("t3.small")
+
+        post.assert_not_called()
+        self.assertEqual(power.avg_power_watts, 5.0)
+
+    def test_network_result_is_added_to_table(self):
+        """A single on-demand lookup grows the offline table"""
+        client = BoaviztaClient(repository=self.repository)
+        response = {"verbose": {"avg_power": {"value": 12.0}}}
+
+        async def _fake_post(payload):
+            return response
+
+        with patch.object(client, "_async_post", side_effect=_fake_post):
+            power = client.get_power_consumption("c5.large")
+
+        self.assertEqual(power.avg_power_watts, 12.0)
+        self.assertIn("c5.large", PowerModelTable(self.repository))
+
+
+class TestPowerEngineRouting(unittest.TestCase):
+    """Refreshes evaluate hourly power through the offline table"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.repository = FileCacheRepository(Path(self._tmp.name))
+        self.client = BoaviztaClient(repository=self.repository)
+        self.client.power_table.upsert([PowerModelEntry("m5.large", 20.0, 10.0, 40.0)])
+        self.gateway = InfrastructureGateway(
+            electricity_client=Mock(), boavizta_client=self.client, aws_client=Mock(), region_zone_mapping={}
+        )
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_runtime_service_uses_gateway_engine(self):
+        service = create_runtime_service(repository=self.repository, gateway=self.gateway)
+        cpu = np.array([0.0, 50.0, np.nan])
+
+        np.testing.assert_allclose(service._engine_power_hourly("m5.large", cpu), [6.0, 13.0, np.nan])
+        self.assertIsNone(service._engine_power_hourly("x9.huge", cpu))
+
+    def test_engine_power_matches_base_power_formula(self):
+        cpu = np.array([10.0, 80.0, np.nan, 40.0])
+        carbon = np.array([300.0, 250.0, 200.0, np.nan])
+        runtime = np.ones(4)
+        engine = self.gateway.get_power_engine().power_matrix(["m5.large"], cpu[np.newaxis, :])[0]
+
+        via_engine = calculate_co2_hourly_precise_vectorized(20.0, cpu, carbon, runtime, power_watts_hourly=engine)
+        via_base = calculate_co2_hourly_precise_vectorized(20.0, cpu, carbon, runtime)
+        self.assertEqual(via_engine["total_co2_kg"], via_base["total_co2_kg"])
+
+    def test_refresh_warms_missing_types_in_one_bulk_call(self):
+        self.gateway.refresh_power_table = Mock(return_value=2)
+        use_case = FetchInfrastructureDataUseCase(
+            runtime_service=Mock(), carbon_service=Mock(), calculator=Mock(), gateway=self.gateway, repository=self.repository
+        )
+        instances = [{"instance_type": kind} for kind in ("t3.micro", "m5.large", "c5.xlarge", "t3.micro")]
+
+        use_case._warm_power_table(instances)
+
+        self.gateway.refresh_power_table.assert_called_once_with(["c5.xlarge", "t3.micro"])
+
+
+def _boavizta_transport(request):
+    """Mock Boavizta: ``bad.json`` returns an invalid body, every other type 10 W."""
+    instance_type = request.url.params.get("instance_type") or json.loads(request.content)["instance_type"]
+    if instance_type == "bad.json":
+        return httpx.Response(200, content=b"<html>maintenance</html>")
+    if request.url.path.endswith("instance_config"):
+        return httpx.Response(200, json={"vcpu": {"default": 2}, "memory": {"default": 4}})
+    return httpx.Response(200, json={"verbose": {"avg_power": {"value": 10.0}}})
+
+
+class TestBulkPowerTableRefresh(unittest.TestCase):
+    """A failing instance type never discards the rest of a bulk refresh"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.repository = FileCacheRepository(Path(self._tmp.name))
+        self.client = BoaviztaClient(repository=self.repository)
+        async_client = httpx.AsyncClient
+        self._patch = patch.object(
+            httpx,
+            "AsyncClient",
+            lambda **kwargs: async_client(transport=httpx.MockTransport(_boavizta_transport), **kwargs),
+        )
+        self._patch.start()
+
+    def tearDown(self):
+        self._patch.stop()
+        self._tmp.cleanup()
+
+    def test_invalid_json_skips_only_that_type(self):
+        written = self.client.refresh_power_table(["m5.large", "bad.json", "t3.micro"])
+
+        self.assertEqual(written, 2)
+        self.assertNotIn("bad.json", self.client.power_table)
+        self.assertEqual(self.client.power_table.entry("m5.large").vcpu, 2)
+
+    def test_refresh_from_running_event_loop(self):
+        async def caller():
+            return self.client.refresh_power_table(["c5.large"])
+
+        self.assertEqual(asyncio.run(caller()), 1)
+        self.assertIn("c5.large", self.client.power_table)
+
+
+if __name__ == "__main__":
+    unittest.main()
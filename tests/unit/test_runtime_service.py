@@ -0,0 +1,172 @@
+"""
+Unit Tests for RuntimeService full-period hourly-precise enrichment
+"""
+
+import pickle
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import Mock
+
+import numpy as np
+
+from src.domain.constants import AcademicConstants
+from src.domain.models import EC2Instance, HourlyBreakdown, PowerConsumption
+from src.domain.services import RuntimeService
+from src.domain.timeline import hour_axis, hourly_analysis_window, slot_timestamps
+from src.infrastructure.cache import FileCacheRepository
+
+
+class TestFullPeriodHourlyPrecise(unittest.TestCase):
+    """Hourly-precise totals cover every hour of the selected period"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.repository = FileCacheRepository(Path(self._tmp.name))
+        self.period_days = 30
+        self.hours = self.period_days * 24
+        self.window_start, self.window_end = hourly_analysis_window(self.hours)
+        self.slots = slot_timestamps(self.window_start, self.hours)
+
+        self.gateway = Mock()
+        self.gateway.get_power_consumption.return_value = PowerConsumption(
+            avg_power_watts=10.0, min_power_watts=8.0, max_power_watts=12.0, confidence_level="high", source="test"
+        )
+        self.gateway.get_instance_pricing.return_value = 0.01
+        self.gateway.lookup_instance_events.return_value = []
+        self.gateway.get_cached_launch_time.return_value = None
+        self.gateway.fetch_cpu_metrics.return_value = [
+            {"Id": "cpu_utilization", "Values": [50.0] * self.hours, "Timestamps": list(self.slots)}
+        ]
+
+        self.service = RuntimeService(repository=self.repository, gateway=self.gateway)
+        self.instance = {
+            "instance_id": "i-always-on",
+            "instance_type": "t3.micro",
+            "state": "running",
+            "region": "eu-central-1",
+            "launch_time": datetime.now(timezone.utc) - timedelta(days=90),
+        }
+        self.carbon_history = [
+            {"datetime": slot.isoformat(), "carbonIntensity": 300.0} for slot in self.slots
+        ]
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _enrich(self):
+        return self.service.enrich_instance(
+            self.instance,
+            carbon_intensity=300.0,
+            carbon_history=self.carbon_history,
+            window_end=self.window_end,
+            period_days=self.period_days,
+        )
+
+    def test_full_period_without_scaling(self):
+        """720 hours × 6.5 W × 300 g/kWh, no 24h × period extrapolation"""
+        enriched = self._enrich()
+
+        self.assertEqual(enriched.co2_calculation_method, "hourly")
+        self.assertAlmostEqual(enriched.co2_kg_hourly, 0.0065 * 300 * self.hours / 1000.0, places=3)
+        self.assertEqual(len(enriched.hourly_co2_breakdown), self.hours)
+        self.assertEqual(enriched.data_completeness_24h, 24)
+
+        _, kwargs = self.gateway.fetch_cpu_metrics.call_args
+        self.assertEqual(kwargs["start_time"], self.window_start)
+        self.assertEqual(kwargs["end_time"], self.window_end)
+
+    def test_missing_cpu_hours_are_extrapolated_by_runtime_share(self):
+        """Gaps in CPU data do not shrink the period total"""
+        half = self.hours // 2
+        self.gateway.fetch_cpu_metrics.return_value = [
+            {"Id": "cpu_utilization", "Values": [50.0] * half, "Timestamps": list(self.slots[half:])}
+        ]
+        enriched = self._enrich()
+
+        self.assertEqual(enriched.co2_calculation_method, "hourly")
+        self.assertAlmostEqual(enriched.co2_kg_hourly, 0.0065 * 300 * self.hours / 1000.0, places=3)
+        missing = [row for row in enriched.hourly_co2_breakdown if row.get("data_missing")]
+        self.assertEqual(len(missing), half)
+
+    def test_low_runtime_coverage_falls_back_to_average(self):
+        """One covered hour out of 720 is not extrapolated 720x"""
+        self.gateway.fetch_cpu_metrics.return_value = [
+            {"Id": "cpu_utilization", "Values": [50.0], "Timestamps": [self.slots[-1]]}
+        ]
+        enriched = self._enrich()
+
+        self.assertEqual(enriched.co2_calculation_method, "average")
+        self.assertIsNone(enriched.co2_kg_hourly)
+        self.assertIsNone(enriched.hourly_co2_breakdown)
+        self.assertIsNotNone(enriched.co2_kg_average)
+
+    def test_breakdown_is_columnar_with_shared_axis(self):
+        """Breakdown columns are float32 arrays on the shared hour axis; rows keep the legacy shape"""
+        first = self._enrich().hourly_co2_breakdown
+        second = self._enrich().hourly_co2_breakdown
+
+        self.assertIsInstance(first, HourlyBreakdown)
+        self.assertIs(first.timestamps, second.timestamps)
+        self.assertIs(first.timestamps, hour_axis(self.window_start, self.hours))
+        self.assertEqual(first.co2_g.dtype, np.float32)
+        self.assertLess(first.nbytes, 64 * self.hours)
+
+        row = first[-1]
+        self.assertEqual(row["timestamp"], self.slots[-1].isoformat())
+        self.assertEqual(
+            set(row),
+            {"timestamp", "co2_g", "power_watts", "cpu_percent", "carbon_intensity", "runtime_fraction", "running", "cost_eur"},
+        )
+        self.assertAlmostEqual(row["co2_g"], 1.95, places=3)
+        self.assertEqual(len(first[:24]), 24)
+        self.assertEqual(int(first.data_missing.sum()), 0)
+
+        restored = pickle.loads(pickle.dumps(first))
+        np.testing.assert_array_equal(restored.co2_g, first.co2_g)
+
+    def test_deprecated_fields_are_derived(self):
+        """monthly_* names are read-only views over the period-based fields"""
+        enriched = self._enrich()
+
+        self.assertFalse(hasattr(enriched, "__dict__"))
+        self.assertEqual(enriched.monthly_co2_kg, enriched.co2_kg_average)
+        self.assertEqual(enriched.monthly_cost_eur, enriched.cost_eur_average)
+        self.assertEqual(enriched.monthly_co2_kg_projected, enriched.co2_kg_hourly)
+        self.assertEqual(enriched.monthly_cost_projected_eur, enriched.cost_eur_hourly)
+        self.assertAlmostEqual(
+            enriched.monthly_cost_usd, enriched.cost_eur_average / AcademicConstants.get_eur_usd_rate(), places=2
+        )
+        with self.assertRaises(AttributeError):
+            enriched.monthly_co2_kg = 1.0
+
+    def test_deprecated_fields_keep_prior_rounding(self):
+        """monthly_* values are rounded as the former stored fields were"""
+        instance = EC2Instance(
+            "i-unrounded", "t3.micro", "running", "eu-central-1",
+            co2_kg_hourly=1.23456, co2_kg_average=2.34567, cost_eur_hourly=3.4567, cost_eur_average=4.5678,
+        )
+
+        self.assertEqual(instance.monthly_co2_kg, 2.346)
+        self.assertEqual(instance.monthly_co2_kg_30d, 2.346)
+        self.assertEqual(instance.monthly_co2_kg_projected, 1.235)
+        self.assertEqual(instance.monthly_cost_eur, 4.57)
+        self.assertEqual(instance.monthly_cost_projected_eur, 3.46)
+        self.assertEqual(instance.monthly_cost_usd, round(4.5678 / AcademicConstants.get_eur_usd_rate(), 2))
+        self.assertIsNone(EC2Instance("i-empty", "t3.micro", "running", "eu-central-1").monthly_co2_kg)
+
+    def test_no_carbon_overlap_falls_back_to_average(self):
+        """Without carbon data inside the window the average-based method is used"""
+        self.carbon_history = [
+            {"datetime": (self.window_start - timedelta(days=5)).isoformat(), "carbonIntensity": 300.0}
+        ]
+        enriched = self._enrich()
+
+        self.assertEqual(enriched.co2_calculation_method, "average")
+        self.assertIsNone(enriched.co2_kg_hourly)
+        self.assertIsNotNone(enriched.co2_kg_average)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+Unit Tests for the runtime timeline engine
+"""
+
+import random
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from src.domain.timeline import RuntimeTimeline, runtime_matrix
+
+WINDOW_END = datetime(2025, 10, 28, 12, 0, tzinfo=timezone.utc)
+
+
+def _reference_fractions(intervals, window_start, hours):
+    """Brute-force overlap per hour (the original O(hours × intervals) loop)."""
+    fractions = []
+    for hour_offset in range(hours):
+        hour_start = window_start + timedelta(hours=hour_offset)
+        hour_end = hour_start + timedelta(hours=1)
+        seconds = 0.0
+        for interval_start, interval_end in intervals:
+            overlap_start = max(hour_start, interval_start)
+            overlap_end = min(hour_end, interval_end)
+            if overlap_start < overlap_end:
+                seconds += (overlap_end - overlap_start).total_seconds()
+        fractions.append(min(seconds / 3600.0, 1.0))
+    return fractions
+
+
+class TestRuntimeTimeline(unittest.TestCase):
+    """Correctness of interval merging and per-slot fractions"""
+
+    def test_docstring_example(self):
+        """Start 10:15, stop 12:45 → 0.75 / 1.0 / 0.75 / 0.0"""
+        window_start = datetime(2025, 10, 28, 10, 0, tzinfo=timezone.utc)
+        events = [
+            {"name": "StartInstances", "time": window_start + timedelta(minutes=15)},
+            {"name": "StopInstances", "time": window_start + timedelta(hours=2, minutes=45)},
+        ]
+        timeline = RuntimeTimeline.from_events(
+            events, window_start=window_start, window_end=window_start + timedelta(hours=4)
+        )
+        np.testing.assert_allclose(timeline.runtime_fractions(window_start, 4), [0.75, 1.0, 0.75, 0.0])
+        self.assertAlmostEqual(timeline.total_runtime_hours, 2.5)
+
+    def test_overlapping_intervals_are_merged(self):
+        """Overlaps never count twice"""
+        start = WINDOW_END - timedelta(hours=3)
+        timeline = RuntimeTimeline.from_intervals(
+            [(start, start + timedelta(hours=2)), (start + timedelta(hours=1), start + timedelta(hours=3))]
+        )
+        self.assertEqual(len(timeline), 1)
+        np.testing.assert_allclose(timeline.runtime_fractions(start, 3), [1.0, 1.0, 1.0])
+
+    def test_always_on_instance_without_events(self):
+        """Running instance with no events covers the whole window"""
+        window_start = WINDOW_END - timedelta(hours=48)
+        timeline = RuntimeTimeline.from_events(
+            [], window_start=window_start, window_end=WINDOW_END, instance_state="running"
+        )
+        np.testing.assert_allclose(timeline.runtime_fractions(window_start, 48), np.ones(48))
+
+    def test_stopped_before_window(self):
+        """Last event before the window was a stop → not running at window start"""
+        window_start = WINDOW_END - timedelta(hours=24)
+        events = [{"name": "StopInstances", "time": window_start - timedelta(hours=1)}]
+        timeline = RuntimeTimeline.from_events(
+            events,
+            window_start=window_start,
+            window_end=WINDOW_END,
+            instance_state="stopped",
+            launch_time=window_start - timedelta(days=3),
+        )
+        self.assertEqual(timeline.runtime_fractions(window_start, 24).sum(), 0.0)
+
+    def test_matches_bruteforce_at_sub_hour_resolution(self):
+        """Random intervals agree with the per-hour overlap loop, also for 15-minute slots"""
+        rng = random.Random(7)
+        window_start = WINDOW_END - timedelta(hours=72)
+        intervals = []
+        cursor = window_start - timedelta(hours=2)
+        while cursor < WINDOW_END:
+            start = cursor + timedelta(minutes=rng.randint(1, 240))
+            end = start + timedelta(minutes=rng.randint(1, 300))
+            intervals.append((start, end))
+            cursor = end
+
+        timeline = RuntimeTimeline.from_intervals(intervals)
+        expected = _reference_fractions(intervals, window_start, 72)
+        np.testing.assert_allclose(timeline.runtime_fractions(window_start, 72), expected, atol=1e-9)
+
+        quarter = timeline.runtime_fractions(window_start, 72 * 4, timedelta(minutes=15))
+        np.testing.assert_allclose(quarter.reshape(72, 4).mean(axis=1), expected, atol=1e-9)
+
+    def test_runtime_matrix_shape(self):
+        """Fleet matrix has one row per timeline"""
+        window_start = WINDOW_END - timedelta(hours=720)
+        timelines = [
+            RuntimeTimeline.from_intervals([(window_start, WINDOW_END)]),
+            RuntimeTimeline.from_intervals([]),
+        ]
+        matrix = runtime_matrix(timelines, window_start, 720)
+        self.assertEqual(matrix.shape, (2, 720))
+        self.assertEqual(matrix[0].sum(), 720.0)
+        self.assertEqual(matrix[1].sum(), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+Unit Tests for the office-hours auto-stop simulator
+"""
+
+import unittest
+from unittest.mock import patch
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from src.domain.models import EC2Instance, HourlyBreakdown
+from src.domain.schedules import IntervalIndex, OfficeSchedule, schedule_grid, simulate_fleet_schedules, simulate_schedules
+from src.domain.timeline import RuntimeTimeline
+
+UTC = timezone.utc
+
+
+def _minutes_off(schedule, intervals):
+    """Reference: walk every running minute and check it against the schedule"""
+    zone = ZoneInfo(schedule.timezone)
+    total = 0
+    for start, end in intervals:
+        minute = start
+        while minute < end:
+            local = minute.astimezone(zone)
+            on = (
+                local.weekday() in schedule.weekdays
+                and schedule.start_hour <= local.hour < schedule.end_hour
+                and local.date() not in schedule.holidays
+            )
+            total += 0 if on else 1
+            minute += timedelta(minutes=1)
+    return total / 60.0
+
+
+class TestScheduleSimulation(unittest.TestCase):
+    """Interval replay matches a minute-by-minute walk for many schedules at once"""
+
+    def setUp(self):
+        # Thursday 2025-03-27 00:00 UTC, across the DST switch on Sunday 2025-03-30
+        self.window_start = datetime(2025, 3, 27, tzinfo=UTC)
+        self.window_end = self.window_start + timedelta(days=5)
+        self.intervals = {
+            "i-office": [
+                (datetime(2025, 3, 27, 6, 15, tzinfo=UTC), datetime(2025, 3, 27, 19, 40, tzinfo=UTC)),
+                (datetime(2025, 3, 28, 5, 0, tzinfo=UTC), datetime(2025, 3, 31, 9, 30, tzinfo=UTC)),
+            ],
+            "i-always": [(self.window_start, self.window_end)],
+            "i-stopped": [],
+        }
+        self.index = IntervalIndex.from_timelines(
+            [(instance_id, RuntimeTimeline.from_intervals(pairs)) for instance_id, pairs in self.intervals.items()]
+        )
+        self.schedules = [
+            OfficeSchedule("office", 8, 18),
+            OfficeSchedule("early", 6, 16, weekdays=(0, 1, 2, 3, 4, 5)),
+            OfficeSchedule("holiday", 8, 18, holidays=(date(2025, 3, 28),)),
+            OfficeSchedule("new york", 9, 17, timezone="America/New_York"),
+        ]
+
+    def test_avoided_hours_match_minute_walk(self):
+        result = simulate_schedules(
+            self.index,
+            self.schedules,
+            window_start=self.window_start,
+            window_end=self.window_end,
+            power_watts=np.array([10.0, 20.0, 5.0]),
+            hourly_price_eur=np.array([0.1, 0.2, 0.3]),
+        )
+
+        self.assertEqual(result.avoided_hours.shape, (4, 3))
+        for row, schedule in enumerate(self.schedules):
+            for column, instance_id in enumerate(self.index.instance_ids):
+                with self.subTest(schedule=schedule.name, instance=instance_id):
+                    expected = _minutes_off(schedule, self.intervals[instance_id])
+                    self.assertAlmostEqual(result.avoided_hours[row, column], expected, places=6)
+        np.testing.assert_allclose(result.runtime_hours, [13 + 25 / 60 + 76.5, 120.0, 0.0])
+        np.testing.assert_allclose(result.avoided_cost_eur, result.avoided_hours * [0.1, 0.2, 0.3])
+
+        # Tiny blocks evaluate one instance at a time with the same result
+        with patch("src.domain.schedules._BLOCK_CELLS", 1):
+            blocked = simulate_schedules(
+                self.index,
+                self.schedules,
+                window_start=self.window_start,
+                window_end=self.window_end,
+                power_watts=np.array([10.0, 20.0, 5.0]),
+                hourly_price_eur=np.array([0.1, 0.2, 0.3]),
+            )
+        np.testing.assert_allclose(blocked.avoided_hours, result.avoided_hours)
+
+    def test_co2_uses_carbon_of_avoided_hours(self):
+        carbon = np.where(np.arange(120) % 24 < 12, 100.0, 500.0)
+        always_on = IntervalIndex.from_timelines([("i-always", RuntimeTimeline.from_intervals(self.intervals["i-always"]))])
+        # Stop during the second half of every UTC day only
+        schedule = OfficeSchedule("utc mornings", 0, 12, weekdays=tuple(range(7)), timezone="UTC")
+
+        result = simulate_schedules(
+            always_on,
+            [schedule],
+            window_start=self.window_start,
+            window_end=self.window_end,
+            power_watts=np.array([1000.0]),
+            hourly_price_eur=np.array([1.0]),
+            carbon_intensity_hourly=carbon,
+        )
+
+        self.assertAlmostEqual(result.avoided_hours[0, 0], 60.0)
+        self.assertAlmostEqual(result.avoided_co2_kg[0, 0], 60 * 1.0 * 500 / 1000)
+
+    def test_grid_ranking_from_breakdowns(self):
+        hours = 7 * 24
+        start = np.datetime64("2025-06-02T00:00:00")  # Monday
+        breakdown = HourlyBreakdown(
+            timestamps=start + np.arange(hours) * np.timedelta64(3600, "s"),
+            co2_g=np.zeros(hours, dtype=np.float32),
+            power_watts=np.full(hours, 10.0, dtype=np.float32),
+            cpu_percent=np.full(hours, 10.0, dtype=np.float32),
+            carbon_intensity=np.full(hours, 300.0, dtype=np.float32),
+            runtime_fraction=np.ones(hours, dtype=np.float32),
+            running=np.ones(hours, dtype=bool),
+        )
+        instance = EC2Instance(
+            instance_id="i-a", instance_type="t3.micro", state="running", region="eu-central-1",
+            power_watts=10.0, hourly_price_usd=1.0, hourly_co2_breakdown=breakdown,
+        )
+        schedules = schedule_grid()
+
+        simulation = simulate_fleet_schedules([instance], schedules, eur_usd_rate=1.0)
+        best, cost, co2, avoided = simulation.ranking()[0]
+
+        self.assertEqual(len(schedules), 50)
+        self.assertEqual((best.start_hour, best.end_hour, best.weekdays), (10, 16, (0, 1, 2, 3, 4)))
+        self.assertAlmostEqual(avoided, hours - 5 * 6)
+        self.assertAlmostEqual(cost, avoided)
+        self.assertAlmostEqual(co2, avoided * 0.01 * 300 / 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
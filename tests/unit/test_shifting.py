@@ -0,0 +1,146 @@
+"""
+Unit Tests for the carbon-aware workload shifting simulator
+"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from src.domain.models import EC2Instance, HourlyBreakdown
+from src.domain.shifting import ShiftPolicy, local_hours, simulate_fleet_shifting, simulate_shifting
+
+
+def _brute_force(energy, carbon, hours_of_day, policy):
+    """Reference: loop over instances, hours and offsets"""
+    shifted = np.zeros(energy.shape[0])
+    for row in range(energy.shape[0]):
+        best_profile = None
+        for offset in policy.offsets:
+            total = 0.0
+            for hour in range(energy.shape[1]):
+                target = hour + offset
+                allowed = 0 <= target < energy.shape[1]
+                if allowed and policy.window is not None and offset != 0:
+                    start, end = policy.window
+                    local = hours_of_day[target]
+                    allowed = start <= local < end if start < end else (local >= start or local < end)
+                if allowed and policy.deadline_hour is not None:
+                    allowed = offset <= (policy.deadline_hour - hours_of_day[hour] - 1) % 24
+                total += energy[row, hour] * (carbon[target] if allowed else carbon[hour])
+            best_profile = total if best_profile is None else min(best_profile, total)
+        if policy.keep_profile:
+            shifted[row] = best_profile
+        else:
+            for hour in range(energy.shape[1]):
+                candidates = [carbon[hour]]
+                for offset in policy.offsets:
+                    target = hour + offset
+                    if not 0 <= target < energy.shape[1]:
+                        continue
+                    if policy.window is not None and offset != 0:
+                        start, end = policy.window
+                        local = hours_of_day[target]
+                        if not (start <= local < end if start < end else (local >= start or local < end)):
+                            continue
+                    if policy.deadline_hour is not None and offset > (policy.deadline_hour - hours_of_day[hour] - 1) % 24:
+                        continue
+                    candidates.append(carbon[target])
+                shifted[row] += energy[row, hour] * min(candidates)
+    return shifted / 1000.0
+
+
+class TestShiftingSimulation(unittest.TestCase):
+    """Vectorized policies match a loop over instances × hours × offsets"""
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.hours = 72
+        self.hours_of_day = np.arange(self.hours) % 24
+        self.carbon = 300 + 120 * np.cos(2 * np.pi * (self.hours_of_day - 13) / 24) + rng.normal(0, 15, self.hours)
+        self.energy = rng.uniform(0, 0.05, (6, self.hours)) * (rng.random((6, self.hours)) > 0.3)
+
+    def test_policies_match_brute_force(self):
+        policies = [
+            ShiftPolicy("defer", max_shift_hours=6),
+            ShiftPolicy("advance", max_shift_hours=4, allow_advance=True),
+            ShiftPolicy("night", max_shift_hours=18, window=(22, 6), deadline_hour=8),
+            ShiftPolicy("profile", max_shift_hours=6, allow_advance=True, keep_profile=True),
+        ]
+        results = simulate_shifting(self.energy, self.carbon, self.hours_of_day, policies)
+
+        for policy, result in zip(policies, results):
+            with self.subTest(policy=policy.name):
+                np.testing.assert_allclose(result.shifted_co2_kg, _brute_force(self.energy, self.carbon, self.hours_of_day, policy))
+                self.assertTrue(np.all(result.savings_kg >= -1e-12))
+
+    def test_constraints_and_flexible_share(self):
+        flat = np.full(self.hours, 200.0)
+        flat[30] = 50.0  # one clean hour at 06:00 on day 2
+        energy = np.zeros((1, self.hours))
+        energy[0, 27] = 1.0  # work at 03:00
+
+        unconstrained, too_short, past_deadline, half = simulate_shifting(
+            energy,
+            flat,
+            self.hours_of_day,
+            [
+                ShiftPolicy("3h", max_shift_hours=3),
+                ShiftPolicy("2h", max_shift_hours=2),
+                ShiftPolicy("deadline 05:00", max_shift_hours=3, deadline_hour=5),
+                ShiftPolicy("half", max_shift_hours=3, shiftable_fraction=0.5),
+            ],
+        )
+
+        self.assertAlmostEqual(unconstrained.fleet_savings_kg, 0.15)
+        self.assertEqual(unconstrained.mean_shift_hours[0], 3.0)
+        self.assertEqual(too_short.fleet_savings_kg, 0.0)
+        self.assertEqual(past_deadline.fleet_savings_kg, 0.0)
+        self.assertAlmostEqual(half.fleet_savings_kg, 0.075)
+
+    def test_unknown_intensity_is_neither_counted_nor_targeted(self):
+        carbon = np.full(4, 300.0)
+        carbon[1] = np.nan
+        carbon[3] = 100.0
+        energy = np.array([[1.0, 1.0, 0.0, 0.0]])
+
+        (result,) = simulate_shifting(energy, carbon, np.arange(4), [ShiftPolicy("defer", max_shift_hours=3)])
+
+        self.assertAlmostEqual(result.fleet_baseline_kg, 0.3)
+        self.assertAlmostEqual(result.fleet_savings_kg, 0.2)
+
+
+class TestFleetShifting(unittest.TestCase):
+    """Enriched instances are turned into an energy matrix on their shared hour axis"""
+
+    def test_simulate_fleet_from_breakdowns(self):
+        hours = 48
+        start = np.datetime64("2025-06-01T00:00:00")
+        timestamps = start + np.arange(hours) * np.timedelta64(3600, "s")
+        carbon = np.where(local_hours(timestamps) == 13, 100.0, 400.0)
+        running = np.ones(hours, dtype=bool)
+        breakdown = HourlyBreakdown(
+            timestamps=timestamps,
+            co2_g=np.full(hours, 4.0, dtype=np.float32),
+            power_watts=np.full(hours, 10.0, dtype=np.float32),
+            cpu_percent=np.full(hours, 20.0, dtype=np.float32),
+            carbon_intensity=carbon.astype(np.float32),
+            runtime_fraction=np.ones(hours, dtype=np.float32),
+            running=running,
+        )
+        instances = [
+            EC2Instance(instance_id="i-a", instance_type="t3.micro", state="running", region="eu-central-1", hourly_co2_breakdown=breakdown),
+            EC2Instance(instance_id="i-avg", instance_type="t3.micro", state="running", region="eu-central-1"),
+        ]
+
+        with_series = simulate_fleet_shifting(instances, carbon, [ShiftPolicy("24h", max_shift_hours=24)])[0]
+        from_breakdowns = simulate_fleet_shifting(instances, None, [ShiftPolicy("24h", max_shift_hours=24)])[0]
+
+        self.assertEqual(with_series.instance_ids, ("i-a",))
+        self.assertAlmostEqual(with_series.fleet_baseline_kg, hours * 0.01 * 400 / 1000 - 2 * 0.01 * 300 / 1000)
+        self.assertGreater(with_series.savings_pct, 50.0)
+        self.assertAlmostEqual(from_breakdowns.fleet_savings_kg, with_series.fleet_savings_kg)
+
+
+if __name__ == "__main__":
+    unittest.main()
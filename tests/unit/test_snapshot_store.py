@@ -0,0 +1,118 @@
+"""
+Unit Tests for persisted dashboard snapshots
+"""
+
+import gzip
+import pickle
+import tempfile
+import unittest
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+from unittest.mock import patch
+
+import numpy as np
+
+from src.domain.models import DashboardData, EC2Instance, HourlyBreakdown, dataclass_schema_digest
+from src.infrastructure.cache import FileCacheRepository
+from src.infrastructure.snapshot_store import DashboardSnapshotStore, diff_dashboard_data
+
+
+def _instance(instance_id, cost, co2, *, hours=0):
+    breakdown = None
+    if hours:
+        breakdown = HourlyBreakdown(
+            timestamps=np.datetime64("2025-06-01T00:00:00") + np.arange(hours) * np.timedelta64(3600, "s"),
+            co2_g=np.full(hours, 2.0, dtype=np.float32),
+            power_watts=np.full(hours, 10.0, dtype=np.float32),
+            cpu_percent=np.full(hours, 20.0, dtype=np.float32),
+            carbon_intensity=np.full(hours, 300.0, dtype=np.float32),
+            runtime_fraction=np.ones(hours, dtype=np.float32),
+            running=np.ones(hours, dtype=bool),
+        )
+    return EC2Instance(
+        instance_id, "t3.micro", "running", "eu-central-1",
+        cost_eur_hourly=cost, co2_kg_hourly=co2, hourly_co2_breakdown=breakdown,
+    )
+
+
+class TestDashboardSnapshotStore(unittest.TestCase):
+    """Snapshots round-trip, rotate per period and ignore other schema versions"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.store = DashboardSnapshotStore(FileCacheRepository(Path(self._tmp.name)), history=2)
+        self.saved_at = datetime(2025, 6, 1, 12, 0)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_round_trip_keeps_columnar_breakdowns(self):
+        data = DashboardData(instances=[_instance("i-a", 1.5, 0.2, hours=24)], analysis_period_days=7, total_cost_hourly=1.5)
+        self.store.save(data, saved_at=self.saved_at)
+
+        restored = self.store.latest(7)
+
+        self.assertEqual(restored.saved_at, self.saved_at)
+        self.assertEqual(restored.data.total_cost_hourly, 1.5)
+        np.testing.assert_array_equal(restored.data.instances[0].hourly_co2_breakdown.co2_g, np.full(24, 2.0))
+        self.assertIsNone(self.store.latest(30))
+
+    def test_history_is_rotated_per_period(self):
+        for offset in range(4):
+            self.store.save(DashboardData(instances=[_instance("i-a", float(offset), 0.0)]), saved_at=self.saved_at + timedelta(hours=offset))
+        self.store.save(DashboardData(instances=[], analysis_period_days=1), saved_at=self.saved_at)
+
+        history = self.store.history(30)
+
+        self.assertEqual([snapshot.saved_at.hour for snapshot in history], [15, 14])
+        self.assertEqual(len(self.store.history(1)), 1)
+
+    def test_other_schema_versions_are_ignored(self):
+        path = self.store.save(DashboardData(instances=[]), saved_at=self.saved_at)
+        with gzip.open(path, "wb") as handle:
+            pickle.dump({"version": 0, "saved_at": self.saved_at, "data": DashboardData(instances=[])}, handle)
+
+        self.assertIsNone(self.store.latest(30))
+
+    def test_model_schema_changes_are_ignored(self):
+        self.store.save(DashboardData(instances=[_instance("i-a", 1.0, 0.1)]), saved_at=self.saved_at)
+
+        with patch("src.infrastructure.snapshot_store.model_schema_digest", return_value="changed"):
+            self.assertIsNone(self.store.latest(30))
+        self.assertIsNotNone(self.store.latest(30))
+
+    def test_schema_digest_tracks_field_layout(self):
+        @dataclass(slots=True)
+        class Before:
+            cost: float
+            co2: Optional[float] = None
+
+        @dataclass(slots=True)
+        class Reordered:
+            co2: Optional[float] = None
+            cost: float = 0.0
+
+        Reordered.__qualname__ = Before.__qualname__
+        self.assertEqual(dataclass_schema_digest([Before]), dataclass_schema_digest([Before]))
+        self.assertNotEqual(dataclass_schema_digest([Before]), dataclass_schema_digest([Reordered]))
+
+    def test_diff_between_refreshes(self):
+        self.store.save(DashboardData(instances=[_instance("i-a", 1.0, 0.1), _instance("i-b", 2.0, 0.2)]), saved_at=self.saved_at)
+        self.store.save(
+            DashboardData(instances=[_instance("i-a", 1.5, 0.1), _instance("i-c", 3.0, 0.3)]),
+            saved_at=self.saved_at + timedelta(hours=1),
+        )
+
+        diff = self.store.diff_latest(30)
+
+        self.assertEqual((diff.added, diff.removed), (("i-c",), ("i-b",)))
+        self.assertAlmostEqual(diff.cost_delta_eur, 1.5)
+        self.assertAlmostEqual(diff.co2_delta_kg, 0.1)
+        self.assertEqual(diff.instance_changes, {"i-a": (0.5, 0.0)})
+        self.assertTrue(diff_dashboard_data(self.store.latest(30).data, self.store.latest(30).data).unchanged)
+
+
+if __name__ == "__main__":
+    unittest.main()
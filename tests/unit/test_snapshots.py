@@ -0,0 +1,179 @@
+"""
+Unit Tests for the shared dashboard snapshot refresher
+"""
+
+import threading
+import time
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from src.application import snapshots
+from src.application.snapshots import SnapshotRefresher
+from src.domain.models import DashboardData, EC2Instance, RefreshProgress
+from src.infrastructure.snapshot_store import StoredSnapshot
+
+
+def _data(count):
+    instances = [EC2Instance(f"i-{index}", "t3.micro", "running", "eu-central-1") for index in range(count)]
+    return DashboardData(instances=instances)
+
+
+class FakeOrchestrator:
+    """Yields one partial and one final progress per refresh"""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.calls = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def iter_infrastructure_data(self, force_refresh=False, period_days=30):
+        self.calls.append((period_days, force_refresh))
+        yield RefreshProgress(period_days=period_days, total=1)
+        self.release.wait(5)
+        yield RefreshProgress(period_days=period_days, total=1, dashboard_data=self.results.pop(0))
+
+
+class FailingOrchestrator:
+    """Raises for the first ``failures`` refreshes, then returns ``result``"""
+
+    def __init__(self, failures, result):
+        self.failures = failures
+        self.result = result
+        self.calls = []
+
+    def iter_infrastructure_data(self, force_refresh=False, period_days=30):
+        self.calls.append(time.monotonic())
+        if len(self.calls) <= self.failures:
+            raise ConnectionError("API down")
+        yield RefreshProgress(period_days=period_days, total=1, dashboard_data=self.result)
+
+
+class TestSnapshotRefresher(unittest.TestCase):
+    """One background thread publishes snapshots that every reader shares"""
+
+    def tearDown(self):
+        self.refresher.stop(timeout=5)
+
+    def test_first_view_refreshes_once_for_all_readers(self):
+        orchestrator = FakeOrchestrator([_data(2)])
+        self.refresher = SnapshotRefresher(orchestrator, interval_seconds=3600).start()
+
+        self.assertIsNone(self.refresher.latest(7))
+        snapshot = self.refresher.wait(7, timeout=5)
+
+        self.assertIsNotNone(snapshot)
+        self.assertEqual(len(snapshot.data.instances), 2)
+        self.assertIs(self.refresher.latest(7), snapshot)
+        self.assertEqual(orchestrator.calls, [(7, False)])
+
+    def test_forced_refresh_replaces_snapshot_and_failures_keep_previous(self):
+        orchestrator = FakeOrchestrator([_data(2), _data(3), _data(0)])
+        self.refresher = SnapshotRefresher(orchestrator, interval_seconds=3600).start()
+        first = self.refresher.wait(30, timeout=5)
+
+        orchestrator.release.clear()
+        self.refresher.request_refresh(30, force=True)
+        # Readers keep the old snapshot while the refresh is running
+        while self.refresher.progress(30) is None:
+            self.refresher.wait(30, timeout=0.01)
+        self.assertIs(self.refresher.latest(30), first)
+        orchestrator.release.set()
+        self._wait_until(lambda: self.refresher.latest(30) is not first)
+        second = self.refresher.latest(30)
+        self.assertEqual(len(second.data.instances), 3)
+
+        self.refresher.request_refresh(30)
+        self._wait_until(lambda: len(orchestrator.calls) == 3 and not self.refresher.is_refreshing(30))
+        self.assertIs(self.refresher.latest(30), second)
+        self.assertEqual(orchestrator.calls, [(30, False), (30, True), (30, False)])
+
+    def test_published_progress_is_not_the_running_accumulator(self):
+        running = RefreshProgress(period_days=30, total=2)
+        orchestrator = FakeOrchestrator([_data(2)])
+
+        def iter_infrastructure_data(force_refresh=False, period_days=30):
+            running.include(EC2Instance("i-0", "t3.micro", "running", "eu-central-1", cost_eur_average=1.0))
+            yield running
+            orchestrator.release.wait(5)
+            running.include(EC2Instance("i-1", "t3.micro", "running", "eu-central-1", cost_eur_average=2.0))
+            yield RefreshProgress(period_days=period_days, total=2, dashboard_data=_data(2))
+
+        orchestrator.release.clear()
+        with patch.object(orchestrator, "iter_infrastructure_data", iter_infrastructure_data):
+            self.refresher = SnapshotRefresher(orchestrator, interval_seconds=3600).start()
+            self.refresher.request_refresh(30)
+            self._wait_until(lambda: self.refresher.progress(30) is not None)
+            published = self.refresher.progress(30)
+            orchestrator.release.set()
+            self.refresher.wait(30, timeout=5)
+
+        self.assertIsNot(published, running)
+        self.assertEqual((published.processed, published.total_cost_average), (1, 1.0))
+        self.assertEqual((running.processed, running.total_cost_average), (2, 3.0))
+
+    def test_due_periods_are_refreshed_on_schedule(self):
+        orchestrator = FakeOrchestrator([_data(1), _data(2)])
+        self.refresher = SnapshotRefresher(orchestrator, interval_seconds=0.05).start()
+        first = self.refresher.wait(1, timeout=5)
+
+        self._wait_until(lambda: self.refresher.latest(1) is not first)
+        self.assertEqual(len(self.refresher.latest(1).data.instances), 2)
+
+    def test_persisted_snapshot_is_served_while_refreshing(self):
+        orchestrator = FakeOrchestrator([_data(4)])
+        orchestrator.load_snapshot = lambda period_days: StoredSnapshot(period_days, datetime(2025, 6, 1), _data(1))
+        orchestrator.release.clear()
+        self.refresher = SnapshotRefresher(orchestrator, interval_seconds=3600).start()
+
+        restored = self.refresher.latest(30)
+        self.assertTrue(restored.restored)
+        self.assertEqual(len(restored.data.instances), 1)
+
+        orchestrator.release.set()
+        self._wait_until(lambda: not self.refresher.latest(30).restored)
+        self.assertEqual(len(self.refresher.latest(30).data.instances), 4)
+
+    def test_failed_refresh_is_recorded_and_retried_with_backoff(self):
+        orchestrator = FailingOrchestrator(failures=2, result=_data(2))
+        with patch.object(snapshots, "RETRY_BASE_SECONDS", 0.2):
+            self.refresher = SnapshotRefresher(orchestrator, interval_seconds=3600).start()
+
+            # The first failure ends the wait early instead of blocking until the timeout
+            started = time.monotonic()
+            self.assertIsNone(self.refresher.wait(30, timeout=5))
+            self.assertLess(time.monotonic() - started, 1.0)
+            failure = self.refresher.last_error(30)
+            self.assertEqual((failure.attempts, failure.message, failure.retry_in_seconds), (1, "API down", 0.2))
+
+            # No hot loop: the second attempt waits for the backoff, the third for twice as long
+            time.sleep(0.1)
+            self.assertEqual(len(orchestrator.calls), 1)
+            self._wait_until(lambda: self.refresher.latest(30) is not None)
+
+        self.assertEqual(len(orchestrator.calls), 3)
+        self.assertGreaterEqual(orchestrator.calls[2] - orchestrator.calls[1], 0.35)
+        self.assertIsNone(self.refresher.last_error(30))
+
+    def test_error_response_without_instances_counts_as_failure(self):
+        orchestrator = FakeOrchestrator([DashboardData(instances=[], academic_disclaimers=["No EC2 instances found"])])
+        self.refresher = SnapshotRefresher(orchestrator, interval_seconds=3600).start()
+
+        snapshot = self.refresher.wait(1, timeout=5)
+
+        self.assertEqual(snapshot.data.instances, [])
+        self._wait_until(lambda: self.refresher.last_error(1) is not None)
+        self.assertEqual(self.refresher.last_error(1).message, "No EC2 instances found")
+
+    def _wait_until(self, condition, timeout=5.0):
+        event = threading.Event()
+        for _ in range(int(timeout / 0.01)):
+            if condition():
+                return
+            event.wait(0.01)
+        self.fail("condition not reached")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+Tests for lazy package exports and the startup import-time report
+"""
+
+import unittest
+
+import src.application
+import src.domain
+import src.presentation
+from benchmarks.startup import import_time_report, parse_importtime
+
+
+IMPORTTIME_SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      2500 |       4000 |     pandas.core
+import time:       900 |       4900 |   pandas
+import time:       300 |       5200 | src.app
+"""
+
+
+class TestLazyExports(unittest.TestCase):
+    """Package-level names still resolve, heavy modules load on first access"""
+
+    def test_domain_simulators_resolve(self):
+        from src.domain import simulate_fleet_shifting, simulate_schedules
+        from src.domain.shifting import simulate_fleet_shifting as direct
+
+        self.assertIs(simulate_fleet_shifting, direct)
+        self.assertTrue(callable(simulate_schedules))
+
+    def test_application_and_presentation_exports_resolve(self):
+        from src.application.snapshots import SnapshotRefresher
+
+        self.assertIs(src.application.SnapshotRefresher, SnapshotRefresher)
+        self.assertTrue(callable(src.presentation.render_infrastructure_page))
+
+    def test_unknown_name_raises_attribute_error(self):
+        with self.assertRaises(AttributeError):
+            src.domain.does_not_exist  # noqa: B018
+
+        for package in (src.domain, src.application, src.presentation):
+            for name in package.__all__:
+                self.assertTrue(hasattr(package, name), f"{package.__name__}.{name}")
+
+
+class TestStartupReport(unittest.TestCase):
+    """``import src.app`` stays free of pandas, pydantic, the AWS SDK and plotly figures"""
+
+    def test_parse_importtime(self):
+        timings = parse_importtime(IMPORTTIME_SAMPLE)
+
+        self.assertEqual([timing.module for timing in timings], ["_io", "pandas.core", "pandas", "src.app"])
+        self.assertEqual(timings[1].depth, 2)
+        self.assertEqual(timings[3].depth, 0)
+        self.assertEqual(timings[3].cumulative_us, 5200)
+
+    def test_app_import_defers_heavy_modules(self):
+        report = import_time_report(top=5)
+
+        self.assertEqual(report["heavy_modules_loaded"], [], f"loaded at import: {report['heavy_modules_loaded']}")
+        self.assertEqual(report["top_cumulative"][0]["module"], "src.app")
+        self.assertEqual(len(report["top_self"]), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
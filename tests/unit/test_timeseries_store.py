@@ -0,0 +1,162 @@
+"""
+Unit Tests for the columnar time-series store
+"""
+
+import json
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+from src.infrastructure.cache import FileCacheRepository
+from src.infrastructure.timeseries_store import ColumnarTimeSeriesStore
+
+
+def _rows(start, hours, cost=0.5):
+    return [
+        {
+            "timestamp": start + timedelta(hours=hour),
+            "cost_eur_per_hour": cost,
+            "co2_kg_per_hour": 0.01 * hour,
+            "carbon_intensity": None if hour % 5 == 0 else 300.0,
+        }
+        for hour in range(hours)
+    ]
+
+
+class TestColumnarTimeSeriesStore(unittest.TestCase):
+    """Day segments, range queries, incremental writes, retention and migration"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.repository = FileCacheRepository(Path(self._tmp.name))
+        self.start = datetime.combine(date.today() - timedelta(days=3), datetime.min.time())
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _store(self, **kwargs):
+        return ColumnarTimeSeriesStore(self.repository, "timeseries/cost_carbon", **kwargs)
+
+    def test_rows_round_trip_in_day_segments(self):
+        store = self._store()
+        self.assertEqual(store.append(_rows(self.start, 48)), 48)
+
+        self.assertEqual(sorted(path.stem for path in store.directory.glob("*.npy")), [
+            self.start.date().isoformat(),
+            (self.start + timedelta(days=1)).date().isoformat(),
+        ])
+        rows = self._store().load()
+        self.assertEqual(rows, _rows(self.start, 48))
+
+    def test_range_query_reads_only_requested_slots(self):
+        store = self._store()
+        store.append(_rows(self.start, 72))
+
+        columns = store.query(self.start + timedelta(hours=20), self.start + timedelta(hours=30))
+
+        self.assertEqual(columns["timestamp"].size, 10)
+        self.assertEqual(columns["timestamp"][0].tolist(), self.start + timedelta(hours=20))
+        np.testing.assert_allclose(columns["co2_kg_per_hour"], [0.01 * hour for hour in range(20, 30)])
+        self.assertTrue(np.isnan(columns["carbon_intensity"][0]))
+        self.assertEqual(store.time_range(), (self.start, self.start + timedelta(hours=71)))
+
+    def test_only_changed_rows_rewrite_their_segment(self):
+        store = self._store()
+        store.append(_rows(self.start, 48))
+        first_day = store.directory / f"{self.start.date().isoformat()}.npy"
+        before = first_day.stat().st_mtime_ns
+
+        self.assertEqual(store.append(_rows(self.start, 24)), 0)
+        changed = _rows(self.start + timedelta(hours=24), 24, cost=0.75)
+        self.assertEqual(store.append(changed), 24)
+
+        self.assertEqual(first_day.stat().st_mtime_ns, before)
+        self.assertEqual(store.load(self.start + timedelta(hours=24))[0]["cost_eur_per_hour"], 0.75)
+
+    def test_retention_drops_old_segments(self):
+        store = self._store(retention_days=2)
+        store.append(_rows(self.start, 96))
+
+        remaining = store.load()
+        self.assertGreaterEqual(remaining[0]["timestamp"].date(), date.today() - timedelta(days=2))
+
+    def test_legacy_json_is_migrated(self):
+        legacy = self.repository.path("timeseries", "cost_carbon")
+        rows = _rows(self.start, 6)
+        self.repository.write_json(legacy, [{**row, "timestamp": row["timestamp"].isoformat()} for row in rows])
+
+        self.assertEqual(self._store().load(), rows)
+        self.assertFalse(legacy.exists())
+
+    def test_legacy_migration_persists_rollups(self):
+        legacy = self.repository.path("timeseries", "cost_carbon")
+        rows = _rows(self.start, 6)
+        self.repository.write_json(legacy, [{**row, "timestamp": row["timestamp"].isoformat()} for row in rows])
+
+        self.assertEqual(self._store().query_rollup("week")["timestamp"].size, 1)
+
+        # Migration alone (no append afterwards) must leave week/month tables on disk
+        reopened = self._store()
+        for resolution in ("day", "week", "month"):
+            self.assertTrue((reopened.directory / "_rollups" / f"{resolution}.npy").exists(), resolution)
+            self.assertEqual(reopened.query_rollup(resolution)["slots"].sum(), 6, resolution)
+
+
+class TestTimeSeriesRollups(unittest.TestCase):
+    """Day/week/month rollups follow appends and serve long windows"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.repository = FileCacheRepository(Path(self._tmp.name))
+        self.store = ColumnarTimeSeriesStore(self.repository, "timeseries/cost_carbon", retention_days=None)
+        # Monday 2026-08-03, 60 days of hourly rows
+        self.start = datetime(2026, 8, 3)
+        self.store.append(_rows(self.start, 60 * 24))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_daily_rollup_matches_raw_hours(self):
+        daily = self.store.query_rollup("day", self.start, self.start + timedelta(days=2))
+        hours = self.store.query(self.start, self.start + timedelta(days=1))
+
+        self.assertEqual(daily["timestamp"].size, 2)
+        self.assertAlmostEqual(daily["co2_kg_per_hour_sum"][0], float(np.sum(hours["co2_kg_per_hour"])))
+        self.assertAlmostEqual(daily["co2_kg_per_hour_max"][0], 0.23)
+        self.assertEqual(daily["carbon_intensity_count"][0], 19)  # every 5th hour has no intensity
+        self.assertEqual(daily["coverage"][0], 1.0)
+
+    def test_week_and_month_rollups_are_updated_incrementally(self):
+        self.store.append(_rows(self.start + timedelta(days=1), 24, cost=1.5))
+
+        weekly = self.store.query_rollup("week", self.start, self.start + timedelta(days=7))
+        monthly = self.store.query_rollup("month", self.start, self.start + timedelta(days=1))
+
+        self.assertEqual(weekly["timestamp"][0].tolist(), self.start)
+        self.assertAlmostEqual(weekly["cost_eur_per_hour_sum"][0], 6 * 24 * 0.5 + 24 * 1.5)
+        self.assertEqual(weekly["cost_eur_per_hour_max"][0], 1.5)
+        self.assertEqual(monthly["timestamp"][0].tolist(), datetime(2026, 8, 1))
+        self.assertEqual(monthly["slots"][0], 29 * 24)
+        self.assertLess(monthly["coverage"][0], 1.0)
+
+    def test_auto_resolution_keeps_long_windows_small(self):
+        self.assertEqual(self.store.choose_resolution(self.start, self.start + timedelta(days=7)), "hour")
+
+        resolution, result = self.store.query_auto(self.start, self.start + timedelta(days=30))
+
+        self.assertEqual(resolution, "day")
+        self.assertEqual(result["timestamp"].size, 30)
+
+    def test_rollups_are_rebuilt_for_existing_segments(self):
+        (self.store.directory / "_rollups" / "day.npy").unlink()
+
+        reopened = ColumnarTimeSeriesStore(self.repository, "timeseries/cost_carbon", retention_days=None)
+
+        self.assertEqual(reopened.query_rollup("day")["timestamp"].size, 60)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+"""
+Unit Tests for refresh pipeline tracing spans
+"""
+
+import contextvars
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.synthetic import create_synthetic_gateway
+from src.application.orchestrator import DashboardDataOrchestrator
+from src.config import settings
+from src.domain.tracing import (
+    NOOP_SPAN,
+    RefreshTrace,
+    current_trace,
+    iter_traced,
+    record_cache,
+    span,
+    stage,
+    start_trace,
+    traced,
+)
+from src.infrastructure.cache import FileCacheRepository
+
+
+class TestRefreshTrace(unittest.TestCase):
+    """Spans nest under the active trace and export as Chrome trace events"""
+
+    def test_spans_nest_under_stages(self):
+        with start_trace("refresh") as trace:
+            stage("load")
+            with span("gateway.fetch", category="gateway", instance_id="i-1") as outer:
+                with span("parse") as inner:
+                    pass
+            stage("aggregate")
+
+        load = next(s for s in trace.spans if s.name == "load")
+        self.assertEqual(load.parent_id, trace.root.span_id)
+        self.assertEqual(outer.parent_id, load.span_id)
+        self.assertEqual(inner.parent_id, outer.span_id)
+        self.assertTrue(all(s.end_ns is not None for s in trace.spans))
+        self.assertIsNone(current_trace())
+
+    def test_helpers_are_noops_without_trace(self):
+        @traced("noop")
+        def compute(instance_id):
+            record_cache(True)
+            return instance_id
+
+        with span("outside") as outside:
+            stage("ignored")
+            self.assertEqual(compute("i-1"), "i-1")
+
+        self.assertIs(outside, NOOP_SPAN)
+
+    def test_cache_counts_and_errors_land_on_innermost_span(self):
+        @traced("gateway.lookup", category="gateway")
+        def lookup(*, instance_id, region):
+            record_cache(False)
+            raise RuntimeError("throttled")
+
+        with start_trace() as trace:
+            with span("enrich", category="enrich", instance_id="i-1") as enrich:
+                record_cache(True)
+                with self.assertRaises(RuntimeError):
+                    lookup(instance_id="i-1", region="eu-central-1")
+
+        call = next(s for s in trace.spans if s.name == "gateway.lookup")
+        self.assertEqual((enrich.cache_hits, enrich.cache_misses), (1, 0))
+        self.assertEqual((call.cache_hits, call.cache_misses), (0, 1))
+        self.assertEqual(call.attributes, {"instance_id": "i-1", "region": "eu-central-1", "error": "RuntimeError"})
+
+        summary = trace.summary()
+        self.assertEqual(summary.operations["gateway.lookup"]["calls"], 1)
+        self.assertEqual(summary.slowest_instances[0][0], "i-1")
+
+    def test_iter_traced_does_not_leak_across_yield(self):
+        def steps():
+            for name in ("first", "second"):
+                stage(name)
+                yield current_trace()
+
+        trace = RefreshTrace("refresh")
+        seen = []
+        for active in iter_traced(trace, steps()):
+            seen.append(active)
+            # The consumer runs outside the trace: its spans are not recorded
+            self.assertIsNone(current_trace())
+            with span("consumer") as consumer:
+                self.assertIs(consumer, NOOP_SPAN)
+
+        self.assertEqual(seen, [trace, trace])
+        self.assertEqual([s.name for s in trace.spans], ["refresh", "first", "second"])
+        self.assertTrue(all(s.end_ns is not None for s in trace.spans))
+
+    def test_iter_traced_closed_from_another_context(self):
+        trace = RefreshTrace("refresh")
+        iterator = iter_traced(trace, (stage(name) for name in ("a", "b")))
+        next(iterator)
+
+        # Abandoning the refresh in a different context must not fail on the token reset
+        contextvars.copy_context().run(iterator.close)
+
+        self.assertIsNotNone(trace.root.end_ns)
+        self.assertIsNone(current_trace())
+
+    def test_chrome_trace_export(self):
+        with start_trace("refresh", period_days=7) as trace:
+            stage("load")
+
+        exported = json.loads(json.dumps(trace.to_chrome_trace()))
+        events = {event["name"]: event for event in exported["traceEvents"]}
+
+        self.assertEqual(set(events), {"refresh", "load"})
+        self.assertTrue(all(event["ph"] == "X" and event["dur"] >= 0 for event in events.values()))
+        self.assertEqual(events["load"]["args"]["parent_span_id"], events["refresh"]["args"]["span_id"])
+        self.assertEqual(events["refresh"]["args"]["trace_id"], trace.trace_id)
+        self.assertEqual(events["refresh"]["args"]["period_days"], 7)
+
+
+class TestTracedRefresh(unittest.TestCase):
+    """A full offline refresh reports stage timings and per-instance enrichment"""
+
+    def test_refresh_attaches_summary_and_exports_trace(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            orchestrator = DashboardDataOrchestrator(
+                repository=FileCacheRepository(Path(tmp)), gateway=create_synthetic_gateway(4, seed=11)
+            )
+            data = orchestrator.get_infrastructure_data(period_days=1)
+            summary = data.refresh_trace
+
+            self.assertIsNotNone(summary)
+            self.assertIn("step_06.enrich_instances", summary.stages)
+            self.assertIn(summary.slowest_stage, summary.stages)
+            self.assertEqual(summary.operations["enrich"]["calls"], 4)
+            self.assertGreater(summary.operations["enrich"]["cache_misses"], 0)
+            self.assertEqual(len(summary.slowest_instances), 4)
+            self.assertIsNone(summary.trace_path)
+
+    def test_trace_export_keeps_newest_files(self):
+        with tempfile.TemporaryDirectory() as tmp, patch.object(settings, "refresh_trace_export", True), patch.object(
+            settings, "refresh_trace_history", 2
+        ):
+            repository = FileCacheRepository(Path(tmp))
+            older = [repository.path("traces", f"refresh_2020010{day}T000000_00000000") for day in (1, 2)]
+            for path in older:
+                path.write_text("[]")
+            orchestrator = DashboardDataOrchestrator(repository=repository, gateway=create_synthetic_gateway(2, seed=11))
+
+            exported = Path(orchestrator.get_infrastructure_data(period_days=1).refresh_trace.trace_path)
+
+            self.assertEqual(sorted(exported.parent.glob("refresh_*.json")), [older[1], exported])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Unit Tests for the Monte Carlo business case uncertainty engine
+"""
+
+import unittest
+
+import numpy as np
+
+from src.application.calculator import BusinessCaseCalculator
+from src.domain.models import EC2Instance, HourlyBreakdown, PowerConsumption
+from src.domain.uncertainty import (
+    UncertaintyInputs,
+    _triangular,
+    build_uncertainty_inputs,
+    simulate_business_case_uncertainty,
+)
+
+
+def _inputs(count=200, *, spread=True, seed=0):
+    rng = np.random.default_rng(seed)
+    avg = rng.uniform(5.0, 50.0, count)
+    return UncertaintyInputs(
+        power_avg_watts=avg,
+        power_min_watts=avg * 0.6 if spread else avg,
+        power_max_watts=avg * 1.5 if spread else avg,
+        cpu_mean=rng.uniform(5.0, 80.0, count),
+        cpu_std=rng.uniform(1.0, 10.0, count) if spread else np.zeros(count),
+        runtime_hours=np.full(count, 720.0),
+        hourly_price_usd=rng.uniform(0.01, 0.5, count),
+        carbon_mean=350.0,
+        carbon_std=20.0 if spread else 0.0,
+        eur_usd_rate=0.92,
+        eur_usd_std=0.03 if spread else 0.0,
+    )
+
+
+class TestMonteCarloUncertainty(unittest.TestCase):
+    """Sampled bands are ordered, reproducible and collapse without uncertainty"""
+
+    def test_triangular_inverse_cdf(self):
+        uniform = np.random.default_rng(1).random(200_000)
+        samples = _triangular(uniform, np.full(uniform.size, 2.0), np.full(uniform.size, 3.0), np.full(uniform.size, 7.0))
+
+        self.assertAlmostEqual(samples.mean(), (2.0 + 3.0 + 7.0) / 3.0, places=2)
+        self.assertGreaterEqual(samples.min(), 2.0)
+        self.assertLessEqual(samples.max(), 7.0)
+        np.testing.assert_array_equal(_triangular(uniform[:3], np.ones(3), np.ones(3), np.ones(3)), np.ones(3))
+
+    def test_bands_without_spread_equal_point_estimate(self):
+        inputs = _inputs(spread=False)
+        result = simulate_business_case_uncertainty(inputs, savings_factor_range=(0.2, 0.2), samples=500, seed=3)
+
+        expected_cost = 0.92 * float(inputs.hourly_price_usd @ inputs.runtime_hours)
+        power = inputs.power_avg_watts * (0.3 + 0.7 * inputs.cpu_mean / 100.0)
+        expected_co2 = float(power @ inputs.runtime_hours) / 1000.0 * 350.0 / 1000.0
+        np.testing.assert_allclose(result.band("baseline_cost_eur"), [expected_cost] * 3)
+        np.testing.assert_allclose(result.band("co2_savings_kg"), [expected_co2 * 0.2] * 3)
+        self.assertEqual(result.relative_half_width(), 0.0)
+
+    def test_bands_are_ordered_reproducible_and_rescaled(self):
+        inputs = _inputs()
+        first = simulate_business_case_uncertainty(
+            inputs, savings_factor_range=(0.1, 0.2), samples=2000, baseline_cost_eur=100.0, baseline_co2_kg=10.0, seed=5
+        )
+        second = simulate_business_case_uncertainty(
+            inputs, savings_factor_range=(0.1, 0.2), samples=2000, baseline_cost_eur=100.0, baseline_co2_kg=10.0, seed=5
+        )
+
+        self.assertEqual(first.bands, second.bands)
+        for values in first.bands.values():
+            self.assertLess(values[0], values[1])
+            self.assertLess(values[1], values[2])
+        self.assertAlmostEqual(first.band("baseline_cost_eur")[1], 100.0, delta=1.0)
+        self.assertAlmostEqual(first.band("baseline_co2_kg")[1], 10.0, delta=0.5)
+        self.assertGreater(first.band("cost_savings_eur")[0], 100.0 * 0.1 * 0.9)
+        self.assertLess(first.band("cost_savings_eur")[2], 100.0 * 0.2 * 1.1)
+
+    def test_inputs_from_instances(self):
+        hours = 48
+        breakdown = HourlyBreakdown(
+            timestamps=np.datetime64("2025-06-01T00:00:00") + np.arange(hours) * np.timedelta64(3600, "s"),
+            co2_g=np.zeros(hours, dtype=np.float32),
+            power_watts=np.full(hours, 10.0, dtype=np.float32),
+            cpu_percent=np.tile(np.array([20.0, 40.0], dtype=np.float32), hours // 2),
+            carbon_intensity=np.full(hours, 300.0, dtype=np.float32),
+            runtime_fraction=np.ones(hours, dtype=np.float32),
+            running=np.ones(hours, dtype=bool),
+        )
+        instances = [
+            EC2Instance("i-a", "t3.micro", "running", "eu-central-1", runtime_hours=48.0, hourly_price_usd=0.01, hourly_co2_breakdown=breakdown),
+            EC2Instance("i-b", "m5.large", "running", "eu-central-1", power_watts=13.0, cpu_utilization=100.0, runtime_hours=10.0),
+        ]
+        models = {"t3.micro": PowerConsumption(avg_power_watts=8.0, min_power_watts=4.0, max_power_watts=12.0, confidence_level="high", source="test")}
+        carbon = np.where(np.arange(hours) % 2 == 0, 250.0, 350.0)
+
+        inputs = build_uncertainty_inputs(instances, models, carbon_intensity_hourly=carbon)
+
+        np.testing.assert_allclose(inputs.power_avg_watts, [8.0, 13.0])
+        np.testing.assert_allclose(inputs.power_min_watts, [4.0, 13.0])
+        np.testing.assert_allclose(inputs.cpu_mean, [30.0, 100.0])
+        self.assertAlmostEqual(inputs.cpu_std[0], 10.0 / np.sqrt(2.0))
+        self.assertEqual((inputs.carbon_mean, inputs.carbon_std), (300.0, 50.0 / np.sqrt(2.0)))
+        np.testing.assert_allclose(inputs.hourly_price_usd, [0.01, 0.0])
+
+    def test_business_case_reports_bands(self):
+        calculator = BusinessCaseCalculator()
+        with_bands = calculator.calculate_business_case(200.0, 50.0, 1.0, uncertainty=_inputs(), samples=2000)
+        without = calculator.calculate_business_case(200.0, 50.0, 1.0)
+
+        low, median, high = with_bands.cost_savings_band_eur
+        self.assertLess(low, median)
+        self.assertLess(median, high)
+        self.assertAlmostEqual(with_bands.confidence_interval, (high - low) / 2 / median, places=3)
+        self.assertEqual(with_bands.carbon_aware_savings_eur, without.carbon_aware_savings_eur)
+        self.assertIsNone(without.co2_savings_band_kg)
+        self.assertEqual(without.confidence_interval, 0.15)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Unit Tests for the memoized dashboard view models
+"""
+
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from src.domain.models import APIHealthStatus, DashboardData, EC2Instance
+from src.presentation import view_models
+from src.presentation.view_models import (
+    build_instance_frame,
+    build_view_model,
+    dashboard_fingerprint,
+    get_view_model,
+    query_instance_frame,
+)
+
+
+def _data(cost=1.25):
+    instances = [
+        EC2Instance(
+            "i-a", "t3.micro", "running", "eu-central-1", instance_name="web",
+            power_watts=12.0, runtime_hours=10.0, hourly_price_usd=0.01, cpu_utilization=25.0,
+            cost_eur_average=cost, co2_kg_average=0.5, data_quality="measured",
+        ),
+        EC2Instance("i-b", "m5.large", "stopped", "eu-central-1"),
+    ]
+    return DashboardData(
+        instances=instances,
+        analysis_period_days=7,
+        data_freshness=datetime(2025, 6, 1, 12, 0),
+        api_health_status={
+            "ElectricityMaps": APIHealthStatus("ElectricityMaps", "healthy", 120.0, datetime(2025, 6, 1, 12, 0), healthy=True),
+            "CloudTrail": APIHealthStatus("CloudTrail", "degraded", 300.0, datetime(2025, 6, 1, 12, 0)),
+        },
+    )
+
+
+class TestDashboardViewModel(unittest.TestCase):
+    """Tables and totals are derived once per dashboard result"""
+
+    def setUp(self):
+        view_models._cached_view_model.clear()
+
+    def test_tables_and_totals(self):
+        view = build_view_model(_data())
+
+        self.assertEqual((view.instance_count, view.running_instances, view.instance_types), (2, 1, 2))
+        self.assertEqual((view.total_cost_eur, view.total_power_watts), (1.25, 12.0))
+        self.assertEqual((view.apis_online, view.apis_total), (1, 2))
+        self.assertEqual(view.instance_frame["cost_eur"].dtype, float)
+        self.assertEqual(view.instance_frame.loc[0, "cost_eur"], 1.25)
+        self.assertTrue(np.isnan(view.instance_frame.loc[1, "cpu_percent"]))
+        self.assertEqual(list(view.instance_frame["data_quality"]), ["🟢 Measured", "🔴 Limited"])
+        self.assertEqual(list(view.api_status_table["Service"]), ["AWS CloudTrail", "ElectricityMaps"])
+        self.assertEqual(view.api_status_table.loc[0, "Status"], "🟡 Degraded")
+        self.assertEqual((view.runtime_coverage, view.pricing_coverage, view.measured_quality), (1, 1, 1))
+
+    def test_fingerprint_tracks_content(self):
+        data = _data()
+
+        self.assertEqual(dashboard_fingerprint(data), dashboard_fingerprint(_data()))
+        self.assertNotEqual(dashboard_fingerprint(data), dashboard_fingerprint(_data(cost=2.0)))
+
+    def test_reruns_reuse_the_view_model(self):
+        data = _data()
+        with patch.object(view_models, "build_view_model", wraps=build_view_model) as builder:
+            first = get_view_model(data)
+            second = get_view_model(data)
+            get_view_model(_data(cost=2.0))
+
+        self.assertEqual(builder.call_count, 2)
+        pd.testing.assert_frame_equal(first.instance_frame, second.instance_frame)
+
+    def test_query_filters_sorts_and_pages(self):
+        instances = [
+            EC2Instance(f"i-{index:03d}", "t3.micro" if index % 2 else "m5.large", "running" if index % 3 else "stopped",
+                        "eu-central-1", instance_name=f"web-{index}", cost_eur_average=float(index % 7) if index % 5 else None)
+            for index in range(100)
+        ]
+        frame = build_instance_frame(instances)
+
+        page = query_instance_frame(frame, types=["t3.micro"], states=["Running"], sort_by="cost_eur", descending=True, page=2, page_size=10)
+        expected = sorted(
+            (instance for instance in instances if instance.instance_type == "t3.micro" and instance.state == "running"),
+            key=lambda instance: -instance.cost_eur_average if instance.cost_eur_average is not None else np.inf,
+        )
+        self.assertEqual(page.matching, len(expected))
+        self.assertEqual((page.page, page.page_count), (2, -(-len(expected) // 10)))
+        self.assertEqual(list(page.rows["instance_id"]), [instance.instance_id for instance in expected[10:20]])
+
+        searched = query_instance_frame(frame, search="WEB-4", page=99, page_size=5)
+        self.assertEqual(searched.matching, 11)
+        self.assertEqual((searched.page, len(searched.rows)), (3, 1))
+        self.assertTrue(frame["cost_eur"].isna().iloc[list(query_instance_frame(frame, sort_by="cost_eur", page_size=100).rows.index[-20:])].all())
+
+
+if __name__ == "__main__":
+    unittest.main()